@@ -0,0 +1,28 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('num_heads', [1, 8])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, num_heads, num_threads):
+    device = utils.get_bench_device()
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size)
+    score = torch.randn(g.num_edges(), num_heads, 1, device=device)
+
+    # dry run
+    for i in range(3):
+        dgl.ops.edge_softmax(g, score)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.ops.edge_softmax(g, score)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
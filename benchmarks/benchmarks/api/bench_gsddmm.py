@@ -0,0 +1,29 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('op', ['add', 'mul', 'dot', 'copy_lhs'])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, op, num_threads):
+    device = utils.get_bench_device()
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size)
+    x = torch.randn(g.num_nodes(), 16, device=device)
+    y = torch.randn(g.num_nodes(), 16, device=device)
+
+    # dry run
+    for i in range(3):
+        dgl.ops.gsddmm(g, op, x, y)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.ops.gsddmm(g, op, x, y)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
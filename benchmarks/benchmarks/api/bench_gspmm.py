@@ -0,0 +1,30 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('op', ['copy_lhs', 'mul', 'add'])
+@utils.parametrize('reducer', ['sum', 'max'])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, op, reducer, num_threads):
+    device = utils.get_bench_device()
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size)
+    x = torch.randn(g.num_nodes(), 16, device=device)
+    w = torch.randn(g.num_edges(), 16, device=device)
+
+    # dry run
+    for i in range(3):
+        dgl.ops.gspmm(g, op, reducer, x, w)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.ops.gspmm(g, op, reducer, x, w)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+import time
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('stmt', ['import dgl',
+                            'import dgl; dgl.graph(([0, 1], [1, 2]))',
+                            'import dgl.data',
+                            'import dgl.dataloading'])
+def track_time(stmt):
+    # every import runs in a fresh interpreter to measure cold starts
+    times = []
+    for i in range(5):
+        t0 = time.time()
+        subprocess.check_call([sys.executable, '-c', stmt])
+        times.append(time.time() - t0)
+
+    return min(times)
@@ -0,0 +1,32 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw', 'bipartite'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('length', [4, 16])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, length, num_threads):
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size).to('cpu')
+    if graph == 'bipartite':
+        seeds = torch.randint(0, g.num_nodes('item'), (10000,))
+        kwargs = {'metapath': ['bought-by', 'buys'] * (length // 2)}
+    else:
+        seeds = torch.randint(0, g.num_nodes(), (10000,))
+        kwargs = {'length': length}
+
+    # dry run
+    for i in range(3):
+        dgl.sampling.random_walk(g, seeds, **kwargs)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.sampling.random_walk(g, seeds, **kwargs)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
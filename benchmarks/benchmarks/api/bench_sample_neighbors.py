@@ -0,0 +1,28 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('fanout', [5, 20])
+@utils.parametrize('replace', [False, True])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, fanout, replace, num_threads):
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size).to('cpu')
+    seeds = torch.randint(0, g.num_nodes(), (1024,))
+
+    # dry run
+    for i in range(3):
+        dgl.sampling.sample_neighbors(g, seeds, fanout, replace=replace)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.sampling.sample_neighbors(g, seeds, fanout, replace=replace)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
@@ -0,0 +1,31 @@
+import os
+import tempfile
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw', 'bipartite'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('direction', ['save', 'load'])
+def track_time(graph, size, direction):
+    g = utils.get_synthetic_graph(graph, size).to('cpu')
+    for ntype in g.ntypes:
+        g.nodes[ntype].data['h'] = torch.randn(g.num_nodes(ntype), 16)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'graph.bin')
+        dgl.save_graphs(path, [g])
+
+        # timing
+        t0 = time.time()
+        for i in range(3):
+            if direction == 'save':
+                dgl.save_graphs(path, [g])
+            else:
+                dgl.load_graphs(path)
+        t1 = time.time()
+
+    return (t1 - t0) / 3
@@ -0,0 +1,28 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('num_seeds', [1024, 8192])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, num_seeds, num_threads):
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size).to('cpu')
+    seeds = torch.randperm(g.num_nodes())[:num_seeds]
+    frontier = dgl.sampling.sample_neighbors(g, seeds, 10)
+
+    # dry run
+    for i in range(3):
+        dgl.to_block(frontier, seeds)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.to_block(frontier, seeds)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
@@ -0,0 +1,25 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('graph', ['uniform', 'powerlaw', 'bipartite'])
+@utils.parametrize('size', ['small', 'medium'])
+@utils.parametrize('num_threads', [1, 8])
+def track_time(graph, size, num_threads):
+    utils.set_num_threads(num_threads)
+    g = utils.get_synthetic_graph(graph, size).to('cpu')
+
+    # dry run
+    for i in range(3):
+        dgl.to_simple(g)
+
+    # timing
+    t0 = time.time()
+    for i in range(10):
+        dgl.to_simple(g)
+    t1 = time.time()
+
+    return (t1 - t0) / 10
@@ -0,0 +1,33 @@
+import time
+import dgl
+import torch
+
+from .. import utils
+
+@utils.benchmark('time')
+@utils.parametrize('batch_size', [4, 32, 256])
+@utils.parametrize('graph', ['uniform', 'powerlaw'])
+def track_time(batch_size, graph):
+    device = utils.get_bench_device()
+
+    # prepare graph
+    graphs = []
+    for i in range(batch_size):
+        if graph == 'uniform':
+            g = dgl.rand_graph(1000, 10000)
+        else:
+            g = utils.powerlaw_graph(1000, 10000, seed=i)
+        graphs.append(g.to(device))
+    bg = dgl.batch(graphs)
+
+    # dry run
+    for i in range(10):
+        dgl.unbatch(bg)
+
+    # timing
+    t0 = time.time()
+    for i in range(100):
+        dgl.unbatch(bg)
+    t1 = time.time()
+
+    return (t1 - t0) / 100
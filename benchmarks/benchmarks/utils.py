@@ -215,6 +215,82 @@ def process_data(name):
 def get_bench_device():
     return os.environ.get('DGL_BENCH_DEVICE', 'cpu')
 
+def _powerlaw_ids(num_nodes, num_samples, alpha, rng):
+    # node i (in a random order) is drawn with probability proportional to (i+1)^-alpha
+    weights = np.arange(1, num_nodes + 1, dtype=np.float64) ** -alpha
+    weights /= weights.sum()
+    ids = rng.choice(num_nodes, num_samples, p=weights)
+    return rng.permutation(num_nodes)[ids]
+
+def powerlaw_graph(num_nodes, num_edges, alpha=0.8, seed=42):
+    """Generate a graph whose in-degrees and out-degrees follow a power law.
+
+    Endpoints are drawn independently from a Zipf-like distribution over the
+    nodes, so a few hub nodes own most of the edges, like in social networks.
+    """
+    rng = np.random.RandomState(seed)
+    src = _powerlaw_ids(num_nodes, num_edges, alpha, rng)
+    dst = _powerlaw_ids(num_nodes, num_edges, alpha, rng)
+    return dgl.graph((torch.from_numpy(src), torch.from_numpy(dst)), num_nodes=num_nodes)
+
+def bipartite_graph(num_nodes, num_edges, alpha=0.8, seed=42):
+    """Generate a user-item graph with power-law item popularity and its reverse."""
+    rng = np.random.RandomState(seed)
+    num_users = num_nodes // 2
+    num_items = num_nodes - num_users
+    src = torch.from_numpy(rng.randint(0, num_users, num_edges))
+    dst = torch.from_numpy(_powerlaw_ids(num_items, num_edges, alpha, rng))
+    return dgl.heterograph({
+        ('user', 'buys', 'item'): (src, dst),
+        ('item', 'bought-by', 'user'): (dst, src)},
+        num_nodes_dict={'user': num_users, 'item': num_items})
+
+# number of nodes for each synthetic graph size; all graphs have an average degree of 10
+SYNTHETIC_GRAPH_SIZES = {
+    'small': 10000,
+    'medium': 100000,
+    'large': 1000000,
+}
+
+_synthetic_graph_cache = {}
+
+def get_synthetic_graph(kind, size, avg_degree=10):
+    """Generate a synthetic graph locally without downloading anything.
+
+    Parameters
+    ----------
+    kind : str
+        ``'uniform'`` (``dgl.rand_graph``), ``'powerlaw'`` or ``'bipartite'``.
+    size : str
+        A key of ``SYNTHETIC_GRAPH_SIZES``.
+    avg_degree : int
+        Average degree of the nodes.
+
+    Returns
+    -------
+    DGLGraph
+        The graph on the benchmark device. Graphs are cached within the process.
+    """
+    key = (kind, size, avg_degree)
+    if key not in _synthetic_graph_cache:
+        num_nodes = SYNTHETIC_GRAPH_SIZES[size]
+        num_edges = num_nodes * avg_degree
+        if kind == 'uniform':
+            g = dgl.rand_graph(num_nodes, num_edges)
+        elif kind == 'powerlaw':
+            g = powerlaw_graph(num_nodes, num_edges)
+        elif kind == 'bipartite':
+            g = bipartite_graph(num_nodes, num_edges)
+        else:
+            raise ValueError('Invalid synthetic graph kind:', kind)
+        _synthetic_graph_cache[key] = g
+    return _synthetic_graph_cache[key].to(get_bench_device())
+
+def set_num_threads(num_threads):
+    """Set the number of threads used by both DGL and PyTorch on CPU."""
+    dgl.utils.set_num_threads(num_threads)
+    torch.set_num_threads(num_threads)
+
 def setup_track_time(*args, **kwargs):
     # fix random seed
     np.random.seed(42)
@@ -360,6 +360,56 @@ COOMatrix CSRRowWiseSampling(
     FloatArray prob = FloatArray(),
     bool replace = true);
 
+/*!
+ * \brief Alias tables of all the rows of a CSR matrix for O(1) weighted sampling.
+ *
+ * Both arrays are aligned with \c indices of the CSR matrix. To draw an entry from the
+ * row starting at offset \c off, pick a uniform offset \c j within the row, then take
+ * the entry \c off + \c j with probability \c prob[off + j] and the entry
+ * \c off + \c alias[off + j] otherwise.
+ */
+struct CSRAliasTable {
+  /*! \brief The acceptance probability of each entry */
+  FloatArray prob;
+  /*! \brief The alias of each entry as an offset within its row */
+  IdArray alias;
+};
+
+/*!
+ * \brief Build the alias tables of all the rows of a CSR matrix.
+ *
+ * Rows whose probabilities sum up to zero are sampled uniformly.
+ *
+ * \param mat Input CSR matrix.
+ * \param prob Unnormalized probability array. Should be of the same length as the
+ *             data array.
+ * \return The alias tables.
+ */
+CSRAliasTable CSRBuildAliasTable(CSRMatrix mat, FloatArray prob);
+
+/*!
+ * \brief Same as CSRRowWiseSampling but draws from precomputed alias tables.
+ *
+ * Sampling with replacement costs O(1) per draw. Sampling without replacement rejects
+ * duplicate draws and falls back to sampling from \c prob if there are too many of them.
+ *
+ * \param mat Input CSR matrix.
+ * \param rows Rows to sample from.
+ * \param num_samples Number of samples
+ * \param prob Unnormalized probability array. Should be of the same length as the data
+ *             array.
+ * \param table Alias tables built by CSRBuildAliasTable from \c mat and \c prob.
+ * \param replace True if sample with replacement
+ * \return A COOMatrix storing the picked row, col and data indices.
+ */
+COOMatrix CSRRowWiseSamplingAlias(
+    CSRMatrix mat,
+    IdArray rows,
+    int64_t num_samples,
+    FloatArray prob,
+    const CSRAliasTable& table,
+    bool replace = true);
+
 /*!
  * \brief Select K non-zero entries with the largest weights along each given row.
  *
@@ -10,6 +10,9 @@
 #include <dgl/array.h>
 #include <dmlc/thread_local.h>
 #include <dmlc/logging.h>
+#include <atomic>
+#include <limits>
+#include <memory>
 #include <random>
 #include <thread>
 #include <vector>
@@ -34,8 +37,99 @@ inline uint32_t GetThreadId() {
 
 };  // namespace
 
+/*!
+ * \brief Philox4x32-10 counter-based random bit generator.
+ *
+ * The generator encrypts a 128-bit counter with a 64-bit key.  The key holds the
+ * seed and a 32-bit stream ID, and the counter holds a 64-bit item and a 64-bit
+ * block number.  Every triple of (seed, stream, item) identifies an independent
+ * stream, so any stream can be started in constant time without generating the
+ * preceding numbers.  It satisfies the requirements of UniformRandomBitGenerator.
+ */
+class PhiloxEngine {
+ public:
+  typedef uint32_t result_type;
+
+  static constexpr result_type min() { return 0; }
+  static constexpr result_type max() { return std::numeric_limits<result_type>::max(); }
+
+  PhiloxEngine() { Reset(0, 0, 0); }
+
+  /*!
+   * \brief Start the stream identified by the seed, the stream ID and the item.
+   */
+  void Reset(uint32_t seed, uint32_t stream, uint64_t item) {
+    key_[0] = seed;
+    key_[1] = stream;
+    counter_[0] = 0;
+    counter_[1] = 0;
+    counter_[2] = static_cast<uint32_t>(item);
+    counter_[3] = static_cast<uint32_t>(item >> 32);
+    pos_ = 4;
+  }
+
+  result_type operator()() {
+    if (pos_ == 4) {
+      Generate();
+      // the block number is 64-bit, so a stream never wraps in practice
+      if (++counter_[0] == 0)
+        ++counter_[1];
+      pos_ = 0;
+    }
+    return output_[pos_++];
+  }
+
+ private:
+  void Generate() {
+    uint32_t ctr[4] = {counter_[0], counter_[1], counter_[2], counter_[3]};
+    uint32_t key[2] = {key_[0], key_[1]};
+    for (int round = 0; round < 10; ++round) {
+      const uint64_t prod0 = static_cast<uint64_t>(0xD2511F53U) * ctr[0];
+      const uint64_t prod1 = static_cast<uint64_t>(0xCD9E8D57U) * ctr[2];
+      const uint32_t hi0 = prod0 >> 32, lo0 = static_cast<uint32_t>(prod0);
+      const uint32_t hi1 = prod1 >> 32, lo1 = static_cast<uint32_t>(prod1);
+      ctr[0] = hi1 ^ ctr[1] ^ key[0];
+      ctr[1] = lo1;
+      ctr[2] = hi0 ^ ctr[3] ^ key[1];
+      ctr[3] = lo0;
+      key[0] += 0x9E3779B9U;
+      key[1] += 0xBB67AE85U;
+    }
+    for (int i = 0; i < 4; ++i)
+      output_[i] = ctr[i];
+  }
+
+  uint32_t key_[2];
+  uint32_t counter_[4];
+  uint32_t output_[4];
+  int pos_;
+};
+
 /*!
  * \brief Thread-local Random Number Generator class
+ *
+ * By default, the generator of every thread has its own stream, so the result of a
+ * parallel kernel depends on how the work is scheduled over the threads.  In
+ * deterministic mode, parallel kernels instead switch the generator to a stream
+ * keyed by the global seed, the kernel call and the work item (e.g. the seed node),
+ * so the result is independent of the number of threads:
+ *
+ * \code
+ * const int64_t stream = RandomEngine::NewStream();
+ * RandomEngine::StreamGuard stream_guard(stream);
+ * #pragma omp parallel for
+ * for (int64_t i = 0; i < num_items; ++i) {
+ *   RandomEngine *rng = RandomEngine::ThreadLocal();
+ *   rng->SetStream(stream_guard, i);
+ *   ...
+ * }
+ * \endcode
+ *
+ * When the guard is destroyed, every generator keyed by its kernel call switches
+ * back to its own stream at the position it was left at, so the numbers drawn
+ * outside of keyed kernels do not depend on how the items were scheduled either.
+ * Kernel calls from different host threads may run concurrently, since each guard
+ * only affects the generators keyed by its own call.
  */
 class RandomEngine {
  public:
@@ -50,6 +144,32 @@ class RandomEngine {
     SetSeed(seed);
   }
 
+  /*!
+   * \brief Switch the generators back to their own streams when destroyed.
+   *
+   * Must be created and destroyed outside of the parallel region.
+   */
+  class StreamGuard {
+   public:
+    /*! \param stream The stream ID returned by NewStream. */
+    explicit StreamGuard(int64_t stream) : stream_(stream) {
+      if (stream_ >= 0)
+        active_ = std::make_shared<std::atomic<bool>>(true);
+    }
+    ~StreamGuard() {
+      if (active_)
+        active_->store(false, std::memory_order_relaxed);
+    }
+    StreamGuard(const StreamGuard &) = delete;
+    StreamGuard &operator=(const StreamGuard &) = delete;
+
+   private:
+    friend class RandomEngine;
+    int64_t stream_;
+    // Shared with the generators keyed by this kernel call.
+    std::shared_ptr<std::atomic<bool>> active_;
+  };
+
   /*! \brief Get the thread-local random number generator instance */
   static RandomEngine *ThreadLocal() {
     return dmlc::ThreadLocalStore<RandomEngine>::Get();
@@ -59,7 +179,62 @@ class RandomEngine {
    * \brief Set the seed of this random number generator
    */
   void SetSeed(uint32_t seed) {
-    rng_.seed(seed + GetThreadId());
+    rng_.Reset(seed, kThreadStream, GetThreadId());
+    keyed_ = false;
+  }
+
+  /*!
+   * \brief Set the global seed, which keys the streams in deterministic mode, and
+   *        restart the numbering of the streams.
+   */
+  static void SetGlobalSeed(uint32_t seed) {
+    GlobalSeed() = seed;
+    StreamCounter() = 0;
+  }
+
+  /*!
+   * \brief Enable or disable deterministic mode.
+   */
+  static void SetDeterministic(bool deterministic) {
+    Deterministic() = deterministic;
+  }
+
+  /*! \brief Whether deterministic mode is enabled. */
+  static bool IsDeterministic() {
+    return Deterministic();
+  }
+
+  /*!
+   * \brief Allocate a stream ID for a call of a parallel kernel.
+   *
+   * Must be called outside of the parallel region.
+   *
+   * \return The stream ID in deterministic mode, or -1 otherwise.
+   */
+  static int64_t NewStream() {
+    // the largest stream ID is reserved for the streams of the threads
+    return Deterministic() ?
+      static_cast<int64_t>(StreamCounter()++ % kThreadStream) : -1;
+  }
+
+  /*!
+   * \brief Switch this generator to the stream of the given work item.
+   *
+   * Does nothing if the stream ID of the guard is -1, i.e. not in deterministic
+   * mode.  The generator switches back to its own stream once the guard is
+   * destroyed.
+   *
+   * \param guard The StreamGuard of the kernel call.
+   * \param item The ID of the work item.
+   */
+  void SetStream(const StreamGuard &guard, uint64_t item) {
+    if (guard.stream_ >= 0) {
+      keyed_rng_.Reset(GlobalSeed(), static_cast<uint32_t>(guard.stream_), item);
+      // only copied once per thread and kernel call
+      if (keyed_active_ != guard.active_)
+        keyed_active_ = guard.active_;
+      keyed_ = true;
+    }
   }
 
   /*!
@@ -77,7 +252,7 @@ class RandomEngine {
   T RandInt(T lower, T upper) {
     CHECK_LT(lower, upper);
     std::uniform_int_distribution<T> dist(lower, upper - 1);
-    return dist(rng_);
+    return dist(Engine());
   }
 
   /*!
@@ -97,7 +272,7 @@ class RandomEngine {
     // www.cplusplus.com/reference/random/uniform_real_distribution/uniform_real_distribution/
     CHECK_LE(lower, upper);
     std::uniform_real_distribution<T> dist(lower, upper);
-    return dist(rng_);
+    return dist(Engine());
   }
 
   /*!
@@ -179,7 +354,40 @@ class RandomEngine {
   }
 
  private:
-  std::default_random_engine rng_;
+  // Reserved stream ID of the generators not in deterministic mode.
+  static constexpr uint32_t kThreadStream = std::numeric_limits<uint32_t>::max();
+
+  // The engine of the current work item in a keyed kernel, or the thread's own one.
+  PhiloxEngine &Engine() {
+    if (keyed_) {
+      if (keyed_active_->load(std::memory_order_relaxed))
+        return keyed_rng_;
+      keyed_ = false;
+      keyed_active_.reset();
+    }
+    return rng_;
+  }
+
+  static uint32_t &GlobalSeed() {
+    static uint32_t seed = std::random_device()();
+    return seed;
+  }
+
+  static std::atomic<bool> &Deterministic() {
+    static std::atomic<bool> deterministic(false);
+    return deterministic;
+  }
+
+  static std::atomic<uint64_t> &StreamCounter() {
+    static std::atomic<uint64_t> counter(0);
+    return counter;
+  }
+
+  PhiloxEngine rng_;
+  PhiloxEngine keyed_rng_;
+  // Whether the kernel call keying keyed_rng_ is still running.
+  std::shared_ptr<std::atomic<bool>> keyed_active_;
+  bool keyed_ = false;
 };
 
 };  // namespace dgl
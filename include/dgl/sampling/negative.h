@@ -0,0 +1,66 @@
+/*!
+ *  Copyright (c) 2021 by Contributors
+ * \file dgl/sampling/negative.h
+ * \brief Negative sampling.
+ */
+#ifndef DGL_SAMPLING_NEGATIVE_H_
+#define DGL_SAMPLING_NEGATIVE_H_
+
+#include <dgl/base_heterograph.h>
+#include <dgl/array.h>
+#include <utility>
+
+namespace dgl {
+namespace sampling {
+
+/*!
+ * \brief Build the alias table for drawing nodes with the given unnormalized
+ *        probabilities.
+ *
+ * The table is stored as the alias table of a CSR matrix with a single row.
+ *
+ * \param weights The unnormalized probability of every node.
+ * \param bits The bit width of the node IDs.
+ * \return The alias table.
+ */
+aten::CSRAliasTable BuildUnigramAliasTable(FloatArray weights, uint8_t bits);
+
+/*!
+ * \brief Generate negative examples by corrupting one endpoint of the given edges.
+ *
+ * For every edge, \c k negative examples are generated by replacing the destination
+ * (or the source) with a random node of the same type.
+ *
+ * \param hg The input graph.
+ * \param etype The edge type.
+ * \param fixed The endpoints to keep of the edges, i.e. the sources if \c corrupt_dst
+ *              is true and the destinations otherwise.
+ * \param keys The keys of the random streams of the edges in deterministic mode,
+ *             usually the edge IDs.
+ * \param k The number of negative examples per edge.
+ * \param corrupt_dst Whether to corrupt the destinations or the sources.
+ * \param table The alias table built by BuildUnigramAliasTable to draw the corrupted
+ *              nodes from.  If the arrays are empty, the nodes are drawn uniformly.
+ * \param exclude_positive If true, redraw the corrupted nodes of the negative examples
+ *                         that are edges in the graph a bounded number of times.  With
+ *                         shared negatives, such examples are removed instead.
+ * \param chunk_size If positive, the edges are split into chunks of this size, and the
+ *                   edges in the same chunk share the same \c k corrupted nodes.
+ * \return The fixed and the corrupted endpoints of the negative examples.  Without
+ *         removal, the examples of the i-th edge are stored in [i * k, (i + 1) * k).
+ */
+std::pair<IdArray, IdArray> NegativeSampling(
+    const HeteroGraphPtr hg,
+    dgl_type_t etype,
+    IdArray fixed,
+    IdArray keys,
+    int64_t k,
+    bool corrupt_dst,
+    const aten::CSRAliasTable& table,
+    bool exclude_positive,
+    int64_t chunk_size);
+
+}  // namespace sampling
+}  // namespace dgl
+
+#endif  // DGL_SAMPLING_NEGATIVE_H_
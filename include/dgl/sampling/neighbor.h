@@ -8,6 +8,7 @@
 
 #include <dgl/base_heterograph.h>
 #include <dgl/array.h>
+#include <tuple>
 #include <vector>
 
 namespace dgl {
@@ -31,6 +32,8 @@ namespace sampling {
  * \param probability A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
  * \param replace If true, sample with replacement.
+ * \param alias_tables Optional alias tables built by BuildAliasTable from \c probability
+ *        for each edge type. Edge types without alias tables sample from \c probability.
  * \return Sampled neighborhoods as a graph. The return graph has the same schema as the
  *         original one.
  */
@@ -40,7 +43,52 @@ HeteroSubgraph SampleNeighbors(
     const std::vector<int64_t>& fanouts,
     EdgeDir dir,
     const std::vector<FloatArray>& probability,
-    bool replace = true);
+    bool replace = true,
+    const std::vector<aten::CSRAliasTable>& alias_tables = {});
+
+/*!
+ * \brief Sample the inbound neighbors of the seed nodes for multiple layers and convert
+ *        the sampled frontier of every layer to a block in one call.
+ *
+ * Starting from the last layer, the frontier of every layer is sampled with
+ * SampleNeighbors and converted to a block with transform::ToBlock, whose input nodes
+ * become the seed nodes of the previous layer.
+ *
+ * \param hg The input graph.
+ * \param seeds Node IDs of each type of the output nodes of the last layer. The vector
+ *              length must be equal to the number of node types. Empty array is allowed.
+ * \param fanouts Number of sampled neighbors for each edge type of each layer, starting
+ *                from the first layer. -1 takes all the neighbors.
+ * \param replace If true, sample with replacement.
+ * \return For every layer starting from the first layer, the block, its input node IDs of
+ *         each type, and the IDs of its edges of each type in the input graph.
+ */
+std::vector<std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>>>
+SampleNeighborsToBlocks(
+    const HeteroGraphPtr hg,
+    const std::vector<IdArray>& seeds,
+    const std::vector<std::vector<int64_t>>& fanouts,
+    bool replace);
+
+/*!
+ * \brief Build the alias tables for weighted sampling of the neighbors of one edge type.
+ *
+ * The tables are aligned with the in-edge CSC (or out-edge CSR if \c dir is out) matrix
+ * of the edge type, so they can be reused by every SampleNeighbors and RandomWalk call on
+ * the same graph.
+ *
+ * \param hg The input graph.
+ * \param etype The edge type.
+ * \param dir Edge direction.
+ * \param probability The unnormalized probability of each edge of the edge type.
+ * \return The alias tables. Both arrays are empty if the graph is not allowed to
+ *         create the required sparse format.
+ */
+aten::CSRAliasTable BuildAliasTable(
+    const HeteroGraphPtr hg,
+    dgl_type_t etype,
+    EdgeDir dir,
+    FloatArray probability);
 
 /*!
  * Select the neighbors with k-largest weights on the connecting edges for each given node.
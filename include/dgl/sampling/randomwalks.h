@@ -10,6 +10,7 @@
 #include <dgl/array.h>
 #include <vector>
 #include <utility>
+#include <tuple>
 
 namespace dgl {
 
@@ -23,6 +24,8 @@ namespace sampling {
  * \param metapath A 1D array of edge types representing the metapath.
  * \param prob A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A pair of
  *         1. One 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *            paths that terminated early are padded with -1.
@@ -32,7 +35,8 @@ std::pair<IdArray, TypeArray> RandomWalk(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob);
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables = {});
 
 /*!
  * \brief Metapath-based random walk with restart probability.
@@ -43,6 +47,8 @@ std::pair<IdArray, TypeArray> RandomWalk(
  * \param prob A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
  * \param restart_prob Restart probability
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A pair of
  *         1. One 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *            paths that terminated early are padded with -1.
@@ -53,7 +59,8 @@ std::pair<IdArray, TypeArray> RandomWalkWithRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob);
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables = {});
 
 /*!
  * \brief Metapath-based random walk with stepwise restart probability.  Useful
@@ -66,6 +73,8 @@ std::pair<IdArray, TypeArray> RandomWalkWithRestart(
  *        each edge by edge type.  An empty float array assumes uniform transition.
  * \param restart_prob Restart probability array which has the same number of elements
  *        as \c metapath, indicating the probability to terminate after transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A pair of
  *         1. One 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *            paths that terminated early are padded with -1.
@@ -76,7 +85,81 @@ std::pair<IdArray, TypeArray> RandomWalkWithStepwiseRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob);
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables = {});
+
+/*!
+ * \brief Select the most visited nodes by metapath-based random walks from each seed.
+ *
+ * Visits are counted at the end of every traversal of the metapath in thread-local hash
+ * maps, so the traces are never materialized.  Ties are broken by node ID.
+ *
+ * \param hg The heterograph.
+ * \param seeds A 1D array of seed nodes, with the type the source type of the first
+ *        edge type in the metapath.
+ * \param metapath A 1D array of edge types of one traversal, which must start and end
+ *        at the same node type.
+ * \param prob A vector of 1D float arrays, indicating the transition probability of
+ *        each edge by edge type.  An empty float array assumes uniform transition.
+ * \param num_traversals The maximum number of traversals of a random walk.
+ * \param termination_prob The probability to terminate after each traversal.
+ * \param num_random_walks The number of random walks from each seed.
+ * \param k The number of nodes to select for each seed.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
+ * \return A tuple of the selected nodes, their seeds and their number of visits, sorted
+ *         by seed and then by decreasing number of visits.
+ */
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k,
+    const std::vector<aten::CSRAliasTable> &alias_tables = {});
+
+/*!
+ * \brief Node2vec random walk.
+ *
+ * The second-order transition probabilities are never materialized; each step proposes
+ * a successor from the first-order transition probability and accepts it with probability
+ * proportional to the search bias.
+ *
+ * \param hg The homogeneous graph.
+ * \param seeds A 1D array of seed nodes.
+ * \param p The return parameter.  The bias of returning to the previous node is 1/p.
+ * \param q The in-out parameter.  The bias of moving away from the previous node is 1/q.
+ * \param walk_length The length of each random walk path.
+ * \param prob A 1D float array, indicating the unnormalized transition probability of
+ *        each edge.  An empty float array assumes uniform transition.
+ * \param alias_table Alias tables of \c prob built on the out-edge CSR matrix.  They
+ *        are built on the fly if empty.
+ * \param sorted_indices The column indices of the out-edge CSR matrix sorted within
+ *        each row, used to test the adjacency to the previous node.  They are
+ *        computed on the fly if empty; see SortedCSRIndices.
+ * \return A 2D array of shape (len(seeds), walk_length + 1) with node IDs.  The
+ *         paths that terminated early are padded with -1.
+ */
+IdArray Node2vec(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t walk_length,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table = {},
+    const IdArray sorted_indices = aten::NullArray());
+
+/*!
+ * \brief Get the column indices of the out-edge CSR matrix of a homogeneous graph,
+ *        sorted within each row, so that they can be cached across Node2vec calls.
+ * \param hg The homogeneous graph.
+ * \return The sorted column indices.
+ */
+IdArray SortedCSRIndices(const HeteroGraphPtr hg);
 
 };  // namespace sampling
 
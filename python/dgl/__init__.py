@@ -8,17 +8,16 @@ and transforming graphs.
 # Windows compatibility
 # This initializes Winsock and performs cleanup at termination as required
 import socket
+import importlib
+import sys
 
 # Should import backend before importing anything else
 from .backend import load_backend, backend_name
 
 from . import function
-from . import contrib
 from . import container
-from . import distributed
 from . import random
 from . import sampling
-from . import dataloading
 from . import ops
 
 from ._ffi.runtime_ctypes import TypeCode
@@ -37,7 +36,36 @@ from .traversal import *
 from .transform import *
 from .propagate import *
 from .random import *
-from .data.utils import save_graphs, load_graphs
 
-from ._deprecate.graph import DGLGraph as DGLGraphStale
-from ._deprecate.nodeflow import *
+# Subpackages that are slow to import and not needed by most programs. They (and
+# the FFI functions they register) are imported on first attribute access.
+_LAZY_SUBMODULES = ['contrib', 'data', 'dataloading', 'distributed']
+# Attributes provided by lazily imported modules: name -> (module, attribute)
+_LAZY_ATTRS = {
+    'save_graphs': ('data.utils', 'save_graphs'),
+    'load_graphs': ('data.utils', 'load_graphs'),
+    'DGLGraphStale': ('_deprecate.graph', 'DGLGraph'),
+    'NodeFlow': ('_deprecate.nodeflow', 'NodeFlow'),
+}
+
+def _load_lazy(name):
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        module, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module('.' + module, __name__), attr)
+    globals()[name] = value
+    return value
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name in _LAZY_SUBMODULES or name in _LAZY_ATTRS:
+            return _load_lazy(name)
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRS))
+else:
+    # Module-level __getattr__ is not supported before Python 3.7 (PEP 562).
+    for _name in _LAZY_SUBMODULES + list(_LAZY_ATTRS):
+        _load_lazy(_name)
@@ -84,8 +84,10 @@ def invoke_edge_udf(graph, eid, etype, func, *, orig_eid=None):
 def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     """Invoke user-defined reduce function on all the nodes in the graph.
 
-    It analyzes the graph, groups nodes by their degrees and applies the UDF on each
-    group -- a strategy called *degree-bucketing*.
+    By default, it analyzes the graph, groups nodes by their degrees and applies the
+    UDF on each group -- a strategy called *degree-bucketing*. If the UDF is decorated
+    by :func:`dgl.udf.mailbox_layout` with the ``'padded'`` or ``'packed'`` layout,
+    the UDF is applied once on all the nodes instead.
 
     Parameters
     ----------
@@ -103,6 +105,10 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     dict[str, Tensor]
         Results from running the UDF.
     """
+    layout = getattr(func, 'mailbox_layout', 'bucket')
+    if layout != 'bucket':
+        return _invoke_udf_reduce_single(graph, func, msgdata, layout, orig_nid)
+
     degs = graph.in_degrees()
     nodes = graph.dstnodes()
     if orig_nid is None:
@@ -136,7 +142,9 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
             newshape = (len(node_bkt), deg) + F.shape(msg)[1:]
             maildata[k] = F.reshape(msg, newshape)
         # invoke udf
-        nbatch = NodeBatch(graph, orig_nid_bkt, ntype, ndata_bkt, msgs=maildata)
+        lengths = F.full_1d(len(node_bkt), int(deg), F.int64, F.context(node_bkt))
+        nbatch = NodeBatch(graph, orig_nid_bkt, ntype, ndata_bkt, msgs=maildata,
+                           msg_lengths=lengths)
         bkt_rsts.append(func(nbatch))
 
     # prepare a result frame
@@ -154,6 +162,77 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
 
     return retf
 
+def _invoke_udf_reduce_single(graph, func, msgdata, layout, orig_nid):
+    """Invoke user-defined reduce function once on all the nodes with incoming
+    messages, laying out the mailbox in the ``'padded'`` or ``'packed'`` layout.
+
+    The mailbox is built by one traversal of the edges sorted by destination.
+    See :func:`dgl.udf.mailbox_layout` for the layouts.
+    """
+    ntype = graph.dsttypes[0]
+    ntid = graph.get_ntype_id_from_dst(ntype)
+    dstdata = graph._node_frames[ntid]
+    num_dst = graph.number_of_dst_nodes()
+    ctx = graph.device
+
+    # incoming edges of each node ordered by edge ID, in CSR order
+    dst = F.asnumpy(graph.edges()[1]).astype(np.int64)
+    order = np.argsort(dst, kind='stable')
+    degs = np.bincount(dst, minlength=num_dst)
+    starts = np.cumsum(degs) - degs
+    nodes = np.nonzero(degs)[0]
+    if layout == 'packed':
+        # sort by decreasing degree, the order expected by packed sequences
+        nodes = nodes[np.argsort(-degs[nodes], kind='stable')]
+    node_degs = degs[nodes]
+    num_nodes = len(nodes)
+    num_edges = len(order)
+
+    # prepare a result frame
+    retf = Frame(num_rows=num_dst)
+    retf._initializers = dstdata._initializers
+    retf._default_initializer = dstdata._default_initializer
+    if num_nodes == 0:
+        # if all the nodes have zero degree, no need to invoke the UDF.
+        return retf
+
+    max_deg = int(node_degs.max())
+    # (row, step) of every message in the mailbox
+    row = np.repeat(np.arange(num_nodes), node_degs)
+    step = np.arange(num_edges) - np.repeat(np.cumsum(node_degs) - node_degs, node_degs)
+    eid = order[np.repeat(starts[nodes], node_degs) + step]
+
+    mask = batch_sizes = None
+    if layout == 'padded':
+        # padding slots read an extra all-zero message at position num_edges
+        index = np.full((num_nodes * max_deg,), num_edges, dtype=np.int64)
+        index[row * max_deg + step] = eid
+        mask = F.copy_to(F.tensor(index != num_edges, F.bool), ctx)
+    else:
+        # the first batch_sizes[t] nodes have a t-th message
+        batch_sizes = num_nodes - np.cumsum(np.bincount(node_degs, minlength=max_deg + 1))
+        batch_sizes = batch_sizes[:max_deg]
+        index = np.empty((num_edges,), dtype=np.int64)
+        index[(np.cumsum(batch_sizes) - batch_sizes)[step] + row] = eid
+        batch_sizes = F.tensor(batch_sizes, F.int64)
+    maildata = {}
+    for k, msg in msgdata.items():
+        msg_index = F.copy_to(F.tensor(index, F.int64), F.context(msg))
+        if layout == 'padded':
+            pad = F.zeros((1,) + F.shape(msg)[1:], F.dtype(msg), F.context(msg))
+            msg = F.gather_row(F.cat([msg, pad], 0), msg_index)
+            maildata[k] = F.reshape(msg, (num_nodes, max_deg) + F.shape(msg)[1:])
+        else:
+            maildata[k] = F.gather_row(msg, msg_index)
+
+    nodes = F.copy_to(F.tensor(nodes, graph.idtype), ctx)
+    orig_nid = nodes if orig_nid is None else F.gather_row(orig_nid, nodes)
+    lengths = F.copy_to(F.tensor(node_degs, F.int64), ctx)
+    nbatch = NodeBatch(graph, orig_nid, ntype, dstdata.subframe(nodes), msgs=maildata,
+                       msg_lengths=lengths, msg_mask=mask, msg_batch_sizes=batch_sizes)
+    retf.update_row(nodes, func(nbatch))
+    return retf
+
 def _bucketing(val):
     """Internal function to create groups on the values.
 
@@ -23,8 +23,9 @@ from .icews18 import ICEWS18, ICEWS18Dataset
 from .qm7b import QM7b, QM7bDataset
 from .dgl_dataset import DGLDataset, DGLBuiltinDataset
 from .citation_graph import CoraGraphDataset, CiteseerGraphDataset, PubmedGraphDataset
-from .knowledge_graph import FB15k237Dataset, FB15kDataset, WN18Dataset
+from .knowledge_graph import FB15k237Dataset, FB15kDataset, WN18Dataset, load_kg_triplets
 from .rdf import AIFBDataset, MUTAGDataset, BGSDataset, AMDataset
+from .mmap_graph import save_mmap_graphs, MmapGraphDataset
 
 
 def register_data_args(parser):
@@ -14,6 +14,7 @@ from .dgl_dataset import DGLBuiltinDataset
 from .utils import loadtxt, save_graphs, load_graphs, save_info, load_info, download, extract_archive
 from ..utils import retry_method_with_fix
 from ..convert import graph as dgl_graph
+from ..batch import unbatch
 
 
 class GINDataset(DGLBuiltinDataset):
@@ -131,6 +132,18 @@ class GINDataset(DGLBuiltinDataset):
         """
         return self.graphs[idx], self.labels[idx]
 
+    @staticmethod
+    def _relabel(raw):
+        """Map the raw labels to consecutive IDs in the order of their first occurrence.
+
+        Returns the mapping dict and the mapped labels."""
+        uniq, first, inverse = np.unique(raw, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        mapping = {int(uniq[i]): int(rank[i]) for i in order}
+        return mapping, rank[inverse]
+
     def _file_path(self):
         return os.path.join(self.raw_dir, "GINDataset", 'dataset', self.name, "{}.txt".format(self.name))
 
@@ -141,91 +154,82 @@ class GINDataset(DGLBuiltinDataset):
             print('loading data...')
         self.file = self._file_path()
         with open(self.file, 'r') as f:
-            # line_1 == N, total number of graphs
-            self.N = int(f.readline().strip())
-
-            for i in range(self.N):
-                if (i + 1) % 10 == 0 and self.verbose is True:
-                    print('processing graph {}...'.format(i + 1))
-
-                grow = f.readline().strip().split()
-                # line_2 == [n_nodes, l] is equal to
-                # [node number of a graph, class label of a graph]
-                n_nodes, glabel = [int(w) for w in grow]
-
-                # relabel graphs
-                if glabel not in self.glabel_dict:
-                    mapped = len(self.glabel_dict)
-                    self.glabel_dict[glabel] = mapped
-
-                self.labels.append(self.glabel_dict[glabel])
-
-                g = dgl_graph(([], []))
-                g.add_nodes(n_nodes)
-
-                nlabels = []  # node labels
-                nattrs = []  # node attributes if it has
-                m_edges = 0
-
-                for j in range(n_nodes):
-                    nrow = f.readline().strip().split()
-
-                    # handle edges and attributes(if has)
-                    tmp = int(nrow[1]) + 2  # tmp == 2 + #edges
-                    if tmp == len(nrow):
-                        # no node attributes
-                        nrow = [int(w) for w in nrow]
-                        nattr = None
-                    elif tmp > len(nrow):
-                        nrow = [int(w) for w in nrow[:tmp]]
-                        nattr = [float(w) for w in nrow[tmp:]]
-                        nattrs.append(nattr)
-                    else:
-                        raise Exception('edge number is incorrect!')
-
-                    # relabel nodes if it has labels
-                    # if it doesn't have node labels, then every nrow[0]==0
-                    if not nrow[0] in self.nlabel_dict:
-                        mapped = len(self.nlabel_dict)
-                        self.nlabel_dict[nrow[0]] = mapped
-
-                    nlabels.append(self.nlabel_dict[nrow[0]])
-
-                    m_edges += nrow[1]
-                    g.add_edges(j, nrow[2:])
-
-                    # add self loop
-                    if self.self_loop:
-                        m_edges += 1
-                        g.add_edges(j, j)
-
-                    if (j + 1) % 10 == 0 and self.verbose is True:
-                        print(
-                            'processing node {} of graph {}...'.format(
-                                j + 1, i + 1))
-                        print('this node has {} edgs.'.format(
-                            nrow[1]))
-
-                if nattrs != []:
-                    nattrs = np.stack(nattrs)
-                    g.ndata['attr'] = F.tensor(nattrs)
-                    self.nattrs_flag = True
-                else:
-                    nattrs = None
-
-                g.ndata['label'] = F.tensor(nlabels)
-                if len(self.nlabel_dict) > 1:
-                    self.nlabels_flag = True
-
-                assert g.number_of_nodes() == n_nodes
-
-                # update statistics of graphs
-                self.n += n_nodes
-                self.m += m_edges
-
-                self.graphs.append(g)
-
-        self.labels = F.tensor(self.labels)
+            lines = f.read().strip().split('\n')
+        # line_1 == N, total number of graphs
+        self.N = int(lines[0].strip())
+
+        # line_2 == [n_nodes, l] is equal to
+        # [node number of a graph, class label of a graph],
+        # followed by one line per node. Only the graph headers are walked here,
+        # all the node lines are parsed at once below.
+        batch_num_nodes = np.zeros((self.N,), dtype=np.int64)
+        glabels = np.zeros((self.N,), dtype=np.int64)
+        node_rows = []
+        pos = 1
+        for i in range(self.N):
+            n_nodes, glabel = [int(w) for w in lines[pos].strip().split()]
+            batch_num_nodes[i] = n_nodes
+            glabels[i] = glabel
+            node_rows.extend(lines[pos + 1:pos + 1 + n_nodes])
+            pos += n_nodes + 1
+        if self.verbose:
+            print('processing {} graphs...'.format(self.N))
+
+        # every node line is [node label, #edges, neighbors..., attributes...]
+        node_rows = [row.split() for row in node_rows]
+        row_len = np.array([len(row) for row in node_rows], dtype=np.int64)
+        tokens = np.array([w for row in node_rows for w in row], dtype=np.float64)
+        row_start = np.cumsum(row_len) - row_len
+        num_nodes = len(node_rows)
+        assert num_nodes == int(batch_num_nodes.sum())
+        if np.any(row_len < 2):
+            raise Exception('edge number is incorrect!')
+        raw_nlabels = tokens[row_start].astype(np.int64)
+        degrees = tokens[row_start + 1].astype(np.int64)
+        num_attrs = row_len - degrees - 2
+        if np.any(num_attrs < 0):
+            raise Exception('edge number is incorrect!')
+
+        # relabel graphs and nodes in the order of first occurrence
+        self.glabel_dict, glabels = self._relabel(glabels)
+        self.labels = F.tensor(glabels)
+        # if it doesn't have node labels, then every node label is 0
+        self.nlabel_dict, nlabels = self._relabel(raw_nlabels)
+        if len(self.nlabel_dict) > 1:
+            self.nlabels_flag = True
+
+        # the neighbors of a node are followed by its self loop if required
+        node_offset = np.repeat(np.cumsum(batch_num_nodes) - batch_num_nodes, batch_num_nodes)
+        num_loops = 1 if self.self_loop else 0
+        seg_len = degrees + num_loops
+        seg_start = np.cumsum(seg_len) - seg_len
+        nbr_idx = np.arange(degrees.sum()) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+        nbrs = tokens[np.repeat(row_start + 2, degrees) + nbr_idx].astype(np.int64)
+        src = np.repeat(np.arange(num_nodes), seg_len)
+        dst = np.empty_like(src)
+        dst[np.repeat(seg_start, degrees) + nbr_idx] = nbrs + np.repeat(node_offset, degrees)
+        if self.self_loop:
+            dst[seg_start + degrees] = np.arange(num_nodes)
+        graph_ids = np.repeat(np.arange(self.N), batch_num_nodes)
+        batch_num_edges = np.bincount(graph_ids[src], minlength=self.N)
+
+        # update statistics of graphs
+        self.n = num_nodes
+        self.m = len(src)
+
+        g = dgl_graph((F.tensor(src), F.tensor(dst)), num_nodes=num_nodes)
+        g.set_batch_num_nodes(F.tensor(batch_num_nodes))
+        g.set_batch_num_edges(F.tensor(batch_num_edges))
+        g.ndata['label'] = F.tensor(nlabels)
+
+        if np.any(num_attrs > 0):
+            if np.any(num_attrs != num_attrs[0]):
+                raise Exception('node attributes must have the same dimension!')
+            dim = int(num_attrs[0])
+            attr_idx = (row_start + 2 + degrees)[:, None] + np.arange(dim)[None, :]
+            g.ndata['attr'] = F.tensor(tokens[attr_idx])
+            self.nattrs_flag = True
+
         # if no attr
         if not self.nattrs_flag:
             if self.verbose:
@@ -235,19 +239,14 @@ class GINDataset(DGLBuiltinDataset):
             if self.degree_as_nlabel:
                 if self.verbose:
                     print('generate node features by node degree...')
-                for g in self.graphs:
-                    # actually this label shouldn't be updated
-                    # in case users want to keep it
-                    # but usually no features means no labels, fine.
-                    g.ndata['label'] = g.in_degrees()
-                    # extracting unique node labels
+                # actually this label shouldn't be updated
+                # in case users want to keep it
+                # but usually no features means no labels, fine.
+                g.ndata['label'] = g.in_degrees()
 
             # in case the labels/degrees are not continuous number
-            nlabel_set = set([])
-            for g in self.graphs:
-                nlabel_set = nlabel_set.union(
-                    set([F.as_scalar(nl) for nl in g.ndata['label']]))
-            nlabel_set = list(nlabel_set)
+            node_labels = F.asnumpy(g.ndata['label'])
+            nlabel_set = np.unique(node_labels).tolist()
             is_label_valid = all([label in self.nlabel_dict for label in nlabel_set])
             if is_label_valid and len(nlabel_set) == np.max(nlabel_set) + 1 and np.min(nlabel_set) == 0:
                 # Note this is different from the author's implementation. In weihua916's implementation,
@@ -260,12 +259,15 @@ class GINDataset(DGLBuiltinDataset):
                     for i in range(len(nlabel_set))
                 }
             # generate node attr by node label
-            for g in self.graphs:
-                attr = np.zeros((
-                    g.number_of_nodes(), len(label2idx)))
-                attr[range(g.number_of_nodes()), [label2idx[nl]
-                                                  for nl in F.asnumpy(g.ndata['label']).tolist()]] = 1
-                g.ndata['attr'] = F.tensor(attr)
+            lookup = np.zeros((int(np.max(nlabel_set)) + 1,), dtype=np.int64)
+            for label, idx in label2idx.items():
+                if 0 <= label < len(lookup):
+                    lookup[label] = idx
+            attr = np.zeros((num_nodes, len(label2idx)))
+            attr[np.arange(num_nodes), lookup[node_labels]] = 1
+            g.ndata['attr'] = F.tensor(attr)
+
+        self.graphs = unbatch(g)
 
         # after load, get the #classes and #dim
         self.gclasses = len(self.glabel_dict)
@@ -75,7 +75,7 @@ class GraphData(ObjectBase):
         return g
 
 
-def save_graphs(filename, g_list, labels=None):
+def save_graphs(filename, g_list, labels=None, append=False):
     r"""Save graphs and optionally their labels to file.
 
     Besides saving to local files, DGL supports writing the graphs directly
@@ -94,6 +94,13 @@ def save_graphs(filename, g_list, labels=None):
         The graphs to be saved.
     labels: dict[str, Tensor]
         labels should be dict of tensors, with str as keys
+    append : bool, optional
+        If True and the file exists, add the graphs to the end of the file
+        instead of overwriting it. The graphs and labels already stored are not
+        rewritten; only the new graphs, their labels and a small index block are
+        written. When loading, the labels are concatenated to the stored labels
+        along the first dimension, so they must have the same keys. Only local
+        files support appending. Default: False.
 
     Examples
     ----------
@@ -113,6 +120,11 @@ def save_graphs(filename, g_list, labels=None):
     >>> graph_labels = {"glabel": th.tensor([0, 1])}
     >>> save_graphs("./data.bin", [g1, g2], graph_labels)
 
+    Add one more graph to the file
+
+    >>> g3 = dgl.graph(([0], [1]))
+    >>> save_graphs("./data.bin", [g3], {"glabel": th.tensor([2])}, append=True)
+
     See Also
     --------
     load_graphs
@@ -125,9 +137,19 @@ def save_graphs(filename, g_list, labels=None):
         if f_path and not os.path.exists(f_path):
             os.makedirs(f_path)
 
+    if append and not is_local_path(filename):
+        raise DGLError("Only local files support appending graphs.")
+    if append and os.path.exists(filename):
+        version = _CAPI_GetFileVersion(filename)
+        if version not in (2, 3):
+            raise DGLError("Graphs can only be appended to files saved by the current format. "
+                           "Please save the file again without appending.")
+    else:
+        append = False
+
     g_sample = g_list[0] if isinstance(g_list, list) else g_list
     if type(g_sample) == DGLHeteroGraph:  # Doesn't support DGLHeteroGraph's derived class
-        save_heterographs(filename, g_list, labels)
+        save_heterographs(filename, g_list, labels, append)
     else:
         raise DGLError(
             "Invalid argument g_list. Must be a DGLGraph or a list of DGLGraphs.")
@@ -152,7 +174,8 @@ def load_graphs(filename, idx_list=None):
     Returns
     --------
     graph_list: list[DGLGraph]
-        The loaded graphs.
+        The loaded graphs. For files appended to by :func:`save_graphs`, the
+        latest index is used, so the graphs of all the appends are returned.
     labels: dict[str, Tensor]
         The graph labels stored in file. If no label is stored, the dictionary is empty.
         Regardless of whether the ``idx_list`` argument is given or not,
@@ -178,7 +201,7 @@ def load_graphs(filename, idx_list=None):
             "You are loading a graph file saved by old version of dgl.  \
             Please consider saving it again with the current format.")
         return load_graph_v1(filename, idx_list)
-    elif version == 2:
+    elif version in (2, 3):
         return load_graph_v2(filename, idx_list)
     else:
         raise DGLError("Invalid DGL Version Number.")
@@ -235,7 +258,7 @@ def load_labels(filename):
     version = _CAPI_GetFileVersion(filename)
     if version == 1:
         return load_labels_v1(filename)
-    elif version == 2:
+    elif version in (2, 3):
         return load_labels_v2(filename)
     else:
         raise Exception("Invalid DGL Version Number")
@@ -18,15 +18,18 @@ def tensor_dict_to_ndarray_dict(tensor_dict):
     return convert_to_strmap(ndarray_dict)
 
 
-def save_heterographs(filename, g_list, labels):
-    """Save heterographs into file"""
+def save_heterographs(filename, g_list, labels, append=False):
+    """Save heterographs into file, or append them to an existing file"""
     if labels is None:
         labels = {}
     if isinstance(g_list, DGLHeteroGraph):
         g_list = [g_list]
     assert all([type(g) == DGLHeteroGraph for g in g_list]), "Invalid DGLHeteroGraph in g_list argument"
     gdata_list = [HeteroGraphData.create(g) for g in g_list]
-    _CAPI_SaveHeteroGraphData(filename, gdata_list, tensor_dict_to_ndarray_dict(labels))
+    if append:
+        _CAPI_AppendHeteroGraphData(filename, gdata_list, tensor_dict_to_ndarray_dict(labels))
+    else:
+        _CAPI_SaveHeteroGraphData(filename, gdata_list, tensor_dict_to_ndarray_dict(labels))
 
 @register_object("heterograph_serialize.HeteroGraphData")
 class HeteroGraphData(ObjectBase):
@@ -5,6 +5,7 @@ import pickle as pkl
 import networkx as nx
 import scipy.sparse as sp
 import os, sys
+import hashlib
 
 from .dgl_dataset import DGLBuiltinDataset
 from .utils import download, extract_archive, get_download_dir
@@ -67,9 +68,8 @@ class KnowledgeGraphDataset(DGLBuiltinDataset):
         test_path = os.path.join(root_path, 'test.txt')
         entity_dict = _read_dictionary(entity_path)
         relation_dict = _read_dictionary(relation_path)
-        train = np.asarray(_read_triplets_as_list(train_path, entity_dict, relation_dict))
-        valid = np.asarray(_read_triplets_as_list(valid_path, entity_dict, relation_dict))
-        test = np.asarray(_read_triplets_as_list(test_path, entity_dict, relation_dict))
+        (train, valid, test), _, _ = load_kg_triplets([train_path, valid_path, test_path],
+                                                      entity_dict, relation_dict)
         num_nodes = len(entity_dict)
         num_rels = len(relation_dict)
         if self.verbose:
@@ -205,126 +205,210 @@ def _read_dictionary(filename):
             d[line[1]] = int(line[0])
     return d
 
-def _read_triplets(filename):
-    with open(filename, 'r+') as f:
-        for line in f:
-            processed_line = line.strip().split('\t')
-            yield processed_line
-
-def _read_triplets_as_list(filename, entity_dict, relation_dict):
-    l = []
-    for triplet in _read_triplets(filename):
-        s = entity_dict[triplet[0]]
-        r = relation_dict[triplet[1]]
-        o = entity_dict[triplet[2]]
-        l.append([s, r, o])
-    return l
+def _factorize(values):
+    """Encode values as IDs in the order of their first occurrence.
+
+    A hash table (``pandas.factorize``) is used when pandas is installed.
+
+    Returns
+    -------
+    numpy.ndarray
+        The ID of each value.
+    numpy.ndarray
+        The unique values indexed by ID.
+    """
+    try:
+        import pandas as pd
+        codes, uniques = pd.factorize(values)
+        return codes.astype(np.int64), np.asarray(uniques, dtype=str)
+    except ImportError:
+        uniques, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return rank[inverse].astype(np.int64), uniques[order]
+
+def _split_triplet_file(filename, chunk_size):
+    """Split a file into byte ranges of about chunk_size bytes."""
+    size = os.path.getsize(filename)
+    starts = list(range(0, max(size, 1), chunk_size))
+    return [(filename, start, min(start + chunk_size, size)) for start in starts]
+
+def _read_triplet_chunk(chunk):
+    """Parse and locally factorize the lines starting in the byte range [start, end).
+
+    Returns the (head, tail) entity codes, the local unique entity names, the
+    relation codes and the local unique relation names.
+    """
+    filename, start, end = chunk
+    with open(filename, 'rb') as f:
+        if start > 0:
+            # skip the line started in the previous chunk
+            f.seek(start - 1)
+            if f.read(1) != b'\n':
+                f.readline()
+        pos = f.tell()
+        buf = f.read(max(end - pos, 0))
+        if buf and not buf.endswith(b'\n'):
+            buf += f.readline()
+    if not buf.strip():
+        triplets = np.zeros((0, 3), dtype=str)
+    else:
+        try:
+            import io
+            import csv
+            import pandas as pd
+            triplets = pd.read_csv(io.BytesIO(buf), sep='\t', header=None, dtype=str,
+                                   quoting=csv.QUOTE_NONE, usecols=[0, 1, 2],
+                                   keep_default_na=False, skip_blank_lines=True).values
+        except ImportError:
+            triplets = np.array([line.strip().split('\t')[:3]
+                                 for line in buf.decode('utf-8').split('\n') if line.strip()],
+                                dtype=str)
+    num = triplets.shape[0]
+    ent_codes, ent_names = _factorize(np.concatenate([triplets[:, 0], triplets[:, 2]]))
+    rel_codes, rel_names = _factorize(triplets[:, 1])
+    return ent_codes[:num], ent_codes[num:], ent_names, rel_codes, rel_names
+
+def _merge_codes(local_names, name_dict):
+    """Map the local unique names of all the chunks to global IDs.
+
+    Returns the global IDs of the local names of every chunk and the global names.
+    """
+    codes, names = _factorize(np.concatenate(local_names))
+    if name_dict is not None:
+        ids = np.array([name_dict[name] for name in names], dtype=np.int64)
+        codes = ids[codes]
+        names = np.array(sorted(name_dict, key=name_dict.get), dtype=str)
+    offsets = np.cumsum([0] + [len(n) for n in local_names])
+    return [codes[offsets[i]:offsets[i + 1]] for i in range(len(local_names))], names
+
+def _file_stats(filenames):
+    return np.array([[os.path.getsize(fn), int(os.path.getmtime(fn))] for fn in filenames],
+                    dtype=np.int64)
+
+def _dict_digest(*name_dicts):
+    """Return a digest of the name to ID mappings, which decide the cached IDs."""
+    digest = hashlib.sha1()
+    for name_dict in name_dicts:
+        if name_dict is None:
+            digest.update(b'\0')
+            continue
+        digest.update(b'\1')
+        for name, idx in sorted(name_dict.items()):
+            digest.update('{}\t{}\n'.format(name, idx).encode('utf-8'))
+    return digest.hexdigest()
+
+def load_kg_triplets(filenames, entity_dict=None, relation_dict=None, num_workers=1,
+                     chunk_size=1 << 26, cache_path=None):
+    """Load knowledge graph triplets from tab-separated files.
+
+    Every line of the files is a ``head<TAB>relation<TAB>tail`` triplet. The files are
+    split into chunks of about ``chunk_size`` bytes that are parsed and factorized one
+    by one, or by a pool of ``num_workers`` processes. The entity and relation names of all the chunks are then
+    mapped to IDs at once, so the names are never looked up line by line.
+
+    Parameters
+    ----------
+    filenames : list[str]
+        The triplet files, e.g., the training, validation and test sets.
+    entity_dict : dict[str, int], optional
+        The ID of every entity name. If not given, the entities are numbered
+        consecutively from 0.
+    relation_dict : dict[str, int], optional
+        The ID of every relation name. If not given, the relations are numbered
+        consecutively from 0.
+    num_workers : int, optional
+        The number of processes. If greater than 1, the chunks are parsed by a
+        ``multiprocessing`` pool. Default: 1, i.e., the chunks are parsed in the
+        calling process.
+    chunk_size : int, optional
+        The number of bytes parsed by a worker at a time. Default: 64MB.
+    cache_path : str, optional
+        If given, the result is saved to this ``.npz`` file and loaded from it as long
+        as the triplet files are not modified and the same ``entity_dict`` and
+        ``relation_dict`` are given.
+
+    Returns
+    -------
+    list[numpy.ndarray]
+        For each file, the triplets as an int64 array of shape (N, 3) whose columns are
+        the head entity, the relation and the tail entity.
+    numpy.ndarray
+        The entity names indexed by entity ID.
+    numpy.ndarray
+        The relation names indexed by relation ID.
+    """
+    stats = _file_stats(filenames)
+    # The IDs do not depend on chunk_size, since the names are numbered in the
+    # order of their first occurrence in any case.
+    digest = _dict_digest(entity_dict, relation_dict)
+    if cache_path is not None and os.path.exists(cache_path):
+        cache = np.load(cache_path)
+        if np.array_equal(cache['file_stats'], stats) and 'dict_digest' in cache.files \
+                and str(cache['dict_digest']) == digest:
+            return [cache['triplets_{}'.format(i)] for i in range(len(filenames))], \
+                cache['entities'], cache['relations']
+
+    chunks = []
+    chunk_file = []
+    for i, filename in enumerate(filenames):
+        file_chunks = _split_triplet_file(filename, chunk_size)
+        chunks.extend(file_chunks)
+        chunk_file.extend([i] * len(file_chunks))
+    if num_workers is not None and num_workers > 1 and len(chunks) > 1:
+        import multiprocessing as mp
+        with mp.Pool(min(num_workers, len(chunks))) as pool:
+            results = pool.map(_read_triplet_chunk, chunks)
+    else:
+        results = [_read_triplet_chunk(chunk) for chunk in chunks]
+
+    ent_map, entities = _merge_codes([res[2] for res in results], entity_dict)
+    rel_map, relations = _merge_codes([res[4] for res in results], relation_dict)
+    parts = [[] for _ in filenames]
+    for i, (heads, tails, _, rels, _) in enumerate(results):
+        parts[chunk_file[i]].append(
+            np.stack([ent_map[i][heads], rel_map[i][rels], ent_map[i][tails]], 1))
+    triplets = [np.concatenate(part) for part in parts]
+
+    if cache_path is not None:
+        arrays = {'triplets_{}'.format(i): t for i, t in enumerate(triplets)}
+        with open(cache_path, 'wb') as f:
+            np.savez(f, file_stats=stats, dict_digest=np.array(digest), entities=entities,
+                     relations=relations, **arrays)
+    return triplets, entities, relations
 
 def build_knowledge_graph(num_nodes, num_rels, train, valid, test, reverse=True):
     """ Create a DGL Homogeneous graph with heterograph info stored as node or edge features.
+
+    The edges are grouped by relation type, in the order of the first occurrence of each
+    relation, followed by the reverse edges in the same order if ``reverse`` is True.
     """
-    src = []
-    rel = []
-    dst = []
-    raw_subg = {}
-    raw_subg_eset = {}
-    raw_subg_etype = {}
-    raw_reverse_sugb = {}
-    raw_reverse_subg_eset = {}
-    raw_reverse_subg_etype = {}
-
-    # here there is noly one node type
-    s_type = "node"
-    d_type = "node"
-
-    def add_edge(s, r, d, reverse, edge_set):
-        r_type = str(r)
-        e_type = (s_type, r_type, d_type)
-        if raw_subg.get(e_type, None) is None:
-            raw_subg[e_type] = ([], [])
-            raw_subg_eset[e_type] = []
-            raw_subg_etype[e_type] = []
-        raw_subg[e_type][0].append(s)
-        raw_subg[e_type][1].append(d)
-        raw_subg_eset[e_type].append(edge_set)
-        raw_subg_etype[e_type].append(r)
-
-        if reverse is True:
-            r_type = str(r + num_rels)
-            re_type = (d_type, r_type, s_type)
-            if raw_reverse_sugb.get(re_type, None) is None:
-                raw_reverse_sugb[re_type] = ([], [])
-                raw_reverse_subg_etype[re_type] = []
-                raw_reverse_subg_eset[re_type] = []
-            raw_reverse_sugb[re_type][0].append(d)
-            raw_reverse_sugb[re_type][1].append(s)
-            raw_reverse_subg_eset[re_type].append(edge_set)
-            raw_reverse_subg_etype[re_type].append(r + num_rels)
-
-    for edge in train:
-        s, r, d = edge
-        assert r < num_rels
-        add_edge(s, r, d, reverse, 1) # train set
-
-    for edge in valid:
-        s, r, d = edge
-        assert r < num_rels
-        add_edge(s, r, d, reverse, 2) # valid set
-
-    for edge in test:
-        s, r, d = edge
-        assert r < num_rels
-        add_edge(s, r, d, reverse, 3) # test set
-
-    subg = []
-    fg_s = []
-    fg_d = []
-    fg_etype = []
-    fg_settype = []
-    for e_type, val in raw_subg.items():
-        s, d = val
-        s = np.asarray(s)
-        d = np.asarray(d)
-        etype = raw_subg_etype[e_type]
-        etype = np.asarray(etype)
-        settype = raw_subg_eset[e_type]
-        settype = np.asarray(settype)
-
-        fg_s.append(s)
-        fg_d.append(d)
-        fg_etype.append(etype)
-        fg_settype.append(settype)
-
-    settype = np.concatenate(fg_settype)
+    triplets = [np.asarray(t, dtype=np.int64).reshape(-1, 3) for t in (train, valid, test)]
+    # 1: train set, 2: valid set, 3: test set
+    settype = np.concatenate([np.full((len(t),), i + 1) for i, t in enumerate(triplets)])
+    s, r, d = np.concatenate(triplets).T
+    assert np.all(r < num_rels)
+
+    # stable sort by the first occurrence of the relation types
+    _, first, inverse = np.unique(r, return_index=True, return_inverse=True)
+    rank = np.empty_like(first)
+    rank[np.argsort(first)] = np.arange(len(first))
+    order = np.argsort(rank[inverse], kind='stable')
+    s, r, d, settype = s[order], r[order], d[order], settype[order]
+
+    edge_settype = settype
     if reverse is True:
-        settype = np.concatenate([settype, np.full((settype.shape[0]), 0)])
-    train_edge_mask = generate_mask_tensor(settype == 1)
-    valid_edge_mask = generate_mask_tensor(settype == 2)
-    test_edge_mask = generate_mask_tensor(settype == 3)
-
-    for e_type, val in raw_reverse_sugb.items():
-        s, d = val
-        s = np.asarray(s)
-        d = np.asarray(d)
-        etype = raw_reverse_subg_etype[e_type]
-        etype = np.asarray(etype)
-        settype = raw_reverse_subg_eset[e_type]
-        settype = np.asarray(settype)
-
-        fg_s.append(s)
-        fg_d.append(d)
-        fg_etype.append(etype)
-        fg_settype.append(settype)
-
-    s = np.concatenate(fg_s)
-    d = np.concatenate(fg_d)
+        s, d = np.concatenate([s, d]), np.concatenate([d, s])
+        r = np.concatenate([r, r + num_rels])
+        edge_settype = np.concatenate([settype, np.full((settype.shape[0]), 0)])
+        settype = np.concatenate([settype, settype])
+    train_edge_mask = generate_mask_tensor(edge_settype == 1)
+    valid_edge_mask = generate_mask_tensor(edge_settype == 2)
+    test_edge_mask = generate_mask_tensor(edge_settype == 3)
+
     g = dgl_graph((s, d), num_nodes=num_nodes)
-    etype = np.concatenate(fg_etype)
-    settype = np.concatenate(fg_settype)
-    etype = F.tensor(etype, dtype=F.data_type_dict['int64'])
-    train_edge_mask = train_edge_mask
-    valid_edge_mask = valid_edge_mask
-    test_edge_mask = test_edge_mask
+    etype = F.tensor(r, dtype=F.data_type_dict['int64'])
     train_mask = generate_mask_tensor(settype == 1) if reverse is True else train_edge_mask
     valid_mask = generate_mask_tensor(settype == 2) if reverse is True else valid_edge_mask
     test_mask = generate_mask_tensor(settype == 3) if reverse is True else test_edge_mask
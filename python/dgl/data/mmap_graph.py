@@ -0,0 +1,299 @@
+"""Memory-mapped storage for large collections of small graphs.
+
+All the graphs of a collection are stored as one concatenated COO edge list and
+concatenated node/edge feature arrays, together with the node and edge offsets of
+every graph. The arrays are memory-mapped when loading, so opening a collection
+is cheap regardless of its size and a graph (or a batch of graphs) is only
+materialized when it is accessed.
+
+Layout of the storage directory::
+
+    meta.json           # number of graphs, ID type, feature schemes
+    node_offsets.bin    # int64, (num_graphs + 1,)
+    edge_offsets.bin    # int64, (num_graphs + 1,)
+    src.bin, dst.bin    # ID type, (total_num_edges,), node IDs local to each graph
+    ndata_<i>.bin       # i-th node feature, (total_num_nodes, *)
+    edata_<i>.bin       # i-th edge feature, (total_num_edges, *)
+    label_<i>.bin       # i-th graph label, (num_graphs, *)
+"""
+from __future__ import absolute_import
+
+import json
+import numbers
+import os
+
+import numpy as np
+
+from .. import backend as F
+from ..base import DGLError
+from ..convert import graph as dgl_graph
+
+__all__ = ['save_mmap_graphs', 'MmapGraphDataset']
+
+_META_FILE = 'meta.json'
+_VERSION = 1
+
+def _scheme(arr):
+    """Data type and per-row shape of a numpy array."""
+    return {'dtype': arr.dtype.str, 'shape': list(arr.shape[1:])}
+
+class _FeatureWriter(object):
+    """Append the features of a kind (ndata, edata or label) to binary files."""
+    def __init__(self, path, prefix):
+        self._path = path
+        self._prefix = prefix
+        self._names = None
+        self._schemes = {}
+        self._files = {}
+
+    def write(self, feats):
+        """Append a chunk of features given as a dict of numpy arrays."""
+        if self._names is None:
+            self._names = sorted(feats.keys())
+            for i, name in enumerate(self._names):
+                self._schemes[name] = _scheme(feats[name])
+                self._files[name] = open(os.path.join(
+                    self._path, '{}_{}.bin'.format(self._prefix, i)), 'wb')
+        if sorted(feats.keys()) != self._names:
+            raise DGLError('Expect all the graphs to have {} features {}, got {}.'.format(
+                self._prefix, self._names, sorted(feats.keys())))
+        for name in self._names:
+            arr = feats[name]
+            if _scheme(arr) != self._schemes[name]:
+                raise DGLError('Expect {} feature "{}" to have scheme {}, got {}.'.format(
+                    self._prefix, name, self._schemes[name], _scheme(arr)))
+            self._files[name].write(np.ascontiguousarray(arr).tobytes())
+
+    def close(self):
+        """Close the files and return the feature schemes."""
+        for f in self._files.values():
+            f.close()
+        return [[name, self._schemes[name]] for name in (self._names or [])]
+
+def _concat_feats(graphs, kind):
+    """Concatenate the node or edge features of a chunk of graphs."""
+    keys = sorted(getattr(graphs[0], kind).keys())
+    for g in graphs:
+        if sorted(getattr(g, kind).keys()) != keys:
+            raise DGLError('Expect all the graphs to have {} features {}, got {}.'.format(
+                kind, keys, sorted(getattr(g, kind).keys())))
+    return {k: np.concatenate([F.asnumpy(getattr(g, kind)[k]) for g in graphs], 0)
+            for k in keys}
+
+def save_mmap_graphs(path, graphs, labels=None, chunk_size=1024):
+    """Save a collection of homogeneous graphs for memory-mapped loading by
+    :class:`MmapGraphDataset`.
+
+    The graphs are written chunk by chunk, so ``graphs`` can be a generator over
+    a collection that does not fit in memory.
+
+    Parameters
+    ----------
+    path : str
+        Directory to save the graphs to. It is created if it does not exist.
+    graphs : iterable[DGLGraph]
+        The graphs. They must have the same ID type and the same node and edge
+        feature names, data types and feature shapes.
+    labels : dict[str, Tensor], optional
+        Graph-level labels. The first dimension of each tensor must be equal
+        to the number of graphs.
+    chunk_size : int, optional
+        Number of graphs written at a time.
+
+    Examples
+    --------
+    >>> dgl.data.save_mmap_graphs('./mols', graphs, {'y': labels})
+    >>> dataset = dgl.data.MmapGraphDataset('./mols')
+    >>> g, label = dataset[0]
+    >>> bg, label = dataset[0:32]   # a batched graph of 32 graphs
+    """
+    if not os.path.exists(path):
+        os.makedirs(path)
+    num_nodes = [np.zeros((1,), dtype=np.int64)]
+    num_edges = [np.zeros((1,), dtype=np.int64)]
+    idtype = None
+    ndata_writer = _FeatureWriter(path, 'ndata')
+    edata_writer = _FeatureWriter(path, 'edata')
+
+    def _write_chunk(chunk, src_f, dst_f):
+        for g in chunk:
+            if len(g.ntypes) != 1 or len(g.etypes) != 1:
+                raise DGLError('Only homogeneous graphs are supported.')
+            if g.idtype != idtype:
+                raise DGLError('Expect all the graphs to have ID type {}, got {}.'.format(
+                    idtype, g.idtype))
+        num_nodes.append(np.array([g.number_of_nodes() for g in chunk], dtype=np.int64))
+        num_edges.append(np.array([g.number_of_edges() for g in chunk], dtype=np.int64))
+        for g in chunk:
+            src, dst = g.edges(order='eid')
+            src_f.write(F.asnumpy(src).tobytes())
+            dst_f.write(F.asnumpy(dst).tobytes())
+        ndata_writer.write(_concat_feats(chunk, 'ndata'))
+        edata_writer.write(_concat_feats(chunk, 'edata'))
+
+    with open(os.path.join(path, 'src.bin'), 'wb') as src_f, \
+            open(os.path.join(path, 'dst.bin'), 'wb') as dst_f:
+        chunk = []
+        for g in graphs:
+            if idtype is None:
+                idtype = g.idtype
+            chunk.append(g)
+            if len(chunk) == chunk_size:
+                _write_chunk(chunk, src_f, dst_f)
+                chunk = []
+        if len(chunk) > 0:
+            _write_chunk(chunk, src_f, dst_f)
+    node_offsets = np.cumsum(np.concatenate(num_nodes))
+    edge_offsets = np.cumsum(np.concatenate(num_edges))
+    node_offsets.tofile(os.path.join(path, 'node_offsets.bin'))
+    edge_offsets.tofile(os.path.join(path, 'edge_offsets.bin'))
+    num_graphs = len(node_offsets) - 1
+
+    label_writer = _FeatureWriter(path, 'label')
+    if labels is not None and len(labels) > 0:
+        labels = {k: F.asnumpy(v) for k, v in labels.items()}
+        for k, v in labels.items():
+            if len(v) != num_graphs:
+                raise DGLError('Expect label "{}" to have {} rows, got {}.'.format(
+                    k, num_graphs, len(v)))
+        label_writer.write(labels)
+
+    meta = {'version': _VERSION,
+            'num_graphs': num_graphs,
+            'idtype': 'int32' if idtype == F.int32 else 'int64',
+            'ndata': ndata_writer.close(),
+            'edata': edata_writer.close(),
+            'labels': label_writer.close()}
+    with open(os.path.join(path, _META_FILE), 'w') as f:
+        json.dump(meta, f, indent=4)
+
+def _open_array(filename, scheme, num_rows):
+    """Memory-map a binary array file."""
+    shape = (num_rows,) + tuple(scheme['shape'])
+    if num_rows == 0:
+        return np.zeros(shape, dtype=np.dtype(scheme['dtype']))
+    return np.memmap(filename, dtype=np.dtype(scheme['dtype']), mode='r', shape=shape)
+
+def _ranges(starts, lengths):
+    """Concatenate the index ranges [starts[i], starts[i] + lengths[i])."""
+    total = int(lengths.sum())
+    shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shift
+
+class MmapGraphDataset(object):
+    """A collection of graphs saved by :func:`save_mmap_graphs`.
+
+    The storage is memory-mapped, so opening a dataset does not load the graphs.
+    Indexing with an integer materializes one graph; indexing with a slice, a list,
+    a numpy array or a tensor of indices materializes the graphs directly as one
+    batched graph, as if they were passed to :func:`dgl.batch`.
+
+    Parameters
+    ----------
+    path : str
+        Directory the graphs were saved to.
+
+    Examples
+    --------
+    >>> dataset = dgl.data.MmapGraphDataset('./mols')
+    >>> len(dataset)
+    1000000
+    >>> g, label = dataset[10]
+    >>> bg, label = dataset[[3, 5, 7]]
+    >>> bg.batch_size
+    3
+    """
+    def __init__(self, path):
+        with open(os.path.join(path, _META_FILE)) as f:
+            meta = json.load(f)
+        if meta['version'] != _VERSION:
+            raise DGLError('Unsupported storage version {}.'.format(meta['version']))
+        num_graphs = meta['num_graphs']
+        self._num_graphs = num_graphs
+        self._idtype = F.int32 if meta['idtype'] == 'int32' else F.int64
+        offset_scheme = {'dtype': np.dtype(np.int64).str, 'shape': []}
+        self._node_offsets = np.fromfile(os.path.join(path, 'node_offsets.bin'), dtype=np.int64)
+        self._edge_offsets = np.fromfile(os.path.join(path, 'edge_offsets.bin'), dtype=np.int64)
+        num_edges = int(self._edge_offsets[-1])
+        num_nodes = int(self._node_offsets[-1])
+        id_scheme = dict(offset_scheme, dtype=np.dtype(meta['idtype']).str)
+        self._src = _open_array(os.path.join(path, 'src.bin'), id_scheme, num_edges)
+        self._dst = _open_array(os.path.join(path, 'dst.bin'), id_scheme, num_edges)
+        self._ndata = {name: _open_array(os.path.join(path, 'ndata_{}.bin'.format(i)),
+                                         scheme, num_nodes)
+                       for i, (name, scheme) in enumerate(meta['ndata'])}
+        self._edata = {name: _open_array(os.path.join(path, 'edata_{}.bin'.format(i)),
+                                         scheme, num_edges)
+                       for i, (name, scheme) in enumerate(meta['edata'])}
+        self._labels = {name: _open_array(os.path.join(path, 'label_{}.bin'.format(i)),
+                                          scheme, num_graphs)
+                        for i, (name, scheme) in enumerate(meta['labels'])}
+
+    def __len__(self):
+        return self._num_graphs
+
+    def _gather(self, ids):
+        """Materialize the given graphs as one graph, with batch information."""
+        contiguous = len(ids) > 0 and np.all(np.diff(ids) == 1)
+        nstart = self._node_offsets[ids]
+        num_nodes = self._node_offsets[ids + 1] - nstart
+        estart = self._edge_offsets[ids]
+        num_edges = self._edge_offsets[ids + 1] - estart
+        if contiguous:
+            # one slice of every array
+            nidx = slice(nstart[0], nstart[0] + num_nodes.sum())
+            eidx = slice(estart[0], estart[0] + num_edges.sum())
+        else:
+            nidx = _ranges(nstart, num_nodes)
+            eidx = _ranges(estart, num_edges)
+        # shift the local node IDs of each graph by the nodes of the preceding graphs
+        shift = np.repeat(np.cumsum(num_nodes) - num_nodes, num_edges)
+        src = np.asarray(self._src[eidx], dtype=np.int64) + shift
+        dst = np.asarray(self._dst[eidx], dtype=np.int64) + shift
+        g = dgl_graph((F.tensor(src, self._idtype), F.tensor(dst, self._idtype)),
+                      num_nodes=int(num_nodes.sum()), idtype=self._idtype)
+        for name, arr in self._ndata.items():
+            g.ndata[name] = F.tensor(np.array(arr[nidx]))
+        for name, arr in self._edata.items():
+            g.edata[name] = F.tensor(np.array(arr[eidx]))
+        return g, num_nodes, num_edges
+
+    def __getitem__(self, idx):
+        """Get a graph or a batched graph.
+
+        Parameters
+        ----------
+        idx : int, slice, list, numpy.ndarray or Tensor
+            The graph index, or the indices of the graphs to batch.
+
+        Returns
+        -------
+        DGLGraph or (DGLGraph, dict[str, Tensor])
+            The graph, and the labels of the graph(s) if labels were saved.
+        """
+        single = isinstance(idx, numbers.Integral)
+        if single:
+            if idx < 0:
+                idx += self._num_graphs
+            if idx < 0 or idx >= self._num_graphs:
+                raise IndexError('Graph index {} out of range.'.format(idx))
+            ids = np.array([idx], dtype=np.int64)
+        elif isinstance(idx, slice):
+            ids = np.arange(self._num_graphs, dtype=np.int64)[idx]
+        else:
+            ids = F.asnumpy(idx) if F.is_tensor(idx) else np.asarray(idx)
+            ids = ids.astype(np.int64)
+            ids[ids < 0] += self._num_graphs
+            if np.any(ids < 0) or np.any(ids >= self._num_graphs):
+                raise IndexError('Graph indices out of range.')
+        g, num_nodes, num_edges = self._gather(ids)
+        if not single:
+            g.set_batch_num_nodes(F.tensor(num_nodes, F.int64))
+            g.set_batch_num_edges(F.tensor(num_edges, F.int64))
+        if len(self._labels) == 0:
+            return g
+        if single:
+            labels = {name: F.tensor(np.array(arr[idx])) for name, arr in self._labels.items()}
+        else:
+            labels = {name: F.tensor(np.array(arr[ids])) for name, arr in self._labels.items()}
+        return g, labels
@@ -4,14 +4,11 @@ Systematic Evaluations of Machine Learning on
 the Semantic Web"
 """
 import os
+from array import array
 from collections import OrderedDict
-import itertools
 import abc
+import hashlib
 import re
-try:
-    import rdflib as rdf
-except ImportError:
-    pass
 
 import networkx as nx
 import numpy as np
@@ -31,6 +28,110 @@ RENAME_DICT = {
     'rev-type' : 'rev-rdftype',
 }
 
+class URIRef(str):
+    """An IRI term of an RDF tuple."""
+
+class Literal(str):
+    """A literal term of an RDF tuple. The string is its lexical form.
+
+    ``datatype`` is the IRI of its datatype and ``language`` is its language
+    tag, or None if the literal has none.
+    """
+    def __new__(cls, value, datatype=None, language=None):
+        term = super(Literal, cls).__new__(cls, value)
+        term.datatype = datatype
+        term.language = language
+        return term
+
+class BNode(str):
+    """A blank node term of an RDF tuple. The string is its label."""
+
+_NT_ESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_NT_ESCAPE_CHARS = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f'}
+_NT_LINE = re.compile(r'\s*(?:<([^>]*)>|_:(\S+))\s+<([^>]*)>\s+'
+                      r'(?:<([^>]*)>|_:(\S+?)|"((?:[^"\\]|\\.)*)"'
+                      r'(?:@([a-zA-Z][a-zA-Z0-9-]*)|\^\^<([^>]*)>)?)\s*\.\s*$')
+
+def _nt_unescape(string):
+    if '\\' not in string:
+        return string
+    def _replace(match):
+        code = match.group(1) or match.group(2)
+        if code is not None:
+            return chr(int(code, 16))
+        return _NT_ESCAPE_CHARS.get(match.group(3), match.group(3))
+    return _NT_ESCAPE.sub(_replace, string)
+
+def parse_ntriples(filename):
+    """Parse an N-Triples file line by line.
+
+    Only the current line is kept in memory, so files of any size can be read.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the N-Triples file.
+
+    Returns
+    -------
+    iterator of (URIRef or BNode, URIRef, URIRef or BNode or Literal)
+        The (subject, predicate, object) tuples in the file order.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f):
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            match = _NT_LINE.match(line)
+            if match is None:
+                raise ValueError('Invalid N-Triples line {} in {}: {}'.format(
+                    lineno + 1, filename, line.strip()))
+            suri, sbnode, pred, ouri, obnode, olit, olang, otype = match.groups()
+            sbj = URIRef(_nt_unescape(suri)) if suri is not None else BNode(sbnode)
+            if ouri is not None:
+                obj = URIRef(_nt_unescape(ouri))
+            elif obnode is not None:
+                obj = BNode(obnode)
+            else:
+                obj = Literal(_nt_unescape(olit),
+                              _nt_unescape(otype) if otype is not None else None, olang)
+            yield sbj, URIRef(_nt_unescape(pred)), obj
+
+def _parse_rdflib(filename, fmt):
+    """Parse a file of any format supported by rdflib into the terms of this module.
+
+    The whole file is loaded by rdflib, so it is only used for non N-Triples files.
+    """
+    import rdflib as rdf
+    def _convert(term):
+        if isinstance(term, rdf.Literal):
+            return Literal(str(term),
+                           str(term.datatype) if term.datatype is not None else None,
+                           term.language)
+        if isinstance(term, rdf.BNode):
+            return BNode(str(term))
+        return URIRef(str(term))
+    g = rdf.Graph()
+    g.parse(filename, format=fmt)
+    # rdflib graphs are unordered
+    return sorted((_convert(s), _convert(p), _convert(o)) for s, p, o in g)
+
+def _tuple_key(raw_tuple):
+    """Return a 16-byte digest identifying an RDF tuple.
+
+    The digest covers the type of each term, and the datatype and the language
+    tag of literals, so equal strings of different terms are told apart.
+    """
+    parts = []
+    for term in raw_tuple:
+        parts.append(type(term).__name__)
+        parts.append(term)
+        if isinstance(term, Literal):
+            parts.append(term.datatype or '')
+            parts.append(term.language or '')
+    data = ''.join('%d:%s' % (len(part), part) for part in parts)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).digest()
+
+
 class Entity:
     """Class for entities
     Parameters
@@ -115,7 +216,6 @@ class RDFGraphDataset(DGLBuiltinDataset):
                  raw_dir=None,
                  force_reload=False,
                  verbose=True):
-        import rdflib as rdf
         self._insert_reverse = insert_reverse
         self._print_every = print_every
         self._predict_category = predict_category
@@ -132,6 +232,9 @@ class RDFGraphDataset(DGLBuiltinDataset):
     def load_raw_tuples(self, root_path):
         """Loading raw RDF dataset
 
+        N-Triples files are streamed line by line. Other formats are parsed
+        with rdflib.
+
         Parameters
         ----------
         root_path : str
@@ -139,26 +242,27 @@ class RDFGraphDataset(DGLBuiltinDataset):
 
         Returns
         -------
-            Loaded rdf data
+        iterator of (URIRef or BNode, URIRef, URIRef or BNode or Literal)
+            Loaded rdf tuples
         """
-        raw_rdf_graphs = []
-        for _, filename in enumerate(os.listdir(root_path)):
-            fmt = None
+        for filename in sorted(os.listdir(root_path)):
+            path = os.path.join(root_path, filename)
             if filename.endswith('nt'):
-                fmt = 'nt'
+                print('Parsing file %s ...' % filename)
+                yield from parse_ntriples(path)
             elif filename.endswith('n3'):
-                fmt = 'n3'
-            if fmt is None:
-                continue
-            g = rdf.Graph()
-            print('Parsing file %s ...' % filename)
-            g.parse(os.path.join(root_path, filename), format=fmt)
-            raw_rdf_graphs.append(g)
-        return itertools.chain(*raw_rdf_graphs)
+                print('Parsing file %s ...' % filename)
+                yield from _parse_rdflib(path, 'n3')
 
     def process_raw_tuples(self, raw_tuples, root_path):
         """Processing raw RDF dataset
 
+        The tuples are consumed one by one and encoded into integer arrays.
+        Duplicated tuples are removed before they are mapped to entities and
+        relations, so distinct tuples mapped to the same edge are kept as
+        multi-edges. Only a 16-byte digest of each valid tuple is kept for
+        this.
+
         Parameters
         ----------
         raw_tuples:
@@ -170,16 +274,14 @@ class RDFGraphDataset(DGLBuiltinDataset):
         ent_classes = OrderedDict()
         rel_classes = OrderedDict()
         entities = OrderedDict()
-        src = []
-        dst = []
-        ntid = []
-        etid = []
-        sorted_tuples = []
-        for t in raw_tuples:
-            sorted_tuples.append(t)
-        sorted_tuples.sort()
-
-        for i, (sbj, pred, obj) in enumerate(sorted_tuples):
+        src = array('q')
+        dst = array('q')
+        ntid = array('q')
+        etid = array('q')
+        # rdf graphs are sets of tuples
+        seen = set()
+
+        for i, (sbj, pred, obj) in enumerate(raw_tuples):
             if self.verbose and i % self._print_every == 0:
                 print('Processed %d tuples, found %d valid tuples.' % (i, len(src)))
             sbjent = self.parse_entity(sbj)
@@ -189,6 +291,10 @@ class RDFGraphDataset(DGLBuiltinDataset):
             if processed is None:
                 # ignored
                 continue
+            key = _tuple_key((sbj, pred, obj))
+            if key in seen:
+                continue
+            seen.add(key)
             # meta graph
             sbjclsid = _get_id(ent_classes, sbjent.cls)
             objclsid = _get_id(ent_classes, objent.cls)
@@ -207,10 +313,10 @@ class RDFGraphDataset(DGLBuiltinDataset):
             dst.append(dst_id)
             etid.append(relclsid)
 
-        src = np.asarray(src)
-        dst = np.asarray(dst)
-        ntid = np.asarray(ntid)
-        etid = np.asarray(etid)
+        src = np.frombuffer(src, dtype=np.int64)
+        dst = np.frombuffer(dst, dtype=np.int64)
+        ntid = np.frombuffer(ntid, dtype=np.int64)
+        etid = np.frombuffer(etid, dtype=np.int64)
         ntypes = list(ent_classes.keys())
         etypes = list(rel_classes.keys())
 
@@ -473,7 +579,7 @@ class RDFGraphDataset(DGLBuiltinDataset):
         whole tuple should be ignored.
         Parameters
         ----------
-        term : rdflib.term.Identifier
+        term : URIRef or BNode or Literal
             RDF term
         Returns
         -------
@@ -489,7 +595,7 @@ class RDFGraphDataset(DGLBuiltinDataset):
         whole tuple should be ignored.
         Parameters
         ----------
-        term : rdflib.term.Identifier
+        term : URIRef or BNode or Literal
             RDF term
         Returns
         -------
@@ -506,7 +612,7 @@ class RDFGraphDataset(DGLBuiltinDataset):
 
         Parameters
         ----------
-        raw_tuple : tuple of rdflib.term.Identifier
+        raw_tuple : tuple of URIRef, BNode or Literal
             (subject, predicate, object) tuple
         sbj : Entity
             Subject entity
@@ -631,9 +737,8 @@ class AIFBDataset(RDFGraphDataset):
                  raw_dir=None,
                  force_reload=False,
                  verbose=True):
-        import rdflib as rdf
-        self.employs = rdf.term.URIRef("http://swrc.ontoware.org/ontology#employs")
-        self.affiliation = rdf.term.URIRef("http://swrc.ontoware.org/ontology#affiliation")
+        self.employs = URIRef("http://swrc.ontoware.org/ontology#employs")
+        self.affiliation = URIRef("http://swrc.ontoware.org/ontology#affiliation")
         url = _get_dgl_url('dataset/rdf/aifb-hetero.zip')
         name = 'aifb-hetero'
         predict_category = 'Personen'
@@ -674,9 +779,9 @@ class AIFBDataset(RDFGraphDataset):
         return super(AIFBDataset, self).__len__()
 
     def parse_entity(self, term):
-        if isinstance(term, rdf.Literal):
+        if isinstance(term, Literal):
             return Entity(e_id=str(term), cls="_Literal")
-        if isinstance(term, rdf.BNode):
+        if isinstance(term, BNode):
             return None
         entstr = str(term)
         if entstr.startswith(self.entity_prefix):
@@ -809,11 +914,10 @@ class MUTAGDataset(RDFGraphDataset):
                  raw_dir=None,
                  force_reload=False,
                  verbose=True):
-        import rdflib as rdf
-        self.is_mutagenic = rdf.term.URIRef("http://dl-learner.org/carcinogenesis#isMutagenic")
-        self.rdf_type = rdf.term.URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
-        self.rdf_subclassof = rdf.term.URIRef("http://www.w3.org/2000/01/rdf-schema#subClassOf")
-        self.rdf_domain = rdf.term.URIRef("http://www.w3.org/2000/01/rdf-schema#domain")
+        self.is_mutagenic = URIRef("http://dl-learner.org/carcinogenesis#isMutagenic")
+        self.rdf_type = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+        self.rdf_subclassof = URIRef("http://www.w3.org/2000/01/rdf-schema#subClassOf")
+        self.rdf_domain = URIRef("http://www.w3.org/2000/01/rdf-schema#domain")
 
         url = _get_dgl_url('dataset/rdf/mutag-hetero.zip')
         name = 'mutag-hetero'
@@ -855,9 +959,9 @@ class MUTAGDataset(RDFGraphDataset):
         return super(MUTAGDataset, self).__len__()
 
     def parse_entity(self, term):
-        if isinstance(term, rdf.Literal):
+        if isinstance(term, Literal):
             return Entity(e_id=str(term), cls="_Literal")
-        elif isinstance(term, rdf.BNode):
+        elif isinstance(term, BNode):
             return None
         entstr = str(term)
         if entstr.startswith(self.entity_prefix):
@@ -1010,11 +1114,10 @@ class BGSDataset(RDFGraphDataset):
                  raw_dir=None,
                  force_reload=False,
                  verbose=True):
-        import rdflib as rdf
         url = _get_dgl_url('dataset/rdf/bgs-hetero.zip')
         name = 'bgs-hetero'
         predict_category = 'Lexicon/NamedRockUnit'
-        self.lith = rdf.term.URIRef("http://data.bgs.ac.uk/ref/Lexicon/hasLithogenesis")
+        self.lith = URIRef("http://data.bgs.ac.uk/ref/Lexicon/hasLithogenesis")
         super(BGSDataset, self).__init__(name, url, predict_category,
                                          print_every=print_every,
                                          insert_reverse=insert_reverse,
@@ -1052,9 +1155,9 @@ class BGSDataset(RDFGraphDataset):
         return super(BGSDataset, self).__len__()
 
     def parse_entity(self, term):
-        if isinstance(term, rdf.Literal):
+        if isinstance(term, Literal):
             return None
-        elif isinstance(term, rdf.BNode):
+        elif isinstance(term, BNode):
             return None
         entstr = str(term)
         if entstr.startswith(self.status_prefix):
@@ -1204,9 +1307,8 @@ class AMDataset(RDFGraphDataset):
                  raw_dir=None,
                  force_reload=False,
                  verbose=True):
-        import rdflib as rdf
-        self.objectCategory = rdf.term.URIRef("http://purl.org/collections/nl/am/objectCategory")
-        self.material = rdf.term.URIRef("http://purl.org/collections/nl/am/material")
+        self.objectCategory = URIRef("http://purl.org/collections/nl/am/objectCategory")
+        self.material = URIRef("http://purl.org/collections/nl/am/material")
         url = _get_dgl_url('dataset/rdf/am-hetero.zip')
         name = 'am-hetero'
         predict_category = 'proxy'
@@ -1247,9 +1349,9 @@ class AMDataset(RDFGraphDataset):
         return super(AMDataset, self).__len__()
 
     def parse_entity(self, term):
-        if isinstance(term, rdf.Literal):
+        if isinstance(term, Literal):
             return None
-        elif isinstance(term, rdf.BNode):
+        elif isinstance(term, BNode):
             return Entity(e_id=str(term), cls='_BNode')
         entstr = str(term)
         if entstr.startswith(self.entity_prefix):
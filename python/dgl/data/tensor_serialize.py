@@ -3,22 +3,35 @@ from __future__ import absolute_import
 from ..ndarray import NDArray
 from .._ffi.function import _init_api
 from .. import backend as F
+from ..base import DGLError
+from .graph_serialize import is_local_path
 
 __all__ = ['save_tensors', "load_tensors"]
 
 _init_api("dgl.data.tensor_serialize")
 
 
-def save_tensors(filename, tensor_dict):
+def save_tensors(filename, tensor_dict, append=False, indexed=False):
     """
     Save dict of tensors to file
-    
+
     Parameters
     ----------
     filename : str
         File name to store dict of tensors. 
     tensor_dict: dict of dgl NDArray or backend tensor
         Python dict using string as key and tensor as value
+    append : bool, optional
+        If True and the file exists, add the tensors to the file instead of
+        overwriting it. A tensor replaces the stored tensor of the same key.
+        Only files in the indexed format are appended to without rewriting the
+        stored tensors. Only local files support appending. Default: False.
+    indexed : bool, optional
+        If True, the tensors are followed by an index block, so that more tensors
+        can be appended later without rewriting the stored ones, and
+        :func:`load_tensors` can read the tensors in parallel or only some of
+        them. Such files cannot be loaded by older versions of DGL. An existing
+        file appended to is converted to the indexed format. Default: False.
 
     Returns
     ----------
@@ -38,26 +51,38 @@ def save_tensors(filename, tensor_dict):
             raise Exception(
                 "Dict value has to be backend tensor or dgl ndarray")
     
-    return _CAPI_SaveNDArrayDict(filename, nd_dict, is_empty_dict)
+    if append and not is_local_path(filename):
+        raise DGLError("Only local files support appending tensors.")
+    return _CAPI_SaveNDArrayDict(filename, nd_dict, is_empty_dict, append, indexed)
 
 
-def load_tensors(filename, return_dgl_ndarray=False):
+def load_tensors(filename, return_dgl_ndarray=False, keys=None, num_threads=0):
     """
     load dict of tensors from file
-    
+
+    For files saved with ``indexed=True``, tensors are read in parallel by
+    multiple threads, and only the tensors given by ``keys`` are read from
+    the file.
+
     Parameters
     ----------
     filename : str
         File name to load dict of tensors. 
     return_dgl_ndarray: bool
         Whether return dict of dgl NDArrays or backend tensors
+    keys : list[str], optional
+        The keys of the tensors to load. All the tensors are loaded by default.
+    num_threads : int, optional
+        The number of threads reading the tensors. If not positive, the default
+        number of OpenMP threads is used. Default: 0.
 
     Returns
     ---------
     tensor_dict : dict
         dict of tensor or ndarray based on return_dgl_ndarray flag
     """
-    nd_dict = _CAPI_LoadNDArrayDict(filename)
+    keys = [] if keys is None else list(keys)
+    nd_dict = _CAPI_LoadNDArrayDict(filename, keys, num_threads)
     tensor_dict = {}
     for key, value in nd_dict.items():
         if return_dgl_ndarray:
@@ -7,8 +7,56 @@ import random
 from .dgl_dataset import DGLBuiltinDataset
 from .utils import loadtxt, save_graphs, load_graphs, save_info, load_info
 from .. import backend as F
+from ..base import NID, EID
 from ..utils import retry_method_with_fix
 from ..convert import graph as dgl_graph
+from ..batch import unbatch
+
+def _batched_graph_from_indicator(edges, indicator):
+    """Build one batched graph of all the graphs of a TU-format dataset.
+
+    The nodes are grouped by graph with one stable sort over the graph indicator,
+    keeping the node order within each graph, and the edges are grouped by graph
+    in the same way. The result is equivalent to batching the subgraphs induced
+    by the nodes of each graph.
+
+    Parameters
+    ----------
+    edges : numpy.ndarray
+        Edges of shape (E, 2) in the global node IDs.
+    indicator : numpy.ndarray
+        The graph ID of each node.
+
+    Returns
+    -------
+    DGLGraph
+        The batched graph, storing the original node and edge IDs in ``ndata[dgl.NID]``
+        and ``edata[dgl.EID]``.
+    numpy.ndarray
+        The original ID of each node of the batched graph.
+    numpy.ndarray
+        The original ID of each edge of the batched graph.
+    """
+    num_graphs = int(np.max(indicator)) + 1
+    node_perm = np.argsort(indicator, kind='stable')
+    new_nid = np.empty_like(node_perm)
+    new_nid[node_perm] = np.arange(len(node_perm))
+    batch_num_nodes = np.bincount(indicator, minlength=num_graphs)
+
+    # keep the edges inside a graph, grouped by graph in the order of their IDs
+    src, dst = edges[:, 0], edges[:, 1]
+    edge_graph = indicator[src]
+    inner = np.nonzero(edge_graph == indicator[dst])[0]
+    edge_perm = inner[np.argsort(edge_graph[inner], kind='stable')]
+    batch_num_edges = np.bincount(edge_graph[edge_perm], minlength=num_graphs)
+
+    g = dgl_graph((F.tensor(new_nid[src[edge_perm]]), F.tensor(new_nid[dst[edge_perm]])),
+                  num_nodes=len(node_perm))
+    g.ndata[NID] = F.tensor(node_perm)
+    g.edata[EID] = F.tensor(edge_perm)
+    g.set_batch_num_nodes(F.tensor(batch_num_nodes, F.int64))
+    g.set_batch_num_edges(F.tensor(batch_num_edges, F.int64))
+    return g, node_perm, edge_perm
 
 class LegacyTUDataset(DGLBuiltinDataset):
     r"""LegacyTUDataset contains lots of graph kernel datasets for graph classification.
@@ -99,29 +147,18 @@ class LegacyTUDataset(DGLBuiltinDataset):
         DS_graph_labels = self._idx_from_zero(
             np.genfromtxt(self._file_path("graph_labels"), dtype=int))
 
-        g = dgl_graph(([], []))
-        g.add_nodes(int(DS_edge_list.max()) + 1)
-        g.add_edges(DS_edge_list[:, 0], DS_edge_list[:, 1])
-
-        node_idx_list = []
-        self.max_num_node = 0
-        for idx in range(np.max(DS_indicator) + 1):
-            node_idx = np.where(DS_indicator == idx)
-            node_idx_list.append(node_idx[0])
-            if len(node_idx[0]) > self.max_num_node:
-                self.max_num_node = len(node_idx[0])
-
-        self.graph_lists = [g.subgraph(node_idx) for node_idx in node_idx_list]
+        # all the graphs are built at once as one batched graph
+        g, node_perm, _ = _batched_graph_from_indicator(DS_edge_list, DS_indicator)
+        batch_num_nodes = F.asnumpy(g.batch_num_nodes())
+        self.max_num_node = int(np.max(batch_num_nodes))
         self.num_labels = max(DS_graph_labels) + 1
         self.graph_labels = DS_graph_labels
 
         try:
             DS_node_labels = self._idx_from_zero(
                 np.loadtxt(self._file_path("node_labels"), dtype=int))
-            g.ndata['node_label'] = F.tensor(DS_node_labels)
             one_hot_node_labels = self._to_onehot(DS_node_labels)
-            for idxs, g in zip(node_idx_list, self.graph_lists):
-                g.ndata['feat'] = F.tensor(one_hot_node_labels[idxs, :])
+            g.ndata['feat'] = F.tensor(one_hot_node_labels[node_perm, :])
             self.data_mode = "node_label"
         except IOError:
             print("No Node Label Data")
@@ -131,33 +168,31 @@ class LegacyTUDataset(DGLBuiltinDataset):
                 self._file_path("node_attributes"), delimiter=",")
             if DS_node_attr.ndim == 1:
                 DS_node_attr = np.expand_dims(DS_node_attr, -1)
-            for idxs, g in zip(node_idx_list, self.graph_lists):
-                g.ndata['feat'] = F.tensor(DS_node_attr[idxs, :])
+            g.ndata['feat'] = F.tensor(DS_node_attr[node_perm, :])
             self.data_mode = "node_attr"
         except IOError:
             print("No Node Attribute Data")
 
         if 'feat' not in g.ndata.keys():
-            for idxs, g in zip(node_idx_list, self.graph_lists):
-                g.ndata['feat'] = np.ones((g.number_of_nodes(), hidden_size))
+            g.ndata['feat'] = F.tensor(np.ones((g.number_of_nodes(), self.hidden_size)))
             self.data_mode = "constant"
             if self.verbose:
-                print("Use Constant one as Feature with hidden size {}".format(hidden_size))
+                print("Use Constant one as Feature with hidden size {}".format(
+                    self.hidden_size))
+
+        self.graph_lists = unbatch(g)
 
         # remove graphs that are too large by user given standard
         # optional pre-processing steop in conformity with Rex Ying's original
         # DiffPool implementation
         if self.max_allow_node:
-            preserve_idx = []
+            preserve_idx = np.nonzero(batch_num_nodes <= self.max_allow_node)[0]
             if self.verbose:
                 print("original dataset length : ", len(self.graph_lists))
-            for (i, g) in enumerate(self.graph_lists):
-                if g.number_of_nodes() <= self.max_allow_node:
-                    preserve_idx.append(i)
             self.graph_lists = [self.graph_lists[i] for i in preserve_idx]
             if self.verbose:
                 print("after pruning graphs that are too big : ", len(self.graph_lists))
-            self.graph_labels = [self.graph_labels[i] for i in preserve_idx]
+            self.graph_labels = np.asarray(self.graph_labels)[preserve_idx]
             self.max_num_node = self.max_allow_node
         self.graph_labels = F.tensor(self.graph_labels)
 
@@ -301,17 +336,9 @@ class TUDataset(DGLBuiltinDataset):
         DS_graph_labels = self._idx_reset(
             loadtxt(self._file_path("graph_labels"), delimiter=",").astype(int))
 
-        g = dgl_graph(([], []))
-        g.add_nodes(int(DS_edge_list.max()) + 1)
-        g.add_edges(DS_edge_list[:, 0], DS_edge_list[:, 1])
-
-        node_idx_list = []
-        self.max_num_node = 0
-        for idx in range(np.max(DS_indicator) + 1):
-            node_idx = np.where(DS_indicator == idx)
-            node_idx_list.append(node_idx[0])
-            if len(node_idx[0]) > self.max_num_node:
-                self.max_num_node = len(node_idx[0])
+        # all the graphs are built at once as one batched graph
+        g, node_perm, edge_perm = _batched_graph_from_indicator(DS_edge_list, DS_indicator)
+        self.max_num_node = int(np.max(F.asnumpy(g.batch_num_nodes())))
 
         self.num_labels = max(DS_graph_labels) + 1
         self.graph_labels = F.tensor(DS_graph_labels)
@@ -328,14 +355,13 @@ class TUDataset(DGLBuiltinDataset):
                 data = loadtxt(self._file_path(filename),
                                delimiter=',').astype(int)
                 if 'label' in filename:
-                    data = F.tensor(self._idx_from_zero(data))
-                else:
-                    data = F.tensor(data)
-                getattr(g, field_name[0])[field_name[1]] = data
+                    data = self._idx_from_zero(data)
+                perm = node_perm if field_name[0] == 'ndata' else edge_perm
+                getattr(g, field_name[0])[field_name[1]] = F.tensor(data[perm])
             except IOError:
                 pass
 
-        self.graph_lists = [g.subgraph(node_idx) for node_idx in node_idx_list]
+        self.graph_lists = unbatch(g)
 
     def save(self):
         graph_path = os.path.join(self.save_path, 'tu_{}.bin'.format(self.name))
@@ -15,6 +15,9 @@ Read the user guide :ref:`guide-minibatch`.
     to changes in future releases. It currently only has implementations in PyTorch.
 """
 from .neighbor import *
+from .layerwise import *
+from .subgraph_sampler import *
+from .inference import *
 from .dataloader import *
 
 from . import negative_sampler
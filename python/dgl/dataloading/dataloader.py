@@ -755,6 +755,57 @@ class EdgeCollator(Collator):
         else:
             return self._collate_with_negative_sampling(items)
 
+class SubgraphCollator(Collator):
+    """DGL collator to generate a subgraph of a single graph per minibatch with a
+    subgraph sampler, e.g. for ClusterGCN and GraphSAINT.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.
+    subgraph_sampler : dgl.dataloading.SubgraphSampler
+        The subgraph sampler.
+
+    Examples
+    --------
+    To train a GNN on minibatches of 20 clusters out of 1000 with ClusterGCN (assume
+    the backend is PyTorch):
+
+    >>> sampler = dgl.dataloading.ClusterGCNSampler(1000, 'partition.npz')
+    >>> collator = dgl.dataloading.SubgraphCollator(g, sampler)
+    >>> dataloader = torch.utils.data.DataLoader(
+    ...     collator.dataset, collate_fn=collator.collate,
+    ...     batch_size=20, shuffle=True, drop_last=False, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg)
+    """
+    def __init__(self, g, subgraph_sampler):
+        self.g = g
+        self.subgraph_sampler = subgraph_sampler
+        # precompute in the main process so that the workers share the result
+        self._dataset = subgraph_sampler.prepare(g)
+
+    @property
+    def dataset(self):
+        return self._dataset
+
+    def collate(self, items):
+        """Generate the subgraph of the given items.
+
+        Parameters
+        ----------
+        items : list[int]
+            The items in the minibatch, e.g. the cluster IDs for ClusterGCN.
+
+        Returns
+        -------
+        DGLGraph
+            The subgraph.  The node and edge IDs in the original graph are stored as
+            ``dgl.NID`` and ``dgl.EID`` features.
+        """
+        items = F.tensor(items)
+        return self.subgraph_sampler.sample_subgraph(self.g, items)
+
 class GraphCollator(object):
     """Given a set of graphs as well as their graph-level data, the collate function will batch the
     graphs into a batched graph, and stack the tensors into a single bigger tensor.  If the
@@ -0,0 +1,310 @@
+"""Block caching and layer-wise inference"""
+import os
+import numbers
+import pickle
+import hashlib
+import tempfile
+from collections.abc import Mapping
+
+from .dataloader import BlockSampler
+from .neighbor import MultiLayerFullNeighborSampler
+from .. import backend as F
+from .. import utils
+from ..base import NID, EID
+from ..heterograph import DGLBlock
+
+__all__ = ['BlockCache', 'CachedBlockSampler', 'layerwise_inference']
+
+def _graph_digest(g):
+    """Return a digest of the graph structure, cached on the graph."""
+    def _compute():
+        digest = hashlib.sha1()
+        digest.update(repr((g.idtype, g.ntypes, g.canonical_etypes,
+                            [g.number_of_nodes(ntype) for ntype in g.ntypes])).encode())
+        for etype in g.canonical_etypes:
+            src, dst = g.edges(etype=etype, order='eid')
+            digest.update(F.asnumpy(src).tobytes())
+            digest.update(F.asnumpy(dst).tobytes())
+        return digest.hexdigest()
+    return g._get_cached_info(('structure_digest',), _compute)
+
+def _nodes_digest(nodes):
+    digest = hashlib.sha1()
+    if not isinstance(nodes, Mapping):
+        nodes = {None: nodes}
+    for ntype in sorted(nodes, key=str):
+        arr = F.asnumpy(nodes[ntype])
+        digest.update(repr((ntype, arr.dtype.str)).encode())
+        digest.update(arr.tobytes())
+    return digest.hexdigest()
+
+def _config_key(value):
+    """Return a description of a value of a sampler configuration that is stable
+    across processes.
+
+    Values that cannot be described, such as functions, are described by their
+    identity, so the cached blocks of such samplers are only reused in the same process.
+    """
+    if value is None or isinstance(value, (bool, numbers.Number, str)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join(_config_key(v) for v in value))
+    if isinstance(value, Mapping):
+        return '{{{}}}'.format(', '.join(sorted(
+            '{}: {}'.format(_config_key(k), _config_key(v)) for k, v in value.items())))
+    if F.is_tensor(value):
+        return 'tensor:' + _nodes_digest(value)
+    if isinstance(value, BlockSampler):
+        return '{}({})'.format(type(value).__name__, ', '.join(
+            '{}={}'.format(k, _config_key(v)) for k, v in sorted(vars(value).items())))
+    return '{}@{}'.format(type(value).__name__, id(value))
+
+class BlockCache(object):
+    """Cache of the blocks sampled for a batch of output nodes.
+
+    Every entry stores the graph structure of the blocks, the IDs of their nodes and
+    edges in the original graph, and the edge features created by the sampler.  The
+    node and edge features of the original graph are not stored; they are sliced from
+    the original graph again when the blocks are restored.
+
+    The entries are kept in memory, and also on disk if ``directory`` is given, so that
+    they are shared by the processes of a data loader and survive across runs.  The
+    keys include a digest of the graph structure, so changing the graph never returns
+    stale blocks.
+
+    Parameters
+    ----------
+    directory : str, optional
+        The directory storing the cached blocks on disk.  Created if it does not exist.
+    in_memory : bool, default True
+        Whether to keep the cached blocks in memory.
+    """
+    def __init__(self, directory=None, in_memory=True):
+        self.directory = directory
+        self.in_memory = in_memory
+        self._entries = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        """Return the entry of the key, or None if it is not cached.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), 'rb') as f:
+                entry = pickle.load(f)
+            if self.in_memory:
+                self._entries[key] = entry
+        return entry
+
+    def put(self, key, entry):
+        """Store the entry of the key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+        entry : object
+            The entry.  Must be picklable if the cache is on disk.
+        """
+        if self.in_memory:
+            self._entries[key] = entry
+        if self.directory is not None:
+            # write to a temporary file first so that concurrent readers never see a
+            # partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+
+    def clear(self):
+        """Remove all the entries in memory and on disk."""
+        self._entries.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def __len__(self):
+        return len(self._entries)
+
+def _compact_blocks(g, blocks):
+    """Convert a list of blocks to a picklable entry, or return None if the blocks
+    cannot be restored from the original graph."""
+    entry = []
+    for block in blocks:
+        eids = []
+        edata = {}
+        for etype in block.canonical_etypes:
+            data = block.edges[etype].data
+            if EID not in data:
+                return None
+            eids.append(F.asnumpy(data[EID]))
+            parent_data = g.edges[etype].data
+            for name in data.keys():
+                if name != EID and name not in parent_data:
+                    edata[etype, name] = F.asnumpy(data[name])
+        entry.append({
+            'graph': block._graph,
+            'ntypes': (block.srctypes, block.dsttypes),
+            'etypes': block.etypes,
+            'srcnodes': [F.asnumpy(block.srcnodes[ntype].data[NID])
+                         for ntype in block.srctypes],
+            'dstnodes': [F.asnumpy(block.dstnodes[ntype].data[NID])
+                         for ntype in block.dsttypes],
+            'eids': eids,
+            'edata': edata})
+    return entry
+
+def _restore_blocks(g, entry):
+    """Restore the blocks from an entry created by :func:`_compact_blocks`."""
+    blocks = []
+    for item in entry:
+        block = DGLBlock(item['graph'], item['ntypes'], item['etypes'])
+        srcnodes = [F.zerocopy_from_numpy(nodes) for nodes in item['srcnodes']]
+        dstnodes = [F.zerocopy_from_numpy(nodes) for nodes in item['dstnodes']]
+        eids = [F.zerocopy_from_numpy(e) for e in item['eids']]
+        node_frames = utils.extract_node_subframes_for_block(g, srcnodes, dstnodes)
+        edge_frames = utils.extract_edge_subframes(g, eids)
+        utils.set_new_frames(block, node_frames=node_frames, edge_frames=edge_frames)
+        for (etype, name), value in item['edata'].items():
+            block.edges[etype].data[name] = F.zerocopy_from_numpy(value)
+        block.create_formats_()
+        blocks.append(block)
+    return blocks
+
+class CachedBlockSampler(BlockSampler):
+    """Block sampler that caches the blocks generated by another block sampler for
+    every batch of output nodes.
+
+    The blocks of a batch are generated on the first request and restored from the
+    cache afterwards, skipping both sampling and :func:`dgl.to_block`.  This is
+    intended for deterministic samplers such as
+    :class:`~dgl.dataloading.MultiLayerFullNeighborSampler`, e.g. for repeated offline
+    inference over an unchanged graph.  For a stochastic sampler, the first sample of
+    every batch is reused forever.
+
+    The cache key consists of a digest of the graph structure, the configuration of
+    the sampler and the output nodes of the batch, so the batches should be the same
+    every time (i.e. no shuffling) for the cache to be effective.
+
+    Parameters
+    ----------
+    block_sampler : BlockSampler
+        The block sampler to cache.  Must store the edge IDs of the original graph in
+        the frontiers as ``dgl.EID``, like all the samplers in DGL do.
+    cache : BlockCache, optional
+        The cache.  A new in-memory cache is created if omitted.
+
+    Examples
+    --------
+    To cache the blocks of full-neighbor sampling on disk, so that repeated inference
+    over the same graph skips sampling (assuming the backend is PyTorch):
+
+    >>> cache = dgl.dataloading.BlockCache('/tmp/block_cache')
+    >>> sampler = dgl.dataloading.CachedBlockSampler(
+    ...     dgl.dataloading.MultiLayerFullNeighborSampler(1), cache)
+    >>> dataloader = dgl.dataloading.NodeDataLoader(
+    ...     g, torch.arange(g.number_of_nodes()), sampler, batch_size=1024)
+    """
+    def __init__(self, block_sampler, cache=None):
+        super().__init__(block_sampler.num_layers, block_sampler.return_eids)
+        self.block_sampler = block_sampler
+        self.cache = cache if cache is not None else BlockCache()
+        self._sampler_key = _config_key(block_sampler)
+
+    def sample_frontier(self, block_id, g, seed_nodes):
+        return self.block_sampler.sample_frontier(block_id, g, seed_nodes)
+
+    def _key(self, g, seed_nodes):
+        digest = hashlib.sha1()
+        digest.update(_graph_digest(g).encode())
+        digest.update(self._sampler_key.encode())
+        digest.update(_nodes_digest(seed_nodes).encode())
+        return digest.hexdigest()
+
+    def sample_blocks(self, g, seed_nodes, exclude_eids=None):
+        # excluded edges are specific to a minibatch of edges, so never cache them
+        if exclude_eids is not None:
+            return self.block_sampler.sample_blocks(g, seed_nodes, exclude_eids)
+        key = self._key(g, seed_nodes)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return _restore_blocks(g, entry)
+        blocks = self.block_sampler.sample_blocks(g, seed_nodes)
+        entry = _compact_blocks(g, blocks)
+        if entry is not None:
+            self.cache.put(key, entry)
+        return blocks
+
+def layerwise_inference(g, layers, feat, batch_size, device=None, cache=None):
+    """Compute the outputs of a multi-layer GNN on all nodes of a homogeneous graph
+    layer by layer, with full neighbors.
+
+    Unlike computing the outputs with multi-layer blocks, every layer computes the
+    representation of every node exactly once.  The blocks of every batch of nodes are
+    the same for all layers, so they are generated once and restored from ``cache``
+    afterwards.  Passing a cache on disk also skips generating them in later calls as
+    long as the graph structure is unchanged.
+
+    The function does not track gradients by itself.  With PyTorch, one would call it
+    under ``torch.no_grad()``.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU.
+    layers : list[callable]
+        The layers.  Every layer is called with a block and the representations of its
+        input nodes, and returns the representations of its output nodes.
+    feat : Tensor
+        The input features of all nodes.
+    batch_size : int
+        The number of output nodes in every batch.
+    device : device context, optional
+        The device to compute the layers on.  The outputs are stored on the device of
+        ``feat``.
+    cache : BlockCache, optional
+        The cache of the blocks.  A new in-memory cache is created if omitted.
+
+    Returns
+    -------
+    Tensor
+        The outputs of the last layer on all nodes.
+
+    Examples
+    --------
+    The following example uses PyTorch backend.
+
+    >>> cache = dgl.dataloading.BlockCache('/tmp/block_cache')
+    >>> with torch.no_grad():
+    ...     emb = dgl.dataloading.layerwise_inference(
+    ...         g, [lambda block, h: F.relu(conv1(block, h)), conv2],
+    ...         g.ndata['feat'], 1024, device='cuda:0', cache=cache)
+    """
+    sampler = CachedBlockSampler(MultiLayerFullNeighborSampler(1), cache)
+    num_nodes = g.number_of_nodes()
+    nids = F.arange(0, num_nodes, g.idtype, F.cpu())
+    batches = [F.narrow_row(nids, start, min(start + batch_size, num_nodes))
+               for start in range(0, num_nodes, batch_size)]
+    ctx = F.context(feat)
+    h = feat
+    for layer in layers:
+        outputs = []
+        for seeds in batches:
+            block = sampler.sample_blocks(g, seeds)[0]
+            x = F.gather_row(h, F.copy_to(F.astype(block.srcdata[NID], F.int64), ctx))
+            if device is not None:
+                block = block.to(device)
+                x = F.copy_to(x, device)
+            outputs.append(F.copy_to(layer(block, x), ctx))
+        h = F.cat(outputs, 0) if outputs else h
+    return h
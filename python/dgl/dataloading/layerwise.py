@@ -0,0 +1,211 @@
+"""Data loading components for layer-wise importance sampling"""
+import numpy as np
+
+from .dataloader import BlockSampler
+from .. import backend as F
+from .. import random
+from ..base import DGLError, EID
+from ..convert import graph
+from ..heterograph import DGLHeteroGraph as DGLGraph
+from ..sampling.utils import tensor_version
+from .. import utils
+
+__all__ = ['FastGCNSampler', 'LADIESSampler']
+
+def _normalized_adjacency(g, edge_weight):
+    """Return the source, destination and normalized adjacency value of every edge,
+    as well as the squared norm of every column of the normalized adjacency matrix.
+
+    The value of the edge ``(u, v)`` is its weight divided by the total weight of the
+    inbound edges of ``v``, i.e. the coefficient of mean aggregation.  The result is
+    cached on the graph until the graph or the edge weight tensor changes.
+    """
+    weight = g.edata[edge_weight] if edge_weight is not None else None
+    version = tensor_version(weight)
+    entry = g._get_cached_info(('layerwise_norm', edge_weight), lambda: [None, None, None])
+    if entry[1] is None or entry[0] is not weight or entry[2] != version:
+        src, dst = g.edges(order='eid')
+        src = F.asnumpy(src)
+        dst = F.asnumpy(dst)
+        if weight is None:
+            value = np.ones(len(src), dtype=np.float64)
+        else:
+            value = F.asnumpy(weight).astype(np.float64).reshape(-1)
+        in_weight = np.bincount(dst, weights=value, minlength=g.number_of_nodes())
+        value = value / np.maximum(in_weight[dst], np.finfo(np.float64).tiny)
+        col_norm = np.bincount(src, weights=value ** 2, minlength=g.number_of_nodes())
+        entry[0] = weight
+        entry[1] = (src, dst, value, col_norm)
+        entry[2] = version
+    return entry[1]
+
+class FastGCNSampler(BlockSampler):
+    """Sampler that builds computational dependency of node representations via
+    layer-wise importance sampling from FastGCN [1]_.
+
+    Instead of sampling neighbors for every output node, the sampler picks a fixed
+    budget of input nodes for each layer, so the size of the blocks does not grow with
+    the number of layers.  The input nodes are drawn with replacement from all the
+    nodes in the graph with a probability proportional to the squared norm of their
+    column in the normalized adjacency matrix.  The probabilities are computed once and
+    cached on the graph.
+
+    Every edge ``(u, v)`` in the blocks carries the importance weight
+    ``c(u) * a(u, v) / (s * p(u))`` as an edge feature, where ``a(u, v)`` is the
+    coefficient of mean aggregation, ``s`` the budget, ``p(u)`` the probability of
+    ``u`` and ``c(u)`` the number of times ``u`` is drawn.  Summing the messages
+    weighted by it gives an unbiased estimate of mean aggregation over all neighbors.
+
+    Only homogeneous graphs are supported.
+
+    Parameters
+    ----------
+    budgets : list[int]
+        Number of input nodes to draw for each GNN layer, starting from the first layer.
+    weight : str, default 'w'
+        The name of the edge feature storing the importance weights in the blocks.
+    edge_weight : str, optional
+        The name of the edge feature on the graph storing the edge weights of the
+        adjacency matrix.  If omitted, all edges have weight 1.
+    return_eids : bool, default False
+        Whether to return the edge IDs involved in message passing in the block.
+        If True, the edge IDs will be stored as an edge feature named ``dgl.EID``.
+
+    Examples
+    --------
+    To train a 3-layer GNN for node classification on a set of nodes ``train_nid`` with
+    512 input nodes per layer (assuming the backend is PyTorch):
+
+    >>> sampler = dgl.dataloading.FastGCNSampler([512, 512, 512])
+    >>> dataloader = dgl.dataloading.NodeDataLoader(
+    ...     g, train_nid, sampler, batch_size=256, shuffle=True)
+    >>> for input_nodes, output_nodes, blocks in dataloader:
+    ...     for block in blocks:
+    ...         block.update_all(fn.u_mul_e('h', 'w', 'm'), fn.sum('m', 'h'))
+
+    References
+    ----------
+    .. [1] Jie Chen, Tengfei Ma and Cao Xiao. FastGCN: Fast Learning with Graph
+       Convolutional Networks via Importance Sampling. ICLR 2018.
+    """
+    def __init__(self, budgets, weight='w', edge_weight=None, return_eids=False):
+        super().__init__(len(budgets), return_eids)
+        self.budgets = budgets
+        self.weight = weight
+        self.edge_weight = edge_weight
+
+    def _node_probability(self, src, value, col_norm):
+        """Return the unnormalized sampling probability of every candidate input node,
+        and the position of the source of every given edge among the candidates.
+
+        Parameters
+        ----------
+        src : numpy.ndarray
+            The source node of every inbound edge of the output nodes.
+        value : numpy.ndarray
+            The normalized adjacency value of every such edge.
+        col_norm : numpy.ndarray
+            The squared norm of every column of the normalized adjacency matrix.
+        """
+        return col_norm, src
+
+    def _reweight(self, weight, dst):
+        """Postprocess the importance weights of the edges in the frontier."""
+        return weight
+
+    def sample_frontier(self, block_id, g, seed_nodes):
+        if not isinstance(g, DGLGraph):
+            raise DGLError('{} does not support distributed graphs.'.format(
+                self.__class__.__name__))
+        if len(g.ntypes) > 1 or len(g.etypes) > 1:
+            raise DGLError('{} only supports homogeneous graphs.'.format(
+                self.__class__.__name__))
+        if isinstance(seed_nodes, dict):
+            seed_nodes = seed_nodes[g.ntypes[0]]
+        budget = self.budgets[block_id]
+        num_nodes = g.number_of_nodes()
+        all_src, all_dst, all_value, col_norm = _normalized_adjacency(g, self.edge_weight)
+
+        # Only the inbound edges of the output nodes are involved.
+        seed_nodes = F.unique(utils.prepare_tensor(g, seed_nodes, 'seed_nodes'))
+        in_eids = np.sort(F.asnumpy(g.in_edges(seed_nodes, form='eid')))
+        src = all_src[in_eids]
+        value = all_value[in_eids]
+        prob, pos = self._node_probability(src, value, col_norm)
+        total = prob.sum()
+
+        count = np.zeros(len(prob), dtype=np.int64)
+        if total > 0:
+            sampled = F.asnumpy(random.choice(
+                len(prob), budget, prob=F.zerocopy_from_numpy(prob)))
+            count = np.bincount(sampled, minlength=len(prob))
+        kept = count[pos] > 0
+        eids = in_eids[kept]
+        pos = pos[kept]
+        frontier_src = src[kept]
+        frontier_dst = all_dst[eids]
+        weight = count[pos] * value[kept] * total / (budget * prob[pos])
+        weight = self._reweight(weight, frontier_dst)
+
+        frontier = graph((F.zerocopy_from_numpy(frontier_src.astype(np.int64)),
+                          F.zerocopy_from_numpy(frontier_dst.astype(np.int64))),
+                         num_nodes=num_nodes, idtype=g.idtype)
+        frontier.edata[EID] = F.astype(F.zerocopy_from_numpy(eids.astype(np.int64)), g.idtype)
+        frontier.edata[self.weight] = F.zerocopy_from_numpy(weight.astype(np.float32))
+        return frontier
+
+class LADIESSampler(FastGCNSampler):
+    """Sampler that builds computational dependency of node representations via
+    layer-dependent importance sampling from LADIES [1]_.
+
+    Like :class:`FastGCNSampler`, the sampler draws a fixed budget of input nodes with
+    replacement for each layer.  The candidates are restricted to the neighbors of the
+    output nodes of the layer, and a candidate is drawn with a probability proportional
+    to the squared norm of its column in the normalized adjacency matrix restricted to
+    the rows of the output nodes.  The per-edge normalized adjacency values are
+    computed once and cached on the graph.
+
+    Every edge in the blocks carries the importance weight of :class:`FastGCNSampler`,
+    normalized to sum up to one over the inbound edges of every output node.
+
+    Only homogeneous graphs are supported.
+
+    Parameters
+    ----------
+    budgets : list[int]
+        Number of input nodes to draw for each GNN layer, starting from the first layer.
+    weight : str, default 'w'
+        The name of the edge feature storing the importance weights in the blocks.
+    edge_weight : str, optional
+        The name of the edge feature on the graph storing the edge weights of the
+        adjacency matrix.  If omitted, all edges have weight 1.
+    return_eids : bool, default False
+        Whether to return the edge IDs involved in message passing in the block.
+        If True, the edge IDs will be stored as an edge feature named ``dgl.EID``.
+
+    Examples
+    --------
+    To train a 3-layer GNN for node classification on a set of nodes ``train_nid`` with
+    512 input nodes per layer (assuming the backend is PyTorch):
+
+    >>> sampler = dgl.dataloading.LADIESSampler([512, 512, 512])
+    >>> dataloader = dgl.dataloading.NodeDataLoader(
+    ...     g, train_nid, sampler, batch_size=256, shuffle=True)
+    >>> for input_nodes, output_nodes, blocks in dataloader:
+    ...     for block in blocks:
+    ...         block.update_all(fn.u_mul_e('h', 'w', 'm'), fn.sum('m', 'h'))
+
+    References
+    ----------
+    .. [1] Difan Zou, Ziniu Hu, Yewen Wang, Song Jiang, Yizhou Sun and Quanquan Gu.
+       Layer-Dependent Importance Sampling for Training Deep and Large Graph
+       Convolutional Networks. NeurIPS 2019.
+    """
+    def _node_probability(self, src, value, col_norm):
+        _, pos = np.unique(src, return_inverse=True)
+        return np.bincount(pos, weights=value ** 2), pos
+
+    def _reweight(self, weight, dst):
+        _, pos = np.unique(dst, return_inverse=True)
+        in_weight = np.bincount(pos, weights=weight)
+        return weight / np.maximum(in_weight[pos], np.finfo(np.float64).tiny)
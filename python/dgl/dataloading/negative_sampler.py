@@ -1,6 +1,8 @@
 """Negative samplers"""
 from collections.abc import Mapping
 from .. import backend as F
+from .. import random
+from .. import sampling
 
 class _BaseNegativeSampler(object):
     def _generate(self, g, eids, canonical_etype):
@@ -63,5 +65,58 @@ class Uniform(_BaseNegativeSampler):
         shape = (shape[0] * self.k,)
         src, _ = g.find_edges(eids, etype=canonical_etype)
         src = F.repeat(src, self.k, 0)
-        dst = F.randint(shape, dtype, ctx, 0, g.number_of_nodes(vtype))
+        if random.is_deterministic() and ctx == F.cpu():
+            # key the negative examples by the edge so that they are reproducible
+            # regardless of the parallelism
+            dst = random.randint_by_key(eids, self.k, g.number_of_nodes(vtype))
+        else:
+            dst = F.randint(shape, dtype, ctx, 0, g.number_of_nodes(vtype))
         return src, dst
+
+class Unigram(_BaseNegativeSampler):
+    """Negative sampler that randomly chooses negative destination nodes
+    for each source node with a probability proportional to the in-degree of the
+    destination nodes to a power.
+
+    For each edge ``(u, v)`` of type ``(srctype, etype, dsttype)``, DGL generates
+    :attr:`k` pairs of negative edges ``(u, v')``, where ``v'`` is chosen from all the
+    nodes of type ``dsttype`` with a probability proportional to ``in_degree(v') **
+    power``.  The sampling runs in C++ with alias tables cached on the graph, and only
+    supports graphs on CPU.  See :func:`dgl.sampling.sample_negative_edges` for details.
+
+    Parameters
+    ----------
+    k : int
+        The number of negative examples per edge.
+    power : float, default 0.75
+        The exponent of the degrees.  0 chooses the nodes uniformly.
+    exclude_positive : bool, default False
+        If True, redraw the negative examples that are edges in the graph, for a bounded
+        number of times.  With ``chunk_size``, such examples are removed instead.
+    chunk_size : int, optional
+        If given, every ``chunk_size`` consecutive edges share the same ``k`` negative
+        nodes, as in knowledge graph embedding training.
+    corrupt : str, default 'dst'
+        ``'dst'`` to corrupt the destinations, or ``'src'`` to corrupt the sources
+        (with probabilities proportional to their out-degrees) instead.
+
+    Examples
+    --------
+    >>> g = dgl.graph(([0, 0, 1, 2], [1, 2, 2, 3]))
+    >>> neg_sampler = dgl.dataloading.negative_sampler.Unigram(2, exclude_positive=True)
+    >>> neg_sampler(g, torch.tensor([0, 3]))
+    (tensor([0, 0, 2, 2]), tensor([3, 3, 2, 1]))
+    """
+    def __init__(self, k, power=0.75, exclude_positive=False, chunk_size=None,
+                 corrupt='dst'):
+        self.k = k
+        self.power = power
+        self.exclude_positive = exclude_positive
+        self.chunk_size = chunk_size
+        self.corrupt = corrupt
+
+    def _generate(self, g, eids, canonical_etype):
+        return sampling.sample_negative_edges(
+            g, eids, self.k, etype=canonical_etype, power=self.power,
+            exclude_positive=self.exclude_positive, chunk_size=self.chunk_size,
+            corrupt=self.corrupt)
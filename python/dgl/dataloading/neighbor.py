@@ -1,5 +1,6 @@
 """Data loading components for neighbor sampling"""
 from .dataloader import BlockSampler
+from .. import backend as F
 from .. import sampling, subgraph, distributed
 
 class MultiLayerNeighborSampler(BlockSampler):
@@ -50,6 +51,13 @@ class MultiLayerNeighborSampler(BlockSampler):
     ...     {('user', 'follows', 'user'): 5,
     ...      ('user', 'plays', 'game'): 4,
     ...      ('game', 'played-by', 'user'): 3}] * 3)
+
+    Notes
+    -----
+    On a graph on CPU, the blocks of all layers are sampled in a single call of
+    :func:`dgl.sampling.sample_neighbor_blocks` unless edges are excluded or
+    :meth:`sample_frontier` is overridden.  The blocks then always carry the edge IDs
+    in the original graph as ``dgl.EID``.
     """
     def __init__(self, fanouts, replace=False, return_eids=False):
         super().__init__(len(fanouts), return_eids)
@@ -73,6 +81,33 @@ class MultiLayerNeighborSampler(BlockSampler):
                 frontier = sampling.sample_neighbors(g, seed_nodes, fanout, replace=self.replace)
         return frontier
 
+    def _fused_fanouts(self, g):
+        """Return the fanouts for :func:`dgl.sampling.sample_neighbor_blocks`, or None if
+        the blocks cannot be sampled in a single call."""
+        if type(self).sample_frontier is not MultiLayerNeighborSampler.sample_frontier:
+            return None
+        if isinstance(g, distributed.DistGraph) or g.device != F.cpu():
+            return None
+        fanouts = []
+        for fanout in self.fanouts:
+            if fanout is None:
+                fanout = -1
+            elif isinstance(fanout, dict) and len(fanout) != len(g.etypes):
+                return None
+            fanouts.append(fanout)
+        return fanouts
+
+    def sample_blocks(self, g, seed_nodes, exclude_eids=None):
+        fanouts = self._fused_fanouts(g) if exclude_eids is None else None
+        if fanouts is None:
+            return super().sample_blocks(g, seed_nodes, exclude_eids)
+        # Sample and relabel all the layers in one call.  The edge IDs of the blocks
+        # are always the ones in the original graph.
+        blocks = sampling.sample_neighbor_blocks(g, seed_nodes, fanouts, replace=self.replace)
+        for block in blocks:
+            block.create_formats_()
+        return blocks
+
 class MultiLayerFullNeighborSampler(MultiLayerNeighborSampler):
     """Sampler that builds computational dependency of node representations by taking messages
     from all neighbors for multilayer GNN.
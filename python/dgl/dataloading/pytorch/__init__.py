@@ -1,9 +1,28 @@
 """DGL PyTorch DataLoaders"""
 import inspect
+from functools import partial
+import torch
 from torch.utils.data import DataLoader
-from ..dataloader import NodeCollator, EdgeCollator, GraphCollator
+from ..dataloader import NodeCollator, EdgeCollator, GraphCollator, SubgraphCollator
 from ...distributed import DistGraph
 from ...distributed import DistDataLoader
+from ... import random
+from .prefetcher import _Prefetcher, _PrefetchingIter
+
+def _pop_prefetch_kwargs(kwargs):
+    return (kwargs.pop('prefetch_node_feats', None), kwargs.pop('device', None),
+            kwargs.pop('num_prefetch', 2))
+
+def _reseed_worker(worker_init_fn, worker_id):
+    """Reseed DGL in a worker process before calling the user's ``worker_init_fn``.
+
+    The worker processes inherit the random state of DGL from the main process, so
+    they would generate the same samples.  PyTorch gives every worker of every epoch
+    a different seed, from which DGL is reseeded.
+    """
+    random.seed(torch.initial_seed() % (2 ** 31))
+    if worker_init_fn is not None:
+        worker_init_fn(worker_id)
 
 def _remove_kwargs_dist(kwargs):
     if 'num_workers' in kwargs:
@@ -139,6 +158,13 @@ class _EdgeCollator(EdgeCollator):
             _pop_blocks_storage(result[-1], self.g_sampling)
             return result
 
+class _SubgraphCollator(SubgraphCollator):
+    def collate(self, items):
+        # subgraph
+        result = super().collate(items)
+        _pop_subgraph_storage(result, self.g)
+        return result
+
 class _NodeDataLoaderIter:
     def __init__(self, node_dataloader):
         self.node_dataloader = node_dataloader
@@ -170,6 +196,17 @@ class _EdgeDataLoaderIter:
             _restore_blocks_storage(result[-1], self.edge_dataloader.collator.g_sampling)
             return result
 
+class _SubgraphDataLoaderIter:
+    def __init__(self, subgraph_dataloader):
+        self.subgraph_dataloader = subgraph_dataloader
+        self.iter_ = iter(subgraph_dataloader.dataloader)
+
+    def __next__(self):
+        # subgraph
+        result = next(self.iter_)
+        _restore_subgraph_storage(result, self.subgraph_dataloader.collator.g)
+        return result
+
 class NodeDataLoader:
     """PyTorch dataloader for batch-iterating over a set of nodes, generating the list
     of blocks as computation dependency of the said minibatch.
@@ -182,6 +219,16 @@ class NodeDataLoader:
         The node set to compute outputs.
     block_sampler : dgl.dataloading.BlockSampler
         The neighborhood sampler.
+    prefetch_node_feats : list[str] or dict[ntype, list[str]], optional
+        The node features to gather for the input nodes of the first block, or a
+        dictionary of node types and such features.  If given, the features are
+        gathered in a background thread while the previous minibatches are being
+        consumed.  See :ref:`the notes <dataloader-prefetch-notes>` below.
+    device : device context, optional
+        The device to move the blocks and the prefetched features to.  The features
+        are copied from pinned memory on a separate CUDA stream if it is a GPU.
+    num_prefetch : int, default 2
+        The maximum number of minibatches prepared in advance by the background thread.
     kwargs : dict
         Arguments being passed to :py:class:`torch.utils.data.DataLoader`.
 
@@ -197,10 +244,30 @@ class NodeDataLoader:
     ...     batch_size=1024, shuffle=True, drop_last=False, num_workers=4)
     >>> for input_nodes, output_nodes, blocks in dataloader:
     ...     train_on(input_nodes, output_nodes, blocks)
+
+    To gather the input features ``'feat'`` and copy them together with the blocks to
+    the GPU in the background:
+
+    >>> dataloader = dgl.dataloading.NodeDataLoader(
+    ...     g, train_nid, sampler, prefetch_node_feats=['feat'], device='cuda:0',
+    ...     batch_size=1024, shuffle=True, drop_last=False, num_workers=4)
+    >>> for input_nodes, output_nodes, blocks in dataloader:
+    ...     train_on(blocks, blocks[0].srcdata['feat'])
+
+    .. _dataloader-prefetch-notes:
+
+    Notes
+    -----
+    Without prefetching, the input features of the blocks are gathered from the
+    graph lazily on first access, i.e. in the main process between the training
+    steps.  With ``prefetch_node_feats`` or ``device``, a background thread gathers
+    the features of the upcoming minibatches into reusable pinned memory buffers
+    and copies them to the device while the current minibatch is being trained on.
     """
     collator_arglist = inspect.getfullargspec(NodeCollator).args
 
     def __init__(self, g, nids, block_sampler, **kwargs):
+        prefetch_node_feats, device, num_prefetch = _pop_prefetch_kwargs(kwargs)
         collator_kwargs = {}
         dataloader_kwargs = {}
         for k, v in kwargs.items():
@@ -224,12 +291,20 @@ class NodeDataLoader:
                                          collate_fn=self.collator.collate,
                                          **dataloader_kwargs)
             self.is_distributed = False
+        self.prefetcher = None
+        if prefetch_node_feats is not None or device is not None:
+            assert not self.is_distributed, \
+                    'NodeDataLoader does not support prefetching with DistGraph.'
+            self.prefetcher = _Prefetcher(g, prefetch_node_feats, device)
+        self.num_prefetch = num_prefetch
 
     def __iter__(self):
         """Return the iterator of the data loader."""
         if self.is_distributed:
             # Directly use the iterator of DistDataLoader, which doesn't copy features anyway.
             return iter(self.dataloader)
+        elif self.prefetcher is not None:
+            return _PrefetchingIter(_NodeDataLoaderIter(self), self.prefetcher, self.num_prefetch)
         else:
             return _NodeDataLoaderIter(self)
 
@@ -301,6 +376,16 @@ class EdgeDataLoader:
 
         See the description of the argument with the same name in the docstring of
         :class:`~dgl.dataloading.EdgeCollator` for more details.
+    prefetch_node_feats : list[str] or dict[ntype, list[str]], optional
+        The node features to gather for the input nodes of the first block in a
+        background thread.
+
+        See the description of the argument with the same name in the docstring of
+        :class:`~dgl.dataloading.pytorch.NodeDataLoader` for more details.
+    device : device context, optional
+        The device to move the pair graphs, the blocks and the prefetched features to.
+    num_prefetch : int, default 2
+        The maximum number of minibatches prepared in advance by the background thread.
     kwargs : dict
         Arguments being passed to :py:class:`torch.utils.data.DataLoader`.
 
@@ -398,6 +483,7 @@ class EdgeDataLoader:
     collator_arglist = inspect.getfullargspec(EdgeCollator).args
 
     def __init__(self, g, eids, block_sampler, **kwargs):
+        prefetch_node_feats, device, num_prefetch = _pop_prefetch_kwargs(kwargs)
         collator_kwargs = {}
         dataloader_kwargs = {}
         for k, v in kwargs.items():
@@ -412,15 +498,67 @@ class EdgeDataLoader:
                 + 'Please use DistDataLoader directly.'
         self.dataloader = DataLoader(
             self.collator.dataset, collate_fn=self.collator.collate, **dataloader_kwargs)
+        self.prefetcher = None
+        if prefetch_node_feats is not None or device is not None:
+            self.prefetcher = _Prefetcher(
+                self.collator.g_sampling, prefetch_node_feats, device)
+        self.num_prefetch = num_prefetch
 
     def __iter__(self):
         """Return the iterator of the data loader."""
+        if self.prefetcher is not None:
+            return _PrefetchingIter(_EdgeDataLoaderIter(self), self.prefetcher, self.num_prefetch)
         return _EdgeDataLoaderIter(self)
 
     def __len__(self):
         """Return the number of batches of the data loader."""
         return len(self.dataloader)
 
+class SubgraphDataLoader:
+    """PyTorch dataloader for batch-iterating over subgraphs of a single graph generated
+    by a subgraph sampler, e.g. for ClusterGCN and GraphSAINT.
+
+    The precomputation of the subgraph sampler, such as graph partitioning, is done once
+    when the data loader is created and shared with the worker processes.  DGL's random
+    number generator is reseeded in every worker process, so the workers generate
+    different subgraphs.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.
+    subgraph_sampler : dgl.dataloading.SubgraphSampler
+        The subgraph sampler.
+    kwargs : dict
+        Arguments being passed to :py:class:`torch.utils.data.DataLoader`.
+
+    Examples
+    --------
+    To train a GNN on minibatches of 20 clusters out of 1000 with ClusterGCN (assume
+    the backend is PyTorch):
+
+    >>> sampler = dgl.dataloading.ClusterGCNSampler(1000, 'partition.npz')
+    >>> dataloader = dgl.dataloading.SubgraphDataLoader(
+    ...     g, sampler, batch_size=20, shuffle=True, drop_last=False, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg)
+    """
+    def __init__(self, g, subgraph_sampler, **kwargs):
+        assert not isinstance(g, DistGraph), \
+                'SubgraphDataLoader does not support DistGraph for now.'
+        self.collator = _SubgraphCollator(g, subgraph_sampler)
+        kwargs['worker_init_fn'] = partial(_reseed_worker, kwargs.get('worker_init_fn'))
+        self.dataloader = DataLoader(
+            self.collator.dataset, collate_fn=self.collator.collate, **kwargs)
+
+    def __iter__(self):
+        """Return the iterator of the data loader."""
+        return _SubgraphDataLoaderIter(self)
+
+    def __len__(self):
+        """Return the number of batches of the data loader."""
+        return len(self.dataloader)
+
 class GraphDataLoader:
     """PyTorch dataloader for batch-iterating over a set of graphs, generating the batched
     graph and corresponding label tensor (if provided) of the said minibatch.
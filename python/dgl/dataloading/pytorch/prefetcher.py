@@ -0,0 +1,172 @@
+"""Prefetching input features of minibatches in a background thread"""
+import threading
+import queue
+from collections.abc import Mapping
+import torch
+
+from ...base import NID
+from ...heterograph import DGLHeteroGraph
+from ..async_transferer import AsyncTransferer
+
+class _PinnedBuffer(object):
+    """A pinned memory buffer reused for gathering rows of a feature tensor.
+
+    The buffer only grows, so that the pinned memory is rarely reallocated.
+    """
+    def __init__(self):
+        self._buffer = None
+
+    def gather(self, feat, index):
+        """Gather the rows of ``feat`` into the buffer and return a view of them."""
+        shape = (index.shape[0],) + tuple(feat.shape[1:])
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        if self._buffer is None or self._buffer.dtype != feat.dtype or \
+                self._buffer.numel() < numel:
+            # over-allocate to avoid reallocating for slightly larger minibatches
+            self._buffer = torch.empty(numel + numel // 4, dtype=feat.dtype).pin_memory()
+        out = self._buffer[:numel].view(shape)
+        torch.index_select(feat, 0, index, out=out)
+        return out
+
+class _Prefetcher(object):
+    """Gathers the input node features of the blocks of every minibatch and copies them
+    to the target device.
+
+    For a GPU device, the features are gathered into reusable pinned memory buffers and
+    copied with :class:`~dgl.dataloading.AsyncTransferer` on a separate CUDA stream.
+    The blocks and the other graphs in the minibatch are moved to the device as well.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph the blocks are sampled from.
+    node_feats : list[str] or dict[str, list[str]]
+        The names of the node features to prefetch, or a dictionary of node types and
+        such names.
+    device : torch.device, optional
+        The device to move the features and the blocks to.
+    """
+    def __init__(self, g, node_feats, device):
+        self.g = g
+        if node_feats is None:
+            node_feats = {}
+        elif not isinstance(node_feats, Mapping):
+            node_feats = {ntype: node_feats for ntype in g.ntypes}
+        self.node_feats = {ntype: list(names) for ntype, names in node_feats.items()}
+        self.device = torch.device(device) if device is not None else None
+        self.use_pinned = self.device is not None and self.device.type == 'cuda'
+        self.buffers = {}
+        self.transferer = AsyncTransferer(self.device) if self.use_pinned else None
+
+    def _fetch(self, key, feat, index):
+        if not self.use_pinned or feat.is_cuda:
+            feat = torch.index_select(feat, 0, index.to(feat.device))
+            return feat if self.device is None else feat.to(self.device)
+        buf = self.buffers.setdefault(key, _PinnedBuffer())
+        out = buf.gather(feat, index)
+        # Wait for the copy before reusing the buffer.  The copy runs on a separate
+        # stream, so it overlaps with the computation of the previous minibatch.
+        return self.transferer.async_copy(out, self.device).wait()
+
+    def __call__(self, result):
+        """Prefetch the features of a minibatch ending with the list of blocks, and move
+        the graphs in it to the device."""
+        result = list(result)
+        if self.device is not None:
+            result[:-1] = [x.to(self.device) if isinstance(x, DGLHeteroGraph) else x
+                           for x in result[:-1]]
+        result[-1] = self._prefetch_blocks(result[-1])
+        return tuple(result)
+
+    def _prefetch_blocks(self, blocks):
+        block = blocks[0]
+        feats = {}
+        for ntype, names in self.node_feats.items():
+            if ntype not in block.srctypes or ntype not in self.g.ntypes:
+                continue
+            srcdata = block.srcnodes[ntype].data
+            index = srcdata[NID].long()
+            for name in names:
+                if name not in self.g.nodes[ntype].data:
+                    continue
+                feats[ntype, name] = self._fetch(
+                    (ntype, name), self.g.nodes[ntype].data[name], index)
+                # avoid gathering the same rows again when moving the block
+                if name in srcdata:
+                    srcdata.pop(name)
+        if self.device is not None:
+            blocks = [b.to(self.device) for b in blocks]
+        for (ntype, name), feat in feats.items():
+            blocks[0].srcnodes[ntype].data[name] = feat
+        return blocks
+
+class _PrefetchingIter(object):
+    """Iterator that runs the prefetcher on the minibatches of another iterator in a
+    background thread, so that preparing the next minibatches overlaps with training
+    on the current one.
+
+    Parameters
+    ----------
+    it : iterator
+        The iterator whose minibatches end with the list of blocks.  Only ``next`` is
+        called on it.
+    prefetcher : _Prefetcher
+        The prefetcher.
+    num_prefetch : int
+        The maximum number of minibatches prepared in advance.
+    """
+    _END = object()
+
+    def __init__(self, it, prefetcher, num_prefetch):
+        self.queue = queue.Queue(num_prefetch)
+        self.stopped = threading.Event()
+        self.done = False
+        self.thread = threading.Thread(
+            target=self._run, args=(it, prefetcher, self.queue, self.stopped), daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def _put(cls, q, stopped, item):
+        # give up when the consumer abandons the iterator
+        while not stopped.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @classmethod
+    def _run(cls, it, prefetcher, q, stopped):
+        try:
+            while True:
+                try:
+                    result = next(it)
+                except StopIteration:
+                    break
+                if not cls._put(q, stopped, (prefetcher(result), None)):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            cls._put(q, stopped, (None, e))
+            return
+        cls._put(q, stopped, (cls._END, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.done:
+            raise StopIteration
+        result, exception = self.queue.get()
+        if exception is not None or result is self._END:
+            self.done = True
+            self.stopped.set()
+            if exception is not None:
+                raise exception
+            raise StopIteration
+        return result
+
+    def __del__(self):
+        self.stopped.set()
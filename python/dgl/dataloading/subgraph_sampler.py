@@ -0,0 +1,393 @@
+"""Data loading components for subgraph sampling"""
+import os
+import numpy as np
+
+from .. import backend as F
+from .. import random, sampling
+from ..base import DGLError, NID, EID
+from ..heterograph import DGLHeteroGraph as DGLGraph
+from ..partition import metis_partition_assignment
+from .inference import _graph_digest
+
+__all__ = ['SubgraphSampler', 'ClusterGCNSampler', 'GraphSAINTSampler',
+           'GraphSAINTNodeSampler', 'GraphSAINTEdgeSampler', 'GraphSAINTRandomWalkSampler']
+
+def _check_homogeneous(g, sampler):
+    if not isinstance(g, DGLGraph):
+        raise DGLError('{} does not support distributed graphs.'.format(
+            sampler.__class__.__name__))
+    if len(g.ntypes) > 1 or len(g.etypes) > 1:
+        raise DGLError('{} only supports homogeneous graphs.'.format(
+            sampler.__class__.__name__))
+
+class SubgraphSampler(object):
+    """Abstract class specifying a subgraph sampler which generates one subgraph of
+    the whole graph per minibatch, e.g. for ClusterGCN and GraphSAINT.
+
+    One would implement :meth:`prepare` to precompute the information shared by all
+    minibatches, and :meth:`sample_subgraph` to generate the subgraph of a minibatch.
+
+    :meth:`prepare` is called once when the collator is created, i.e. before the
+    sampler is sent to the worker processes, so the precomputed information is never
+    computed more than once.
+    """
+    def prepare(self, g):
+        """Precompute the information shared by all minibatches of a graph.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The graph.
+
+        Returns
+        -------
+        Tensor
+            The items to iterate over.  Every minibatch consists of a subset of them.
+        """
+        raise NotImplementedError
+
+    def sample_subgraph(self, g, items):
+        """Generate the subgraph of a minibatch.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The graph.
+        items : Tensor
+            The items in the minibatch.
+
+        Returns
+        -------
+        DGLGraph
+            The subgraph.  The node and edge IDs in the original graph are stored as
+            ``dgl.NID`` and ``dgl.EID`` features.
+        """
+        raise NotImplementedError
+
+class ClusterGCNSampler(SubgraphSampler):
+    """Subgraph sampler from ClusterGCN [1]_.
+
+    The graph is partitioned into ``num_partitions`` clusters with METIS, and every
+    minibatch is the subgraph induced by the nodes of a set of clusters.  The items to
+    iterate over are the cluster IDs, so the batch size of the data loader is the
+    number of clusters per minibatch.
+
+    Partitioning a large graph takes long, so the partition assignment is cached on
+    the graph, and also on disk if ``cache_path`` is given.  An assignment on disk is
+    only reused if it was computed for the same graph structure, number of partitions
+    and ``balance_edges``.
+
+    Parameters
+    ----------
+    num_partitions : int
+        The number of clusters.
+    cache_path : str, optional
+        The path of the file storing the partition assignment in numpy ``.npz`` format.
+    balance_edges : bool, default False
+        Whether to balance the number of edges in every cluster.
+
+    Examples
+    --------
+    To train a GNN on minibatches of 20 clusters out of 1000 (assuming the backend is
+    PyTorch):
+
+    >>> sampler = dgl.dataloading.ClusterGCNSampler(1000, 'reddit_1000.npz')
+    >>> dataloader = dgl.dataloading.SubgraphDataLoader(
+    ...     g, sampler, batch_size=20, shuffle=True, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg)
+
+    References
+    ----------
+    .. [1] Wei-Lin Chiang, Xuanqing Liu, Si Si, Yang Li, Samy Bengio and Cho-Jui Hsieh.
+       Cluster-GCN: An Efficient Algorithm for Training Deep and Large Graph
+       Convolutional Networks. KDD 2019.
+    """
+    def __init__(self, num_partitions, cache_path=None, balance_edges=False):
+        self.num_partitions = num_partitions
+        self.cache_path = cache_path
+        self.balance_edges = balance_edges
+        self.partition_offset = None
+        self.partition_nodes = None
+
+    def _load_assignment(self, digest):
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return None
+        data = np.load(self.cache_path)
+        if not isinstance(data, np.lib.npyio.NpzFile):
+            return None
+        with data:
+            if any(key not in data for key in
+                   ['assignment', 'num_partitions', 'balance_edges', 'digest']):
+                return None
+            if int(data['num_partitions']) != self.num_partitions or \
+                    bool(data['balance_edges']) != self.balance_edges or \
+                    str(data['digest']) != digest:
+                return None
+            return data['assignment']
+
+    def _compute_assignment(self, g):
+        digest = _graph_digest(g) if self.cache_path is not None else None
+        assignment = self._load_assignment(digest)
+        if assignment is None:
+            assignment = F.asnumpy(metis_partition_assignment(
+                g, self.num_partitions, balance_edges=self.balance_edges))
+            if self.cache_path is not None:
+                # write through a file object so that numpy does not append a suffix
+                with open(self.cache_path, 'wb') as f:
+                    np.savez(f, assignment=assignment, num_partitions=self.num_partitions,
+                             balance_edges=self.balance_edges, digest=digest)
+        return assignment
+
+    def prepare(self, g):
+        _check_homogeneous(g, self)
+        assignment = g._get_cached_info(
+            ('metis_assignment', self.num_partitions, self.balance_edges),
+            lambda: self._compute_assignment(g))
+        # group the nodes by cluster, so that a cluster is a contiguous slice
+        self.partition_offset = np.zeros(self.num_partitions + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=self.num_partitions),
+                  out=self.partition_offset[1:])
+        self.partition_nodes = np.argsort(assignment, kind='stable')
+        return F.arange(0, self.num_partitions)
+
+    def sample_subgraph(self, g, items):
+        items = F.asnumpy(items)
+        nodes = np.concatenate([
+            self.partition_nodes[self.partition_offset[i]:self.partition_offset[i + 1]]
+            for i in items])
+        return g.subgraph(F.copy_to(F.tensor(nodes, dtype=g.idtype), g.device))
+
+class GraphSAINTSampler(SubgraphSampler):
+    """Base class of the subgraph samplers from GraphSAINT [1]_.
+
+    Every item is a single subgraph, so the batch size of the data loader should be 1.
+    An epoch consists of ``num_subgraphs`` subgraphs.
+
+    Before training, ``num_norm_subgraphs`` subgraphs are sampled once to estimate how
+    likely every node and edge appears in a subgraph.  The subgraphs then carry the
+    normalization coefficients of GraphSAINT:
+
+    * ``ndata[node_norm]``, the loss normalization coefficient of every node, which
+      is inversely proportional to the probability of the node being sampled.  Summing
+      the node losses weighted by it gives an unbiased estimate of the mean loss on the
+      whole graph.
+    * ``edata[edge_norm]``, the aggregator normalization coefficient of every edge,
+      i.e. the number of times the destination node is sampled divided by the number of
+      times the edge is sampled.
+
+    Subclasses implement :meth:`sample_nodes`.
+
+    Parameters
+    ----------
+    num_subgraphs : int
+        The number of subgraphs in an epoch.
+    num_norm_subgraphs : int, default 50
+        The number of subgraphs to sample for estimating the normalization coefficients.
+    node_norm : str, default 'node_norm'
+        The name of the node feature storing the loss normalization coefficients.
+    edge_norm : str, default 'edge_norm'
+        The name of the edge feature storing the aggregator normalization coefficients.
+
+    References
+    ----------
+    .. [1] Hanqing Zeng, Hongkuan Zhou, Ajitesh Srivastava, Rajgopal Kannan and Viktor
+       Prasanna. GraphSAINT: Graph Sampling Based Inductive Learning Method. ICLR 2020.
+    """
+    def __init__(self, num_subgraphs, num_norm_subgraphs=50, node_norm='node_norm',
+                 edge_norm='edge_norm'):
+        self.num_subgraphs = num_subgraphs
+        self.num_norm_subgraphs = num_norm_subgraphs
+        self.node_norm = node_norm
+        self.edge_norm = edge_norm
+        self.node_norm_values = None
+        self.edge_norm_values = None
+
+    def sample_nodes(self, g):
+        """Sample the nodes of a subgraph.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The graph.
+
+        Returns
+        -------
+        Tensor
+            The unique IDs of the sampled nodes.
+        """
+        raise NotImplementedError
+
+    def prepare(self, g):
+        _check_homogeneous(g, self)
+        num_nodes = g.number_of_nodes()
+        num_edges = g.number_of_edges()
+        node_count = np.zeros(num_nodes, dtype=np.int64)
+        edge_count = np.zeros(num_edges, dtype=np.int64)
+        for _ in range(self.num_norm_subgraphs):
+            subg = g.subgraph(self.sample_nodes(g))
+            node_count[F.asnumpy(subg.ndata[NID])] += 1
+            edge_count[F.asnumpy(subg.edata[EID])] += 1
+        node_count = np.maximum(node_count, 1)
+        edge_count = np.maximum(edge_count, 1)
+        _, dst = g.edges(order='eid')
+        node_norm = self.num_norm_subgraphs / (node_count * num_nodes)
+        edge_norm = node_count[F.asnumpy(dst)] / edge_count
+        self.node_norm_values = F.copy_to(
+            F.tensor(node_norm.astype(np.float32)), g.device)
+        self.edge_norm_values = F.copy_to(
+            F.tensor(edge_norm.astype(np.float32)), g.device)
+        return F.arange(0, self.num_subgraphs)
+
+    def sample_subgraph(self, g, items):
+        subg = g.subgraph(self.sample_nodes(g))
+        subg.ndata[self.node_norm] = F.gather_row(self.node_norm_values, subg.ndata[NID])
+        subg.edata[self.edge_norm] = F.gather_row(self.edge_norm_values, subg.edata[EID])
+        return subg
+
+class GraphSAINTNodeSampler(GraphSAINTSampler):
+    """Node sampler from GraphSAINT [1]_.
+
+    Every subgraph is induced by ``budget`` nodes drawn with replacement, with a
+    probability proportional to their in-degrees.
+
+    Parameters
+    ----------
+    budget : int
+        The number of nodes to draw for every subgraph.
+    num_subgraphs : int
+        The number of subgraphs in an epoch.
+    num_norm_subgraphs : int, default 50
+        The number of subgraphs to sample for estimating the normalization coefficients.
+    node_norm : str, default 'node_norm'
+        The name of the node feature storing the loss normalization coefficients.
+    edge_norm : str, default 'edge_norm'
+        The name of the edge feature storing the aggregator normalization coefficients.
+
+    Examples
+    --------
+    To train a GNN on 100 subgraphs of up to 6000 nodes per epoch (assuming the backend
+    is PyTorch):
+
+    >>> sampler = dgl.dataloading.GraphSAINTNodeSampler(6000, 100)
+    >>> dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg, subg.ndata['node_norm'], subg.edata['edge_norm'])
+
+    References
+    ----------
+    .. [1] Hanqing Zeng, Hongkuan Zhou, Ajitesh Srivastava, Rajgopal Kannan and Viktor
+       Prasanna. GraphSAINT: Graph Sampling Based Inductive Learning Method. ICLR 2020.
+    """
+    def __init__(self, budget, num_subgraphs, num_norm_subgraphs=50,
+                 node_norm='node_norm', edge_norm='edge_norm'):
+        super().__init__(num_subgraphs, num_norm_subgraphs, node_norm, edge_norm)
+        self.budget = budget
+
+    def sample_nodes(self, g):
+        prob = g._get_cached_info(
+            ('saint_node_prob',),
+            lambda: F.astype(F.clamp(g.in_degrees(), 1, g.number_of_nodes()), F.float32))
+        nodes = random.choice(g.number_of_nodes(), self.budget, prob=prob)
+        return F.unique(F.astype(nodes, g.idtype))
+
+class GraphSAINTEdgeSampler(GraphSAINTSampler):
+    """Edge sampler from GraphSAINT [1]_.
+
+    Every subgraph is induced by the endpoints of ``budget`` edges drawn with
+    replacement, where the probability of the edge ``(u, v)`` is proportional to
+    ``1 / deg(u) + 1 / deg(v)`` with ``deg`` being the in-degree.
+
+    Parameters
+    ----------
+    budget : int
+        The number of edges to draw for every subgraph.
+    num_subgraphs : int
+        The number of subgraphs in an epoch.
+    num_norm_subgraphs : int, default 50
+        The number of subgraphs to sample for estimating the normalization coefficients.
+    node_norm : str, default 'node_norm'
+        The name of the node feature storing the loss normalization coefficients.
+    edge_norm : str, default 'edge_norm'
+        The name of the edge feature storing the aggregator normalization coefficients.
+
+    Examples
+    --------
+    To train a GNN on 100 subgraphs of up to 4000 edges per epoch (assuming the backend
+    is PyTorch):
+
+    >>> sampler = dgl.dataloading.GraphSAINTEdgeSampler(4000, 100)
+    >>> dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg, subg.ndata['node_norm'], subg.edata['edge_norm'])
+
+    References
+    ----------
+    .. [1] Hanqing Zeng, Hongkuan Zhou, Ajitesh Srivastava, Rajgopal Kannan and Viktor
+       Prasanna. GraphSAINT: Graph Sampling Based Inductive Learning Method. ICLR 2020.
+    """
+    def __init__(self, budget, num_subgraphs, num_norm_subgraphs=50,
+                 node_norm='node_norm', edge_norm='edge_norm'):
+        super().__init__(num_subgraphs, num_norm_subgraphs, node_norm, edge_norm)
+        self.budget = budget
+
+    def _edge_prob(self, g):
+        deg = F.asnumpy(g.in_degrees()).clip(min=1)
+        src, dst = g.edges(order='eid')
+        prob = 1. / deg[F.asnumpy(src)] + 1. / deg[F.asnumpy(dst)]
+        return F.tensor(prob.astype(np.float32))
+
+    def sample_nodes(self, g):
+        prob = g._get_cached_info(('saint_edge_prob',), lambda: self._edge_prob(g))
+        eids = random.choice(g.number_of_edges(), self.budget, prob=prob)
+        src, dst = g.find_edges(F.copy_to(F.astype(eids, g.idtype), g.device))
+        return F.unique(F.cat([src, dst], 0))
+
+class GraphSAINTRandomWalkSampler(GraphSAINTSampler):
+    """Random walk sampler from GraphSAINT [1]_.
+
+    Every subgraph is induced by the nodes visited by random walks of length
+    ``walk_length`` starting from ``num_roots`` nodes picked uniformly at random.
+
+    Parameters
+    ----------
+    num_roots : int
+        The number of random walks for every subgraph.
+    walk_length : int
+        The length of every random walk.
+    num_subgraphs : int
+        The number of subgraphs in an epoch.
+    num_norm_subgraphs : int, default 50
+        The number of subgraphs to sample for estimating the normalization coefficients.
+    node_norm : str, default 'node_norm'
+        The name of the node feature storing the loss normalization coefficients.
+    edge_norm : str, default 'edge_norm'
+        The name of the edge feature storing the aggregator normalization coefficients.
+
+    Examples
+    --------
+    To train a GNN on 100 subgraphs sampled by 3000 random walks of length 2 per epoch
+    (assuming the backend is PyTorch):
+
+    >>> sampler = dgl.dataloading.GraphSAINTRandomWalkSampler(3000, 2, 100)
+    >>> dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler, num_workers=4)
+    >>> for subg in dataloader:
+    ...     train_on(subg, subg.ndata['node_norm'], subg.edata['edge_norm'])
+
+    References
+    ----------
+    .. [1] Hanqing Zeng, Hongkuan Zhou, Ajitesh Srivastava, Rajgopal Kannan and Viktor
+       Prasanna. GraphSAINT: Graph Sampling Based Inductive Learning Method. ICLR 2020.
+    """
+    def __init__(self, num_roots, walk_length, num_subgraphs, num_norm_subgraphs=50,
+                 node_norm='node_norm', edge_norm='edge_norm'):
+        super().__init__(num_subgraphs, num_norm_subgraphs, node_norm, edge_norm)
+        self.num_roots = num_roots
+        self.walk_length = walk_length
+
+    def sample_nodes(self, g):
+        roots = random.choice(g.number_of_nodes(), self.num_roots)
+        roots = F.copy_to(F.astype(roots, g.idtype), g.device)
+        traces, _ = sampling.random_walk(g, roots, length=self.walk_length)
+        traces = F.reshape(traces, (-1,))
+        return F.unique(F.boolean_mask(traces, traces >= 0))
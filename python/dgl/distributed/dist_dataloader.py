@@ -4,6 +4,8 @@ import multiprocessing as mp
 from queue import Queue
 import traceback
 
+import numpy as np
+
 from .dist_context import get_sampler_pool
 from .. import backend as F
 
@@ -52,6 +54,59 @@ def enable_mp_debug():
     logger = mp.log_to_stderr()
     logger.setLevel(logging.DEBUG)
 
+def _group_by_locality(g, nodes):
+    """Reorder seed nodes so that seeds sharing 1-hop neighbors are adjacent.
+
+    Seeds in the local partition are clustered by the MinHash of their closed
+    in-neighborhoods under a random permutation of the local partition's nodes, so
+    two seeds fall into the same cluster with a probability equal to the Jaccard
+    similarity of their neighborhoods. Seeds owned by other partitions are placed
+    after the local ones, grouped by partition.
+
+    Parameters
+    ----------
+    g : DistGraph
+        The distributed graph.
+    nodes : tensor
+        The seed node IDs.
+
+    Returns
+    -------
+    numpy.ndarray
+        The reordered seed node IDs.
+    """
+    nodes = F.asnumpy(nodes)
+    local_g = g.local_partition
+    if local_g is None or len(nodes) == 0:
+        return nodes
+    gpb = g.get_partition_book()
+    part_ids, local_ids = gpb.map_nids(F.tensor(nodes))
+    part_ids = F.asnumpy(part_ids)
+    local_ids = F.asnumpy(local_ids)
+    is_local = part_ids == gpb.partid
+
+    local_pos = np.nonzero(is_local)[0]
+    local_seeds = local_ids[local_pos]
+    src, dst = local_g.in_edges(F.tensor(np.unique(local_seeds), local_g.idtype))
+    minhash = np.random.permutation(local_g.number_of_nodes())
+    np.minimum.at(minhash, F.asnumpy(dst), minhash[F.asnumpy(src)])
+    local_order = local_pos[np.argsort(minhash[local_seeds], kind='stable')]
+
+    remote_pos = np.nonzero(~is_local)[0]
+    remote_order = remote_pos[np.argsort(part_ids[remote_pos], kind='stable')]
+    return nodes[np.concatenate([local_order, remote_order])]
+
+def _shuffle_batches(nodes, batch_size):
+    """Shuffle the order of the full mini-batches while keeping each batch intact.
+
+    The last incomplete batch, if any, stays at the end.
+    """
+    num_full = len(nodes) // batch_size
+    full_end = num_full * batch_size
+    perm = np.random.permutation(num_full)
+    full = nodes[:full_end].reshape(num_full, batch_size)[perm].reshape(-1)
+    return np.concatenate([full, nodes[full_end:]])
+
 DATALOADER_ID = 0
 
 class DistDataLoader:
@@ -78,6 +133,15 @@ class DistDataLoader:
         by the batch size, then the last batch will be smaller. (default: ``False``)
     queue_size: int, optional
         Size of multiprocessing queue
+    locality_graph: DistGraph, optional
+        If given, the dataset must contain node IDs of this graph, and the nodes are
+        grouped into mini-batches whose seeds share 1-hop neighbors in the local
+        partition, so that more of the sampling in each mini-batch is served by
+        the local partition instead of remote machines. Seeds that are not in the
+        local partition form the last mini-batches, grouped by partition.
+        With ``shuffle=True``, the grouping is recomputed at every epoch and the order
+        of the mini-batches, instead of the order of the individual seeds, is
+        shuffled. (default: ``None``)
 
     Examples
     --------
@@ -108,7 +172,7 @@ class DistDataLoader:
     """
 
     def __init__(self, dataset, batch_size, shuffle=False, collate_fn=None, drop_last=False,
-                 queue_size=None):
+                 queue_size=None, locality_graph=None):
         self.pool, self.num_workers = get_sampler_pool()
         if queue_size is None:
             queue_size = self.num_workers * 4 if self.num_workers > 0 else 4
@@ -128,7 +192,10 @@ class DistDataLoader:
         self.shuffle = shuffle
         self.is_closed = False
 
+        self.locality_graph = locality_graph
         self.dataset = F.tensor(dataset)
+        if self.locality_graph is not None and not self.shuffle:
+            self.dataset = F.tensor(_group_by_locality(self.locality_graph, self.dataset))
         self.expected_idxs = len(dataset) // self.batch_size
         if not self.drop_last and len(dataset) % self.batch_size != 0:
             self.expected_idxs += 1
@@ -169,7 +236,10 @@ class DistDataLoader:
             raise StopIteration
 
     def __iter__(self):
-        if self.shuffle:
+        if self.shuffle and self.locality_graph is not None:
+            dataset = _group_by_locality(self.locality_graph, self.dataset)
+            self.dataset = F.tensor(_shuffle_batches(dataset, self.batch_size))
+        elif self.shuffle:
             self.dataset = F.rand_shuffle(self.dataset)
         self.recv_idxs = 0
         self.current_pos = 0
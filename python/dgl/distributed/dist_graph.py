@@ -11,7 +11,7 @@ from ..base import NID, EID
 from .kvstore import KVServer, get_kvstore
 from .._ffi.ndarray import empty_shared_mem
 from ..frame import infer_scheme
-from .partition import load_partition, load_partition_book
+from .partition import load_partition, load_partition_book, load_partition_halo_feats
 from .graph_partition_book import PartitionPolicy, get_shared_mem_partition_book
 from .graph_partition_book import NODE_PART_POLICY, EDGE_PART_POLICY
 from .shared_mem_utils import _to_shared_mem, _get_ndata_path, _get_edata_path, DTYPE_DICT
@@ -284,6 +284,15 @@ class DistGraphServer(KVServer):
                 self.init_data(name=_get_data_name(name, EDGE_PART_POLICY),
                                policy_str=EDGE_PART_POLICY,
                                data_tensor=edge_feats[name])
+            # Share the replicated node features of HALO nodes with the local clients.
+            halo_node_feats = load_partition_halo_feats(part_config, self.part_id)
+            if halo_node_feats is not None:
+                halo_nids = F.boolean_mask(self.client_g.ndata[NID],
+                                           self.client_g.ndata['inner_node'] == 0)
+                for name in halo_node_feats:
+                    self.init_halo_data(name=_get_data_name(name, NODE_PART_POLICY),
+                                        id_tensor=halo_nids,
+                                        data_tensor=halo_node_feats[name])
 
     def start(self):
         """ Start graph store server.
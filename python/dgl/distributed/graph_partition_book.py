@@ -5,7 +5,9 @@ import numpy as np
 from .. import backend as F
 from ..base import NID, EID
 from .. import utils
+from .. import ndarray as nd
 from .shared_mem_utils import _to_shared_mem, _get_ndata_path, _get_edata_path, DTYPE_DICT
+from .._ffi.function import _init_api
 from .._ffi.ndarray import empty_shared_mem
 from ..ndarray import exist_shared_mem_array
 
@@ -177,6 +179,44 @@ class GraphPartitionBook:
             partition IDs
         """
 
+    def map_nids(self, nids):
+        """From global node IDs to partition IDs and local node IDs in one pass.
+
+        Local node IDs are only computed for the nodes in the current partition.
+        The local ID of a node in any other partition is -1.
+
+        Parameters
+        ----------
+        nids : tensor
+            global node IDs
+
+        Returns
+        -------
+        tensor
+            partition IDs
+        tensor
+            local node IDs
+        """
+
+    def map_eids(self, eids):
+        """From global edge IDs to partition IDs and local edge IDs in one pass.
+
+        Local edge IDs are only computed for the edges in the current partition.
+        The local ID of an edge in any other partition is -1.
+
+        Parameters
+        ----------
+        eids : tensor
+            global edge IDs
+
+        Returns
+        -------
+        tensor
+            partition IDs
+        tensor
+            local edge IDs
+        """
+
     def partid2nids(self, partid):
         """From partition id to global node IDs
 
@@ -362,6 +402,22 @@ class BasicPartitionBook(GraphPartitionBook):
         """
         return F.gather_row(self._eid2partid, eids)
 
+    def map_nids(self, nids):
+        """From global node IDs to partition IDs and local node IDs in one pass.
+        """
+        return _map_ids(_CAPI_DGLBasicPartitionBookMapIds, nids,
+                        F.zerocopy_to_dgl_ndarray(self._nid2partid),
+                        F.zerocopy_to_dgl_ndarray(self._nidg2l[self._part_id]),
+                        self._part_id)
+
+    def map_eids(self, eids):
+        """From global edge IDs to partition IDs and local edge IDs in one pass.
+        """
+        return _map_ids(_CAPI_DGLBasicPartitionBookMapIds, eids,
+                        F.zerocopy_to_dgl_ndarray(self._eid2partid),
+                        F.zerocopy_to_dgl_ndarray(self._eidg2l[self._part_id]),
+                        self._part_id)
+
     def partid2nids(self, partid):
         """From partition id to global node IDs
         """
@@ -424,6 +480,9 @@ class RangePartitionBook(GraphPartitionBook):
             edge_map = F.asnumpy(edge_map)
         self._node_map = node_map
         self._edge_map = edge_map
+        # The range boundaries are kept as DGL NDArrays for the C++ ID translation.
+        self._node_map_nd = nd.array(node_map.astype(np.int64))
+        self._edge_map_nd = nd.array(edge_map.astype(np.int64))
         # Get meta data of the partition book
         self._partition_meta_data = []
         for partid in range(self._num_partitions):
@@ -469,19 +528,29 @@ class RangePartitionBook(GraphPartitionBook):
     def nid2partid(self, nids):
         """From global node IDs to partition IDs
         """
-        nids = utils.toindex(nids)
-        ret = np.searchsorted(self._node_map, nids.tonumpy(), side='right')
-        ret = utils.toindex(ret)
-        return ret.tousertensor()
+        ret, _ = _map_ids(_CAPI_DGLRangePartitionBookMapIds, nids, self._node_map_nd, -1)
+        return ret
 
 
     def eid2partid(self, eids):
         """From global edge IDs to partition IDs
         """
-        eids = utils.toindex(eids)
-        ret = np.searchsorted(self._edge_map, eids.tonumpy(), side='right')
-        ret = utils.toindex(ret)
-        return ret.tousertensor()
+        ret, _ = _map_ids(_CAPI_DGLRangePartitionBookMapIds, eids, self._edge_map_nd, -1)
+        return ret
+
+
+    def map_nids(self, nids):
+        """From global node IDs to partition IDs and local node IDs in one pass.
+        """
+        return _map_ids(_CAPI_DGLRangePartitionBookMapIds, nids, self._node_map_nd,
+                        self._partid)
+
+
+    def map_eids(self, eids):
+        """From global edge IDs to partition IDs and local edge IDs in one pass.
+        """
+        return _map_ids(_CAPI_DGLRangePartitionBookMapIds, eids, self._edge_map_nd,
+                        self._partid)
 
 
     def partid2nids(self, partid):
@@ -534,6 +603,12 @@ class RangePartitionBook(GraphPartitionBook):
         """
         return self._partid
 
+def _map_ids(capi, ids, *args):
+    """Translate global IDs to partition IDs and local IDs with the given C API."""
+    ids = utils.toindex(ids).todgltensor()
+    part_ids, local_ids = capi(ids, *args)
+    return F.zerocopy_from_dgl_ndarray(part_ids), F.zerocopy_from_dgl_ndarray(local_ids)
+
 NODE_PART_POLICY = 'node'
 EDGE_PART_POLICY = 'edge'
 
@@ -635,6 +710,30 @@ class PartitionPolicy(object):
         else:
             raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
 
+    def to_partid_and_local(self, id_tensor):
+        """Mapping global ID to partition ID and local ID in one pass.
+
+        The local ID of an ID that does not belong to the current partition is -1.
+
+        Parameters
+        ----------
+        id_tensor : tensor
+            Global ID tensor
+
+        Return
+        ------
+        tensor
+            partition ID
+        tensor
+            local ID tensor
+        """
+        if self._policy_str == EDGE_PART_POLICY:
+            return self._partition_book.map_eids(id_tensor)
+        elif self._policy_str == NODE_PART_POLICY:
+            return self._partition_book.map_nids(id_tensor)
+        else:
+            raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
+
     def get_part_size(self):
         """Get data size of current partition.
 
@@ -664,3 +763,5 @@ class PartitionPolicy(object):
             return self._partition_book._num_nodes()
         else:
             raise RuntimeError('Cannot support policy: %s ' % self._policy_str)
+
+_init_api("dgl.distributed.graph_partition_book")
@@ -329,15 +329,20 @@ class GetSharedDataResponse(rpc.Response):
 
         {'data_0' : (shape, dtype, policy_str),
          'data_1' : (shape, dtype, policy_str)}
+    halo_meta : dict, optional
+        a dict of meta of the replicated HALO data, e.g.,
+
+        {'data_0' : (shape, dtype)}
     """
-    def __init__(self, meta):
+    def __init__(self, meta, halo_meta=None):
         self.meta = meta
+        self.halo_meta = halo_meta if halo_meta is not None else {}
 
     def __getstate__(self):
-        return self.meta
+        return self.meta, self.halo_meta
 
     def __setstate__(self, state):
-        self.meta = state
+        self.meta, self.halo_meta = state
 
 class GetSharedDataRequest(rpc.Request):
     """Send a signal (just a short string message) to get the
@@ -367,7 +372,10 @@ class GetSharedDataRequest(rpc.Request):
                           kv_store.part_policy[name].policy_str)
         if len(meta) == 0:
             raise RuntimeError('There is no data on kvserver.')
-        res = GetSharedDataResponse(meta)
+        halo_meta = {}
+        for name, (_, data) in kv_store.halo_data_store.items():
+            halo_meta[name] = (F.shape(data), F.reverse_data_type_dict[F.dtype(data)])
+        res = GetSharedDataResponse(meta, halo_meta)
         return res
 
 GET_PART_SHAPE = 901238
@@ -528,6 +536,8 @@ class DeleteDataRequest(rpc.Request):
             del kv_store.part_policy[self.name]
             del kv_store.push_handlers[self.name]
             del kv_store.pull_handlers[self.name]
+        if self.name in kv_store.halo_data_store:
+            del kv_store.halo_data_store[self.name]
         res = DeleteDataResponse(DELETE_MSG)
         return res
 
@@ -574,6 +584,48 @@ def default_pull_handler(target, name, id_tensor):
     # TODO(chao): support Tensorflow backend
     return target[name][id_tensor]
 
+class HaloCache(object):
+    """A read-only replica of rows of a tensor owned by other partitions.
+
+    The replica is a snapshot taken when the graph is partitioned. It is not updated
+    by push, so it should only be used for data that is not modified during training.
+
+    Parameters
+    ----------
+    id_tensor : tensor
+        the global IDs of the replicated rows
+    data_tensor : tensor
+        the replicated rows, in the same order as id_tensor
+    """
+    def __init__(self, id_tensor, data_tensor):
+        ids = F.asnumpy(id_tensor)
+        self._order = np.argsort(ids)
+        self._sorted_ids = ids[self._order]
+        self._data = data_tensor
+
+    def lookup(self, id_tensor):
+        """Find the IDs that are in the replica.
+
+        Parameters
+        ----------
+        id_tensor : tensor
+            a vector storing the global IDs
+
+        Returns
+        -------
+        numpy.ndarray
+            the positions in id_tensor of the IDs found in the replica
+        tensor
+            the replicated rows of these IDs
+        """
+        ids = F.asnumpy(id_tensor)
+        if len(self._sorted_ids) == 0:
+            return np.zeros((0,), np.int64), None
+        pos = np.searchsorted(self._sorted_ids, ids)
+        pos[pos == len(self._sorted_ids)] = 0
+        hit = np.nonzero(self._sorted_ids[pos] == ids)[0]
+        return hit, F.gather_row(self._data, F.tensor(self._order[pos[hit]]))
+
 class KVServer(object):
     """KVServer is a lightweight key-value store service for DGL distributed training.
 
@@ -634,6 +686,8 @@ class KVServer(object):
                              DeleteDataResponse)
         # Store the tensor data with specified data name
         self._data_store = {}
+        # Store the replicated HALO data (IDs and rows) with specified data name
+        self._halo_data_store = {}
         # Store the partition information with specified data name
         self._policy_set = set()
         self._part_policy = {}
@@ -678,6 +732,11 @@ class KVServer(object):
         """Get data store"""
         return self._data_store
 
+    @property
+    def halo_data_store(self):
+        """Get the replicated HALO data store"""
+        return self._halo_data_store
+
     @property
     def part_policy(self):
         """Get part policy"""
@@ -747,6 +806,33 @@ class KVServer(object):
         self._pull_handlers[name] = default_pull_handler
         self._push_handlers[name] = default_push_handler
 
+    def init_halo_data(self, name, id_tensor, data_tensor):
+        """Init the read-only replica of rows owned by other partitions.
+
+        The replica is shared with the KVClients on the same machine, which serve
+        pulls of these rows locally instead of sending requests to remote servers.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        id_tensor : tensor
+            the global IDs of the replicated rows
+        data_tensor : tensor
+            the replicated rows, in the same order as id_tensor
+        """
+        assert name in self._data_store, 'data name: %s does not exist.' % name
+        assert F.shape(id_tensor)[0] == F.shape(data_tensor)[0], \
+                'The data must has the same row size with ID.'
+        shared_id = empty_shared_mem(name+'-kvhalo-id-', True, F.shape(id_tensor), 'int64')
+        shared_id = F.zerocopy_from_dlpack(shared_id.to_dlpack())
+        rpc.copy_data_to_shared_memory(shared_id, F.astype(id_tensor, F.int64))
+        data_type = F.reverse_data_type_dict[F.dtype(data_tensor)]
+        shared_data = empty_shared_mem(name+'-kvhalo-', True, F.shape(data_tensor), data_type)
+        shared_data = F.zerocopy_from_dlpack(shared_data.to_dlpack())
+        rpc.copy_data_to_shared_memory(shared_data, data_tensor)
+        self._halo_data_store[name] = (shared_id, shared_data)
+
     def find_policy(self, policy_str):
         """Find a partition policy from existing policy set
 
@@ -823,6 +909,8 @@ class KVClient(object):
         self._part_policy = {}
         # This stores all unique partition policies in the kvstore. The key is the policy name.
         self._all_possible_part_policy = {}
+        # Store the read-only replicas of HALO data with specified data name
+        self._halo_cache = {}
         # Store the full data shape across kvserver
         self._full_data_shape = {}
         # Store all the data name
@@ -1048,6 +1136,8 @@ class KVClient(object):
         del self._part_policy[name]
         del self._pull_handlers[name]
         del self._push_handlers[name]
+        if name in self._halo_cache:
+            del self._halo_cache[name]
         self.barrier()
 
     def map_shared_data(self, partition_book):
@@ -1101,9 +1191,18 @@ class KVClient(object):
                 rpc.send_request(server_id, request)
             # recv response from all the backup server nodes
             for _ in range(self._group_count-1):
-                response = rpc.recv_response()
-                assert response.msg == SEND_META_TO_BACKUP_MSG
+                res = rpc.recv_response()
+                assert res.msg == SEND_META_TO_BACKUP_MSG
             self._data_name_list.add(name)
+        # Map the replicated HALO data
+        for name, meta in response.halo_meta.items():
+            if name not in self._halo_cache:
+                shape, dtype = meta
+                shared_id = empty_shared_mem(name+'-kvhalo-id-', False, (shape[0],), 'int64')
+                shared_data = empty_shared_mem(name+'-kvhalo-', False, shape, dtype)
+                self._halo_cache[name] = HaloCache(
+                    F.zerocopy_from_dlpack(shared_id.to_dlpack()),
+                    F.zerocopy_from_dlpack(shared_data.to_dlpack()))
         self.barrier()
 
     def data_name_list(self):
@@ -1187,15 +1286,32 @@ class KVClient(object):
         id_tensor = utils.toindex(id_tensor)
         id_tensor = id_tensor.tousertensor()
         assert F.ndim(id_tensor) == 1, 'ID must be a vector.'
+        if name in self._halo_cache and self._pull_handlers[name] is default_pull_handler:
+            # Rows replicated from other partitions are read locally without RPC.
+            hit, halo_data = self._halo_cache[name].lookup(id_tensor)
+            if len(hit) > 0:
+                is_miss = np.ones((len(id_tensor),), dtype=bool)
+                is_miss[hit] = False
+                miss = np.nonzero(is_miss)[0]
+                if len(miss) == 0:
+                    return halo_data
+                data = self._pull(name, F.gather_row(id_tensor, F.tensor(miss)))
+                order = np.argsort(np.concatenate([miss, hit]))
+                return F.gather_row(F.cat([data, halo_data], 0), F.tensor(order))
+        return self._pull(name, id_tensor)
+
+    def _pull(self, name, id_tensor):
+        """Pull message from KVServer without reading the replicated HALO data."""
         if self._pull_handlers[name] is default_pull_handler: # Use fast-pull
-            part_id = self._part_policy[name].to_partid(id_tensor)
+            part_id, local_id = self._part_policy[name].to_partid_and_local(id_tensor)
             return rpc.fast_pull(name, id_tensor, part_id, KVSTORE_PULL,
                                  self._machine_count,
                                  self._group_count,
                                  self._machine_id,
                                  self._client_id,
                                  self._data_store[name],
-                                 self._part_policy[name])
+                                 self._part_policy[name],
+                                 local_id)
         else:
             # partition data
             machine_id = self._part_policy[name].to_partid(id_tensor)
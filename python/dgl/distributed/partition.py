@@ -12,7 +12,8 @@ from ..data.utils import load_graphs, save_graphs, load_tensors, save_tensors
 from ..transform import metis_partition_assignment, partition_graph_with_halo
 from .graph_partition_book import BasicPartitionBook, RangePartitionBook
 
-def load_partition(part_config, part_id):
+def load_partition(part_config, part_id, node_feat_keys=None, edge_feat_keys=None,
+                   num_threads=0):
     ''' Load data of a partition from the data path.
 
     A partition data includes a graph structure of the partition, a dict of node tensors,
@@ -31,6 +32,13 @@ def load_partition(part_config, part_id):
         The path of the partition config file.
     part_id : int
         The partition Id.
+    node_feat_keys : list[str], optional
+        The names of the node features to load. All the node features are loaded by default.
+    edge_feat_keys : list[str], optional
+        The names of the edge features to load. All the edge features are loaded by default.
+    num_threads : int, optional
+        The number of threads reading the features. If not positive, the default
+        number of OpenMP threads is used. Default: 0.
 
     Returns
     -------
@@ -52,8 +60,10 @@ def load_partition(part_config, part_id):
     assert 'node_feats' in part_files, "the partition does not contain node features."
     assert 'edge_feats' in part_files, "the partition does not contain edge feature."
     assert 'part_graph' in part_files, "the partition does not contain graph structure."
-    node_feats = load_tensors(part_files['node_feats'])
-    edge_feats = load_tensors(part_files['edge_feats'])
+    node_feats = load_tensors(part_files['node_feats'], keys=node_feat_keys,
+                              num_threads=num_threads)
+    edge_feats = load_tensors(part_files['edge_feats'], keys=edge_feat_keys,
+                              num_threads=num_threads)
     graph = load_graphs(part_files['part_graph'])[0][0]
 
     assert NID in graph.ndata, "the partition graph should contain node mapping to global node Id"
@@ -65,6 +75,33 @@ def load_partition(part_config, part_id):
     assert np.all(F.asnumpy(partids == part_id)), 'load a wrong partition'
     return graph, node_feats, edge_feats, gpb, graph_name
 
+def load_partition_halo_feats(part_config, part_id):
+    ''' Load the replicated node features of the HALO nodes of a partition.
+
+    The features exist only if the graph was partitioned with ``cache_halo_feats=True``.
+    The rows of each tensor follow the order of the HALO nodes (the nodes whose
+    "inner_node" is 0) in the graph structure of the partition.
+
+    Parameters
+    ----------
+    part_config : str
+        The path of the partition config file.
+    part_id : int
+        The partition Id.
+
+    Returns
+    -------
+    dict of tensors or None
+        The node features of the HALO nodes, or None if they are not stored.
+    '''
+    with open(part_config) as conf_f:
+        part_metadata = json.load(conf_f)
+    assert 'part-{}'.format(part_id) in part_metadata, "part-{} does not exist".format(part_id)
+    part_files = part_metadata['part-{}'.format(part_id)]
+    if 'halo_node_feats' not in part_files:
+        return None
+    return load_tensors(part_files['halo_node_feats'])
+
 def load_partition_book(part_config, part_id, graph=None):
     ''' Load a graph partition book from the partition config file.
 
@@ -113,7 +150,8 @@ def load_partition_book(part_config, part_id, graph=None):
                                   graph), part_metadata['graph_name']
 
 def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method="metis",
-                    reshuffle=True, balance_ntypes=None, balance_edges=False):
+                    reshuffle=True, balance_ntypes=None, balance_edges=False,
+                    cache_halo_feats=False):
     ''' Partition a graph for distributed training and store the partitions on files.
 
     The partitioning occurs in three steps: 1) run a partition algorithm (e.g., Metis) to
@@ -139,6 +177,7 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
               |-- node_feats.dgl  # node features stored in binary format
               |-- edge_feats.dgl  # edge features stored in binary format
               |-- graph.dgl       # graph structure of this partition stored in binary format
+              |-- halo_node_feat.dgl  # node features of HALO nodes (optional)
           |-- part1/              # data for partition 1
               |-- node_feats.dgl
               |-- edge_feats.dgl
@@ -208,7 +247,18 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
     Node and edge features are splitted and stored together with each graph partition.
     All node/edge features in a partition are stored in a file with DGL format. The node/edge
     features are stored in dictionaries, in which the key is the node/edge data name and
-    the value is a tensor. We do not store features of HALO nodes and edges.
+    the value is a tensor. The files are saved in the indexed format of
+    :func:`dgl.data.utils.save_tensors`, so that :func:`load_partition` can read only some
+    of the features, using multiple threads. By default, we do not store features of HALO
+    nodes and edges.
+
+    With ``cache_halo_feats=True``, the node features of the HALO nodes are additionally
+    replicated into each partition (``halo_node_feat.dgl``, recorded under
+    "halo_node_feats" in the partition configuration). ``DistGraphServer`` shares them
+    with the trainers on the same machine, which then read the features of these remote
+    nodes locally without RPC. The replicas are read-only snapshots of the input
+    features: writing to the node data in ``DistGraph`` does not update them, so only
+    use this option for node data that is not modified during training.
 
     When performing Metis partitioning, we can put some constraint on the partitioning.
     Current, it supports two constrants to balance the partitioning. By default, Metis
@@ -248,6 +298,10 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
     balance_edges : bool
         Indicate whether to balance the edges in each partition. This argument is used by
         the Metis algorithm.
+    cache_halo_feats : bool, optional
+        Replicate the node features of HALO nodes into each partition so that reading
+        them does not require remote access. It trades disk space and memory for
+        fewer remote feature fetches. The default value is False.
 
     Examples
     --------
@@ -333,6 +387,7 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
         # Get the node/edge features of each partition.
         node_feats = {}
         edge_feats = {}
+        halo_node_feats = {}
         if num_parts > 1:
             # To get the edges in the input graph, we should use original node Ids.
             ndata_name = 'orig_id' if reshuffle else NID
@@ -352,6 +407,12 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
                 if name in [EID, 'inner_edge']:
                     continue
                 edge_feats[name] = F.gather_row(g.edata[name], local_edges)
+            if cache_halo_feats:
+                halo_nodes = F.boolean_mask(part.ndata[ndata_name], part.ndata['inner_node'] == 0)
+                for name in g.ndata:
+                    if name in [NID, 'inner_node']:
+                        continue
+                    halo_node_feats[name] = F.gather_row(g.ndata[name], halo_nodes)
         else:
             for name in g.ndata:
                 if name in [NID, 'inner_node']:
@@ -370,9 +431,13 @@ def partition_graph(g, graph_name, num_parts, out_path, num_hops=1, part_method=
                                                     'edge_feats': edge_feat_file,
                                                     'part_graph': part_graph_file}
         os.makedirs(part_dir, mode=0o775, exist_ok=True)
-        save_tensors(node_feat_file, node_feats)
-        save_tensors(edge_feat_file, edge_feats)
+        save_tensors(node_feat_file, node_feats, indexed=True)
+        save_tensors(edge_feat_file, edge_feats, indexed=True)
         save_graphs(part_graph_file, [part])
+        if cache_halo_feats and num_parts > 1:
+            halo_node_feat_file = os.path.join(part_dir, "halo_node_feat.dgl")
+            part_metadata['part-{}'.format(part_id)]['halo_node_feats'] = halo_node_feat_file
+            save_tensors(halo_node_feat_file, halo_node_feats, indexed=True)
 
     with open('{}/{}.json'.format(out_path, graph_name), 'w') as outfile:
         json.dump(part_metadata, outfile, sort_keys=True, indent=4)
@@ -9,6 +9,7 @@ from .._ffi.object import register_object, ObjectBase
 from .._ffi.function import _init_api
 from ..base import DGLError
 from .. import backend as F
+from . import rpc_trace
 
 __all__ = ['set_rank', 'get_rank', 'Request', 'Response', 'register_service', \
 'create_sender', 'create_receiver', 'finalize_sender', 'finalize_receiver', \
@@ -16,7 +17,8 @@ __all__ = ['set_rank', 'get_rank', 'Request', 'Response', 'register_service', \
 'get_num_machines', 'set_num_machines', 'get_machine_id', 'set_machine_id', \
 'send_request', 'recv_request', 'send_response', 'recv_response', 'remote_call', \
 'send_request_to_machine', 'remote_call_to_machine', 'fast_pull', \
-'get_num_client', 'set_num_client', 'client_barrier', 'copy_data_to_shared_memory']
+'get_num_client', 'set_num_client', 'client_barrier', 'copy_data_to_shared_memory', \
+'enable_tracing', 'disable_tracing', 'get_tracer']
 
 REQUEST_CLASS_TO_SERVICE_ID = {}
 RESPONSE_CLASS_TO_SERVICE_ID = {}
@@ -24,6 +26,8 @@ SERVICE_ID_TO_PROPERTY = {}
 
 DEFUALT_PORT = 30050
 
+_TRACER = None
+
 def read_ip_config(filename, num_servers):
     """Read network configuration information of server from file.
 
@@ -313,6 +317,55 @@ def register_service(service_id, req_cls, res_cls=None):
         RESPONSE_CLASS_TO_SERVICE_ID[res_cls] = service_id
     SERVICE_ID_TO_PROPERTY[service_id] = (req_cls, res_cls)
 
+def enable_tracing(max_events=1000000):
+    """Start tracing the RPC messages of the current process.
+
+    Every message sent or received afterwards is timed and counted per request
+    class. Tracing is off by default since it adds a small overhead to every message.
+
+    Parameters
+    ----------
+    max_events : int, optional
+        Maximal number of events kept for the Chrome trace.
+
+    Returns
+    -------
+    RPCTracer
+        The tracer collecting the records. Call :meth:`RPCTracer.stats` for the
+        latency histograms and byte counts, or :meth:`RPCTracer.dump_chrome_trace`
+        to save a trace viewable in ``chrome://tracing``.
+    """
+    global _TRACER
+    _TRACER = rpc_trace.RPCTracer(max_events)
+    return _TRACER
+
+def disable_tracing():
+    """Stop tracing the RPC messages of the current process.
+
+    Returns
+    -------
+    RPCTracer
+        The tracer that has been collecting the records, or None if tracing was
+        not enabled.
+    """
+    global _TRACER
+    tracer = _TRACER
+    _TRACER = None
+    return tracer
+
+def get_tracer():
+    """Get the RPC tracer of the current process, or None if tracing is not enabled."""
+    return _TRACER
+
+def _trace_name(service_id):
+    """Name of the request class of a service, used to aggregate trace records."""
+    req_cls = SERVICE_ID_TO_PROPERTY[service_id][0]
+    return req_cls.__name__ if req_cls is not None else str(service_id)
+
+def _trace_now():
+    """Current time for tracing, or None if tracing is not enabled."""
+    return rpc_trace.now() if _TRACER is not None else None
+
 def get_service_property(service_id):
     """Get service property.
 
@@ -539,6 +592,46 @@ class RPCMessage(ObjectBase):
         rst = _CAPI_DGLRPCMessageGetTensors(self)
         return [F.zerocopy_from_dgl_ndarray(tsor) for tsor in rst]
 
+def _send_payload(payload, msg_seq, client_id, server_id, target):
+    """Serialize a request or response to an :class:`RPCMessage` and send it to target."""
+    tracer = _TRACER
+    if tracer is None:
+        data, tensors = serialize_to_payload(payload)
+        msg = RPCMessage(payload.service_id, msg_seq, client_id, server_id, data, tensors)
+        send_rpc_message(msg, target)
+        return
+    name = _trace_name(payload.service_id)
+    if isinstance(payload, Request) and get_service_property(payload.service_id)[1] is not None:
+        tracer.begin_call(msg_seq, name)
+    start = rpc_trace.now()
+    data, tensors = serialize_to_payload(payload)
+    serialized = rpc_trace.now()
+    msg = RPCMessage(payload.service_id, msg_seq, client_id, server_id, data, tensors)
+    send_rpc_message(msg, target)
+    tracer.record(name, 'serialize', start, serialized)
+    tracer.record(name, 'send', serialized)
+    tracer.count_bytes(name, 'sent', rpc_trace.payload_nbytes(data, tensors))
+
+def _deserialize_message(cls, msg, recv_start=None):
+    """De-serialize a received :class:`RPCMessage` into an object of class cls.
+
+    recv_start is the time when the receiver started waiting for the message.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        return deserialize_from_payload(cls, msg.data, msg.tensors)
+    name = _trace_name(msg.service_id)
+    start = rpc_trace.now()
+    data, tensors = msg.data, msg.tensors
+    obj = deserialize_from_payload(cls, data, tensors)
+    if recv_start is not None:
+        tracer.record(name, 'wait', recv_start, start)
+    tracer.record(name, 'deserialize', start)
+    tracer.count_bytes(name, 'recv', rpc_trace.payload_nbytes(data, tensors))
+    if isinstance(obj, Response):
+        tracer.end_call(msg.msg_seq)
+    return obj
+
 def send_request(target, request):
     """Send one request to the target server.
 
@@ -561,13 +654,10 @@ def send_request(target, request):
     ------
     ConnectionError if there is any problem with the connection.
     """
-    service_id = request.service_id
     msg_seq = incr_msg_seq()
     client_id = get_rank()
     server_id = target
-    data, tensors = serialize_to_payload(request)
-    msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors)
-    send_rpc_message(msg, server_id)
+    _send_payload(request, msg_seq, client_id, server_id, server_id)
 
 def send_request_to_machine(target, request):
     """Send one request to the target machine, which will randomly
@@ -589,14 +679,11 @@ def send_request_to_machine(target, request):
     ------
     ConnectionError if there is any problem with the connection.
     """
-    service_id = request.service_id
     msg_seq = incr_msg_seq()
     client_id = get_rank()
     server_id = random.randint(target*get_num_server_per_machine(),
                                (target+1)*get_num_server_per_machine()-1)
-    data, tensors = serialize_to_payload(request)
-    msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors)
-    send_rpc_message(msg, server_id)
+    _send_payload(request, msg_seq, client_id, server_id, server_id)
 
 def send_response(target, response):
     """Send one response to the target client.
@@ -620,13 +707,10 @@ def send_response(target, response):
     ------
     ConnectionError if there is any problem with the connection.
     """
-    service_id = response.service_id
     msg_seq = get_msg_seq()
     client_id = target
     server_id = get_rank()
-    data, tensors = serialize_to_payload(response)
-    msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors)
-    send_rpc_message(msg, client_id)
+    _send_payload(response, msg_seq, client_id, server_id, client_id)
 
 def recv_request(timeout=0):
     """Receive one request.
@@ -653,6 +737,7 @@ def recv_request(timeout=0):
     ConnectionError if there is any problem with the connection.
     """
     # TODO(chao): handle timeout
+    recv_start = _trace_now()
     msg = recv_rpc_message(timeout)
     if msg is None:
         return None
@@ -661,7 +746,7 @@ def recv_request(timeout=0):
     if req_cls is None:
         raise DGLError('Got request message from service ID {}, '
                        'but no request class is registered.'.format(msg.service_id))
-    req = deserialize_from_payload(req_cls, msg.data, msg.tensors)
+    req = _deserialize_message(req_cls, msg, recv_start)
     if msg.server_id != get_rank():
         raise DGLError('Got request sent to server {}, '
                        'different from my rank {}!'.format(msg.server_id, get_rank()))
@@ -690,6 +775,7 @@ def recv_response(timeout=0):
     ConnectionError if there is any problem with the connection.
     """
     # TODO(chao): handle timeout
+    recv_start = _trace_now()
     msg = recv_rpc_message(timeout)
     if msg is None:
         return None
@@ -697,7 +783,7 @@ def recv_response(timeout=0):
     if res_cls is None:
         raise DGLError('Got response message from service ID {}, '
                        'but no response class is registered.'.format(msg.service_id))
-    res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+    res = _deserialize_message(res_cls, msg, recv_start)
     if msg.client_id != get_rank() and get_rank() != -1:
         raise DGLError('Got reponse of request sent by client {}, '
                        'different from my rank {}!'.format(msg.client_id, get_rank()))
@@ -736,28 +822,26 @@ def remote_call(target_and_requests, timeout=0):
     myrank = get_rank()
     for pos, (target, request) in enumerate(target_and_requests):
         # send request
-        service_id = request.service_id
         msg_seq = incr_msg_seq()
         client_id = get_rank()
         server_id = random.randint(target*get_num_server_per_machine(),
                                    (target+1)*get_num_server_per_machine()-1)
-        data, tensors = serialize_to_payload(request)
-        msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors)
-        send_rpc_message(msg, server_id)
+        _send_payload(request, msg_seq, client_id, server_id, server_id)
         # check if has response
-        res_cls = get_service_property(service_id)[1]
+        res_cls = get_service_property(request.service_id)[1]
         if res_cls is not None:
             num_res += 1
             msgseq2pos[msg_seq] = pos
     while num_res != 0:
         # recv response
+        recv_start = _trace_now()
         msg = recv_rpc_message(timeout)
         num_res -= 1
         _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
         if res_cls is None:
             raise DGLError('Got response message from service ID {}, '
                            'but no response class is registered.'.format(msg.service_id))
-        res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+        res = _deserialize_message(res_cls, msg, recv_start)
         if msg.client_id != myrank:
             raise DGLError('Got reponse of request sent by client {}, '
                            'different from my rank {}!'.format(msg.client_id, myrank))
@@ -785,17 +869,14 @@ def send_requests_to_machine(target_and_requests):
     msgseq2pos = {}
     for pos, (target, request) in enumerate(target_and_requests):
         # send request
-        service_id = request.service_id
         msg_seq = incr_msg_seq()
         client_id = get_rank()
 
         server_id = random.randint(target*get_num_server_per_machine(),
                                    (target+1)*get_num_server_per_machine()-1)
-        data, tensors = serialize_to_payload(request)
-        msg = RPCMessage(service_id, msg_seq, client_id, server_id, data, tensors)
-        send_rpc_message(msg, server_id)
+        _send_payload(request, msg_seq, client_id, server_id, server_id)
         # check if has response
-        res_cls = get_service_property(service_id)[1]
+        res_cls = get_service_property(request.service_id)[1]
         if res_cls is not None:
             msgseq2pos[msg_seq] = pos
     return msgseq2pos
@@ -828,13 +909,14 @@ def recv_responses(msgseq2pos, timeout=0):
     num_res = len(msgseq2pos)
     while num_res != 0:
         # recv response
+        recv_start = _trace_now()
         msg = recv_rpc_message(timeout)
         num_res -= 1
         _, res_cls = SERVICE_ID_TO_PROPERTY[msg.service_id]
         if res_cls is None:
             raise DGLError('Got response message from service ID {}, '
                            'but no response class is registered.'.format(msg.service_id))
-        res = deserialize_from_payload(res_cls, msg.data, msg.tensors)
+        res = _deserialize_message(res_cls, msg, recv_start)
         if msg.client_id != myrank:
             raise DGLError('Got reponse of request sent by client {}, '
                            'different from my rank {}!'.format(msg.client_id, myrank))
@@ -939,7 +1021,7 @@ def finalize_server():
 
 def fast_pull(name, id_tensor, part_id, service_id,
               machine_count, group_count, machine_id,
-              client_id, local_data, policy):
+              client_id, local_data, policy, local_id=None):
     """Fast-pull api used by kvstore.
 
     Parameters
@@ -964,14 +1046,23 @@ def fast_pull(name, id_tensor, part_id, service_id,
         local data tensor
     policy : PartitionPolicy
         store the partition information
+    local_id : tensor, optional
+        local ID of every element in id_tensor as returned by
+        :py:meth:`PartitionPolicy.to_partid_and_local`. If given, the local IDs
+        are not recomputed from the partition policy.
     """
+    start = _trace_now()
     msg_seq = incr_msg_seq()
     pickle_data = bytearray(pickle.dumps(([0], [name])))
-    global_id = _CAPI_DGLRPCGetGlobalIDFromLocalPartition(F.zerocopy_to_dgl_ndarray(id_tensor),
-                                                          F.zerocopy_to_dgl_ndarray(part_id),
-                                                          machine_id)
-    global_id = F.zerocopy_from_dgl_ndarray(global_id)
-    g2l_id = policy.to_local(global_id)
+    if local_id is not None:
+        g2l_id = F.boolean_mask(local_id, part_id == machine_id)
+    else:
+        global_id = _CAPI_DGLRPCGetGlobalIDFromLocalPartition(
+            F.zerocopy_to_dgl_ndarray(id_tensor),
+            F.zerocopy_to_dgl_ndarray(part_id),
+            machine_id)
+        global_id = F.zerocopy_from_dgl_ndarray(global_id)
+        g2l_id = policy.to_local(global_id)
     res_tensor = _CAPI_DGLRPCFastPull(name,
                                       int(machine_id),
                                       int(machine_count),
@@ -984,7 +1075,14 @@ def fast_pull(name, id_tensor, part_id, service_id,
                                       F.zerocopy_to_dgl_ndarray(part_id),
                                       F.zerocopy_to_dgl_ndarray(g2l_id),
                                       F.zerocopy_to_dgl_ndarray(local_data))
-    return F.zerocopy_from_dgl_ndarray(res_tensor)
+    res_tensor = F.zerocopy_from_dgl_ndarray(res_tensor)
+    if start is not None:
+        # requests and responses of fast-pull are handled in C++, so only the
+        # whole call is traced.
+        name = _trace_name(service_id)
+        _TRACER.record(name, 'fast_pull', start)
+        _TRACER.count_bytes(name, 'recv', rpc_trace.payload_nbytes(b'', [res_tensor]))
+    return res_tensor
 
 def register_sig_handler():
     """Register for handling signal event.
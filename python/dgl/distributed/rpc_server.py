@@ -1,8 +1,10 @@
 """Functions used by server."""
 
+import os
 import time
 
 from . import rpc
+from . import rpc_trace
 from .constants import MAX_QUEUE_SIZE
 
 def start_server(server_id, ip_config, num_servers, num_clients, server_state, \
@@ -32,6 +34,11 @@ def start_server(server_id, ip_config, num_servers, num_clients, server_state, \
         it will not allocate 20GB memory at once.
     net_type : str
         Networking type. Current options are: 'socket'.
+
+    If the environment variable ``DGL_RPC_TRACE`` is set to a directory, the RPC
+    messages of the server are traced (see :func:`dgl.distributed.enable_tracing`)
+    and the trace is saved to ``rpc_trace_server_<server_id>.json`` in that
+    directory when the server shuts down.
     """
     assert server_id >= 0, 'server_id (%d) cannot be a negative number.' % server_id
     assert num_servers > 0, 'num_servers (%d) must be a positive number.' % num_servers
@@ -54,6 +61,8 @@ def start_server(server_id, ip_config, num_servers, num_clients, server_state, \
                          rpc.ClientBarrierRequest,
                          rpc.ClientBarrierResponse)
     rpc.set_rank(server_id)
+    trace_dir = os.environ.get('DGL_RPC_TRACE')
+    tracer = rpc.enable_tracing() if trace_dir else None
     server_namebook = rpc.read_ip_config(ip_config, num_servers)
     machine_id = server_namebook[server_id][0]
     rpc.set_machine_id(machine_id)
@@ -89,13 +98,19 @@ def start_server(server_id, ip_config, num_servers, num_clients, server_state, \
     # main service loop
     while True:
         req, client_id = rpc.recv_request()
+        start = rpc_trace.now() if tracer is not None else None
         res = req.process_request(server_state)
+        if tracer is not None:
+            tracer.record(type(req).__name__, 'process', start)
         if res is not None:
             if isinstance(res, list):
                 for response in res:
                     target_id, res_data = response
                     rpc.send_response(target_id, res_data)
             elif isinstance(res, str) and res == 'exit':
+                if tracer is not None:
+                    tracer.dump_chrome_trace(
+                        os.path.join(trace_dir, 'rpc_trace_server_{}.json'.format(server_id)))
                 break # break the loop and exit server
             else:
                 rpc.send_response(client_id, res)
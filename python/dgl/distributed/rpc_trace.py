@@ -0,0 +1,178 @@
+"""Opt-in tracing of RPC requests.
+
+The tracer records how long every RPC message spends in each phase (serialization,
+sending, waiting for the message, de-serialization, request processing and the
+round trip seen by the client) together with the bytes it carries. Records are
+aggregated per request class (e.g., ``PullDataRequest``) into latency histograms
+and can be dumped as a Chrome trace (``chrome://tracing``).
+"""
+import json
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from .. import backend as F
+
+__all__ = ['RPCTracer']
+
+# Latency histogram buckets: bucket i counts latencies in [2^(i-1), 2^i) microseconds.
+NUM_BUCKETS = 32
+
+def now():
+    """Current time in microseconds."""
+    return time.time() * 1e6
+
+def payload_nbytes(data, tensors):
+    """Number of bytes of a serialized payload."""
+    nbytes = len(data)
+    for tensor in tensors:
+        itemsize = np.dtype(F.reverse_data_type_dict[F.dtype(tensor)]).itemsize
+        nbytes += int(np.prod(F.shape(tensor))) * itemsize
+    return nbytes
+
+class _PhaseStat:
+    """Latency statistics of one phase of one request class."""
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+        self.histogram = np.zeros((NUM_BUCKETS,), dtype=np.int64)
+
+    def add(self, dur):
+        """Add one latency in microseconds."""
+        self.count += 1
+        self.total += dur
+        self.max = max(self.max, dur)
+        bucket = 0 if dur < 1 else min(int(math.log2(dur)) + 1, NUM_BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def todict(self):
+        """Convert to a dict of plain Python objects."""
+        return {'count': self.count,
+                'total_us': self.total,
+                'mean_us': self.total / self.count if self.count > 0 else 0.,
+                'max_us': self.max,
+                'histogram': self.histogram.tolist()}
+
+class RPCTracer:
+    """Collect per-request timestamps, latency histograms and byte counts.
+
+    Use :func:`dgl.distributed.enable_tracing` to attach a tracer to the RPC
+    layer of the current process.
+
+    Parameters
+    ----------
+    max_events : int, optional
+        Maximal number of events kept for the Chrome trace. Statistics are still
+        aggregated after the limit is reached.
+    """
+    def __init__(self, max_events=1000000):
+        self._max_events = max_events
+        self._events = []
+        self._stats = {}
+        self._bytes = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _add_event(self, event):
+        if len(self._events) < self._max_events:
+            event['pid'] = self._pid
+            self._events.append(event)
+
+    def record(self, name, phase, start, end=None):
+        """Record that a message of the given class spent [start, end) in a phase.
+
+        Parameters
+        ----------
+        name : str
+            Request class name.
+        phase : str
+            Phase name, e.g. ``'serialize'`` or ``'process'``.
+        start : float
+            Start time in microseconds.
+        end : float, optional
+            End time in microseconds. Current time if not given.
+        """
+        end = now() if end is None else end
+        with self._lock:
+            stat = self._stats.setdefault(name, {}).setdefault(phase, _PhaseStat())
+            stat.add(end - start)
+            self._add_event({'name': name, 'cat': phase, 'ph': 'X', 'ts': start,
+                             'dur': end - start, 'tid': threading.get_ident()})
+
+    def count_bytes(self, name, direction, nbytes):
+        """Count bytes of a message of the given class.
+
+        Parameters
+        ----------
+        name : str
+            Request class name.
+        direction : str
+            ``'sent'`` or ``'recv'``.
+        nbytes : int
+            Number of bytes.
+        """
+        with self._lock:
+            counts = self._bytes.setdefault(name, {'sent': 0, 'recv': 0})
+            counts[direction] += nbytes
+
+    def begin_call(self, msg_seq, name):
+        """Mark the start of a remote call waiting for a response."""
+        start = now()
+        with self._lock:
+            self._inflight[msg_seq] = (name, start)
+            self._add_event({'name': name, 'cat': 'roundtrip', 'ph': 'b', 'ts': start,
+                             'id': msg_seq})
+
+    def end_call(self, msg_seq):
+        """Mark the arrival of the response of a remote call."""
+        with self._lock:
+            call = self._inflight.pop(msg_seq, None)
+        if call is None:
+            return
+        name, start = call
+        end = now()
+        with self._lock:
+            stat = self._stats.setdefault(name, {}).setdefault('roundtrip', _PhaseStat())
+            stat.add(end - start)
+            self._add_event({'name': name, 'cat': 'roundtrip', 'ph': 'e', 'ts': end,
+                             'id': msg_seq})
+
+    def stats(self):
+        """Aggregated statistics.
+
+        Returns
+        -------
+        dict[str, dict]
+            For every request class, the statistics of each phase (count, total,
+            mean and max latency in microseconds and the latency histogram whose
+            bucket ``i`` counts latencies in ``[2^(i-1), 2^i)`` microseconds) and
+            the bytes sent and received.
+        """
+        with self._lock:
+            ret = {}
+            for name in set(self._stats) | set(self._bytes):
+                phases = self._stats.get(name, {})
+                ret[name] = {phase: stat.todict() for phase, stat in phases.items()}
+                ret[name]['bytes'] = dict(self._bytes.get(name, {'sent': 0, 'recv': 0}))
+            return ret
+
+    def dump_chrome_trace(self, path):
+        """Write the recorded events as a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Output file path.
+        """
+        with self._lock:
+            trace = {'traceEvents': list(self._events),
+                     'displayTimeUnit': 'ms',
+                     'otherData': {'stats': None}}
+        trace['otherData']['stats'] = self.stats()
+        with open(path, 'w') as outfile:
+            json.dump(trace, outfile)
@@ -83,6 +83,7 @@ class DGLHeteroGraph(object):
         self._canonical_etypes = None
         self._batch_num_nodes = None
         self._batch_num_edges = None
+        self._struct_cache = {}
 
         # Handle node types
         if isinstance(ntypes, tuple):
@@ -147,6 +148,12 @@ class DGLHeteroGraph(object):
                        for i, frame in enumerate(edge_frames)]
         self._edge_frames = edge_frames
 
+    def __getstate__(self):
+        # The structural cache is not pickled; it is rebuilt on demand.
+        state = self.__dict__.copy()
+        state.pop('_struct_cache', None)
+        return state
+
     def __setstate__(self, state):
         # Compatibility check
         # TODO: version the storage
@@ -713,6 +720,38 @@ class DGLHeteroGraph(object):
         """
         self._batch_num_nodes = None
         self._batch_num_edges = None
+        self._struct_cache = {}
+
+    def _get_cached_info(self, key, create_fn):
+        """Get structural information (e.g., degrees) cached on the graph.
+
+        The cache is shared by the shallow copies of the graph, such as the ones
+        created by :meth:`local_scope`. A cached value is only returned if the graph
+        structure it was computed from is unchanged, so it is invalidated by mutations
+        (e.g., :meth:`add_edges`, :meth:`remove_edges`) and by copying the graph to
+        another device or format.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the information.
+        create_fn : callable
+            Function without arguments computing the information on a cache miss.
+
+        Returns
+        -------
+        object
+            The cached information.
+        """
+        cache = getattr(self, '_struct_cache', None)
+        if cache is None:
+            # graphs pickled by older versions
+            cache = self._struct_cache = {}
+        entry = cache.get(key, None)
+        if entry is None or entry[0] is not self._graph:
+            entry = (self._graph, create_fn())
+            cache[key] = entry
+        return entry[1]
 
 
     #################################################################
@@ -3351,6 +3390,8 @@ class DGLHeteroGraph(object):
         int or Tensor
             The in-degree(s) of the node(s) in a Tensor. The i-th element is the in-degree
             of the i-th input node. If :attr:`v` is an ``int``, return an ``int`` too.
+            The in-degrees of all the nodes are cached on the graph. A copy of them
+            is returned, so modifying it in place does not affect the cache.
 
         Examples
         --------
@@ -3389,7 +3430,11 @@ class DGLHeteroGraph(object):
         dsttype = self.to_canonical_etype(etype)[2]
         etid = self.get_etype_id(etype)
         if is_all(v):
-            v = self.dstnodes(dsttype)
+            # the degrees of all the nodes are cached until the graph structure changes;
+            # a copy is returned so that modifying the result does not corrupt the cache
+            return F.clone(self._get_cached_info(
+                ('in_degrees', etid),
+                lambda: self._graph.in_degrees(etid, self.dstnodes(dsttype))))
         v_tensor = utils.prepare_tensor(self, v, 'v')
         deg = self._graph.in_degrees(etid, v_tensor)
         if isinstance(v, numbers.Integral):
@@ -3435,6 +3480,8 @@ class DGLHeteroGraph(object):
         int or Tensor
             The out-degree(s) of the node(s) in a Tensor. The i-th element is the out-degree
             of the i-th input node. If :attr:`v` is an ``int``, return an ``int`` too.
+            The out-degrees of all the nodes are cached on the graph. A copy of them
+            is returned, so modifying it in place does not affect the cache.
 
         Examples
         --------
@@ -3473,7 +3520,11 @@ class DGLHeteroGraph(object):
         srctype = self.to_canonical_etype(etype)[0]
         etid = self.get_etype_id(etype)
         if is_all(u):
-            u = self.srcnodes(srctype)
+            # the degrees of all the nodes are cached until the graph structure changes;
+            # a copy is returned so that modifying the result does not corrupt the cache
+            return F.clone(self._get_cached_info(
+                ('out_degrees', etid),
+                lambda: self._graph.out_degrees(etid, self.srcnodes(srctype))))
         u_tensor = utils.prepare_tensor(self, u, 'u')
         if F.as_scalar(F.sum(self.has_nodes(u_tensor, ntype=srctype), dim=0)) != len(u_tensor):
             raise DGLError('u contains invalid node IDs')
@@ -5160,6 +5211,7 @@ class DGLHeteroGraph(object):
 
         # 1. Copy graph structure
         ret._graph = self._graph.copy_to(utils.to_dgl_context(device))
+        ret._struct_cache = {}
 
         # 2. Copy features
         # TODO(minjie): handle initializer
@@ -5451,6 +5503,7 @@ class DGLHeteroGraph(object):
             # Convert the graph to use another format
             ret = copy.copy(self)
             ret._graph = self._graph.formats(formats)
+            ret._struct_cache = {}
             return ret
 
     def create_formats_(self):
@@ -1,5 +1,5 @@
 """MXNet modules for graph attention networks(GAT)."""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import math
 import mxnet as mx
 from mxnet.gluon import nn
@@ -238,7 +238,9 @@ class GATConv(nn.Block):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if graph.in_degrees().min() == 0:
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info('has_zero_in_degree',
+                                          lambda: bool(graph.in_degrees().min() == 0)):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
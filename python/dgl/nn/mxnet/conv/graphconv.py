@@ -1,5 +1,5 @@
 """MXNet modules for graph convolutions(GCN)"""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import math
 
 import mxnet as mx
@@ -218,7 +218,9 @@ class GraphConv(gluon.Block):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if graph.in_degrees().min() == 0:
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info('has_zero_in_degree',
+                                          lambda: bool(graph.in_degrees().min() == 0)):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
@@ -232,9 +234,12 @@ class GraphConv(gluon.Block):
             feat_src, feat_dst = expand_as_pair(feat, graph)
 
             if self._norm == 'both':
-                degs = graph.out_degrees().as_in_context(feat_src.context).astype('float32')
-                degs = mx.nd.clip(degs, a_min=1, a_max=float("inf"))
-                norm = mx.nd.power(degs, -0.5)
+                ctx = feat_src.context
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'out', 'both', ctx),
+                    lambda: mx.nd.power(mx.nd.clip(
+                        graph.out_degrees().as_in_context(ctx).astype('float32'),
+                        a_min=1, a_max=float("inf")), -0.5))
                 shp = norm.shape + (1,) * (feat_src.ndim - 1)
                 norm = norm.reshape(shp)
                 feat_src = feat_src * norm
@@ -265,12 +270,13 @@ class GraphConv(gluon.Block):
                     rst = mx.nd.dot(rst, weight)
 
             if self._norm != 'none':
-                degs = graph.in_degrees().as_in_context(feat_dst.context).astype('float32')
-                degs = mx.nd.clip(degs, a_min=1, a_max=float("inf"))
-                if self._norm == 'both':
-                    norm = mx.nd.power(degs, -0.5)
-                else:
-                    norm = 1.0 / degs
+                ctx = feat_dst.context
+                exponent = -0.5 if self._norm == 'both' else -1
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'in', self._norm, ctx),
+                    lambda: mx.nd.power(mx.nd.clip(
+                        graph.in_degrees().as_in_context(ctx).astype('float32'),
+                        a_min=1, a_max=float("inf")), exponent))
                 shp = norm.shape + (1,) * (feat_dst.ndim - 1)
                 norm = norm.reshape(shp)
                 rst = rst * norm
@@ -1,5 +1,5 @@
 """Torch modules for graph attention networks(GAT)."""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import torch as th
 from torch import nn
 
@@ -245,7 +245,9 @@ class GATConv(nn.Module):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if (graph.in_degrees() == 0).any():
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info('has_zero_in_degree',
+                                          lambda: bool((graph.in_degrees() == 0).any())):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
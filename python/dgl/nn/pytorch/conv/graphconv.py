@@ -1,5 +1,5 @@
 """Torch modules for graph convolutions(GCN)."""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import torch as th
 from torch import nn
 from torch.nn import init
@@ -233,7 +233,9 @@ class GraphConv(nn.Module):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if (graph.in_degrees() == 0).any():
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info('has_zero_in_degree',
+                                          lambda: bool((graph.in_degrees() == 0).any())):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
@@ -247,8 +249,9 @@ class GraphConv(nn.Module):
             # (BarclayII) For RGCN on heterogeneous graphs we need to support GCN on bipartite.
             feat_src, feat_dst = expand_as_pair(feat, graph)
             if self._norm == 'both':
-                degs = graph.out_degrees().float().clamp(min=1)
-                norm = th.pow(degs, -0.5)
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'out', 'both'),
+                    lambda: th.pow(graph.out_degrees().float().clamp(min=1), -0.5))
                 shp = norm.shape + (1,) * (feat_src.dim() - 1)
                 norm = th.reshape(norm, shp)
                 feat_src = feat_src * norm
@@ -279,11 +282,10 @@ class GraphConv(nn.Module):
                     rst = th.matmul(rst, weight)
 
             if self._norm != 'none':
-                degs = graph.in_degrees().float().clamp(min=1)
-                if self._norm == 'both':
-                    norm = th.pow(degs, -0.5)
-                else:
-                    norm = 1.0 / degs
+                exponent = -0.5 if self._norm == 'both' else -1
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'in', self._norm),
+                    lambda: th.pow(graph.in_degrees().float().clamp(min=1), exponent))
                 shp = norm.shape + (1,) * (feat_dst.dim() - 1)
                 norm = th.reshape(norm, shp)
                 rst = rst * norm
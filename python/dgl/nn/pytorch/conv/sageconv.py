@@ -3,8 +3,10 @@
 import torch
 from torch import nn
 from torch.nn import functional as F
+from torch.nn.utils.rnn import PackedSequence
 
 from .... import function as fn
+from ....udf import mailbox_layout
 from ....utils import expand_as_pair, check_eq_shape
 
 
@@ -135,15 +137,17 @@ class SAGEConv(nn.Module):
             nn.init.xavier_uniform_(self.fc_self.weight, gain=gain)
         nn.init.xavier_uniform_(self.fc_neigh.weight, gain=gain)
 
+    @mailbox_layout('packed')
     def _lstm_reducer(self, nodes):
         """LSTM reducer
-        NOTE(zihao): lstm reducer with default schedule (degree bucketing)
-        is slow, we could accelerate this with degree padding in the future.
+        The messages of all the nodes are received as one packed sequence, so the
+        LSTM is invoked once instead of once per distinct in-degree.
         """
-        m = nodes.mailbox['m'] # (B, L, D)
-        batch_size = m.shape[0]
+        m = nodes.mailbox['m'] # (E, D)
+        batch_size = nodes.batch_size()
         h = (m.new_zeros((1, batch_size, self._in_src_feats)),
              m.new_zeros((1, batch_size, self._in_src_feats)))
+        m = PackedSequence(m, nodes.mailbox_batch_sizes)
         _, (rst, _) = self.lstm(m, h)
         return {'neigh': rst.squeeze(0)}
 
@@ -1,5 +1,5 @@
 """Tensorflow modules for graph attention networks(GAT)."""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import tensorflow as tf
 from tensorflow.keras import layers
 import numpy as np
@@ -232,7 +232,10 @@ class GATConv(layers.Layer):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if  tf.math.count_nonzero(graph.in_degrees() == 0) > 0:
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info(
+                        'has_zero_in_degree',
+                        lambda: bool(tf.math.count_nonzero(graph.in_degrees() == 0) > 0)):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
@@ -1,5 +1,5 @@
 """Tensorflow modules for graph convolutions(GCN)."""
-# pylint: disable= no-member, arguments-differ, invalid-name
+# pylint: disable= no-member, arguments-differ, invalid-name, protected-access
 import tensorflow as tf
 from tensorflow.keras import layers
 import numpy as np
@@ -218,7 +218,10 @@ class GraphConv(layers.Layer):
         """
         with graph.local_scope():
             if not self._allow_zero_in_degree:
-                if  tf.math.count_nonzero(graph.in_degrees() == 0) > 0:
+                # the check is cached on the graph until its structure changes
+                if graph._get_cached_info(
+                        'has_zero_in_degree',
+                        lambda: bool(tf.math.count_nonzero(graph.in_degrees() == 0) > 0)):
                     raise DGLError('There are 0-in-degree nodes in the graph, '
                                    'output for those nodes will be invalid. '
                                    'This is harmful for some applications, '
@@ -232,10 +235,11 @@ class GraphConv(layers.Layer):
             feat_src, feat_dst = expand_as_pair(feat, graph)
 
             if self._norm == 'both':
-                degs = tf.clip_by_value(tf.cast(graph.out_degrees(), tf.float32),
-                                        clip_value_min=1,
-                                        clip_value_max=np.inf)
-                norm = tf.pow(degs, -0.5)
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'out', 'both'),
+                    lambda: tf.pow(tf.clip_by_value(tf.cast(graph.out_degrees(), tf.float32),
+                                                    clip_value_min=1,
+                                                    clip_value_max=np.inf), -0.5))
                 shp = norm.shape + (1,) * (feat_src.ndim - 1)
                 norm = tf.reshape(norm, shp)
                 feat_src = feat_src * norm
@@ -266,13 +270,12 @@ class GraphConv(layers.Layer):
                     rst = tf.matmul(rst, weight)
 
             if self._norm != 'none':
-                degs = tf.clip_by_value(tf.cast(graph.in_degrees(), tf.float32),
-                                        clip_value_min=1,
-                                        clip_value_max=np.inf)
-                if self._norm == 'both':
-                    norm = tf.pow(degs, -0.5)
-                else:
-                    norm = 1.0 / degs
+                exponent = -0.5 if self._norm == 'both' else -1.
+                norm = graph._get_cached_info(
+                    ('gcn_norm', 'in', self._norm),
+                    lambda: tf.pow(tf.clip_by_value(tf.cast(graph.in_degrees(), tf.float32),
+                                                    clip_value_min=1,
+                                                    clip_value_max=np.inf), exponent))
                 shp = norm.shape + (1,) * (feat_dst.ndim - 1)
                 norm = tf.reshape(norm, shp)
                 rst = rst * norm
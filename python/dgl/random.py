@@ -5,7 +5,7 @@ from ._ffi.function import _init_api
 from . import backend as F
 from . import ndarray as nd
 
-__all__ = ['seed']
+__all__ = ['seed', 'set_deterministic', 'is_deterministic']
 
 def seed(val):
     """Set the random seed of DGL.
@@ -17,6 +17,73 @@ def seed(val):
     """
     _CAPI_SetSeed(val)
 
+def set_deterministic(enabled):
+    """Enable or disable the deterministic mode of DGL's random number generator.
+
+    By default, the parallel sampling kernels draw from a random number generator per
+    thread, so their results change with the number of OpenMP threads and the
+    scheduling even with a fixed seed.  In deterministic mode, the kernels draw from
+    a counter-based generator (Philox) keyed by the seed, the number of kernel calls
+    since :func:`seed` was called, and the work item, so the results only depend on
+    the seed and the sequence of calls.
+
+    The work item is the seed node in :func:`dgl.sampling.sample_neighbors`, the
+    position of the seed node in :func:`dgl.sampling.random_walk` and the other
+    random walk samplers, and the edge in
+    :class:`dgl.dataloading.negative_sampler.Uniform`.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to enable the deterministic mode.
+
+    Examples
+    --------
+    >>> dgl.random.set_deterministic(True)
+    >>> dgl.seed(42)
+    >>> sg1 = dgl.sampling.sample_neighbors(g, seeds, 5)
+    >>> dgl.seed(42)
+    >>> sg2 = dgl.sampling.sample_neighbors(g, seeds, 5)   # same as sg1
+    """
+    _CAPI_SetDeterministic(bool(enabled))
+
+def is_deterministic():
+    """Return whether the deterministic mode of DGL's random number generator is
+    enabled.
+
+    See :func:`set_deterministic` for details.
+
+    Returns
+    -------
+    bool
+        Whether the deterministic mode is enabled.
+    """
+    return bool(_CAPI_IsDeterministic())
+
+def randint_by_key(keys, num_per_key, upper):
+    """Draw ``num_per_key`` integers in ``[0, upper)`` for every key.
+
+    In deterministic mode, the integers drawn for a key only depend on the seed, the
+    number of kernel calls since seeding and the key.
+
+    Parameters
+    ----------
+    keys : 1-D tensor
+        The keys on CPU.
+    num_per_key : int
+        The number of integers to draw for every key.
+    upper : int
+        The upper bound (exclusive).
+
+    Returns
+    -------
+    1-D tensor
+        The integers with the same data type as ``keys``, where the integers of the
+        ``i``-th key are stored in ``[i * num_per_key, (i + 1) * num_per_key)``.
+    """
+    ret = _CAPI_RandIntByKey(F.zerocopy_to_dgl_ndarray(keys), int(num_per_key), int(upper))
+    return F.zerocopy_from_dgl_ndarray(ret)
+
 def choice(a, size, replace=True, prob=None):  # pylint: disable=invalid-name
     """An equivalent to :func:`numpy.random.choice`.
 
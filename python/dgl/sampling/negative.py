@@ -0,0 +1,112 @@
+"""Negative sampling APIs"""
+import numpy as np
+
+from .._ffi.function import _init_api
+from .. import backend as F
+from ..base import DGLError
+from .. import ndarray as nd
+from .. import utils
+
+__all__ = ['sample_negative_edges']
+
+def _get_unigram_alias_table(g, etype, corrupt, power):
+    """Get the alias table for drawing the corrupted nodes with probabilities
+    proportional to their degrees to the power of ``power``, cached on the graph."""
+    def _build():
+        if corrupt == 'dst':
+            deg = g.in_degrees(etype=etype)
+        else:
+            deg = g.out_degrees(etype=etype)
+        weights = F.asnumpy(deg).astype(np.float64) ** power
+        alias_prob, alias = _CAPI_DGLBuildUnigramAliasTable(
+            F.to_dgl_nd(F.zerocopy_from_numpy(weights)), int(g._idtype_str[3:]))
+        return alias_prob, alias
+    return g._get_cached_info(('unigram_alias', etype, corrupt, power), _build)
+
+def sample_negative_edges(g, eids, k, etype=None, power=0., exclude_positive=False,
+                          chunk_size=None, corrupt='dst'):
+    """Generate negative examples for the given edges by corrupting one of their
+    endpoints.
+
+    For every edge ``(u, v)``, ``k`` negative examples ``(u, v')`` are generated, where
+    ``v'`` is drawn from the nodes of the destination type with a probability
+    proportional to their in-degree to the power of ``power``.  If ``corrupt`` is
+    ``'src'``, the examples are ``(u', v)`` instead, where ``u'`` is drawn with a
+    probability proportional to the out-degree to the power of ``power``.  The alias
+    tables of the distributions are built on the first call and cached on the graph.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU.
+    eids : Tensor
+        The edge IDs.
+    k : int
+        The number of negative examples per edge.
+    etype : str or tuple of str, optional
+        The edge type.  Can be omitted if the graph has only one edge type.
+    power : float, optional
+        The exponent of the degrees.  0 draws the nodes uniformly; 0.75 is the common
+        choice for the unigram distribution of word2vec.
+    exclude_positive : bool, optional
+        If True, a negative example that is an edge in the graph is redrawn, for a
+        bounded number of times.  With ``chunk_size``, such examples are removed instead.
+    chunk_size : int, optional
+        If given, the edges are split into chunks of ``chunk_size`` consecutive edges,
+        and all the edges in a chunk share the same ``k`` corrupted nodes, as in
+        knowledge graph embedding training.
+    corrupt : str, optional
+        ``'dst'`` to corrupt the destinations, or ``'src'`` to corrupt the sources.
+
+    Returns
+    -------
+    tuple[Tensor, Tensor]
+        The source and destination nodes of the negative examples.  Unless examples are
+        removed, the ones of the ``i``-th edge are the ``[i * k, (i + 1) * k)``-th
+        elements.
+
+    Notes
+    -----
+    In deterministic mode, the negative examples of an edge are keyed by its edge ID
+    (or the edge ID of the first edge of its chunk).  See
+    :func:`dgl.random.set_deterministic`.
+
+    Examples
+    --------
+    >>> g = dgl.graph(([0, 0, 1, 2], [1, 2, 2, 3]))
+    >>> src, dst = dgl.sampling.sample_negative_edges(
+    ...     g, torch.tensor([0, 3]), 2, power=0.75, exclude_positive=True)
+    >>> src
+    tensor([0, 0, 2, 2])
+    >>> dst
+    tensor([3, 3, 1, 2])
+    """
+    if corrupt not in ('src', 'dst'):
+        raise DGLError('Expect corrupt to be "src" or "dst", got {}.'.format(corrupt))
+    if chunk_size is not None and chunk_size <= 0:
+        raise DGLError('Expect chunk_size to be positive, got {}.'.format(chunk_size))
+    assert g.device == F.cpu(), "Graph must be on CPU."
+    if etype is None:
+        if len(g.canonical_etypes) > 1:
+            raise DGLError('Must specify edge type when the graph has multiple edge types.')
+        etype = g.canonical_etypes[0]
+    etype = g.to_canonical_etype(etype)
+
+    eids = utils.prepare_tensor(g, eids, 'eids')
+    src, dst = g.find_edges(eids, etype=etype)
+    fixed = src if corrupt == 'dst' else dst
+    if power == 0:
+        alias_prob = nd.array([], ctx=nd.cpu())
+        alias = nd.array([], ctx=nd.cpu())
+    else:
+        alias_prob, alias = _get_unigram_alias_table(g, etype, corrupt, power)
+
+    fixed, neg = _CAPI_DGLNegativeSampling(
+        g._graph, g.get_etype_id(etype), F.to_dgl_nd(fixed), F.to_dgl_nd(eids), int(k),
+        corrupt == 'dst', alias_prob, alias, bool(exclude_positive),
+        int(chunk_size) if chunk_size is not None else 0)
+    fixed = F.from_dgl_nd(fixed)
+    neg = F.from_dgl_nd(neg)
+    return (fixed, neg) if corrupt == 'dst' else (neg, fixed)
+
+_init_api('dgl.sampling.negative', __name__)
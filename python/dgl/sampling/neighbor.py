@@ -3,14 +3,28 @@
 from .._ffi.function import _init_api
 from .. import backend as F
 from ..base import DGLError, EID
-from ..heterograph import DGLHeteroGraph
+from ..heterograph import DGLHeteroGraph, DGLBlock
 from .. import ndarray as nd
 from .. import utils
+from .utils import get_alias_tables
 
 __all__ = [
     'sample_neighbors',
+    'sample_neighbor_blocks',
     'select_topk']
 
+def _fanout_list(g, fanout):
+    """Return the fanout of every edge type as a list."""
+    if not isinstance(fanout, dict):
+        return [int(fanout)] * len(g.etypes)
+    if len(fanout) != len(g.etypes):
+        raise DGLError('Fan-out must be specified for each edge type '
+                       'if a dict is provided.')
+    fanout_array = [None] * len(g.etypes)
+    for etype, value in fanout.items():
+        fanout_array[g.get_etype_id(etype)] = value
+    return fanout_array
+
 def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
                      copy_ndata=True, copy_edata=True, _dist_training=False):
     """Sample neighboring edges of the given nodes and return the induced subgraph.
@@ -52,6 +66,10 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
         The features must be non-negative floats, and the sum of the features of
         inbound/outbound edges for every node must be positive (though they don't have
         to sum up to one).  Otherwise, the result will be undefined.
+
+        The alias tables built from the features are cached on the graph.  With
+        PyTorch, modifying the features in place is detected; with the other
+        backends, assign a new tensor to the feature instead.
     replace : bool, optional
         If True, sample with replacement.
     copy_ndata: bool, optional
@@ -129,19 +147,11 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
         else:
             nodes_all_types.append(nd.array([], ctx=nd.cpu()))
 
-    if not isinstance(fanout, dict):
-        fanout_array = [int(fanout)] * len(g.etypes)
-    else:
-        if len(fanout) != len(g.etypes):
-            raise DGLError('Fan-out must be specified for each edge type '
-                           'if a dict is provided.')
-        fanout_array = [None] * len(g.etypes)
-        for etype, value in fanout.items():
-            fanout_array[g.get_etype_id(etype)] = value
-    fanout_array = F.to_dgl_nd(F.tensor(fanout_array, dtype=F.int64))
+    fanout_array = F.to_dgl_nd(F.tensor(_fanout_list(g, fanout), dtype=F.int64))
 
     if prob is None:
         prob_arrays = [nd.array([], ctx=nd.cpu())] * len(g.etypes)
+        alias_probs, aliases = [], []
     else:
         prob_arrays = []
         for etype in g.canonical_etypes:
@@ -149,9 +159,10 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
                 prob_arrays.append(F.to_dgl_nd(g.edges[etype].data[prob]))
             else:
                 prob_arrays.append(nd.array([], ctx=nd.cpu()))
+        alias_probs, aliases = get_alias_tables(g, prob, edge_dir)
 
     subgidx = _CAPI_DGLSampleNeighbors(g._graph, nodes_all_types, fanout_array,
-                                       edge_dir, prob_arrays, replace)
+                                       edge_dir, prob_arrays, replace, alias_probs, aliases)
     induced_edges = subgidx.induced_edges
     ret = DGLHeteroGraph(subgidx.graph, g.ntypes, g.etypes)
 
@@ -174,6 +185,86 @@ def sample_neighbors(g, nodes, fanout, edge_dir='in', prob=None, replace=False,
 
     return ret
 
+def sample_neighbor_blocks(g, seed_nodes, fanouts, replace=False):
+    """Sample the inbound neighbors of the given nodes for multiple layers and return
+    the blocks of all layers.
+
+    This is equivalent to calling :func:`sample_neighbors` and :func:`dgl.to_block` for
+    every layer starting from the last one, with the input nodes of every block as the
+    seed nodes of the previous layer, but all layers are sampled and converted in a
+    single call without going through Python between the layers.
+
+    Node/edge features are preserved as in :func:`dgl.to_block`. The original IDs of
+    the input nodes, output nodes and edges of the blocks are stored as the
+    `dgl.NID` and `dgl.EID` features.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU.
+    seed_nodes : tensor or dict
+        Node IDs of the output nodes of the last layer.
+
+        If the graph has only one node type, one can give a single tensor.  Otherwise,
+        a dictionary of node types and node ID tensors must be given.
+    fanouts : list[int or dict[etype, int]]
+        The number of sampled neighbors of each layer, starting from the first layer.
+        Each element is in the same format as the ``fanout`` argument of
+        :func:`sample_neighbors`.  -1 takes all the neighbors.
+    replace : bool, optional
+        If True, sample with replacement.
+
+    Returns
+    -------
+    list[DGLBlock]
+        The blocks of the layers, starting from the first layer.
+
+    Examples
+    --------
+    >>> g = dgl.graph(([0, 0, 1, 1, 2, 2], [1, 2, 0, 2, 0, 1]))
+    >>> blocks = dgl.sampling.sample_neighbor_blocks(g, torch.tensor([0]), [2, 1])
+    >>> blocks[1].dstdata[dgl.NID]
+    tensor([0])
+    >>> torch.equal(blocks[0].dstdata[dgl.NID], blocks[1].srcdata[dgl.NID])
+    True
+    """
+    if not isinstance(seed_nodes, dict):
+        if len(g.ntypes) > 1:
+            raise DGLError("Must specify node type when the graph is not homogeneous.")
+        seed_nodes = {g.ntypes[0] : seed_nodes}
+    assert g.device == F.cpu(), "Graph must be on CPU."
+
+    seed_nodes = utils.prepare_tensor_dict(g, seed_nodes, 'seed_nodes')
+    seeds_all_types = []
+    for ntype in g.ntypes:
+        if ntype in seed_nodes:
+            seeds_all_types.append(seed_nodes[ntype])
+        else:
+            seeds_all_types.append(F.tensor([], dtype=g.idtype))
+
+    fanout_array = []
+    for fanout in fanouts:
+        fanout_array.extend(_fanout_list(g, fanout))
+    fanout_array = F.to_dgl_nd(F.tensor(fanout_array, dtype=F.int64))
+
+    ret = _CAPI_DGLSampleNeighborsToBlocks(
+        g._graph, [F.to_dgl_nd(nodes) for nodes in seeds_all_types],
+        fanout_array, len(fanouts), replace)
+
+    # the output nodes of every layer are the input nodes of the next layer
+    dst_nodes = [[F.from_dgl_nd(src) for src in layer[1]] for layer in ret[1:]]
+    dst_nodes.append(seeds_all_types)
+    blocks = []
+    for (gidx, src_nodes, eids), dst in zip(ret, dst_nodes):
+        block = DGLBlock(gidx, (g.ntypes, g.ntypes), g.etypes)
+        src_nodes = [F.from_dgl_nd(src) for src in src_nodes]
+        eids = [F.from_dgl_nd(eid) for eid in eids]
+        node_frames = utils.extract_node_subframes_for_block(g, src_nodes, dst)
+        edge_frames = utils.extract_edge_subframes(g, eids)
+        utils.set_new_frames(block, node_frames=node_frames, edge_frames=edge_frames)
+        blocks.append(block)
+    return blocks
+
 def select_topk(g, k, weight, nodes=None, edge_dir='in', ascending=False,
                 copy_ndata=True, copy_edata=True):
     """Select the neighboring edges with k-largest (or k-smallest) weights of the given
@@ -1,13 +1,9 @@
 """PinSAGE sampler & related functions and classes"""
 
-import numpy as np
-
+from .._ffi.function import _init_api
 from .. import backend as F
 from .. import convert
-from .. import transform
-from .randomwalks import random_walk
-from .neighbor import select_topk
-from ..base import EID
+from .. import ndarray as nd
 from .. import utils
 
 
@@ -79,10 +75,10 @@ class RandomWalkNeighborSampler(object):
 
         self.metapath_hops = len(metapath)
         self.metapath = metapath
-        self.full_metapath = metapath * num_traversals
-        restart_prob = np.zeros(self.metapath_hops * num_traversals)
-        restart_prob[self.metapath_hops::self.metapath_hops] = termination_prob
-        self.restart_prob = F.zerocopy_from_numpy(restart_prob)
+        self.termination_prob = termination_prob
+        self.metapath_nd = F.to_dgl_nd(utils.prepare_tensor(
+            G, [G.get_etype_id(etype) for etype in metapath], 'metapath'))
+        self.prob = [nd.array([], ctx=nd.cpu()) for _ in G.canonical_etypes]
 
     # pylint: disable=no-member
     def __call__(self, seed_nodes):
@@ -102,27 +98,20 @@ class RandomWalkNeighborSampler(object):
             to the algorithm above.  The returned graph is on CPU.
         """
         seed_nodes = utils.prepare_tensor(self.G, seed_nodes, 'seed_nodes')
-
-        seed_nodes = F.repeat(seed_nodes, self.num_random_walks, 0)
-        paths, _ = random_walk(
-            self.G, seed_nodes, metapath=self.full_metapath, restart_prob=self.restart_prob)
-        src = F.reshape(paths[:, self.metapath_hops::self.metapath_hops], (-1,))
-        dst = F.repeat(paths[:, 0], self.num_traversals, 0)
-
-        src_mask = (src != -1)
-        src = F.boolean_mask(src, src_mask)
-        dst = F.boolean_mask(dst, src_mask)
-
-        # count the number of visits and pick the K-most frequent neighbors for each node
+        # visits from duplicate seeds are counted only once
+        seed_nodes = F.unique(seed_nodes)
+
+        # random walks, visit counting and top-k selection are fused in C++
+        src, dst, counts = _CAPI_DGLSamplingRandomWalkTopk(
+            self.G._graph, F.to_dgl_nd(seed_nodes), self.metapath_nd, self.prob,
+            self.num_traversals, self.termination_prob, self.num_random_walks,
+            self.num_neighbors, [], [])
         neighbor_graph = convert.heterograph(
-            {(self.ntype, '_E', self.ntype): (src, dst)},
-            {self.ntype: self.G.number_of_nodes(self.ntype)}
+            {(self.ntype, '_E', self.ntype): (F.from_dgl_nd(src), F.from_dgl_nd(dst))},
+            {self.ntype: self.G.number_of_nodes(self.ntype)},
+            idtype=self.G.idtype
         )
-        neighbor_graph = transform.to_simple(neighbor_graph, return_counts=self.weight_column)
-        counts = neighbor_graph.edata[self.weight_column]
-        neighbor_graph = select_topk(neighbor_graph, self.num_neighbors, self.weight_column)
-        selected_counts = F.gather_row(counts, neighbor_graph.edata[EID])
-        neighbor_graph.edata[self.weight_column] = selected_counts
+        neighbor_graph.edata[self.weight_column] = F.from_dgl_nd(counts)
 
         return neighbor_graph
 
@@ -215,3 +204,5 @@ class PinSAGESampler(RandomWalkNeighborSampler):
         super().__init__(G, num_traversals,
                          termination_prob, num_random_walks, num_neighbors,
                          metapath=[fw_etype, bw_etype], weight_column=weight_column)
+
+_init_api('dgl.sampling.pinsage', __name__)
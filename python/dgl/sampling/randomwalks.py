@@ -6,9 +6,11 @@ from .. import backend as F
 from ..base import DGLError
 from .. import ndarray as nd
 from .. import utils
+from .utils import get_alias_tables
 
 __all__ = [
     'random_walk',
+    'node2vec_random_walk',
     'pack_traces']
 
 def random_walk(g, nodes, *, metapath=None, length=None, prob=None, restart_prob=None):
@@ -56,6 +58,10 @@ def random_walk(g, nodes, *, metapath=None, length=None, prob=None, restart_prob
         must be positive for the outbound edges of all nodes (although they don't have
         to sum up to one).  The result will be undefined otherwise.
 
+        The alias tables built from the feature tensor are cached on the graph.  With
+        PyTorch, modifying the tensor in place is detected; with the other backends,
+        assign a new tensor to the feature instead.
+
         If omitted, DGL assumes that the neighbors are picked uniformly.
     restart_prob : float or Tensor, optional
         Probability to terminate the current trace before each transition.
@@ -155,6 +161,7 @@ def random_walk(g, nodes, *, metapath=None, length=None, prob=None, restart_prob
     # Load the probability tensor from the edge frames
     if prob is None:
         p_nd = [nd.array([], ctx=nodes.ctx) for _ in g.canonical_etypes]
+        alias_probs, aliases = [], []
     else:
         p_nd = []
         for etype in g.canonical_etypes:
@@ -167,22 +174,114 @@ def random_walk(g, nodes, *, metapath=None, length=None, prob=None, restart_prob
             else:
                 prob_nd = nd.array([], ctx=nodes.ctx)
             p_nd.append(prob_nd)
+        alias_probs, aliases = get_alias_tables(g, prob, 'out')
 
     # Actual random walk
     if restart_prob is None:
-        traces, types = _CAPI_DGLSamplingRandomWalk(gidx, nodes, metapath, p_nd)
+        traces, types = _CAPI_DGLSamplingRandomWalk(
+            gidx, nodes, metapath, p_nd, alias_probs, aliases)
     elif F.is_tensor(restart_prob):
         restart_prob = F.to_dgl_nd(restart_prob)
         traces, types = _CAPI_DGLSamplingRandomWalkWithStepwiseRestart(
-            gidx, nodes, metapath, p_nd, restart_prob)
+            gidx, nodes, metapath, p_nd, restart_prob, alias_probs, aliases)
     else:
         traces, types = _CAPI_DGLSamplingRandomWalkWithRestart(
-            gidx, nodes, metapath, p_nd, restart_prob)
+            gidx, nodes, metapath, p_nd, restart_prob, alias_probs, aliases)
 
     traces = F.from_dgl_nd(traces)
     types = F.from_dgl_nd(types)
     return traces, types
 
+def node2vec_random_walk(g, nodes, p, q, walk_length, prob=None):
+    """Generate node2vec random walk traces from an array of starting nodes.
+
+    Node2vec [1]_ biases the choice of the next node by the previous node.  Having just
+    traversed from ``t`` to ``v``, the walk moves to a neighbor ``x`` of ``v`` with a
+    probability proportional to the edge probability times the search bias, which is
+    ``1/p`` if ``x`` is ``t``, ``1`` if ``x`` is a neighbor of ``t`` and ``1/q`` otherwise.
+
+    The walk is performed by rejection sampling, so the cost does not depend on the
+    degree of the previous node and no second-order transition tables are created.
+
+    If a random walk stops in advance, DGL pads the trace with -1 to have the same
+    length.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU and must be homogeneous.
+    nodes : Tensor
+        Node ID tensor from which the random walk traces starts.
+
+        The tensor must be on CPU, and must have the same dtype as the ID type
+        of the graph.
+    p : float
+        Return parameter.  A small value keeps the walk close to the starting node.
+    q : float
+        In-out parameter.  A small value pushes the walk outward, like a depth-first
+        search, while a large value keeps it local, like a breadth-first search.
+    walk_length : int
+        Length of random walks.
+    prob : str, optional
+        The name of the edge feature tensor on the graph storing the (unnormalized)
+        probabilities associated with each edge for choosing the next node.
+
+        The feature tensor must be non-negative and the sum of the probabilities
+        must be positive for the outbound edges of all nodes (although they don't have
+        to sum up to one).  The result will be undefined otherwise.
+
+        The alias tables built from the feature tensor are cached on the graph.  With
+        PyTorch, modifying the tensor in place is detected; with the other backends,
+        assign a new tensor to the feature instead.
+
+        If omitted, DGL assumes that the neighbors are picked uniformly.
+
+    Returns
+    -------
+    traces : Tensor
+        A 2-dimensional node ID tensor with shape ``(num_seeds, walk_length + 1)``.
+
+    References
+    ----------
+    .. [1] Aditya Grover and Jure Leskovec. node2vec: Scalable Feature Learning for
+       Networks. KDD 2016.
+
+    Examples
+    --------
+    >>> g1 = dgl.graph(([0, 1, 1, 2, 3], [1, 2, 3, 0, 0]))
+    >>> dgl.sampling.node2vec_random_walk(g1, [0, 1, 2, 0], 1, 1, walk_length=4)
+    tensor([[0, 1, 3, 0, 1],
+            [1, 2, 0, 1, 3],
+            [2, 0, 1, 3, 0],
+            [0, 1, 2, 0, 1]])
+    """
+    assert g.device == F.cpu(), "Graph must be on CPU."
+    if len(g.ntypes) > 1 or len(g.etypes) > 1:
+        raise DGLError("Node2vec random walk only supports homogeneous graphs.")
+
+    gidx = g._graph
+    nodes = F.to_dgl_nd(utils.prepare_tensor(g, nodes, 'nodes'))
+
+    if prob is None:
+        prob_nd = nd.array([], ctx=nodes.ctx)
+        alias_prob, alias = nd.array([], ctx=nodes.ctx), nd.array([], ctx=nodes.ctx)
+    else:
+        prob_nd = F.to_dgl_nd(g.edata[prob])
+        if prob_nd.ctx != nodes.ctx:
+            raise ValueError('context of seed node array and edata[%s] are different' % prob)
+        alias_probs, aliases = get_alias_tables(g, prob, 'out')
+        alias_prob, alias = alias_probs[0], aliases[0]
+
+    # The sorted adjacency lists only depend on the graph structure, so they are
+    # computed once and cached on the graph.
+    sorted_indices = g._get_cached_info(
+        ('node2vec_sorted_indices',), lambda: _CAPI_DGLSamplingSortedCSRIndices(gidx))
+
+    traces = _CAPI_DGLSamplingNode2vec(
+        gidx, nodes, float(p), float(q), walk_length, prob_nd, alias_prob, alias,
+        sorted_indices)
+    return F.from_dgl_nd(traces)
+
 def pack_traces(traces, types):
     """Pack the padded traces returned by ``random_walk()`` into a concatenated array.
     The padding values (-1) are removed, and the length and offset of each trace is
@@ -0,0 +1,62 @@
+"""Sampling utilities"""
+
+from .._ffi.function import _init_api
+from .. import backend as F
+from .. import ndarray as nd
+
+def tensor_version(tensor):
+    """Return the version counter of a tensor, which is incremented by the in-place
+    operations on it, or None if the backend does not track it (only PyTorch does).
+    """
+    return getattr(tensor, '_version', None)
+
+def get_alias_tables(g, prob, edge_dir):
+    """Get the alias tables for weighted sampling of every edge type, cached on the graph.
+
+    The alias tables allow drawing a neighbor in O(1) time without allocating memory.
+    They are built on the first call and reused as long as neither the graph
+    structure nor the probability tensor changes. With PyTorch, modifying the
+    probability tensor in place is detected through its version counter; with the
+    other backends, assign a new tensor to the edge feature instead.
+
+    Parameters
+    ----------
+    g : DGLGraph
+        The graph.  Must be on CPU.
+    prob : str
+        Feature name of the (unnormalized) probabilities associated with each edge.
+    edge_dir : str
+        ``'in'`` for the alias tables of the inbound edges of every node, or ``'out'``
+        for the ones of the outbound edges.
+
+    Returns
+    -------
+    alias_probs : list[dgl.ndarray.NDArray]
+        The acceptance probabilities of every edge type.  Empty if the edge type does
+        not have the probability feature.
+    aliases : list[dgl.ndarray.NDArray]
+        The aliases of every edge type.  Empty if the edge type does not have the
+        probability feature.
+    """
+    alias_probs = []
+    aliases = []
+    for etype in g.canonical_etypes:
+        if prob not in g.edges[etype].data:
+            alias_probs.append(nd.array([], ctx=nd.cpu()))
+            aliases.append(nd.array([], ctx=nd.cpu()))
+            continue
+        etype_id = g.get_etype_id(etype)
+        prob_tensor = g.edges[etype].data[prob]
+        entry = g._get_cached_info(('alias_table', etype_id, prob, edge_dir),
+                                   lambda: [None, None, None])
+        version = tensor_version(prob_tensor)
+        if entry[0] is not prob_tensor or entry[2] != version:
+            entry[1] = tuple(_CAPI_DGLBuildAliasTable(
+                g._graph, etype_id, edge_dir, F.to_dgl_nd(prob_tensor)))
+            entry[0] = prob_tensor
+            entry[2] = version
+        alias_probs.append(entry[1][0])
+        aliases.append(entry[1][1])
+    return alias_probs, aliases
+
+_init_api('dgl.sampling.utils', __name__)
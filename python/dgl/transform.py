@@ -17,7 +17,6 @@ from .partition import partition_graph_with_halo
 from .partition import metis_partition
 
 # TO BE DEPRECATED
-from ._deprecate.graph import DGLGraph as DGLGraphStale
 
 __all__ = [
     'line_graph',
@@ -817,6 +816,7 @@ def to_bidirected_stale(g, readonly=True):
     >>> bg1.edges()
     (tensor([0, 1, 0]), tensor([0, 0, 1]))
     """
+    from ._deprecate.graph import DGLGraph as DGLGraphStale
     if readonly:
         newgidx = _CAPI_DGLToBidirectedImmutableGraph(g._graph)
     else:
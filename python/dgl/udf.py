@@ -1,6 +1,69 @@
 """User-defined function related data structures."""
 from __future__ import absolute_import
 
+from .base import DGLError
+
+MAILBOX_LAYOUTS = ('bucket', 'padded', 'packed')
+
+def mailbox_layout(layout):
+    """Decorator that chooses how a reduce UDF receives its messages.
+
+    The layouts are
+
+    * ``'bucket'`` (default): nodes are grouped by in-degree and the UDF is called once
+      per group. ``nodes.mailbox[k]`` has shape :math:`(N, D, *)`, where :math:`D`
+      is the in-degree of the group.
+    * ``'padded'``: the UDF is called once on all the nodes with incoming messages.
+      ``nodes.mailbox[k]`` has shape :math:`(N, D_{max}, *)` and is zero-padded;
+      ``nodes.mailbox_mask`` is a boolean tensor of shape :math:`(N, D_{max})`
+      marking the real messages.
+    * ``'packed'``: the UDF is called once on all the nodes with incoming messages,
+      sorted by decreasing in-degree. ``nodes.mailbox[k]`` has shape :math:`(E, *)`
+      and stores the messages in the time-major order of a packed sequence: first
+      the first message of every node, then the second message of every node with
+      at least two messages, and so on. ``nodes.mailbox_batch_sizes`` is the number
+      of nodes at each step, so that for PyTorch
+      ``torch.nn.utils.rnn.PackedSequence(nodes.mailbox[k], nodes.mailbox_batch_sizes)``
+      can be fed to an RNN directly.
+
+    In all layouts the messages of a node are ordered by edge ID and
+    ``nodes.mailbox_lengths`` gives the number of messages of every node.
+    The ``'padded'`` and ``'packed'`` layouts avoid one UDF call per distinct
+    in-degree, which is costly for graphs with many distinct degrees. The
+    ``'padded'`` layout needs memory proportional to the maximal in-degree.
+
+    Parameters
+    ----------
+    layout : str
+        One of ``'bucket'``, ``'padded'`` or ``'packed'``.
+
+    Examples
+    --------
+    The following example uses PyTorch backend.
+
+    >>> import dgl
+    >>> import torch
+    >>> import dgl.function as fn
+    >>> g = dgl.graph(([1, 3, 5, 0, 4, 2, 3, 3, 4, 5], [1, 1, 0, 0, 1, 2, 2, 0, 3, 3]))
+    >>> g.edata['eid'] = torch.arange(10)
+    >>> @dgl.udf.mailbox_layout('padded')
+    ... def reducer(nodes):
+    ...     print(nodes.mailbox['eid'])
+    ...     return {'n': nodes.mailbox['eid'].sum(1)}
+    >>> g.update_all(fn.copy_e('eid', 'eid'), reducer)
+    tensor([[2, 3, 7],
+            [0, 1, 4],
+            [5, 6, 0],
+            [8, 9, 0]])
+    """
+    if layout not in MAILBOX_LAYOUTS:
+        raise DGLError('Expect mailbox layout to be one of {}, got {}.'.format(
+            MAILBOX_LAYOUTS, layout))
+    def _decorator(func):
+        func.mailbox_layout = layout
+        return func
+    return _decorator
+
 class EdgeBatch(object):
     """The class that can represent a batch of edges.
 
@@ -246,13 +309,23 @@ class NodeBatch(object):
         Node feature data.
     msgs : dict[str, Tensor], optional
         Messages data.
+    msg_lengths : Tensor, optional
+        Number of messages of each node.
+    msg_mask : Tensor, optional
+        Mask of the real messages in a padded mailbox.
+    msg_batch_sizes : Tensor, optional
+        Number of nodes at each step of a packed mailbox.
     """
-    def __init__(self, graph, nodes, ntype, data, msgs=None):
+    def __init__(self, graph, nodes, ntype, data, msgs=None,
+                 msg_lengths=None, msg_mask=None, msg_batch_sizes=None):
         self._graph = graph
         self._nodes = nodes
         self._ntype = ntype
         self._data = data
         self._msgs = msgs
+        self._msg_lengths = msg_lengths
+        self._msg_mask = msg_mask
+        self._msg_batch_sizes = msg_batch_sizes
 
     @property
     def data(self):
@@ -320,6 +393,32 @@ class NodeBatch(object):
         """
         return self._msgs
 
+    @property
+    def mailbox_lengths(self):
+        """Return the number of messages received by each node in the batch.
+
+        See :func:`~dgl.udf.mailbox_layout` for details.
+        """
+        return self._msg_lengths
+
+    @property
+    def mailbox_mask(self):
+        """Return the boolean mask of the real messages of a ``'padded'`` mailbox,
+        or None for other layouts.
+
+        See :func:`~dgl.udf.mailbox_layout` for details.
+        """
+        return self._msg_mask
+
+    @property
+    def mailbox_batch_sizes(self):
+        """Return the number of nodes at each step of a ``'packed'`` mailbox,
+        or None for other layouts. It is an int64 tensor on CPU.
+
+        See :func:`~dgl.udf.mailbox_layout` for details.
+        """
+        return self._msg_batch_sizes
+
     def nodes(self):
         """Return the nodes in the batch.
 
@@ -520,6 +520,29 @@ COOMatrix CSRRowWiseSampling(
   return ret;
 }
 
+CSRAliasTable CSRBuildAliasTable(CSRMatrix mat, FloatArray prob) {
+  CSRAliasTable ret;
+  ATEN_CSR_SWITCH(mat, XPU, IdType, "CSRBuildAliasTable", {
+    ATEN_FLOAT_TYPE_SWITCH(prob->dtype, FloatType, "probability", {
+      ret = impl::CSRBuildAliasTable<XPU, IdType, FloatType>(mat, prob);
+    });
+  });
+  return ret;
+}
+
+COOMatrix CSRRowWiseSamplingAlias(
+    CSRMatrix mat, IdArray rows, int64_t num_samples, FloatArray prob,
+    const CSRAliasTable& table, bool replace) {
+  COOMatrix ret;
+  ATEN_CSR_SWITCH(mat, XPU, IdType, "CSRRowWiseSamplingAlias", {
+    ATEN_FLOAT_TYPE_SWITCH(prob->dtype, FloatType, "probability", {
+      ret = impl::CSRRowWiseSamplingAlias<XPU, IdType, FloatType>(
+          mat, rows, num_samples, prob, table, replace);
+    });
+  });
+  return ret;
+}
+
 COOMatrix CSRRowWiseTopk(
     CSRMatrix mat, IdArray rows, int64_t k, NDArray weight, bool ascending) {
   COOMatrix ret;
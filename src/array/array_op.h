@@ -150,6 +150,14 @@ template <DLDeviceType XPU, typename IdType>
 COOMatrix CSRRowWiseSamplingUniform(
     CSRMatrix mat, IdArray rows, int64_t num_samples, bool replace);
 
+template <DLDeviceType XPU, typename IdType, typename FloatType>
+CSRAliasTable CSRBuildAliasTable(CSRMatrix mat, FloatArray prob);
+
+template <DLDeviceType XPU, typename IdType, typename FloatType>
+COOMatrix CSRRowWiseSamplingAlias(
+    CSRMatrix mat, IdArray rows, int64_t num_samples, FloatArray prob,
+    const CSRAliasTable& table, bool replace);
+
 // FloatType is the type of weight data.
 template <DLDeviceType XPU, typename IdType, typename DType>
 COOMatrix CSRRowWiseTopk(
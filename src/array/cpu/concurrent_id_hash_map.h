@@ -0,0 +1,201 @@
+/*!
+ *  Copyright (c) 2021 by Contributors
+ * \file array/cpu/concurrent_id_hash_map.h
+ * \brief A hashmap for relabeling IDs that is built and queried in parallel.
+ */
+#ifndef DGL_ARRAY_CPU_CONCURRENT_ID_HASH_MAP_H_
+#define DGL_ARRAY_CPU_CONCURRENT_ID_HASH_MAP_H_
+
+#include <dgl/aten/types.h>
+#include <dmlc/omp.h>
+#include <algorithm>
+#include <atomic>
+#include <limits>
+#include <memory>
+#include <vector>
+#include "../../c_api_common.h"
+
+namespace dgl {
+namespace aten {
+
+/*!
+ * \brief A hashmap that maps the IDs in the given arrays to new IDs starting from zero,
+ *        in the order of their first appearance.
+ *
+ * The relabeling is identical to IdHashMap updated with the same arrays one by one, but
+ * the map is built with OpenMP using an open addressing table whose slots are claimed
+ * with atomic compare-and-swap.  The map cannot be updated after it is built.
+ */
+template <typename IdType>
+class ConcurrentIdHashMap {
+ public:
+  ConcurrentIdHashMap() = default;
+
+  /*!
+   * \brief Build the hashmap from the concatenation of the given arrays.
+   *
+   * The arrays could contain duplicates.
+   */
+  void Init(const std::vector<IdArray> &ids_list) {
+    std::vector<int64_t> offsets(ids_list.size() + 1, 0);
+    for (size_t i = 0; i < ids_list.size(); ++i)
+      offsets[i + 1] = offsets[i] + ids_list[i]->shape[0];
+    const int64_t total = offsets.back();
+
+    log_capacity_ = 1;
+    while ((int64_t(1) << log_capacity_) < 2 * total)
+      ++log_capacity_;
+    const int64_t capacity = int64_t(1) << log_capacity_;
+    mask_ = capacity - 1;
+    keys_.reset(new std::atomic<IdType>[capacity]);
+    values_.reset(new std::atomic<int64_t>[capacity]);
+#pragma omp parallel for
+    for (int64_t i = 0; i < capacity; ++i) {
+      keys_[i].store(kEmptyKey, std::memory_order_relaxed);
+      values_[i].store(std::numeric_limits<int64_t>::max(), std::memory_order_relaxed);
+    }
+
+    // Insert every ID with the minimum of the positions it appears at.
+    for (size_t a = 0; a < ids_list.size(); ++a) {
+      const IdType *ids_data = static_cast<IdType *>(ids_list[a]->data);
+      const int64_t len = ids_list[a]->shape[0];
+      const int64_t offset = offsets[a];
+#pragma omp parallel for
+      for (int64_t i = 0; i < len; ++i)
+        Insert(ids_data[i], offset + i);
+    }
+
+    // Find the first appearances and number them in order.
+    std::vector<int64_t> new_ids(total + 1, 0);
+    for (size_t a = 0; a < ids_list.size(); ++a) {
+      const IdType *ids_data = static_cast<IdType *>(ids_list[a]->data);
+      const int64_t len = ids_list[a]->shape[0];
+      const int64_t offset = offsets[a];
+#pragma omp parallel for
+      for (int64_t i = 0; i < len; ++i) {
+        const int64_t slot = Find(ids_data[i]);
+        new_ids[offset + i + 1] =
+          (values_[slot].load(std::memory_order_relaxed) == offset + i) ? 1 : 0;
+      }
+    }
+    ParallelInclusiveScan(&new_ids);
+    size_ = new_ids[total];
+
+    values_array_ = NewIdArray(size_, DLContext{kDLCPU, 0}, sizeof(IdType) * 8);
+    IdType *values_data = static_cast<IdType *>(values_array_->data);
+    for (size_t a = 0; a < ids_list.size(); ++a) {
+      const IdType *ids_data = static_cast<IdType *>(ids_list[a]->data);
+      const int64_t len = ids_list[a]->shape[0];
+      const int64_t offset = offsets[a];
+#pragma omp parallel for
+      for (int64_t i = 0; i < len; ++i) {
+        const int64_t pos = offset + i;
+        if (new_ids[pos + 1] != new_ids[pos]) {
+          // only the first appearance writes, so every slot is written once
+          values_[Find(ids_data[i])].store(new_ids[pos], std::memory_order_relaxed);
+          values_data[new_ids[pos]] = ids_data[i];
+        }
+      }
+    }
+  }
+
+  // Return the new id of the given id. If the given id is not contained
+  // in the hash map, returns the default_val instead.
+  IdType Map(IdType id, IdType default_val) const {
+    const int64_t slot = Find(id);
+    return (slot == -1) ? default_val :
+      static_cast<IdType>(values_[slot].load(std::memory_order_relaxed));
+  }
+
+  // Return the new id of each id in the given array.
+  IdArray Map(IdArray ids, IdType default_val) const {
+    const IdType* ids_data = static_cast<IdType*>(ids->data);
+    const int64_t len = ids->shape[0];
+    IdArray values = NewIdArray(len, ids->ctx, ids->dtype.bits);
+    IdType* values_data = static_cast<IdType*>(values->data);
+#pragma omp parallel for
+    for (int64_t i = 0; i < len; ++i)
+      values_data[i] = Map(ids_data[i], default_val);
+    return values;
+  }
+
+  // Return all the old ids, ordered by new id.
+  IdArray Values() const {
+    return values_array_;
+  }
+
+  inline size_t Size() const {
+    return size_;
+  }
+
+ private:
+  static constexpr IdType kEmptyKey = -1;
+
+  inline int64_t Hash(IdType id) const {
+    // Fibonacci hashing spreads consecutive IDs over the table.
+    return static_cast<int64_t>(
+        (static_cast<uint64_t>(id) * 0x9E3779B97F4A7C15ULL) >> (64 - log_capacity_));
+  }
+
+  void Insert(IdType id, int64_t pos) {
+    int64_t slot = Hash(id);
+    while (true) {
+      IdType expected = kEmptyKey;
+      if (keys_[slot].compare_exchange_strong(expected, id) || expected == id)
+        break;
+      slot = (slot + 1) & mask_;
+    }
+    int64_t current = values_[slot].load(std::memory_order_relaxed);
+    while (pos < current && !values_[slot].compare_exchange_weak(current, pos)) {}
+  }
+
+  int64_t Find(IdType id) const {
+    int64_t slot = Hash(id);
+    while (true) {
+      const IdType key = keys_[slot].load(std::memory_order_relaxed);
+      if (key == id)
+        return slot;
+      if (key == kEmptyKey)
+        return -1;
+      slot = (slot + 1) & mask_;
+    }
+  }
+
+  // In-place inclusive prefix sum, computed chunk by chunk in parallel.
+  static void ParallelInclusiveScan(std::vector<int64_t> *data) {
+    const int64_t len = data->size();
+    int64_t *ptr = data->data();
+    const int num_chunks = omp_get_max_threads();
+    const int64_t chunk_size = (len + num_chunks - 1) / num_chunks;
+    std::vector<int64_t> chunk_sums(num_chunks + 1, 0);
+#pragma omp parallel for
+    for (int c = 0; c < num_chunks; ++c) {
+      const int64_t begin = std::min(len, c * chunk_size);
+      const int64_t end = std::min(len, begin + chunk_size);
+      for (int64_t i = begin + 1; i < end; ++i)
+        ptr[i] += ptr[i - 1];
+      chunk_sums[c + 1] = (end > begin) ? ptr[end - 1] : 0;
+    }
+    for (int c = 0; c < num_chunks; ++c)
+      chunk_sums[c + 1] += chunk_sums[c];
+#pragma omp parallel for
+    for (int c = 1; c < num_chunks; ++c) {
+      const int64_t begin = std::min(len, c * chunk_size);
+      const int64_t end = std::min(len, begin + chunk_size);
+      for (int64_t i = begin; i < end; ++i)
+        ptr[i] += chunk_sums[c];
+    }
+  }
+
+  int log_capacity_ = 1;
+  int64_t mask_ = 0;
+  int64_t size_ = 0;
+  std::unique_ptr<std::atomic<IdType>[]> keys_;
+  std::unique_ptr<std::atomic<int64_t>[]> values_;
+  IdArray values_array_;
+};
+
+}  // namespace aten
+}  // namespace dgl
+
+#endif  // DGL_ARRAY_CPU_CONCURRENT_ID_HASH_MAP_H_
@@ -7,6 +7,7 @@
 #define DGL_ARRAY_CPU_ROWWISE_PICK_H_
 
 #include <dgl/array.h>
+#include <dgl/random.h>
 #include <functional>
 #include <algorithm>
 
@@ -40,14 +41,22 @@ using PickFn = std::function<void(
 
 // Template for picking non-zero values row-wise. The implementation utilizes
 // OpenMP parallelization on rows because each row performs computation independently.
+//
+// In deterministic mode, the random stream of every row is keyed by the row ID, or by
+// the corresponding element of row_keys if given.
 template <typename IdxType>
 COOMatrix CSRRowWisePick(CSRMatrix mat, IdArray rows,
-                         int64_t num_picks, bool replace, PickFn<IdxType> pick_fn) {
+                         int64_t num_picks, bool replace, PickFn<IdxType> pick_fn,
+                         IdArray row_keys = NullArray()) {
   using namespace aten;
   const IdxType* indptr = static_cast<IdxType*>(mat.indptr->data);
   const IdxType* indices = static_cast<IdxType*>(mat.indices->data);
   const IdxType* data = CSRHasData(mat)? static_cast<IdxType*>(mat.data->data) : nullptr;
   const IdxType* rows_data = static_cast<IdxType*>(rows->data);
+  const IdxType* keys_data = IsNullArray(row_keys) ?
+    rows_data : static_cast<IdxType*>(row_keys->data);
+  const int64_t stream = RandomEngine::NewStream();
+  RandomEngine::StreamGuard stream_guard(stream);
   const int64_t num_rows = rows->shape[0];
   const auto& ctx = mat.indptr->ctx;
 
@@ -100,6 +109,7 @@ COOMatrix CSRRowWisePick(CSRMatrix mat, IdArray rows,
         picked_idata[i * num_picks + j] = data? data[off + j] : off + j;
       }
     } else {
+      RandomEngine::ThreadLocal()->SetStream(stream_guard, keys_data[i]);
       pick_fn(rid, off, len,
               indices, data,
               picked_idata + i * num_picks);
@@ -141,7 +151,8 @@ COOMatrix COORowWisePick(COOMatrix mat, IdArray rows,
   using namespace aten;
   const auto& csr = COOToCSR(COOSliceRows(mat, rows));
   const IdArray new_rows = Range(0, rows->shape[0], rows->dtype.bits, rows->ctx);
-  const auto& picked = CSRRowWisePick<IdxType>(csr, new_rows, num_picks, replace, pick_fn);
+  const auto& picked = CSRRowWisePick<IdxType>(
+      csr, new_rows, num_picks, replace, pick_fn, rows);
   return COOMatrix(mat.num_rows, mat.num_cols,
                    IndexSelect(rows, picked.row),  // map the row index to the correct one
                    picked.col,
@@ -4,7 +4,10 @@
  * \brief rowwise sampling
  */
 #include <dgl/random.h>
+#include <dmlc/omp.h>
+#include <algorithm>
 #include <numeric>
+#include <vector>
 #include "./rowwise_pick.h"
 
 namespace dgl {
@@ -44,6 +47,50 @@ inline PickFn<IdxType> GetSamplingPickFn(
   return pick_fn;
 }
 
+// Maximal number of draws per sample before sampling without replacement from alias
+// tables gives up rejecting duplicates.
+constexpr int64_t kMaxAliasDrawsPerSample = 8;
+
+template <typename IdxType, typename FloatType>
+inline PickFn<IdxType> GetSamplingAliasPickFn(
+    int64_t num_samples, FloatArray prob, const CSRAliasTable& table, bool replace) {
+  const FloatType* accept = static_cast<FloatType*>(table.prob->data);
+  const IdxType* alias = static_cast<IdxType*>(table.alias->data);
+  PickFn<IdxType> fallback = GetSamplingPickFn<IdxType, FloatType>(num_samples, prob, replace);
+  PickFn<IdxType> pick_fn = [table, accept, alias, num_samples, replace, fallback]
+    (IdxType rowid, IdxType off, IdxType len,
+     const IdxType* col, const IdxType* data,
+     IdxType* out_idx) {
+      RandomEngine* rng = RandomEngine::ThreadLocal();
+      auto draw = [rng, accept, alias, off, len] () {
+        const IdxType j = rng->RandInt<IdxType>(len);
+        return off + ((rng->Uniform<FloatType>() < accept[off + j]) ? j : alias[off + j]);
+      };
+      if (replace) {
+        for (int64_t j = 0; j < num_samples; ++j)
+          out_idx[j] = draw();
+        return;
+      }
+      // Rejecting duplicates of independent draws is equivalent to sampling without
+      // replacement. It is only efficient if the row is much longer than the number of
+      // samples and the probability mass is not concentrated on a few entries.
+      if (num_samples * 2 <= len) {
+        int64_t num_picked = 0;
+        for (int64_t trial = 0;
+             trial < kMaxAliasDrawsPerSample * num_samples && num_picked < num_samples;
+             ++trial) {
+          const IdxType picked = draw();
+          if (std::find(out_idx, out_idx + num_picked, picked) == out_idx + num_picked)
+            out_idx[num_picked++] = picked;
+        }
+        if (num_picked == num_samples)
+          return;
+      }
+      fallback(rowid, off, len, col, data, out_idx);
+    };
+  return pick_fn;
+}
+
 template <typename IdxType>
 inline PickFn<IdxType> GetSamplingUniformPickFn(
     int64_t num_samples, bool replace) {
@@ -80,6 +127,92 @@ template COOMatrix CSRRowWiseSampling<kDLCPU, int32_t, double>(
 template COOMatrix CSRRowWiseSampling<kDLCPU, int64_t, double>(
     CSRMatrix, IdArray, int64_t, FloatArray, bool);
 
+template <DLDeviceType XPU, typename IdxType, typename FloatType>
+CSRAliasTable CSRBuildAliasTable(CSRMatrix mat, FloatArray prob) {
+  const IdxType* indptr = static_cast<IdxType*>(mat.indptr->data);
+  const IdxType* data = CSRHasData(mat)? static_cast<IdxType*>(mat.data->data) : nullptr;
+  const FloatType* prob_data = static_cast<FloatType*>(prob->data);
+  const int64_t nnz = mat.indices->shape[0];
+
+  CSRAliasTable table;
+  table.prob = FloatArray::Empty({nnz}, prob->dtype, prob->ctx);
+  table.alias = IdArray::Empty({nnz}, mat.indices->dtype, mat.indices->ctx);
+  FloatType* accept = static_cast<FloatType*>(table.prob->data);
+  IdxType* alias = static_cast<IdxType*>(table.alias->data);
+
+  // Vose's alias method on every row
+#pragma omp parallel
+  {
+    std::vector<IdxType> small, large;
+#pragma omp for schedule(dynamic, 64)
+    for (int64_t i = 0; i < mat.num_rows; ++i) {
+      const IdxType off = indptr[i];
+      const IdxType len = indptr[i + 1] - off;
+      FloatType* row_accept = accept + off;
+      IdxType* row_alias = alias + off;
+      double sum = 0;
+      for (IdxType j = 0; j < len; ++j)
+        sum += prob_data[data ? data[off + j] : off + j];
+
+      small.clear();
+      large.clear();
+      for (IdxType j = 0; j < len; ++j) {
+        row_alias[j] = j;
+        if (sum > 0) {
+          row_accept[j] = static_cast<FloatType>(prob_data[data ? data[off + j] : off + j] *
+                                                 len / sum);
+          (row_accept[j] < 1 ? small : large).push_back(j);
+        } else {
+          row_accept[j] = 1;
+        }
+      }
+      while (!small.empty() && !large.empty()) {
+        const IdxType s = small.back();
+        const IdxType l = large.back();
+        small.pop_back();
+        row_alias[s] = l;
+        row_accept[l] -= 1 - row_accept[s];
+        if (row_accept[l] < 1) {
+          large.pop_back();
+          small.push_back(l);
+        }
+      }
+      // whatever is left only differs from 1 by rounding errors
+      for (IdxType j : small)
+        row_accept[j] = 1;
+      for (IdxType j : large)
+        row_accept[j] = 1;
+    }
+  }
+  return table;
+}
+
+template CSRAliasTable CSRBuildAliasTable<kDLCPU, int32_t, float>(CSRMatrix, FloatArray);
+template CSRAliasTable CSRBuildAliasTable<kDLCPU, int64_t, float>(CSRMatrix, FloatArray);
+template CSRAliasTable CSRBuildAliasTable<kDLCPU, int32_t, double>(CSRMatrix, FloatArray);
+template CSRAliasTable CSRBuildAliasTable<kDLCPU, int64_t, double>(CSRMatrix, FloatArray);
+
+template <DLDeviceType XPU, typename IdxType, typename FloatType>
+COOMatrix CSRRowWiseSamplingAlias(CSRMatrix mat, IdArray rows, int64_t num_samples,
+                                  FloatArray prob, const CSRAliasTable& table, bool replace) {
+  CHECK(prob.defined());
+  CHECK_EQ(table.prob->shape[0], mat.indices->shape[0])
+    << "The alias tables do not match the CSR matrix.";
+  CHECK_EQ(table.prob->dtype, prob->dtype)
+    << "The alias tables do not match the probability array.";
+  auto pick_fn = GetSamplingAliasPickFn<IdxType, FloatType>(num_samples, prob, table, replace);
+  return CSRRowWisePick(mat, rows, num_samples, replace, pick_fn);
+}
+
+template COOMatrix CSRRowWiseSamplingAlias<kDLCPU, int32_t, float>(
+    CSRMatrix, IdArray, int64_t, FloatArray, const CSRAliasTable&, bool);
+template COOMatrix CSRRowWiseSamplingAlias<kDLCPU, int64_t, float>(
+    CSRMatrix, IdArray, int64_t, FloatArray, const CSRAliasTable&, bool);
+template COOMatrix CSRRowWiseSamplingAlias<kDLCPU, int32_t, double>(
+    CSRMatrix, IdArray, int64_t, FloatArray, const CSRAliasTable&, bool);
+template COOMatrix CSRRowWiseSamplingAlias<kDLCPU, int64_t, double>(
+    CSRMatrix, IdArray, int64_t, FloatArray, const CSRAliasTable&, bool);
+
 template <DLDeviceType XPU, typename IdxType>
 COOMatrix CSRRowWiseSamplingUniform(CSRMatrix mat, IdArray rows,
                                     int64_t num_samples, bool replace) {
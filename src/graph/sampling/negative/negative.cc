@@ -0,0 +1,210 @@
+/*!
+ *  Copyright (c) 2021 by Contributors
+ * \file graph/sampling/negative.cc
+ * \brief Definition of negative sampling APIs.
+ */
+
+#include <dgl/runtime/container.h>
+#include <dgl/packed_func_ext.h>
+#include <dgl/array.h>
+#include <dgl/random.h>
+#include <dgl/sampling/negative.h>
+#include <dmlc/omp.h>
+#include <algorithm>
+#include <utility>
+#include <vector>
+#include "../../../c_api_common.h"
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace dgl {
+namespace sampling {
+
+namespace {
+
+// Maximal number of draws per negative example when rejecting the edges in the graph.
+constexpr int64_t kMaxRejectionTrials = 100;
+
+template <typename IdxType, typename FloatType>
+std::pair<IdArray, IdArray> NegativeSamplingImpl(
+    CSRMatrix csr,
+    int64_t num_candidates,
+    IdArray fixed,
+    IdArray keys,
+    int64_t k,
+    const CSRAliasTable& table,
+    bool exclude_positive,
+    int64_t chunk_size) {
+  const int64_t num_edges = fixed->shape[0];
+  const IdxType* fixed_data = static_cast<IdxType*>(fixed->data);
+  const IdxType* keys_data = static_cast<IdxType*>(keys->data);
+  const bool use_alias = !IsNullArray(table.prob) && table.prob->shape[0] > 0;
+  const FloatType* accept = use_alias ? static_cast<FloatType*>(table.prob->data) : nullptr;
+  const IdxType* alias = use_alias ? static_cast<IdxType*>(table.alias->data) : nullptr;
+  const IdxType* indptr = exclude_positive ? static_cast<IdxType*>(csr.indptr->data) : nullptr;
+  const IdxType* indices = exclude_positive ? static_cast<IdxType*>(csr.indices->data) : nullptr;
+
+  auto draw = [num_candidates, use_alias, accept, alias] (RandomEngine* rng) {
+    const IdxType j = rng->RandInt<IdxType>(num_candidates);
+    if (!use_alias)
+      return j;
+    return (rng->Uniform<FloatType>() < accept[j]) ? j : alias[j];
+  };
+  auto is_edge = [&csr, indptr, indices] (IdxType row, IdxType col) {
+    const IdxType* begin = indices + indptr[row];
+    const IdxType* end = indices + indptr[row + 1];
+    return csr.sorted ? std::binary_search(begin, end, col) : (std::find(begin, end, col) != end);
+  };
+
+  IdArray ret_fixed = IdArray::Empty({num_edges * k}, fixed->dtype, fixed->ctx);
+  IdArray ret_neg = IdArray::Empty({num_edges * k}, fixed->dtype, fixed->ctx);
+  IdxType* ret_fixed_data = static_cast<IdxType*>(ret_fixed->data);
+  IdxType* ret_neg_data = static_cast<IdxType*>(ret_neg->data);
+  const int64_t stream = RandomEngine::NewStream();
+  RandomEngine::StreamGuard stream_guard(stream);
+
+  if (chunk_size <= 0) {
+#pragma omp parallel for
+    for (int64_t i = 0; i < num_edges; ++i) {
+      RandomEngine* rng = RandomEngine::ThreadLocal();
+      rng->SetStream(stream_guard, keys_data[i]);
+      for (int64_t j = 0; j < k; ++j) {
+        IdxType neg = draw(rng);
+        for (int64_t trial = 1;
+             exclude_positive && trial < kMaxRejectionTrials && is_edge(fixed_data[i], neg);
+             ++trial)
+          neg = draw(rng);
+        ret_fixed_data[i * k + j] = fixed_data[i];
+        ret_neg_data[i * k + j] = neg;
+      }
+    }
+    return std::make_pair(ret_fixed, ret_neg);
+  }
+
+  // Draw the corrupted nodes shared by every chunk of edges.
+  const int64_t num_chunks = (num_edges + chunk_size - 1) / chunk_size;
+  std::vector<IdxType> shared(num_chunks * k);
+#pragma omp parallel for
+  for (int64_t c = 0; c < num_chunks; ++c) {
+    RandomEngine* rng = RandomEngine::ThreadLocal();
+    rng->SetStream(stream_guard, keys_data[c * chunk_size]);
+    for (int64_t j = 0; j < k; ++j)
+      shared[c * k + j] = draw(rng);
+  }
+  std::vector<char> keep(exclude_positive ? num_edges * k : 0, 1);
+#pragma omp parallel for
+  for (int64_t i = 0; i < num_edges; ++i) {
+    const int64_t c = i / chunk_size;
+    for (int64_t j = 0; j < k; ++j) {
+      ret_fixed_data[i * k + j] = fixed_data[i];
+      ret_neg_data[i * k + j] = shared[c * k + j];
+      if (exclude_positive)
+        keep[i * k + j] = !is_edge(fixed_data[i], shared[c * k + j]);
+    }
+  }
+  if (!exclude_positive)
+    return std::make_pair(ret_fixed, ret_neg);
+
+  // Remove the negative examples that are edges in the graph.
+  int64_t num_kept = 0;
+  for (int64_t i = 0; i < num_edges * k; ++i) {
+    if (keep[i]) {
+      ret_fixed_data[num_kept] = ret_fixed_data[i];
+      ret_neg_data[num_kept] = ret_neg_data[i];
+      ++num_kept;
+    }
+  }
+  return std::make_pair(ret_fixed.CreateView({num_kept}, ret_fixed->dtype),
+                        ret_neg.CreateView({num_kept}, ret_neg->dtype));
+}
+
+};  // namespace
+
+aten::CSRAliasTable BuildUnigramAliasTable(FloatArray weights, uint8_t bits) {
+  CHECK_FLOAT(weights, "weights");
+  CHECK_NDIM(weights, 1, "weights");
+  const int64_t num_nodes = weights->shape[0];
+  const IdArray indptr = VecToIdArray(std::vector<int64_t>({0, num_nodes}), bits);
+  const IdArray indices = Range(0, num_nodes, bits, weights->ctx);
+  return aten::CSRBuildAliasTable(CSRMatrix(1, num_nodes, indptr, indices), weights);
+}
+
+std::pair<IdArray, IdArray> NegativeSampling(
+    const HeteroGraphPtr hg,
+    dgl_type_t etype,
+    IdArray fixed,
+    IdArray keys,
+    int64_t k,
+    bool corrupt_dst,
+    const aten::CSRAliasTable& table,
+    bool exclude_positive,
+    int64_t chunk_size) {
+  CHECK_EQ(hg->Context().device_type, kDLCPU)
+    << "Negative sampling only supports graphs on CPU.";
+  CHECK_SAME_DTYPE(fixed, keys);
+  CHECK_EQ(fixed->shape[0], keys->shape[0])
+    << "Number of keys must match the number of edges.";
+  CHECK_GE(k, 0) << "Number of negative examples must be non-negative.";
+  const auto pair = hg->meta_graph()->FindEdge(etype);
+  const dgl_type_t corrupt_vtype = corrupt_dst ? pair.second : pair.first;
+  const int64_t num_candidates = hg->NumVertices(corrupt_vtype);
+  CHECK_GT(num_candidates, 0) << "There are no nodes to draw negative examples from.";
+  const bool use_alias = !IsNullArray(table.prob) && table.prob->shape[0] > 0;
+  if (use_alias) {
+    CHECK_EQ(table.prob->shape[0], num_candidates)
+      << "The alias table does not match the number of nodes.";
+    CHECK_SAME_DTYPE(fixed, table.alias);
+  }
+
+  // The rows of the adjacency matrix are the fixed endpoints.
+  CSRMatrix csr;
+  if (exclude_positive)
+    csr = corrupt_dst ? hg->GetCSRMatrix(etype) : hg->GetCSCMatrix(etype);
+
+  const DLDataType prob_dtype = use_alias ? table.prob->dtype : DLDataType{kDLFloat, 64, 1};
+  std::pair<IdArray, IdArray> ret;
+  ATEN_ID_TYPE_SWITCH(fixed->dtype, IdxType, {
+    ATEN_FLOAT_TYPE_SWITCH(prob_dtype, FloatType, "probability", {
+      ret = NegativeSamplingImpl<IdxType, FloatType>(
+          csr, num_candidates, fixed, keys, k, table, exclude_positive, chunk_size);
+    });
+  });
+  return ret;
+}
+
+DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLBuildUnigramAliasTable")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    FloatArray weights = args[0];
+    const int bits = args[1];
+    auto table = sampling::BuildUnigramAliasTable(weights, bits);
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(table.prob)));
+    ret.push_back(Value(MakeValue(table.alias)));
+    *rv = ret;
+  });
+
+DGL_REGISTER_GLOBAL("sampling.negative._CAPI_DGLNegativeSampling")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    const dgl_type_t etype = args[1];
+    IdArray fixed = args[2];
+    IdArray keys = args[3];
+    const int64_t k = args[4];
+    const bool corrupt_dst = args[5];
+    FloatArray alias_prob = args[6];
+    IdArray alias = args[7];
+    const bool exclude_positive = args[8];
+    const int64_t chunk_size = args[9];
+
+    const auto& result = sampling::NegativeSampling(
+        hg.sptr(), etype, fixed, keys, k, corrupt_dst, {alias_prob, alias},
+        exclude_positive, chunk_size);
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(result.first)));
+    ret.push_back(Value(MakeValue(result.second)));
+    *rv = ret;
+  });
+
+}  // namespace sampling
+}  // namespace dgl
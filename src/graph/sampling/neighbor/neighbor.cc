@@ -8,6 +8,10 @@
 #include <dgl/packed_func_ext.h>
 #include <dgl/array.h>
 #include <dgl/sampling/neighbor.h>
+#include <dgl/transform.h>
+#include <algorithm>
+#include <tuple>
+#include <vector>
 #include "../../../c_api_common.h"
 #include "../../unit_graph.h"
 
@@ -23,7 +27,8 @@ HeteroSubgraph SampleNeighbors(
     const std::vector<int64_t>& fanouts,
     EdgeDir dir,
     const std::vector<FloatArray>& prob,
-    bool replace) {
+    bool replace,
+    const std::vector<aten::CSRAliasTable>& alias_tables) {
 
   // sanity check
   CHECK_EQ(nodes.size(), hg->NumVertexTypes())
@@ -32,10 +37,14 @@ HeteroSubgraph SampleNeighbors(
     << "Number of fanout values must match the number of edge types.";
   CHECK_EQ(prob.size(), hg->NumEdgeTypes())
     << "Number of probability tensors must match the number of edge types.";
+  CHECK(alias_tables.empty() || alias_tables.size() == hg->NumEdgeTypes())
+    << "Number of alias tables must match the number of edge types.";
 
   std::vector<HeteroGraphPtr> subrels(hg->NumEdgeTypes());
   std::vector<IdArray> induced_edges(hg->NumEdgeTypes());
   for (dgl_type_t etype = 0; etype < hg->NumEdgeTypes(); ++etype) {
+    const bool has_alias = !alias_tables.empty() && !IsNullArray(prob[etype]) &&
+      !IsNullArray(alias_tables[etype].prob);
     auto pair = hg->meta_graph()->FindEdge(etype);
     const dgl_type_t src_vtype = pair.first;
     const dgl_type_t dst_vtype = pair.second;
@@ -78,13 +87,25 @@ HeteroSubgraph SampleNeighbors(
           break;
         case SparseFormat::kCSR:
           CHECK(dir == EdgeDir::kOut) << "Cannot sample out edges on CSC matrix.";
-          sampled_coo = aten::CSRRowWiseSampling(
-            hg->GetCSRMatrix(etype), nodes_ntype, fanouts[etype], prob[etype], replace);
+          if (has_alias) {
+            sampled_coo = aten::CSRRowWiseSamplingAlias(
+              hg->GetCSRMatrix(etype), nodes_ntype, fanouts[etype], prob[etype],
+              alias_tables[etype], replace);
+          } else {
+            sampled_coo = aten::CSRRowWiseSampling(
+              hg->GetCSRMatrix(etype), nodes_ntype, fanouts[etype], prob[etype], replace);
+          }
           break;
         case SparseFormat::kCSC:
           CHECK(dir == EdgeDir::kIn) << "Cannot sample in edges on CSR matrix.";
-          sampled_coo = aten::CSRRowWiseSampling(
-            hg->GetCSCMatrix(etype), nodes_ntype, fanouts[etype], prob[etype], replace);
+          if (has_alias) {
+            sampled_coo = aten::CSRRowWiseSamplingAlias(
+              hg->GetCSCMatrix(etype), nodes_ntype, fanouts[etype], prob[etype],
+              alias_tables[etype], replace);
+          } else {
+            sampled_coo = aten::CSRRowWiseSampling(
+              hg->GetCSCMatrix(etype), nodes_ntype, fanouts[etype], prob[etype], replace);
+          }
           sampled_coo = aten::COOTranspose(sampled_coo);
           break;
         default:
@@ -104,6 +125,25 @@ HeteroSubgraph SampleNeighbors(
   return ret;
 }
 
+aten::CSRAliasTable BuildAliasTable(
+    const HeteroGraphPtr hg,
+    dgl_type_t etype,
+    EdgeDir dir,
+    FloatArray prob) {
+  CHECK_FLOAT(prob, "probability");
+  CHECK_NDIM(prob, 1, "probability");
+  CHECK_EQ(prob->shape[0], hg->NumEdges(etype))
+    << "Number of probabilities must match the number of edges.";
+  auto req_fmt = (dir == EdgeDir::kOut)? csr_code : csc_code;
+  auto avail_fmt = hg->SelectFormat(etype, req_fmt);
+  if (dir == EdgeDir::kOut && avail_fmt == SparseFormat::kCSR)
+    return aten::CSRBuildAliasTable(hg->GetCSRMatrix(etype), prob);
+  if (dir == EdgeDir::kIn && avail_fmt == SparseFormat::kCSC)
+    return aten::CSRBuildAliasTable(hg->GetCSCMatrix(etype), prob);
+  // sampling from COO does not use alias tables
+  return aten::CSRAliasTable{aten::NullArray(prob->dtype), aten::NullArray()};
+}
+
 HeteroSubgraph SampleNeighborsTopk(
     const HeteroGraphPtr hg,
     const std::vector<IdArray>& nodes,
@@ -190,6 +230,41 @@ HeteroSubgraph SampleNeighborsTopk(
   return ret;
 }
 
+std::vector<std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>>>
+SampleNeighborsToBlocks(
+    const HeteroGraphPtr hg,
+    const std::vector<IdArray>& seeds,
+    const std::vector<std::vector<int64_t>>& fanouts,
+    bool replace) {
+  const int64_t num_layers = fanouts.size();
+  const std::vector<FloatArray> prob(hg->NumEdgeTypes(), aten::NullArray());
+  std::vector<std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>>> ret;
+  std::vector<IdArray> layer_seeds = seeds;
+  for (int64_t layer = num_layers - 1; layer >= 0; --layer) {
+    const HeteroSubgraph frontier = SampleNeighbors(
+        hg, layer_seeds, fanouts[layer], EdgeDir::kIn, prob, replace);
+
+    HeteroGraphPtr block;
+    std::vector<IdArray> src_nodes;
+    std::vector<IdArray> block_eids;
+    std::tie(block, src_nodes, block_eids) = transform::ToBlock(
+        frontier.graph, layer_seeds, true);
+
+    // Map the edge IDs of the blocks from the frontier to the input graph.
+    std::vector<IdArray> eids(hg->NumEdgeTypes());
+    for (dgl_type_t etype = 0; etype < hg->NumEdgeTypes(); ++etype) {
+      if (block_eids[etype]->shape[0] == 0)
+        eids[etype] = IdArray::Empty({0}, hg->DataType(), hg->Context());
+      else
+        eids[etype] = aten::IndexSelect(frontier.induced_edges[etype], block_eids[etype]);
+    }
+    ret.emplace_back(block, src_nodes, eids);
+    layer_seeds = src_nodes;
+  }
+  std::reverse(ret.begin(), ret.end());
+  return ret;
+}
+
 DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighbors")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     HeteroGraphRef hg = args[0];
@@ -199,18 +274,79 @@ DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighbors")
     const std::string dir_str = args[3];
     const auto& prob = ListValueToVector<FloatArray>(args[4]);
     const bool replace = args[5];
+    const auto& alias_prob = ListValueToVector<FloatArray>(args[6]);
+    const auto& alias = ListValueToVector<IdArray>(args[7]);
 
     CHECK(dir_str == "in" || dir_str == "out")
       << "Invalid edge direction. Must be \"in\" or \"out\".";
     EdgeDir dir = (dir_str == "in")? EdgeDir::kIn : EdgeDir::kOut;
+    CHECK_EQ(alias_prob.size(), alias.size());
+    std::vector<aten::CSRAliasTable> alias_tables(alias.size());
+    for (size_t i = 0; i < alias.size(); ++i)
+      alias_tables[i] = {alias_prob[i], alias[i]};
 
     std::shared_ptr<HeteroSubgraph> subg(new HeteroSubgraph);
     *subg = sampling::SampleNeighbors(
-        hg.sptr(), nodes, fanouts, dir, prob, replace);
+        hg.sptr(), nodes, fanouts, dir, prob, replace, alias_tables);
 
     *rv = HeteroSubgraphRef(subg);
   });
 
+DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighborsToBlocks")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    const auto& seeds = ListValueToVector<IdArray>(args[1]);
+    IdArray fanouts_array = args[2];
+    const int64_t num_layers = args[3];
+    const bool replace = args[4];
+
+    const auto& flat_fanouts = fanouts_array.ToVector<int64_t>();
+    const int64_t num_etypes = hg->NumEdgeTypes();
+    CHECK_EQ(flat_fanouts.size(), num_layers * num_etypes)
+      << "Fanouts must be given for every edge type of every layer.";
+    std::vector<std::vector<int64_t>> fanouts(num_layers);
+    for (int64_t layer = 0; layer < num_layers; ++layer)
+      fanouts[layer].assign(
+          flat_fanouts.begin() + layer * num_etypes,
+          flat_fanouts.begin() + (layer + 1) * num_etypes);
+
+    const auto blocks = sampling::SampleNeighborsToBlocks(hg.sptr(), seeds, fanouts, replace);
+
+    List<ObjectRef> ret;
+    for (const auto &block : blocks) {
+      List<Value> src_nodes_ref;
+      for (const IdArray &array : std::get<1>(block))
+        src_nodes_ref.push_back(Value(MakeValue(array)));
+      List<Value> eids_ref;
+      for (const IdArray &array : std::get<2>(block))
+        eids_ref.push_back(Value(MakeValue(array)));
+      List<ObjectRef> block_ref;
+      block_ref.push_back(HeteroGraphRef(std::get<0>(block)));
+      block_ref.push_back(src_nodes_ref);
+      block_ref.push_back(eids_ref);
+      ret.push_back(block_ref);
+    }
+    *rv = ret;
+  });
+
+DGL_REGISTER_GLOBAL("sampling.utils._CAPI_DGLBuildAliasTable")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    dgl_type_t etype = args[1];
+    const std::string dir_str = args[2];
+    FloatArray prob = args[3];
+
+    CHECK(dir_str == "in" || dir_str == "out")
+      << "Invalid edge direction. Must be \"in\" or \"out\".";
+    EdgeDir dir = (dir_str == "in")? EdgeDir::kIn : EdgeDir::kOut;
+
+    auto table = sampling::BuildAliasTable(hg.sptr(), etype, dir, prob);
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(table.prob)));
+    ret.push_back(Value(MakeValue(table.alias)));
+    *rv = ret;
+  });
+
 DGL_REGISTER_GLOBAL("sampling.neighbor._CAPI_DGLSampleNeighborsTopk")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     HeteroGraphRef hg = args[0];
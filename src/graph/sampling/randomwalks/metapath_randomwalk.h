@@ -45,6 +45,8 @@ using TerminatePredicate = std::function<bool(IdxType *, dgl_id_t, int64_t)>;
  * \param edges_by_type Vector of results from \c GetAdj() by edge type.
  * \param metapath_data Edge types of given metapath.
  * \param prob Transition probability per edge type.
+ * \param alias_tables Alias tables of the transition probability per edge type.  Edge
+ *        types without alias tables are sampled from \c prob.
  * \param terminate Predicate for terminating the current random walk path.
  *
  * \return A pair of ID of next successor (-1 if not exist), as well as whether to terminate.
@@ -57,6 +59,7 @@ std::pair<dgl_id_t, bool> MetapathRandomWalkStep(
     const std::vector<std::vector<IdArray> > &edges_by_type,
     const IdxType *metapath_data,
     const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
     TerminatePredicate<IdxType> terminate) {
   dgl_type_t etype = metapath_data[len];
 
@@ -76,7 +79,17 @@ std::pair<dgl_id_t, bool> MetapathRandomWalkStep(
 
   FloatArray prob_etype = prob[etype];
   IdxType idx = 0;
-  if (IsNullArray(prob_etype)) {
+  if (!alias_tables.empty() && !IsNullArray(alias_tables[etype].prob)) {
+    // O(1) draw from the alias table of the current node
+    const aten::CSRAliasTable &table = alias_tables[etype];
+    ATEN_FLOAT_TYPE_SWITCH(table.prob->dtype, DType, "probability", {
+      const DType *accept = static_cast<DType *>(table.prob->data) + offsets[curr];
+      const IdxType *alias = static_cast<IdxType *>(table.alias->data) + offsets[curr];
+      idx = RandomEngine::ThreadLocal()->RandInt(size);
+      if (RandomEngine::ThreadLocal()->Uniform<DType>() >= accept[idx])
+        idx = alias[idx];
+    });
+  } else if (IsNullArray(prob_etype)) {
     // empty probability array; assume uniform
     idx = RandomEngine::ThreadLocal()->RandInt(size);
   } else {
@@ -106,6 +119,8 @@ std::pair<dgl_id_t, bool> MetapathRandomWalkStep(
  * \param metapath A 1D array of edge types representing the metapath.
  * \param prob A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  May be empty.
  * \param terminate Predicate for terminating a random walk path.
  * \return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.
  */
@@ -115,6 +130,7 @@ IdArray MetapathBasedRandomWalk(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
     TerminatePredicate<IdxType> terminate) {
   int64_t max_num_steps = metapath->shape[0];
   const IdxType *metapath_data = static_cast<IdxType *>(metapath->data);
@@ -128,10 +144,10 @@ IdArray MetapathBasedRandomWalk(
     edges_by_type.push_back(hg->GetAdj(etype, true, "csr"));
 
   StepFunc<IdxType> step =
-    [&edges_by_type, metapath_data, &prob, terminate]
+    [&edges_by_type, metapath_data, &prob, &alias_tables, terminate]
     (IdxType *data, dgl_id_t curr, int64_t len) {
       return MetapathRandomWalkStep<XPU, IdxType>(
-          data, curr, len, edges_by_type, metapath_data, prob, terminate);
+          data, curr, len, edges_by_type, metapath_data, prob, alias_tables, terminate);
     };
 
   return GenericRandomWalk<XPU, IdxType>(seeds, max_num_steps, step);
@@ -0,0 +1,173 @@
+/*!
+ *  Copyright (c) 2021 by Contributors
+ * \file graph/sampling/node2vec_cpu.cc
+ * \brief DGL sampler - CPU implementation of node2vec random walk with OpenMP
+ */
+
+#include <dgl/array.h>
+#include <dgl/base_heterograph.h>
+#include <dgl/random.h>
+#include <algorithm>
+#include <utility>
+#include "randomwalks_impl.h"
+#include "randomwalks_cpu.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+namespace {
+
+/*!
+ * \brief Whether there is an edge from \c u to \c v.
+ * \note The column indices of every row of the CSR matrix must be sorted.
+ */
+template<typename IdxType>
+inline bool HasEdge(const IdxType *indptr, const IdxType *sorted_indices, IdxType u, IdxType v) {
+  const IdxType *begin = sorted_indices + indptr[u];
+  const IdxType *end = sorted_indices + indptr[u + 1];
+  return std::binary_search(begin, end, v);
+}
+
+/*!
+ * \brief Select one successor of node2vec random walk, given the path generated so far.
+ *
+ * The successor is proposed from the first-order transition probability and accepted
+ * with probability proportional to the search bias, i.e. \c 1/p for returning to the
+ * previous node, \c 1 for nodes adjacent to the previous node and \c 1/q otherwise.  The
+ * second-order transition probabilities are never materialized.
+ *
+ * \param data The path generated so far, of type \c IdxType.
+ * \param curr The last node ID generated.
+ * \param len The number of nodes generated so far, excluding the seed node.
+ * \param indptr The index pointer array of the out-edge CSR matrix.
+ * \param indices The column index array of the out-edge CSR matrix.
+ * \param sorted_indices The column index array with every row sorted.
+ * \param accept The acceptance probabilities of the alias tables, or NULL for uniform
+ *        transition.
+ * \param alias The aliases of the alias tables, or NULL for uniform transition.
+ * \param p The return parameter.
+ * \param q The in-out parameter.
+ *
+ * \return A pair of ID of next successor (-1 if not exist), as well as whether to terminate.
+ */
+template<typename IdxType, typename FloatType>
+std::pair<dgl_id_t, bool> Node2vecRandomWalkStep(
+    IdxType *data,
+    dgl_id_t curr,
+    int64_t len,
+    const IdxType *indptr,
+    const IdxType *indices,
+    const IdxType *sorted_indices,
+    const FloatType *accept,
+    const IdxType *alias,
+    double p,
+    double q) {
+  const IdxType off = indptr[curr];
+  const IdxType size = indptr[curr + 1] - off;
+  if (size == 0)
+    return std::make_pair(-1, true);
+
+  RandomEngine *rng = RandomEngine::ThreadLocal();
+  const double max_bias = std::max(1. / p, std::max(1., 1. / q));
+  const IdxType prev = (len > 0) ? data[len - 1] : -1;
+  while (true) {
+    IdxType idx = rng->RandInt(size);
+    if (accept && rng->Uniform<FloatType>() >= accept[off + idx])
+      idx = alias[off + idx];
+    const IdxType next = indices[off + idx];
+    // the first step has no previous node and is not biased
+    if (len == 0)
+      return std::make_pair(next, false);
+
+    double bias;
+    if (next == prev)
+      bias = 1. / p;
+    else if (HasEdge(indptr, sorted_indices, prev, next))
+      bias = 1.;
+    else
+      bias = 1. / q;
+    if (rng->Uniform<double>() * max_bias < bias)
+      return std::make_pair(next, false);
+  }
+}
+
+};  // namespace
+
+template<DLDeviceType XPU, typename IdxType>
+IdArray Node2vec(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t max_num_steps,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table,
+    const IdArray sorted_indices_arr) {
+  const CSRMatrix csr = hg->GetCSRMatrix(0);
+  const IdxType *indptr = static_cast<IdxType *>(csr.indptr->data);
+  const IdxType *indices = static_cast<IdxType *>(csr.indices->data);
+  // the sorted column indices are kept apart so that indices stay aligned with the
+  // alias tables; they are only computed here if the caller did not provide them
+  IdArray sorted_col = sorted_indices_arr;
+  if (IsNullArray(sorted_col) || sorted_col->shape[0] != csr.indices->shape[0])
+    sorted_col = csr.sorted ? csr.indices : CSRSort(csr).indices;
+  const IdxType *sorted_indices = static_cast<IdxType *>(sorted_col->data);
+
+  IdArray traces;
+  if (IsNullArray(prob)) {
+    StepFunc<IdxType> step =
+      [indptr, indices, sorted_indices, p, q] (IdxType *data, dgl_id_t curr, int64_t len) {
+        return Node2vecRandomWalkStep<IdxType, float>(
+            data, curr, len, indptr, indices, sorted_indices, nullptr, nullptr, p, q);
+      };
+    traces = GenericRandomWalk<XPU, IdxType>(seeds, max_num_steps, step);
+  } else {
+    const aten::CSRAliasTable table = IsNullArray(alias_table.prob) ?
+      aten::CSRBuildAliasTable(csr, prob) : alias_table;
+    ATEN_FLOAT_TYPE_SWITCH(table.prob->dtype, FloatType, "probability", {
+      const FloatType *accept = static_cast<FloatType *>(table.prob->data);
+      const IdxType *alias = static_cast<IdxType *>(table.alias->data);
+      StepFunc<IdxType> step =
+        [indptr, indices, sorted_indices, accept, alias, p, q]
+        (IdxType *data, dgl_id_t curr, int64_t len) {
+          return Node2vecRandomWalkStep<IdxType, FloatType>(
+              data, curr, len, indptr, indices, sorted_indices, accept, alias, p, q);
+        };
+      traces = GenericRandomWalk<XPU, IdxType>(seeds, max_num_steps, step);
+    });
+  }
+  return traces;
+}
+
+template
+IdArray Node2vec<kDLCPU, int32_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t max_num_steps,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table,
+    const IdArray sorted_indices_arr);
+template
+IdArray Node2vec<kDLCPU, int64_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t max_num_steps,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table,
+    const IdArray sorted_indices_arr);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
@@ -25,13 +25,15 @@ IdArray RandomWalk(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob) {
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
   TerminatePredicate<IdxType> terminate =
     [] (IdxType *data, dgl_id_t curr, int64_t len) {
       return false;
     };
 
-  return MetapathBasedRandomWalk<XPU, IdxType>(hg, seeds, metapath, prob, terminate);
+  return MetapathBasedRandomWalk<XPU, IdxType>(
+      hg, seeds, metapath, prob, alias_tables, terminate);
 }
 
 template
@@ -39,13 +41,15 @@ IdArray RandomWalk<kDLCPU, int32_t>(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob);
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 template
 IdArray RandomWalk<kDLCPU, int64_t>(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob);
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 
 };  // namespace impl
 
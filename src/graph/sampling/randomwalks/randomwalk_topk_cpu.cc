@@ -0,0 +1,154 @@
+/*!
+ *  Copyright (c) 2021 by Contributors
+ * \file graph/sampling/randomwalk_topk_cpu.cc
+ * \brief DGL sampler - CPU implementation of random walk based neighbor selection (PinSAGE)
+ */
+
+#include <dgl/array.h>
+#include <dgl/base_heterograph.h>
+#include <dgl/random.h>
+#include <dmlc/omp.h>
+#include <parallel_hashmap/phmap.h>
+#include <algorithm>
+#include <tuple>
+#include <utility>
+#include <vector>
+#include "randomwalks_impl.h"
+#include "metapath_randomwalk.h"
+
+namespace dgl {
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace sampling {
+
+namespace impl {
+
+template<DLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k) {
+  const int64_t num_seeds = seeds->shape[0];
+  const IdxType *seed_data = static_cast<IdxType *>(seeds->data);
+  const int64_t num_hops = metapath->shape[0];
+  const int64_t max_num_steps = num_hops * num_traversals;
+  const IdxType *metapath_data = static_cast<IdxType *>(metapath->data);
+  std::vector<IdxType> full_metapath(max_num_steps);
+  for (int64_t i = 0; i < max_num_steps; ++i)
+    full_metapath[i] = metapath_data[i % num_hops];
+
+  // Materialize all OutCSR's before the OpenMP loop to avoid data races.
+  std::vector<std::vector<IdArray> > edges_by_type;
+  for (dgl_type_t etype = 0; etype < hg->NumEdgeTypes(); ++etype)
+    edges_by_type.push_back(hg->GetAdj(etype, true, "csr"));
+
+  TerminatePredicate<IdxType> never = [] (IdxType *data, dgl_id_t curr, int64_t len) {
+      return false;
+    };
+
+  // the most visited nodes of each seed with their number of visits
+  std::vector<std::vector<std::pair<IdxType, IdxType> > > selected(num_seeds);
+  const int64_t stream = RandomEngine::NewStream();
+  RandomEngine::StreamGuard stream_guard(stream);
+#pragma omp parallel
+  {
+    phmap::flat_hash_map<IdxType, IdxType> counts;
+    std::vector<std::pair<IdxType, IdxType> > sorted;
+    std::vector<IdxType> trace(max_num_steps + 1);
+    RandomEngine *rng = RandomEngine::ThreadLocal();
+#pragma omp for schedule(dynamic)
+    for (int64_t i = 0; i < num_seeds; ++i) {
+      rng->SetStream(stream_guard, i);
+      counts.clear();
+      for (int64_t w = 0; w < num_random_walks; ++w) {
+        dgl_id_t curr = trace[0] = seed_data[i];
+        for (int64_t t = 0; t < num_traversals; ++t) {
+          bool dead_end = false;
+          for (int64_t h = 0; h < num_hops; ++h) {
+            const int64_t len = t * num_hops + h;
+            const auto &succ = MetapathRandomWalkStep<XPU, IdxType>(
+                trace.data(), curr, len, edges_by_type, full_metapath.data(), prob,
+                alias_tables, never);
+            if (succ.first == -1) {
+              dead_end = true;
+              break;
+            }
+            trace[len + 1] = curr = succ.first;
+          }
+          if (dead_end)
+            break;
+          ++counts[curr];
+          if (rng->Uniform<double>() < termination_prob)
+            break;
+        }
+      }
+
+      // pick the k most visited nodes, breaking ties by node ID
+      sorted.assign(counts.begin(), counts.end());
+      auto cmp = [] (const std::pair<IdxType, IdxType> &a, const std::pair<IdxType, IdxType> &b) {
+          return a.second > b.second || (a.second == b.second && a.first < b.first);
+        };
+      const int64_t num_selected = std::min<int64_t>(k, sorted.size());
+      std::partial_sort(sorted.begin(), sorted.begin() + num_selected, sorted.end(), cmp);
+      selected[i].assign(sorted.begin(), sorted.begin() + num_selected);
+    }
+  }
+
+  std::vector<int64_t> offsets(num_seeds + 1, 0);
+  for (int64_t i = 0; i < num_seeds; ++i)
+    offsets[i + 1] = offsets[i] + selected[i].size();
+  const int64_t num_edges = offsets[num_seeds];
+  IdArray src = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray dst = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdArray visits = IdArray::Empty({num_edges}, seeds->dtype, seeds->ctx);
+  IdxType *src_data = static_cast<IdxType *>(src->data);
+  IdxType *dst_data = static_cast<IdxType *>(dst->data);
+  IdxType *visits_data = static_cast<IdxType *>(visits->data);
+#pragma omp parallel for
+  for (int64_t i = 0; i < num_seeds; ++i) {
+    for (size_t j = 0; j < selected[i].size(); ++j) {
+      src_data[offsets[i] + j] = selected[i][j].first;
+      dst_data[offsets[i] + j] = seed_data[i];
+      visits_data[offsets[i] + j] = selected[i][j].second;
+    }
+  }
+
+  return std::make_tuple(src, dst, visits);
+}
+
+template
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk<kDLCPU, int32_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k);
+template
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk<kDLCPU, int64_t>(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k);
+
+};  // namespace impl
+
+};  // namespace sampling
+
+};  // namespace dgl
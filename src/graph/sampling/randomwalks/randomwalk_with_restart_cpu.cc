@@ -28,12 +28,14 @@ IdArray RandomWalkWithRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob) {
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
   TerminatePredicate<IdxType> terminate =
     [restart_prob] (IdxType *data, dgl_id_t curr, int64_t len) {
       return RandomEngine::ThreadLocal()->Uniform<double>() < restart_prob;
     };
-  return MetapathBasedRandomWalk<XPU, IdxType>(hg, seeds, metapath, prob, terminate);
+  return MetapathBasedRandomWalk<XPU, IdxType>(
+      hg, seeds, metapath, prob, alias_tables, terminate);
 }
 
 template
@@ -42,14 +44,16 @@ IdArray RandomWalkWithRestart<kDLCPU, int32_t>(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob);
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 template
 IdArray RandomWalkWithRestart<kDLCPU, int64_t>(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob);
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 
 template<DLDeviceType XPU, typename IdxType>
 IdArray RandomWalkWithStepwiseRestart(
@@ -57,7 +61,8 @@ IdArray RandomWalkWithStepwiseRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob) {
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
   IdArray result;
 
   ATEN_FLOAT_TYPE_SWITCH(restart_prob->dtype, DType, "restart probability", {
@@ -66,7 +71,8 @@ IdArray RandomWalkWithStepwiseRestart(
       [restart_prob_data] (IdxType *data, dgl_id_t curr, int64_t len) {
         return RandomEngine::ThreadLocal()->Uniform<DType>() < restart_prob_data[len];
       };
-    result = MetapathBasedRandomWalk<XPU, IdxType>(hg, seeds, metapath, prob, terminate);
+    result = MetapathBasedRandomWalk<XPU, IdxType>(
+        hg, seeds, metapath, prob, alias_tables, terminate);
   });
 
   return result;
@@ -78,14 +84,16 @@ IdArray RandomWalkWithStepwiseRestart<kDLCPU, int32_t>(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob);
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 template
 IdArray RandomWalkWithStepwiseRestart<kDLCPU, int64_t>(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob);
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 
 };  // namespace impl
 
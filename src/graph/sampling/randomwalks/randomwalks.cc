@@ -27,7 +27,8 @@ void CheckRandomWalkInputs(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob) {
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
   CHECK_INT(seeds, "seeds");
   CHECK_INT(metapath, "metapath");
   CHECK_NDIM(seeds, 1, "seeds");
@@ -38,6 +39,8 @@ void CheckRandomWalkInputs(
     if (p.GetSize() != 0)
       CHECK_NDIM(p, 1, "probability");
   }
+  CHECK(alias_tables.empty() || alias_tables.size() == prob.size())
+    << "Number of alias tables must match the number of edge types.";
 }
 
 };  // namespace
@@ -46,15 +49,16 @@ std::pair<IdArray, TypeArray> RandomWalk(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob) {
-  CheckRandomWalkInputs(hg, seeds, metapath, prob);
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
+  CheckRandomWalkInputs(hg, seeds, metapath, prob, alias_tables);
 
   TypeArray vtypes;
   IdArray vids;
   ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "RandomWalk", {
     ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
       vtypes = impl::GetNodeTypesFromMetapath<XPU, IdxType>(hg, metapath);
-      vids = impl::RandomWalk<XPU, IdxType>(hg, seeds, metapath, prob);
+      vids = impl::RandomWalk<XPU, IdxType>(hg, seeds, metapath, prob, alias_tables);
     });
   });
 
@@ -66,8 +70,9 @@ std::pair<IdArray, TypeArray> RandomWalkWithRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob) {
-  CheckRandomWalkInputs(hg, seeds, metapath, prob);
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
+  CheckRandomWalkInputs(hg, seeds, metapath, prob, alias_tables);
   CHECK(restart_prob >= 0 && restart_prob < 1) << "restart probability must belong to [0, 1)";
 
   TypeArray vtypes;
@@ -75,7 +80,8 @@ std::pair<IdArray, TypeArray> RandomWalkWithRestart(
   ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "RandomWalkWithRestart", {
     ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
       vtypes = impl::GetNodeTypesFromMetapath<XPU, IdxType>(hg, metapath);
-      vids = impl::RandomWalkWithRestart<XPU, IdxType>(hg, seeds, metapath, prob, restart_prob);
+      vids = impl::RandomWalkWithRestart<XPU, IdxType>(
+          hg, seeds, metapath, prob, restart_prob, alias_tables);
     });
   });
 
@@ -87,8 +93,9 @@ std::pair<IdArray, TypeArray> RandomWalkWithStepwiseRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob) {
-  CheckRandomWalkInputs(hg, seeds, metapath, prob);
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
+  CheckRandomWalkInputs(hg, seeds, metapath, prob, alias_tables);
   // TODO(BarclayII): check the elements of restart probability
 
   TypeArray vtypes;
@@ -97,13 +104,85 @@ std::pair<IdArray, TypeArray> RandomWalkWithStepwiseRestart(
     ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
       vtypes = impl::GetNodeTypesFromMetapath<XPU, IdxType>(hg, metapath);
       vids = impl::RandomWalkWithStepwiseRestart<XPU, IdxType>(
-          hg, seeds, metapath, prob, restart_prob);
+          hg, seeds, metapath, prob, restart_prob, alias_tables);
     });
   });
 
   return std::make_pair(vids, vtypes);
 }
 
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k,
+    const std::vector<aten::CSRAliasTable> &alias_tables) {
+  CheckRandomWalkInputs(hg, seeds, metapath, prob, alias_tables);
+  CHECK(termination_prob >= 0 && termination_prob <= 1)
+    << "termination probability must belong to [0, 1]";
+
+  std::tuple<IdArray, IdArray, IdArray> result;
+  ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "RandomWalkTopk", {
+    ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
+      result = impl::RandomWalkTopk<XPU, IdxType>(
+          hg, seeds, metapath, prob, alias_tables, num_traversals, termination_prob,
+          num_random_walks, k);
+    });
+  });
+
+  return result;
+}
+
+IdArray Node2vec(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t walk_length,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table,
+    const IdArray sorted_indices) {
+  CHECK_INT(seeds, "seeds");
+  CHECK_NDIM(seeds, 1, "seeds");
+  CHECK_FLOAT(prob, "probability");
+  CHECK_EQ(hg->NumVertexTypes(), 1) << "Node2vec only supports homogeneous graphs.";
+  CHECK_EQ(hg->NumEdgeTypes(), 1) << "Node2vec only supports homogeneous graphs.";
+  CHECK(p > 0 && q > 0) << "p and q must be positive.";
+  CHECK_GE(walk_length, 0) << "walk length must be non-negative.";
+
+  IdArray vids;
+  ATEN_XPU_SWITCH(hg->Context().device_type, XPU, "Node2vec", {
+    ATEN_ID_TYPE_SWITCH(seeds->dtype, IdxType, {
+      vids = impl::Node2vec<XPU, IdxType>(
+          hg, seeds, p, q, walk_length, prob, alias_table, sorted_indices);
+    });
+  });
+
+  return vids;
+}
+
+IdArray SortedCSRIndices(const HeteroGraphPtr hg) {
+  CHECK_EQ(hg->NumEdgeTypes(), 1) << "Node2vec only supports homogeneous graphs.";
+  const CSRMatrix csr = hg->GetCSRMatrix(0);
+  return csr.sorted ? csr.indices : aten::CSRSort(csr).indices;
+}
+
+/*! \brief Convert the alias tables of every edge type passed through FFI. */
+std::vector<aten::CSRAliasTable> ListValueToAliasTables(
+    List<Value> alias_prob, List<Value> alias) {
+  const auto& alias_prob_vec = ListValueToVector<FloatArray>(alias_prob);
+  const auto& alias_vec = ListValueToVector<IdArray>(alias);
+  CHECK_EQ(alias_prob_vec.size(), alias_vec.size());
+  std::vector<aten::CSRAliasTable> alias_tables(alias_vec.size());
+  for (size_t i = 0; i < alias_vec.size(); ++i)
+    alias_tables[i] = {alias_prob_vec[i], alias_vec[i]};
+  return alias_tables;
+}
+
 };  // namespace sampling
 
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalk")
@@ -112,10 +191,11 @@ DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalk")
     IdArray seeds = args[1];
     TypeArray metapath = args[2];
     List<Value> prob = args[3];
+    const auto& alias_tables = sampling::ListValueToAliasTables(args[4], args[5]);
 
     const auto& prob_vec = ListValueToVector<FloatArray>(prob);
 
-    auto result = sampling::RandomWalk(hg.sptr(), seeds, metapath, prob_vec);
+    auto result = sampling::RandomWalk(hg.sptr(), seeds, metapath, prob_vec, alias_tables);
     List<Value> ret;
     ret.push_back(Value(MakeValue(result.first)));
     ret.push_back(Value(MakeValue(result.second)));
@@ -129,11 +209,12 @@ DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalkWithRestart
     TypeArray metapath = args[2];
     List<Value> prob = args[3];
     double restart_prob = args[4];
+    const auto& alias_tables = sampling::ListValueToAliasTables(args[5], args[6]);
 
     const auto& prob_vec = ListValueToVector<FloatArray>(prob);
 
     auto result = sampling::RandomWalkWithRestart(
-        hg.sptr(), seeds, metapath, prob_vec, restart_prob);
+        hg.sptr(), seeds, metapath, prob_vec, restart_prob, alias_tables);
     List<Value> ret;
     ret.push_back(Value(MakeValue(result.first)));
     ret.push_back(Value(MakeValue(result.second)));
@@ -147,17 +228,65 @@ DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingRandomWalkWithStepwis
     TypeArray metapath = args[2];
     List<Value> prob = args[3];
     FloatArray restart_prob = args[4];
+    const auto& alias_tables = sampling::ListValueToAliasTables(args[5], args[6]);
 
     const auto& prob_vec = ListValueToVector<FloatArray>(prob);
 
     auto result = sampling::RandomWalkWithStepwiseRestart(
-        hg.sptr(), seeds, metapath, prob_vec, restart_prob);
+        hg.sptr(), seeds, metapath, prob_vec, restart_prob, alias_tables);
     List<Value> ret;
     ret.push_back(Value(MakeValue(result.first)));
     ret.push_back(Value(MakeValue(result.second)));
     *rv = ret;
   });
 
+DGL_REGISTER_GLOBAL("sampling.pinsage._CAPI_DGLSamplingRandomWalkTopk")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    IdArray seeds = args[1];
+    TypeArray metapath = args[2];
+    List<Value> prob = args[3];
+    int64_t num_traversals = args[4];
+    double termination_prob = args[5];
+    int64_t num_random_walks = args[6];
+    int64_t k = args[7];
+    const auto& alias_tables = sampling::ListValueToAliasTables(args[8], args[9]);
+
+    const auto& prob_vec = ListValueToVector<FloatArray>(prob);
+
+    IdArray src, dst, counts;
+    std::tie(src, dst, counts) = sampling::RandomWalkTopk(
+        hg.sptr(), seeds, metapath, prob_vec, num_traversals, termination_prob,
+        num_random_walks, k, alias_tables);
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(src)));
+    ret.push_back(Value(MakeValue(dst)));
+    ret.push_back(Value(MakeValue(counts)));
+    *rv = ret;
+  });
+
+DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingNode2vec")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    IdArray seeds = args[1];
+    double p = args[2];
+    double q = args[3];
+    int64_t walk_length = args[4];
+    FloatArray prob = args[5];
+    FloatArray alias_prob = args[6];
+    IdArray alias = args[7];
+    IdArray sorted_indices = args[8];
+
+    *rv = sampling::Node2vec(
+        hg.sptr(), seeds, p, q, walk_length, prob, {alias_prob, alias}, sorted_indices);
+  });
+
+DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingSortedCSRIndices")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    HeteroGraphRef hg = args[0];
+    *rv = sampling::SortedCSRIndices(hg.sptr());
+  });
+
 DGL_REGISTER_GLOBAL("sampling.randomwalks._CAPI_DGLSamplingPackTraces")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     IdArray vids = args[0];
@@ -9,6 +9,7 @@
 
 #include <dgl/base_heterograph.h>
 #include <dgl/array.h>
+#include <dgl/random.h>
 #include "randomwalks_impl.h"
 
 namespace dgl {
@@ -42,15 +43,19 @@ IdArray GenericRandomWalk(
 
   const IdxType *seed_data = static_cast<IdxType *>(seeds->data);
   IdxType *traces_data = static_cast<IdxType *>(traces->data);
+  // Key the streams by the position of the seed since the seeds often repeat.
+  const int64_t stream = RandomEngine::NewStream();
+  RandomEngine::StreamGuard stream_guard(stream);
 
 #pragma omp parallel for
   for (int64_t seed_id = 0; seed_id < num_seeds; ++seed_id) {
+    RandomEngine::ThreadLocal()->SetStream(stream_guard, seed_id);
     int64_t i;
     dgl_id_t curr = seed_data[seed_id];
     traces_data[seed_id * trace_length] = curr;
 
     for (i = 0; i < max_num_steps; ++i) {
-      const auto &succ = step(traces_data + seed_id * max_num_steps, curr, i);
+      const auto &succ = step(traces_data + seed_id * trace_length, curr, i);
       traces_data[seed_id * trace_length + i + 1] = curr = succ.first;
       if (succ.second)
         break;
@@ -12,6 +12,7 @@
 #include <vector>
 #include <utility>
 #include <functional>
+#include <tuple>
 
 namespace dgl {
 
@@ -50,6 +51,8 @@ TypeArray GetNodeTypesFromMetapath(
  * \param metapath A 1D array of edge types representing the metapath.
  * \param prob A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *         paths that terminated early are padded with -1.
  * \note This function should be called together with GetNodeTypesFromMetapath to
@@ -60,7 +63,8 @@ IdArray RandomWalk(
     const HeteroGraphPtr hg,
     const IdArray seeds,
     const TypeArray metapath,
-    const std::vector<FloatArray> &prob);
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 
 /*!
  * \brief Metapath-based random walk with restart probability.
@@ -71,6 +75,8 @@ IdArray RandomWalk(
  * \param prob A vector of 1D float arrays, indicating the transition probability of
  *        each edge by edge type.  An empty float array assumes uniform transition.
  * \param restart_prob Restart probability
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *         paths that terminated early are padded with -1.
  * \note This function should be called together with GetNodeTypesFromMetapath to
@@ -82,7 +88,8 @@ IdArray RandomWalkWithRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    double restart_prob);
+    double restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
 
 /*!
  * \brief Metapath-based random walk with stepwise restart probability.  Useful
@@ -95,6 +102,8 @@ IdArray RandomWalkWithRestart(
  *        each edge by edge type.  An empty float array assumes uniform transition.
  * \param restart_prob Restart probability array which has the same number of elements
  *        as \c metapath, indicating the probability to terminate after transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  Edge types without alias tables are sampled from \c prob.
  * \return A 2D array of shape (len(seeds), len(metapath) + 1) with node IDs.  The
  *         paths that terminated early are padded with -1.
  * \note This function should be called together with GetNodeTypesFromMetapath to
@@ -106,7 +115,64 @@ IdArray RandomWalkWithStepwiseRestart(
     const IdArray seeds,
     const TypeArray metapath,
     const std::vector<FloatArray> &prob,
-    FloatArray restart_prob);
+    FloatArray restart_prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables);
+
+/*!
+ * \brief Select the most visited nodes by metapath-based random walks from each seed.
+ * \param hg The heterograph.
+ * \param seeds A 1D array of seed nodes, with the type the source type of the first
+ *        edge type in the metapath.
+ * \param metapath A 1D array of edge types of one traversal, which must start and end
+ *        at the same node type.
+ * \param prob A vector of 1D float arrays, indicating the transition probability of
+ *        each edge by edge type.  An empty float array assumes uniform transition.
+ * \param alias_tables Alias tables of \c prob built on the out-edge CSR matrix of each
+ *        edge type.  May be empty.
+ * \param num_traversals The maximum number of traversals of a random walk.
+ * \param termination_prob The probability to terminate after each traversal.
+ * \param num_random_walks The number of random walks from each seed.
+ * \param k The number of nodes to select for each seed.
+ * \return A tuple of the selected nodes, their seeds and their number of visits.
+ */
+template<DLDeviceType XPU, typename IdxType>
+std::tuple<IdArray, IdArray, IdArray> RandomWalkTopk(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const TypeArray metapath,
+    const std::vector<FloatArray> &prob,
+    const std::vector<aten::CSRAliasTable> &alias_tables,
+    int64_t num_traversals,
+    double termination_prob,
+    int64_t num_random_walks,
+    int64_t k);
+
+/*!
+ * \brief Node2vec random walk on a homogeneous graph.
+ * \param hg The homogeneous graph.
+ * \param seeds A 1D array of seed nodes.
+ * \param p The return parameter.
+ * \param q The in-out parameter.
+ * \param max_num_steps The maximum number of steps of a random walk path.
+ * \param prob A 1D float array, indicating the unnormalized transition probability of
+ *        each edge.  An empty float array assumes uniform transition.
+ * \param alias_table Alias tables of \c prob built on the out-edge CSR matrix.  They
+ *        are built on the fly if empty.
+ * \param sorted_indices_arr The column indices of the out-edge CSR matrix sorted
+ *        within each row.  They are computed on the fly if empty.
+ * \return A 2D array of shape (len(seeds), max_num_steps + 1) with node IDs.  The
+ *         paths that terminated early are padded with -1.
+ */
+template<DLDeviceType XPU, typename IdxType>
+IdArray Node2vec(
+    const HeteroGraphPtr hg,
+    const IdArray seeds,
+    const double p,
+    const double q,
+    const int64_t max_num_steps,
+    const FloatArray prob,
+    const aten::CSRAliasTable &alias_table,
+    const IdArray sorted_indices_arr);
 
 };  // namespace impl
 
@@ -23,6 +23,36 @@
  *
  * }
  *
+ * Appending graphs to a file (version 3) writes the new graphs and an index
+ * block after the end of the file, so the existing graphs and labels are never
+ * rewritten:
+ * {
+ *   // MetaData Section
+ *   uint64_t kDGLSerializeMagic
+ *   uint64_t kVersion = 3
+ *   uint64_t GraphType = kDGLHeteroGraph
+ *   dgl_id_t num_graphs
+ *   uint64_t index_pos (start position of the latest index block, or 0)
+ *   uint64_t base_index_pos (start position of the graph_indices of the
+ * version 2 data)
+ *   ** Reserved Area till 4kB **
+ *
+ *   ... the version 2 data, graph data and index blocks of the previous saves ...
+ *
+ *   vector<HeteroGraphData> appended graph_datas;
+ *   // Index block
+ *   uint64_t prev_index_pos (start position of the previous index block, or 0)
+ *   vector<dgl_id_t> graph_indices (start address of every appended graph)
+ *   vector<pair<string, NDArray>> label_dict (labels of the appended graphs)
+ * }
+ * The graphs of a file are the graphs of the version 2 data followed by the
+ * graphs of every index block in order, and so are the labels. The first append
+ * to a version 2 file converts the metadata section to version 3 before writing
+ * anything after the end of the file, since the version 2 graph_indices are
+ * located from the end of the file. The metadata section is then updated in
+ * place after the index block is written, so an interrupted append leaves the
+ * previous index valid.
+ *
  * Storage of HeteroGraphData is
  * {
  *   HeteroGraphPtr ptr;
@@ -42,6 +72,7 @@
 
 #include <algorithm>
 #include <array>
+#include <cstdio>
 #include <iostream>
 #include <string>
 #include <utility>
@@ -61,6 +92,134 @@ using dmlc::Stream;
 using dmlc::io::FileSystem;
 using dmlc::io::URI;
 
+constexpr uint64_t kIndexedVersion = 3;
+
+/*! \brief The metadata section of a heterograph file. */
+struct HeteroGraphFileMeta {
+  uint64_t version;
+  uint64_t num_graph;
+  /*! \brief Start position of the latest index block (only for version 3) */
+  uint64_t index_pos = 0;
+  /*! \brief Start position of the version 2 graph indices (only for version 3) */
+  uint64_t base_index_pos = 0;
+};
+
+HeteroGraphFileMeta ReadHeteroGraphFileMeta(SeekStream *fs) {
+  uint64_t magicNum, graphType;
+  HeteroGraphFileMeta meta;
+  fs->Read(&magicNum);
+  fs->Read(&meta.version);
+  fs->Read(&graphType);
+  CHECK(fs->Read(&meta.num_graph)) << "Invalid num of graph";
+  CHECK_EQ(magicNum, kDGLSerializeMagic) << "Invalid DGL files";
+  CHECK(meta.version == 2 || meta.version == kIndexedVersion) << "Invalid DGL Version Number";
+  CHECK_EQ(graphType, GraphType::kHeteroGraph) << "Invalid GraphType";
+  if (meta.version == kIndexedVersion) {
+    CHECK(fs->Read(&meta.index_pos)) << "Invalid index position";
+    CHECK(fs->Read(&meta.base_index_pos)) << "Invalid index position";
+  }
+  return meta;
+}
+
+/*! \brief Overwrite the metadata section of a file with a version 3 one. */
+void WriteHeteroGraphFileMeta(const std::string &filename, const HeteroGraphFileMeta &meta) {
+  const uint64_t header[6] = {kDGLSerializeMagic, kIndexedVersion, GraphType::kHeteroGraph,
+                              meta.num_graph, meta.index_pos, meta.base_index_pos};
+  FILE *fp = std::fopen(filename.c_str(), "r+b");
+  CHECK(fp) << "Failed to open " << filename;
+  const size_t written = std::fwrite(header, sizeof(uint64_t), 6, fp);
+  CHECK_EQ(std::fclose(fp), 0) << "Failed to write " << filename;
+  CHECK_EQ(written, 6) << "Failed to write " << filename;
+}
+
+/*! \brief Read the start positions of the index blocks, from the first to the latest. */
+std::vector<uint64_t> ReadIndexBlockPositions(SeekStream *fs, const HeteroGraphFileMeta &meta) {
+  std::vector<uint64_t> positions;
+  for (uint64_t pos = meta.index_pos; pos != 0;) {
+    positions.push_back(pos);
+    fs->Seek(pos);
+    CHECK(fs->Read(&pos)) << "Invalid index block";
+  }
+  std::reverse(positions.begin(), positions.end());
+  return positions;
+}
+
+/*! \brief Find the start position of the graph indices of a version 2 file. */
+uint64_t FindBaseIndexPos(SeekStream *fs, const std::string &filename) {
+  URI uri(filename.c_str());
+  uint64_t filesize = FileSystem::GetInstance(uri)->GetPathInfo(uri).size;
+  fs->Seek(filesize - sizeof(uint64_t));
+  uint64_t indptr_buffer_size;
+  fs->Read(&indptr_buffer_size);
+  return filesize - sizeof(uint64_t) - indptr_buffer_size;
+}
+
+/*! \brief Read the start positions of all the graphs. */
+std::vector<uint64_t> ReadGraphIndices(SeekStream *fs, const std::string &filename,
+                                       const HeteroGraphFileMeta &meta) {
+  std::vector<uint64_t> graph_indices;
+  if (meta.version == kIndexedVersion) {
+    fs->Seek(meta.base_index_pos);
+    CHECK(fs->Read(&graph_indices)) << "Invalid graph index";
+    graph_indices.reserve(meta.num_graph);
+    for (uint64_t pos : ReadIndexBlockPositions(fs, meta)) {
+      std::vector<uint64_t> block_indices;
+      fs->Seek(pos + sizeof(uint64_t));
+      CHECK(fs->Read(&block_indices)) << "Invalid graph index";
+      graph_indices.insert(graph_indices.end(), block_indices.begin(), block_indices.end());
+    }
+  } else {
+    fs->Seek(FindBaseIndexPos(fs, filename));
+    fs->Read(&graph_indices);
+  }
+  CHECK_EQ(graph_indices.size(), meta.num_graph) << "Invalid graph index";
+  return graph_indices;
+}
+
+/*! \brief Read the labels stored with the version 2 data. */
+std::vector<NamedTensor> ReadBaseLabels(SeekStream *fs) {
+  fs->Seek(4096);
+  uint64_t gdata_start_pos;
+  fs->Read(&gdata_start_pos);
+  std::vector<NamedTensor> labels_list;
+  fs->Read(&labels_list);
+  return labels_list;
+}
+
+/*! \brief Read the labels stored in an index block. */
+std::vector<NamedTensor> ReadBlockLabels(SeekStream *fs, uint64_t pos) {
+  fs->Seek(pos + sizeof(uint64_t));
+  std::vector<uint64_t> graph_indices;
+  fs->Read(&graph_indices);
+  std::vector<NamedTensor> labels_list;
+  fs->Read(&labels_list);
+  return labels_list;
+}
+
+/*! \brief Concatenate the label tensors of the saves along the first dimension. */
+NDArray ConcatLabels(const std::string &name, const std::vector<NDArray> &parts) {
+  if (parts.size() == 1)
+    return parts[0];
+  std::vector<int64_t> shape(parts[0]->shape, parts[0]->shape + parts[0]->ndim);
+  shape[0] = 0;
+  for (const NDArray &part : parts) {
+    CHECK_EQ(part->ndim, static_cast<int>(shape.size()))
+      << "Label " << name << " has inconsistent shapes";
+    CHECK(part->dtype == parts[0]->dtype) << "Label " << name << " has inconsistent dtypes";
+    CHECK(std::equal(shape.begin() + 1, shape.end(), part->shape + 1))
+      << "Label " << name << " has inconsistent shapes";
+    shape[0] += part->shape[0];
+  }
+  NDArray ret = NDArray::Empty(shape, parts[0]->dtype, parts[0]->ctx);
+  int64_t offset = 0;
+  for (const NDArray &part : parts) {
+    std::vector<int64_t> part_shape(part->shape, part->shape + part->ndim);
+    ret.CreateView(part_shape, part->dtype, offset).CopyFrom(part);
+    offset += part.GetSize();
+  }
+  return ret;
+}
+
 bool SaveHeteroGraphs(std::string filename, List<HeteroGraphData> hdata,
                       const std::vector<NamedTensor> &nd_list) {
   auto fs = std::unique_ptr<StreamWithCount>(
@@ -119,30 +278,78 @@ bool SaveHeteroGraphs(std::string filename, List<HeteroGraphData> hdata,
   return true;
 }
 
+bool AppendHeteroGraphs(const std::string &filename, List<HeteroGraphData> hdata,
+                        const std::vector<NamedTensor> &nd_list) {
+  HeteroGraphFileMeta meta;
+  bool converted = false;
+  {
+    auto in = std::unique_ptr<SeekStream>(
+      SeekStream::CreateForRead(filename.c_str(), false));
+    CHECK(in) << "File name " << filename << " is not a valid name";
+    meta = ReadHeteroGraphFileMeta(in.get());
+    // Every save has the keys of the first one.
+    const std::vector<NamedTensor> stored = ReadBaseLabels(in.get());
+    std::vector<std::string> stored_keys, keys;
+    for (const auto &kv : stored)
+      stored_keys.push_back(kv.first);
+    for (const auto &kv : nd_list)
+      keys.push_back(kv.first);
+    std::sort(stored_keys.begin(), stored_keys.end());
+    std::sort(keys.begin(), keys.end());
+    CHECK(keys == stored_keys) << "The label keys do not match the stored label keys.";
+    if (meta.version != kIndexedVersion) {
+      meta.version = kIndexedVersion;
+      meta.base_index_pos = FindBaseIndexPos(in.get(), filename);
+      converted = true;
+    }
+  }
+  // A version 2 file is converted before anything is written after its end,
+  // which its graph indices are located from.
+  if (converted)
+    WriteHeteroGraphFileMeta(filename, meta);
+  URI uri(filename.c_str());
+  const uint64_t filesize = FileSystem::GetInstance(uri)->GetPathInfo(uri).size;
+
+  uint64_t index_pos;
+  {
+    auto fs = std::unique_ptr<StreamWithCount>(
+      StreamWithCount::Create(filename.c_str(), "a", false));
+    CHECK(fs->IsValid()) << "File name " << filename << " is not a valid name";
+    std::vector<uint64_t> graph_indices;
+    for (uint64_t i = 0; i < hdata.size(); ++i) {
+      graph_indices.push_back(filesize + fs->Count());
+      auto gdata = hdata[i].sptr();
+      fs->Write(gdata);
+    }
+    index_pos = filesize + fs->Count();
+    fs->Write(meta.index_pos);
+    fs->Write(graph_indices);
+    fs->Write(nd_list);
+  }
+
+  // Point the metadata section to the new index block
+  meta.num_graph += hdata.size();
+  meta.index_pos = index_pos;
+  WriteHeteroGraphFileMeta(filename, meta);
+  return true;
+}
+
 std::vector<HeteroGraphData> LoadHeteroGraphs(const std::string &filename,
                                               std::vector<dgl_id_t> idx_list) {
   auto fs = std::unique_ptr<SeekStream>(
     SeekStream::CreateForRead(filename.c_str(), false));
   CHECK(fs) << "File name " << filename << " is not a valid name";
   // Read DGL MetaData
-  uint64_t magicNum, graphType, version, num_graph;
-  fs->Read(&magicNum);
-  fs->Read(&version);
-  fs->Read(&graphType);
-  CHECK(fs->Read(&num_graph)) << "Invalid num of graph";
-  fs->Seek(4096);
-
-  CHECK_EQ(magicNum, kDGLSerializeMagic) << "Invalid DGL files";
-  CHECK_EQ(version, 2) << "Invalid GraphType";
-  CHECK_EQ(graphType, GraphType::kHeteroGraph) << "Invalid GraphType";
-
-  uint64_t gdata_start_pos;
-  fs->Read(&gdata_start_pos);
-  // Skip labels part
-  fs->Seek(gdata_start_pos);
+  HeteroGraphFileMeta meta = ReadHeteroGraphFileMeta(fs.get());
+  const uint64_t num_graph = meta.num_graph;
 
   std::vector<HeteroGraphData> gdata_refs;
-  if (idx_list.empty()) {
+  if (idx_list.empty() && meta.version == 2) {
+    fs->Seek(4096);
+    uint64_t gdata_start_pos;
+    fs->Read(&gdata_start_pos);
+    // Skip labels part
+    fs->Seek(gdata_start_pos);
     // Read All Graphs
     gdata_refs.reserve(num_graph);
     for (uint64_t i = 0; i < num_graph; ++i) {
@@ -152,23 +359,19 @@ std::vector<HeteroGraphData> LoadHeteroGraphs(const std::string &filename,
       gdata_refs.push_back(gdata);
     }
   } else {
-    uint64_t gdata_start_pos = fs->Tell();
     // Read Selected Graphss
+    std::vector<uint64_t> graph_indices = ReadGraphIndices(fs.get(), filename, meta);
+    if (idx_list.empty()) {
+      idx_list.resize(num_graph);
+      for (uint64_t i = 0; i < num_graph; ++i)
+        idx_list[i] = i;
+    }
     gdata_refs.reserve(idx_list.size());
-    URI uri(filename.c_str());
-    uint64_t filesize = FileSystem::GetInstance(uri)->GetPathInfo(uri).size;
-    fs->Seek(filesize - sizeof(uint64_t));
-    uint64_t indptr_buffer_size;
-    fs->Read(&indptr_buffer_size);
-
-    std::vector<uint64_t> graph_indices(num_graph);
-    fs->Seek(filesize - sizeof(uint64_t) - indptr_buffer_size);
-    fs->Read(&graph_indices);
 
-    fs->Seek(gdata_start_pos);
     // Would be better if idx_list is sorted. However the returned the graphs
     // should be the same order as the idx_list
     for (uint64_t i = 0; i < idx_list.size(); ++i) {
+      CHECK_LT(idx_list[i], num_graph) << "Graph index " << idx_list[i] << " is out of range";
       fs->Seek(graph_indices[idx_list[i]]);
       HeteroGraphData gdata = HeteroGraphData::Create();
       auto hetero_data = gdata.sptr();
@@ -185,19 +388,25 @@ std::vector<NamedTensor> LoadLabels_V2(const std::string &filename) {
     SeekStream::CreateForRead(filename.c_str(), false));
   CHECK(fs) << "File name " << filename << " is not a valid name";
   // Read DGL MetaData
-  uint64_t magicNum, graphType, version, num_graph;
-  fs->Read(&magicNum);
-  fs->Read(&version);
-  fs->Read(&graphType);
-  CHECK(fs->Read(&num_graph)) << "Invalid num of graph";
-  fs->Seek(4096);
-
-  uint64_t gdata_start_pos;
-  fs->Read(&gdata_start_pos);
-
-  std::vector<NamedTensor> labels_list;
-  fs->Read(&labels_list);
-
+  HeteroGraphFileMeta meta = ReadHeteroGraphFileMeta(fs.get());
+  std::vector<NamedTensor> labels_list = ReadBaseLabels(fs.get());
+  if (meta.version != kIndexedVersion)
+    return labels_list;
+
+  // Concatenate the labels of every save
+  std::vector<std::vector<NDArray>> parts(labels_list.size());
+  for (size_t i = 0; i < labels_list.size(); ++i)
+    parts[i].push_back(labels_list[i].second);
+  for (uint64_t pos : ReadIndexBlockPositions(fs.get(), meta)) {
+    for (const auto &kv : ReadBlockLabels(fs.get(), pos)) {
+      auto it = std::find_if(labels_list.begin(), labels_list.end(),
+                             [&kv] (const NamedTensor &t) { return t.first == kv.first; });
+      CHECK(it != labels_list.end()) << "Label " << kv.first << " is not in every save";
+      parts[it - labels_list.begin()].push_back(kv.second);
+    }
+  }
+  for (size_t i = 0; i < labels_list.size(); ++i)
+    labels_list[i].second = ConcatLabels(labels_list[i].first, parts[i]);
   return labels_list;
 }
 
@@ -225,6 +434,19 @@ DGL_REGISTER_GLOBAL("data.heterograph_serialize._CAPI_SaveHeteroGraphData")
     *rv = dgl::serialize::SaveHeteroGraphs(filename, hgdata, nd_list);
   });
 
+DGL_REGISTER_GLOBAL("data.heterograph_serialize._CAPI_AppendHeteroGraphData")
+  .set_body([](DGLArgs args, DGLRetValue *rv) {
+    std::string filename = args[0];
+    List<HeteroGraphData> hgdata = args[1];
+    Map<std::string, Value> nd_map = args[2];
+    std::vector<NamedTensor> nd_list;
+    for (auto kv : nd_map) {
+      NDArray ndarray = static_cast<NDArray>(kv.second->data);
+      nd_list.emplace_back(kv.first, ndarray);
+    }
+    *rv = dgl::serialize::AppendHeteroGraphs(filename, hgdata, nd_list);
+  });
+
 DGL_REGISTER_GLOBAL(
   "data.heterograph_serialize._CAPI_GetGindexFromHeteroGraphData")
   .set_body([](DGLArgs args, DGLRetValue *rv) {
@@ -2,17 +2,56 @@
  *  Copyright (c) 2019 by Contributors
  * \file graph/serialize/tensor_serialize.cc
  * \brief Graph serialization implementation
+ *
+ * By default, tensor files are stored in the legacy format
+ * {
+ *   uint64_t kDGLSerialize_Tensors
+ *   uint64_t num_elements
+ *   vector<pair<string, NDArray>> named_tensors
+ * }
+ * which can be read by every version of DGL. Optionally, they are stored with a
+ * trailing index:
+ * {
+ *   uint64_t kDGLSerialize_IndexedTensors
+ *   NDArray tensors...
+ *   vector<string> names       (index block)
+ *   vector<uint64_t> offsets   (start position of each named tensor)
+ *   uint64_t index_pos         (start position of the index block)
+ * }
+ *
+ * Appending writes the new tensors and a new index block after the end of the
+ * file, so the existing tensors are never rewritten. The last index block is the
+ * valid one. Appending to a file of the legacy format rewrites it.
+ *
+ * Tensors of an indexed file are loaded in parallel, each thread reading whole
+ * tensors with its own stream, and a subset of the tensors can be loaded without
+ * reading the others.
  */
 #include <dgl/packed_func_ext.h>
 #include <dgl/runtime/container.h>
 #include <dgl/runtime/ndarray.h>
 #include <dgl/runtime/object.h>
 #include <dmlc/io.h>
+#include <dmlc/omp.h>
+#ifndef _WIN32
+#include <fcntl.h>
+#include <unistd.h>
+#endif  // _WIN32
+
+#include <algorithm>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
 
 #include "../../c_api_common.h"
+#include "./streamwithcount.h"
 
 using namespace dgl::runtime;
 using dmlc::SeekStream;
+using dmlc::io::FileSystem;
+using dmlc::io::URI;
 
 namespace dgl {
 namespace serialize {
@@ -20,43 +59,287 @@ namespace serialize {
 typedef std::pair<std::string, NDArray> NamedTensor;
 
 constexpr uint64_t kDGLSerialize_Tensors = 0xDD5A9FBE3FA2443F;
+constexpr uint64_t kDGLSerialize_IndexedTensors = 0xDD5A9FBE3FA24440;
+
+/*! \brief Names and start positions of the tensors in an indexed tensor file. */
+struct TensorIndex {
+  std::vector<std::string> names;
+  std::vector<uint64_t> offsets;
+
+  /*! \brief Add a tensor, replacing the entry of the same name if any. */
+  void Set(const std::string &name, uint64_t offset) {
+    for (size_t i = 0; i < names.size(); ++i) {
+      if (names[i] == name) {
+        offsets[i] = offset;
+        return;
+      }
+    }
+    names.push_back(name);
+    offsets.push_back(offset);
+  }
+};
+
+uint64_t GetFileSize(const std::string &filename) {
+  URI uri(filename.c_str());
+  return FileSystem::GetInstance(uri)->GetPathInfo(uri).size;
+}
+
+/*! \brief Read the index block of an indexed tensor file. */
+TensorIndex ReadTensorIndex(SeekStream *fs, const std::string &filename) {
+  const uint64_t filesize = GetFileSize(filename);
+  CHECK_GE(filesize, 2 * sizeof(uint64_t)) << "Invalid DGL tensor file";
+  uint64_t index_pos;
+  fs->Seek(filesize - sizeof(uint64_t));
+  CHECK(fs->Read(&index_pos)) << "Invalid DGL tensor file";
+  fs->Seek(index_pos);
+  TensorIndex index;
+  CHECK(fs->Read(&index.names)) << "Invalid DGL tensor file";
+  CHECK(fs->Read(&index.offsets)) << "Invalid DGL tensor file";
+  CHECK_EQ(index.names.size(), index.offsets.size()) << "Invalid DGL tensor file";
+  return index;
+}
+
+/*!
+ * \brief Read all the tensors of a tensor file.
+ * \param fs The stream positioned after the magic number.
+ */
+std::vector<NamedTensor> ReadAllTensors(SeekStream *fs, const std::string &filename,
+                                        uint64_t magic) {
+  std::vector<NamedTensor> named_tensors;
+  if (magic == kDGLSerialize_Tensors) {
+    uint64_t num_elements;
+    CHECK(fs->Read(&num_elements)) << "Invalid num of elements";
+    fs->Read(&named_tensors);
+  } else {
+    CHECK_EQ(magic, kDGLSerialize_IndexedTensors) << "Invalid DGL tensor file";
+    TensorIndex index = ReadTensorIndex(fs, filename);
+    named_tensors.resize(index.names.size());
+    for (size_t i = 0; i < index.names.size(); ++i) {
+      fs->Seek(index.offsets[i]);
+      named_tensors[i].first = index.names[i];
+      CHECK(named_tensors[i].second.Load(fs)) << "Invalid DGL tensor file";
+    }
+  }
+  return named_tensors;
+}
+
+/*!
+ * \brief Write tensors followed by the updated index block.
+ * \param fs The output stream.
+ * \param base The position in the file corresponding to the start of the stream.
+ * \param tensors The tensors to write.
+ * \param index The index of the tensors already in the file. It is updated.
+ */
+void WriteTensors(StreamWithCount *fs, uint64_t base,
+                  const std::vector<NamedTensor> &tensors, TensorIndex *index) {
+  for (const auto &kv : tensors) {
+    index->Set(kv.first, base + fs->Count());
+    fs->Write(kv.second);
+  }
+  const uint64_t index_pos = base + fs->Count();
+  fs->Write(index->names);
+  fs->Write(index->offsets);
+  fs->Write(index_pos);
+}
+
+/*!
+ * \brief Write tensors in the legacy format.
+ */
+void WriteLegacyTensors(const std::string &filename, const std::vector<NamedTensor> &tensors) {
+  auto fs = std::unique_ptr<StreamWithCount>(
+    StreamWithCount::Create(filename.c_str(), "w", false));
+  CHECK(fs->IsValid()) << "Filename is invalid";
+  fs->Write(kDGLSerialize_Tensors);
+  fs->Write(static_cast<uint64_t>(tensors.size()));
+  fs->Write(tensors);
+}
+
+/*!
+ * \brief Save tensors to a file.
+ * \param filename The file name.
+ * \param tensors The tensors to save.
+ * \param append If true and the file exists, add the tensors to the file. A tensor
+ *        with the name of a tensor in the file replaces it.
+ * \param indexed Whether to write a new file in the indexed format. A file of the
+ *        legacy format that is appended to is converted to it.
+ */
+void SaveTensors(const std::string &filename, const std::vector<NamedTensor> &tensors,
+                 bool append, bool indexed) {
+  TensorIndex index;
+  if (append) {
+    auto in = std::unique_ptr<SeekStream>(
+      SeekStream::CreateForRead(filename.c_str(), true));
+    if (in) {
+      uint64_t magic;
+      CHECK(in->Read(&magic)) << "Invalid file";
+      if (magic == kDGLSerialize_IndexedTensors) {
+        index = ReadTensorIndex(in.get(), filename);
+        in.reset();
+        const uint64_t base = GetFileSize(filename);
+        auto fs = std::unique_ptr<StreamWithCount>(
+          StreamWithCount::Create(filename.c_str(), "a", false));
+        CHECK(fs->IsValid()) << "Filename is invalid";
+        WriteTensors(fs.get(), base, tensors, &index);
+        return;
+      }
+      // The legacy format has no index, so the file is rewritten.
+      std::vector<NamedTensor> merged = ReadAllTensors(in.get(), filename, magic);
+      in.reset();
+      for (const auto &kv : tensors) {
+        auto it = std::find_if(merged.begin(), merged.end(),
+                               [&kv] (const NamedTensor &t) { return t.first == kv.first; });
+        if (it == merged.end())
+          merged.push_back(kv);
+        else
+          it->second = kv.second;
+      }
+      SaveTensors(filename, merged, false, indexed);
+      return;
+    }
+  }
+  if (!indexed) {
+    WriteLegacyTensors(filename, tensors);
+    return;
+  }
+  auto fs = std::unique_ptr<StreamWithCount>(
+    StreamWithCount::Create(filename.c_str(), "w", false));
+  CHECK(fs->IsValid()) << "Filename is invalid";
+  fs->Write(kDGLSerialize_IndexedTensors);
+  WriteTensors(fs.get(), 0, tensors, &index);
+}
+
+/*!
+ * \brief Hint the OS to prefetch the byte ranges that are going to be read.
+ *
+ * Only local files on POSIX systems are supported; it is a no-op otherwise.
+ */
+void PrefetchRanges(const std::string &filename,
+                    const std::vector<std::pair<uint64_t, uint64_t>> &ranges) {
+#if !defined(_WIN32) && defined(POSIX_FADV_WILLNEED)
+  URI uri(filename.c_str());
+  if (uri.protocol != "" && uri.protocol != "file://")
+    return;
+  const int fd = open(uri.name.c_str(), O_RDONLY);
+  if (fd < 0)
+    return;
+  for (const auto &range : ranges)
+    posix_fadvise(fd, range.first, range.second - range.first, POSIX_FADV_WILLNEED);
+  close(fd);
+#endif
+}
+
+/*!
+ * \brief Load the tensors of a tensor file.
+ * \param filename The file name.
+ * \param keys The names of the tensors to load. All the tensors are loaded if empty.
+ * \param num_threads The number of threads reading the tensors. The default number of
+ *        OpenMP threads is used if it is not positive.
+ */
+std::vector<NamedTensor> LoadTensors(const std::string &filename,
+                                     const std::vector<std::string> &keys,
+                                     int num_threads) {
+  TensorIndex index;
+  uint64_t index_pos;
+  {
+    auto fs = std::unique_ptr<SeekStream>(
+      SeekStream::CreateForRead(filename.c_str(), false));
+    CHECK(fs) << "Filename is invalid or file doesn't exists";
+    uint64_t magic;
+    CHECK(fs->Read(&magic)) << "Invalid file";
+    if (magic != kDGLSerialize_IndexedTensors) {
+      // The legacy format can only be read sequentially.
+      std::vector<NamedTensor> tensors = ReadAllTensors(fs.get(), filename, magic);
+      if (keys.empty())
+        return tensors;
+      std::vector<NamedTensor> selected;
+      for (const auto &key : keys) {
+        auto it = std::find_if(tensors.begin(), tensors.end(),
+                               [&key] (const NamedTensor &t) { return t.first == key; });
+        CHECK(it != tensors.end()) << "Tensor " << key << " is not in " << filename;
+        selected.push_back(*it);
+      }
+      return selected;
+    }
+    index = ReadTensorIndex(fs.get(), filename);
+    index_pos = GetFileSize(filename) - sizeof(uint64_t);
+  }
+
+  std::vector<size_t> selected;
+  if (keys.empty()) {
+    for (size_t i = 0; i < index.names.size(); ++i)
+      selected.push_back(i);
+  } else {
+    std::unordered_map<std::string, size_t> name2idx;
+    for (size_t i = 0; i < index.names.size(); ++i)
+      name2idx[index.names[i]] = i;
+    for (const auto &key : keys) {
+      auto it = name2idx.find(key);
+      CHECK(it != name2idx.end()) << "Tensor " << key << " is not in " << filename;
+      selected.push_back(it->second);
+    }
+  }
+
+  // A tensor ends before the next tensor or index block in the file.
+  std::vector<uint64_t> bounds(index.offsets);
+  bounds.push_back(index_pos);
+  std::sort(bounds.begin(), bounds.end());
+  std::vector<std::pair<uint64_t, uint64_t>> ranges;
+  for (size_t i : selected) {
+    const uint64_t start = index.offsets[i];
+    ranges.emplace_back(start, *std::upper_bound(bounds.begin(), bounds.end(), start));
+  }
+  PrefetchRanges(filename, ranges);
+
+  std::vector<NamedTensor> tensors(selected.size());
+  std::string error;
+  const int64_t num_selected = selected.size();
+  if (num_threads <= 0)
+    num_threads = omp_get_max_threads();
+#pragma omp parallel for schedule(dynamic) num_threads(num_threads)
+  for (int64_t i = 0; i < num_selected; ++i) {
+    // Exceptions cannot leave an OpenMP region.
+    try {
+      auto fs = std::unique_ptr<SeekStream>(
+        SeekStream::CreateForRead(filename.c_str(), false));
+      fs->Seek(index.offsets[selected[i]]);
+      tensors[i].first = index.names[selected[i]];
+      CHECK(tensors[i].second.Load(fs.get())) << "Invalid DGL tensor file";
+    } catch (const std::exception &e) {
+#pragma omp critical
+      error = e.what();
+    }
+  }
+  CHECK(error.empty()) << error;
+  return tensors;
+}
 
 DGL_REGISTER_GLOBAL("data.tensor_serialize._CAPI_SaveNDArrayDict")
   .set_body([](DGLArgs args, DGLRetValue *rv) {
     std::string filename = args[0];
-    auto fs = std::unique_ptr<dmlc::Stream>(
-      dmlc::Stream::Create(filename.c_str(), "w"));
-    CHECK(fs) << "Filename is invalid";
-    fs->Write(kDGLSerialize_Tensors);
     bool empty_dict = args[2];
+    bool append = args[3];
+    bool indexed = args[4];
     Map<std::string, Value> nd_dict;
     if (!empty_dict) {
       nd_dict = args[1];
     }
     std::vector<NamedTensor> namedTensors;
-    fs->Write(static_cast<uint64_t>(nd_dict.size()));
     for (auto kv : nd_dict) {
       NDArray ndarray = static_cast<NDArray>(kv.second->data);
       namedTensors.emplace_back(kv.first, ndarray);
     }
-    fs->Write(namedTensors);
+    SaveTensors(filename, namedTensors, append, indexed);
     *rv = true;
   });
 
 DGL_REGISTER_GLOBAL("data.tensor_serialize._CAPI_LoadNDArrayDict")
   .set_body([](DGLArgs args, DGLRetValue *rv) {
     std::string filename = args[0];
-    auto fs = std::unique_ptr<dmlc::Stream>(
-      dmlc::Stream::Create(filename.c_str(), "r"));
-    CHECK(fs) << "Filename is invalid or file doesn't exists";
-    uint64_t magincNum, num_elements;
-    CHECK(fs->Read(&magincNum)) << "Invalid file";
-    CHECK_EQ(magincNum, kDGLSerialize_Tensors) << "Invalid DGL tensor file";
-    CHECK(fs->Read(&num_elements)) << "Invalid num of elements";
+    List<Value> key_list = args[1];
+    int num_threads = args[2];
+    auto keys = ListValueToVector<std::string>(key_list);
     Map<std::string, Value> nd_dict;
-    std::vector<NamedTensor> namedTensors;
-    fs->Read(&namedTensors);
-    for (auto kv : namedTensors) {
+    for (auto kv : LoadTensors(filename, keys, num_threads)) {
       Value ndarray = Value(MakeValue(kv.second));
       nd_dict.Set(kv.first, ndarray);
     }
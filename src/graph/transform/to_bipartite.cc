@@ -11,11 +11,14 @@
 #include <dgl/immutable_graph.h>
 #include <dgl/runtime/registry.h>
 #include <dgl/runtime/container.h>
+#include <dmlc/omp.h>
+#include <atomic>
 #include <vector>
 #include <tuple>
 // TODO(BarclayII): currently ToBlock depend on IdHashMap<IdType> implementation which
 // only works on CPU.  Should fix later to make it device agnostic.
 #include "../../array/cpu/array_utils.h"
+#include "../../array/cpu/concurrent_id_hash_map.h"
 
 namespace dgl {
 
@@ -26,44 +29,60 @@ namespace transform {
 
 namespace {
 
+// Below this number of IDs to relabel, the serial hashmap is faster than the concurrent one.
+constexpr int64_t kParallelRelabelThreshold = 1 << 16;
+
+template<typename IdType>
+void BuildMap(IdHashMap<IdType> *map, const std::vector<IdArray> &ids_list) {
+  for (const IdArray &ids : ids_list)
+    map->Update(ids);
+}
+
 template<typename IdType>
+void BuildMap(ConcurrentIdHashMap<IdType> *map, const std::vector<IdArray> &ids_list) {
+  map->Init(ids_list);
+}
+
+template<typename IdType, typename MapType>
 std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>>
 ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool include_rhs_in_lhs) {
   const int64_t num_etypes = graph->NumEdgeTypes();
   const int64_t num_ntypes = graph->NumVertexTypes();
   std::vector<EdgeArray> edge_arrays(num_etypes);
 
-  CHECK(rhs_nodes.size() == static_cast<size_t>(num_ntypes))
-    << "rhs_nodes not given for every node type";
-
-  const std::vector<IdHashMap<IdType>> rhs_node_mappings(rhs_nodes.begin(), rhs_nodes.end());
-  std::vector<IdHashMap<IdType>> lhs_node_mappings;
-
-  if (include_rhs_in_lhs)
-    lhs_node_mappings = rhs_node_mappings;  // copy
-  else
-    lhs_node_mappings.resize(num_ntypes);
-
-  std::vector<int64_t> num_nodes_per_type;
-  num_nodes_per_type.reserve(2 * num_ntypes);
-
+  // The IDs to relabel for every node type, in the order of relabeling.  The rhs nodes
+  // come first in the lhs nodes if included.
+  std::vector<std::vector<IdArray>> lhs_ids(num_ntypes);
+  if (include_rhs_in_lhs) {
+    for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
+      lhs_ids[ntype].push_back(rhs_nodes[ntype]);
+  }
   for (int64_t etype = 0; etype < num_etypes; ++etype) {
     const auto src_dst_types = graph->GetEndpointTypes(etype);
     const dgl_type_t srctype = src_dst_types.first;
     const dgl_type_t dsttype = src_dst_types.second;
     if (!aten::IsNullArray(rhs_nodes[dsttype])) {
       const EdgeArray& edges = graph->Edges(etype);
-      lhs_node_mappings[srctype].Update(edges.src);
+      lhs_ids[srctype].push_back(edges.src);
       edge_arrays[etype] = edges;
     }
   }
 
+  std::vector<MapType> rhs_node_mappings(num_ntypes);
+  std::vector<MapType> lhs_node_mappings(num_ntypes);
+  for (int64_t ntype = 0; ntype < num_ntypes; ++ntype) {
+    BuildMap(&rhs_node_mappings[ntype], {rhs_nodes[ntype]});
+    BuildMap(&lhs_node_mappings[ntype], lhs_ids[ntype]);
+  }
+
   const auto meta_graph = graph->meta_graph();
   const EdgeArray etypes = meta_graph->Edges("eid");
   const IdArray new_dst = Add(etypes.dst, num_ntypes);
   const auto new_meta_graph = ImmutableGraph::CreateFromCOO(
       num_ntypes * 2, etypes.src, new_dst);
 
+  std::vector<int64_t> num_nodes_per_type;
+  num_nodes_per_type.reserve(2 * num_ntypes);
   for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
     num_nodes_per_type.push_back(lhs_node_mappings[ntype].Size());
   for (int64_t ntype = 0; ntype < num_ntypes; ++ntype)
@@ -75,8 +94,8 @@ ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool includ
     const auto src_dst_types = graph->GetEndpointTypes(etype);
     const dgl_type_t srctype = src_dst_types.first;
     const dgl_type_t dsttype = src_dst_types.second;
-    const IdHashMap<IdType> &lhs_map = lhs_node_mappings[srctype];
-    const IdHashMap<IdType> &rhs_map = rhs_node_mappings[dsttype];
+    const MapType &lhs_map = lhs_node_mappings[srctype];
+    const MapType &rhs_map = rhs_node_mappings[dsttype];
     if (rhs_map.Size() == 0) {
       // No rhs nodes are given for this edge type. Create an empty graph.
       rel_graphs.push_back(CreateFromCOO(
@@ -87,11 +106,18 @@ ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool includ
       IdArray new_src = lhs_map.Map(edge_arrays[etype].src, -1);
       IdArray new_dst = rhs_map.Map(edge_arrays[etype].dst, -1);
       // Check whether there are unmapped IDs and raise error.
-      for (int64_t i = 0; i < new_dst->shape[0]; ++i)
-        CHECK_NE(new_dst.Ptr<IdType>()[i], -1)
-          << "Node " << edge_arrays[etype].dst.Ptr<IdType>()[i] << " does not exist"
-          << " in `rhs_nodes`. Argument `rhs_nodes` must contain all the edge"
-          << " destination nodes.";
+      const IdType *new_dst_data = new_dst.Ptr<IdType>();
+      const int64_t num_edges = new_dst->shape[0];
+      std::atomic<int64_t> unmapped(-1);
+#pragma omp parallel for
+      for (int64_t i = 0; i < num_edges; ++i) {
+        if (new_dst_data[i] == -1)
+          unmapped.store(i, std::memory_order_relaxed);
+      }
+      CHECK_EQ(unmapped.load(), -1)
+        << "Node " << edge_arrays[etype].dst.Ptr<IdType>()[unmapped.load()] << " does not exist"
+        << " in `rhs_nodes`. Argument `rhs_nodes` must contain all the edge"
+        << " destination nodes.";
       rel_graphs.push_back(CreateFromCOO(
           2, lhs_map.Size(), rhs_map.Size(),
           new_src, new_dst));
@@ -102,7 +128,7 @@ ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool includ
   const HeteroGraphPtr new_graph = CreateHeteroGraph(
       new_meta_graph, rel_graphs, num_nodes_per_type);
   std::vector<IdArray> lhs_nodes;
-  for (const IdHashMap<IdType> &lhs_map : lhs_node_mappings)
+  for (const MapType &lhs_map : lhs_node_mappings)
     lhs_nodes.push_back(lhs_map.Values());
   return std::make_tuple(new_graph, lhs_nodes, induced_edges);
 }
@@ -112,8 +138,21 @@ ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool includ
 std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>>
 ToBlock(HeteroGraphPtr graph, const std::vector<IdArray> &rhs_nodes, bool include_rhs_in_lhs) {
   std::tuple<HeteroGraphPtr, std::vector<IdArray>, std::vector<IdArray>> ret;
+  CHECK(rhs_nodes.size() == static_cast<size_t>(graph->NumVertexTypes()))
+    << "rhs_nodes not given for every node type";
+  int64_t num_ids = 0;
+  for (const IdArray &nodes : rhs_nodes)
+    num_ids += nodes->shape[0];
+  for (dgl_type_t etype = 0; etype < graph->NumEdgeTypes(); ++etype)
+    num_ids += graph->NumEdges(etype);
+  const bool parallel = num_ids >= kParallelRelabelThreshold && omp_get_max_threads() > 1;
   ATEN_ID_TYPE_SWITCH(graph->DataType(), IdType, {
-    ret = ToBlock<IdType>(graph, rhs_nodes, include_rhs_in_lhs);
+    if (parallel) {
+      ret = ToBlock<IdType, ConcurrentIdHashMap<IdType>>(
+          graph, rhs_nodes, include_rhs_in_lhs);
+    } else {
+      ret = ToBlock<IdType, IdHashMap<IdType>>(graph, rhs_nodes, include_rhs_in_lhs);
+    }
   });
   return ret;
 }
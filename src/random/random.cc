@@ -14,14 +14,62 @@ using namespace dgl::runtime;
 
 namespace dgl {
 
+namespace {
+
+// Draw num_per_key integers in [0, upper) for every key.  In deterministic mode, the
+// integers of a key only depend on the global seed, the call and the key.
+template <typename IdType>
+IdArray RandIntByKey(IdArray keys, int64_t num_per_key, int64_t upper) {
+  const int64_t num_keys = keys->shape[0];
+  IdArray ret = IdArray::Empty({num_keys * num_per_key}, keys->dtype, keys->ctx);
+  const IdType *keys_data = static_cast<IdType *>(keys->data);
+  IdType *ret_data = static_cast<IdType *>(ret->data);
+  const int64_t stream = RandomEngine::NewStream();
+  RandomEngine::StreamGuard stream_guard(stream);
+#pragma omp parallel for
+  for (int64_t i = 0; i < num_keys; ++i) {
+    RandomEngine *rng = RandomEngine::ThreadLocal();
+    rng->SetStream(stream_guard, keys_data[i]);
+    for (int64_t j = 0; j < num_per_key; ++j)
+      ret_data[i * num_per_key + j] = rng->RandInt<IdType>(upper);
+  }
+  return ret;
+}
+
+}  // namespace
+
 DGL_REGISTER_GLOBAL("rng._CAPI_SetSeed")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     const int seed = args[0];
+    RandomEngine::SetGlobalSeed(seed);
 #pragma omp parallel for
     for (int i = 0; i < omp_get_max_threads(); ++i)
       RandomEngine::ThreadLocal()->SetSeed(seed);
   });
 
+DGL_REGISTER_GLOBAL("rng._CAPI_SetDeterministic")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    const bool deterministic = args[0];
+    RandomEngine::SetDeterministic(deterministic);
+  });
+
+DGL_REGISTER_GLOBAL("rng._CAPI_IsDeterministic")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    *rv = RandomEngine::IsDeterministic();
+  });
+
+DGL_REGISTER_GLOBAL("rng._CAPI_RandIntByKey")
+.set_body([] (DGLArgs args, DGLRetValue *rv) {
+    const IdArray keys = args[0];
+    const int64_t num_per_key = args[1];
+    const int64_t upper = args[2];
+    CHECK_EQ(keys->ctx.device_type, kDLCPU) << "Keys must be on CPU.";
+    CHECK_GT(upper, 0) << "The upper bound must be positive.";
+    ATEN_ID_TYPE_SWITCH(keys->dtype, IdType, {
+      *rv = RandIntByKey<IdType>(keys, num_per_key, upper);
+    });
+  });
+
 DGL_REGISTER_GLOBAL("rng._CAPI_Choice")
 .set_body([] (DGLArgs args, DGLRetValue *rv) {
     const int64_t num = args[0];
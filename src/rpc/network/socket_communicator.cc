@@ -125,39 +125,64 @@ void SocketSender::Finalize() {
   }
 }
 
+/*!
+ * \brief Send all the buffers, retrying on partial sends.
+ */
+static void SendAll(TCPSocket* socket, std::vector<IOBuffer>* buffers) {
+  size_t first = 0;
+  while (first < buffers->size()) {
+    int64_t tmp = socket->SendV(buffers->data() + first, buffers->size() - first);
+    CHECK_NE(tmp, -1);
+    // Skip the buffers that have been sent completely and advance the partial one.
+    while (first < buffers->size() && tmp >= (*buffers)[first].size) {
+      tmp -= (*buffers)[first].size;
+      ++first;
+    }
+    if (tmp > 0) {
+      (*buffers)[first].data += tmp;
+      (*buffers)[first].size -= tmp;
+    }
+  }
+}
+
 void SocketSender::SendLoop(TCPSocket* socket, MessageQueue* queue) {
   CHECK_NOTNULL(socket);
   CHECK_NOTNULL(queue);
   bool exit = false;
+  std::vector<Message> batch;
+  std::vector<int64_t> sizes;
+  std::vector<IOBuffer> buffers;
   while (!exit) {
+    batch.clear();
     Message msg;
     STATUS code = queue->Remove(&msg);
     if (code == QUEUE_CLOSE) {
       msg.size = 0;  // send an end-signal to receiver
       exit = true;
     }
-    // First send the size
-    // If exit == true, we will send zero size to reciever
-    int64_t sent_bytes = 0;
-    while (static_cast<size_t>(sent_bytes) < sizeof(int64_t)) {
-      int64_t max_len = sizeof(int64_t) - sent_bytes;
-      int64_t tmp = socket->Send(
-        reinterpret_cast<char*>(&msg.size)+sent_bytes,
-        max_len);
-      CHECK_NE(tmp, -1);
-      sent_bytes += tmp;
+    batch.push_back(msg);
+    // Coalesce the messages that are already in the queue
+    while (!exit && batch.size() < kMaxCoalescedMessages &&
+           queue->Remove(&msg, false) == REMOVE_SUCCESS) {
+      batch.push_back(msg);
     }
-    // Then send the data
-    sent_bytes = 0;
-    while (sent_bytes < msg.size) {
-      int64_t max_len = msg.size - sent_bytes;
-      int64_t tmp = socket->Send(msg.data+sent_bytes, max_len);
-      CHECK_NE(tmp, -1);
-      sent_bytes += tmp;
+    // Frame each message by its size followed by its data.
+    // If exit == true, we will send zero size to reciever
+    sizes.resize(batch.size());
+    buffers.clear();
+    for (size_t i = 0; i < batch.size(); ++i) {
+      sizes[i] = batch[i].size;
+      buffers.push_back({reinterpret_cast<char*>(&sizes[i]), sizeof(int64_t)});
+      if (batch[i].size > 0) {
+        buffers.push_back({batch[i].data, batch[i].size});
+      }
     }
+    SendAll(socket, &buffers);
     // delete msg
-    if (msg.deallocator != nullptr) {
-      msg.deallocator(&msg);
+    for (auto& m : batch) {
+      if (m.deallocator != nullptr) {
+        m.deallocator(&m);
+      }
     }
   }
 }
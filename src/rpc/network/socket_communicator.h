@@ -23,6 +23,7 @@ namespace network {
 static constexpr int kMaxTryCount = 1024;    // maximal connection: 1024
 static constexpr int kTimeOut = 10 * 60;     // 10 minutes (in seconds) for socket timeout
 static constexpr int kMaxConnection = 1024;  // maximal connection: 1024
+static constexpr size_t kMaxCoalescedMessages = 256;  // maximal messages sent in one call
 
 /*!
  * \breif Networking address
@@ -115,6 +116,10 @@ class SocketSender : public Sender {
    * \param socket TCPSocket for current connection
    * \param queue message_queue for current connection
    * 
+   * Every message is framed as its size followed by its data. The messages that are
+   * already waiting in the queue are coalesced and their frames are sent together
+   * with scatter-gather I/O, directly from the message buffers without copying them.
+   *
    * Note that, the SendLoop will finish its loop-job and exit thread
    * when the main thread invokes Signal() API on the message queue.
    */
@@ -13,17 +13,24 @@
 #include <netdb.h>
 #include <netinet/in.h>
 #include <sys/socket.h>
+#include <sys/uio.h>
 #include <unistd.h>
 #endif  // !_WIN32
 #include <string.h>
 #include <errno.h>
 
+#include <algorithm>
+#include <vector>
+
 namespace dgl {
 namespace network {
 
 typedef struct sockaddr_in SAI;
 typedef struct sockaddr SA;
 
+// Maximal number of buffers passed to one sendmsg() call (IOV_MAX on Linux and macOS).
+static constexpr int64_t kMaxIOVecs = 1024;
+
 TCPSocket::TCPSocket() {
   // init socket
   socket_ = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP);
@@ -198,6 +205,34 @@ int64_t TCPSocket::Send(const char * data, int64_t len_data) {
   return number_send;
 }
 
+int64_t TCPSocket::SendV(const IOBuffer * buffers, int64_t num_buffers) {
+#ifdef _WIN32
+  // There is no sendmsg() on Windows; send the first buffer and let the caller continue.
+  return Send(buffers[0].data, buffers[0].size);
+#else   // !_WIN32
+  const int64_t count = std::min(num_buffers, kMaxIOVecs);
+  std::vector<struct iovec> iov(count);
+  for (int64_t i = 0; i < count; ++i) {
+    iov[i].iov_base = const_cast<char*>(buffers[i].data);
+    iov[i].iov_len = buffers[i].size;
+  }
+  struct msghdr msg;
+  memset(&msg, 0, sizeof(msg));
+  msg.msg_iov = iov.data();
+  msg.msg_iovlen = count;
+
+  int64_t number_send;
+  do {  // retry if EINTR failure appears
+    number_send = sendmsg(socket_, &msg, 0);
+  } while (number_send == -1 && errno == EINTR);
+  if (number_send == -1) {
+    LOG(ERROR) << "sendmsg error: " << strerror(errno);
+  }
+
+  return number_send;
+#endif  // _WIN32
+}
+
 int64_t TCPSocket::Receive(char * buffer, int64_t size_buffer) {
   int64_t number_recv;
 
@@ -14,11 +14,26 @@
 #else   // !_WIN32
 #include <sys/socket.h>
 #endif  // _WIN32
+#include <cstdint>
 #include <string>
 
 namespace dgl {
 namespace network {
 
+/*!
+ * \brief A contiguous memory region sent by TCPSocket::SendV().
+ */
+struct IOBuffer {
+  /*!
+   * \brief start of the memory region
+   */
+  const char* data;
+  /*!
+   * \brief size of the memory region in bytes
+   */
+  int64_t size;
+};
+
 /*!
  * \brief TCPSocket is a simple wrapper around a socket. 
  * It supports only TCP connections.
@@ -106,6 +121,16 @@ class TCPSocket {
    */  
   int64_t Send(const char * data, int64_t len_data);
 
+  /*!
+   * \brief Send data gathered from multiple buffers in one system call.
+   * \param buffers buffers for sending, in order
+   * \param num_buffers number of buffers
+   * \return return number of bytes sent if OK, -1 on error
+   *
+   * Like Send(), SendV() may send fewer bytes than the total size of the buffers.
+   */
+  int64_t SendV(const IOBuffer * buffers, int64_t num_buffers);
+
   /*!
    * \brief Receive data.
    * \param buffer buffer for receving
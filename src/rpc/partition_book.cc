@@ -0,0 +1,163 @@
+/*!
+ *  Copyright (c) 2020 by Contributors
+ * \file rpc/partition_book.cc
+ * \brief Batched ID translation used by the graph partition books.
+ */
+#include <dgl/runtime/container.h>
+#include <dgl/packed_func_ext.h>
+#include <dgl/array.h>
+#include <algorithm>
+#include <utility>
+#include "../c_api_common.h"
+
+using namespace dgl::runtime;
+using namespace dgl::aten;
+
+namespace dgl {
+namespace rpc {
+
+namespace {
+
+/*!
+ * \brief Check that all the IDs are in [0, upper).
+ *
+ * The range is found by a parallel reduction, so that the check is done outside of
+ * the OpenMP regions; an exception thrown inside of them terminates the process.
+ */
+template <typename IdType>
+void CheckIdRange(IdArray ids, int64_t upper) {
+  const IdType* ids_data = static_cast<IdType*>(ids->data);
+  const int64_t len = ids->shape[0];
+  int64_t min_id = 0, max_id = -1;
+  if (len > 0)
+    min_id = max_id = ids_data[0];
+#pragma omp parallel for reduction(min:min_id) reduction(max:max_id)
+  for (int64_t i = 0; i < len; ++i) {
+    min_id = std::min(min_id, static_cast<int64_t>(ids_data[i]));
+    max_id = std::max(max_id, static_cast<int64_t>(ids_data[i]));
+  }
+  CHECK_GE(min_id, 0) << "ID " << min_id << " is out of range.";
+  CHECK_LT(max_id, upper) << "ID " << max_id << " is out of range.";
+}
+
+/*!
+ * \brief Map global IDs to partition IDs and local IDs under a range partitioning.
+ *
+ * Partition i owns the global IDs in [range_end[i-1], range_end[i]), where
+ * range_end[-1] is 0. Both outputs are computed in a single pass over the IDs.
+ *
+ * \param ids The global IDs.
+ * \param range_end The exclusive end of the ID range of each partition.
+ * \param local_part The partition whose local IDs are computed. Local IDs of IDs
+ *        belonging to any other partition are set to -1. If it is negative,
+ *        local IDs are computed for every partition.
+ * \return A pair of the partition IDs (int64) and the local IDs (same type as ids).
+ */
+template <typename IdType>
+std::pair<IdArray, IdArray> RangeMapIds(IdArray ids, IdArray range_end, int64_t local_part) {
+  const IdType* ids_data = static_cast<IdType*>(ids->data);
+  const int64_t* end_data = static_cast<int64_t*>(range_end->data);
+  const int64_t num_parts = range_end->shape[0];
+  const int64_t len = ids->shape[0];
+  IdArray part_ids = NewIdArray(len, ids->ctx, 64);
+  IdArray local_ids = NewIdArray(len, ids->ctx, ids->dtype.bits);
+  int64_t* part_data = static_cast<int64_t*>(part_ids->data);
+  IdType* local_data = static_cast<IdType*>(local_ids->data);
+  CheckIdRange<IdType>(ids, num_parts > 0 ? end_data[num_parts - 1] : 0);
+
+#pragma omp parallel for
+  for (int64_t i = 0; i < len; ++i) {
+    const int64_t id = ids_data[i];
+    const int64_t part = std::upper_bound(end_data, end_data + num_parts, id) - end_data;
+    part_data[i] = part;
+    if (local_part < 0 || part == local_part)
+      local_data[i] = static_cast<IdType>(id - (part > 0 ? end_data[part - 1] : 0));
+    else
+      local_data[i] = -1;
+  }
+  return std::make_pair(part_ids, local_ids);
+}
+
+/*!
+ * \brief Map global IDs to partition IDs and local IDs with lookup tables.
+ *
+ * \param ids The global IDs.
+ * \param id2part The partition ID of every global ID.
+ * \param g2l The local ID of every global ID in the partition local_part. It may
+ *        be shorter than id2part.
+ * \param local_part The partition whose local IDs are computed. Local IDs of IDs
+ *        belonging to any other partition are set to -1.
+ * \return A pair of the partition IDs (int64) and the local IDs (same type as ids).
+ */
+template <typename IdType>
+std::pair<IdArray, IdArray> TableMapIds(
+    IdArray ids, IdArray id2part, IdArray g2l, int64_t local_part) {
+  const IdType* ids_data = static_cast<IdType*>(ids->data);
+  const int64_t* id2part_data = static_cast<int64_t*>(id2part->data);
+  const int64_t* g2l_data = static_cast<int64_t*>(g2l->data);
+  const int64_t num_ids = id2part->shape[0];
+  const int64_t num_local = g2l->shape[0];
+  const int64_t len = ids->shape[0];
+  IdArray part_ids = NewIdArray(len, ids->ctx, 64);
+  IdArray local_ids = NewIdArray(len, ids->ctx, ids->dtype.bits);
+  int64_t* part_data = static_cast<int64_t*>(part_ids->data);
+  IdType* local_data = static_cast<IdType*>(local_ids->data);
+  CheckIdRange<IdType>(ids, num_ids);
+
+#pragma omp parallel for
+  for (int64_t i = 0; i < len; ++i) {
+    const int64_t id = ids_data[i];
+    const int64_t part = id2part_data[id];
+    part_data[i] = part;
+    if (part == local_part && id < num_local)
+      local_data[i] = static_cast<IdType>(g2l_data[id]);
+    else
+      local_data[i] = -1;
+  }
+  return std::make_pair(part_ids, local_ids);
+}
+
+};  // namespace
+
+DGL_REGISTER_GLOBAL("distributed.graph_partition_book._CAPI_DGLRangePartitionBookMapIds")
+.set_body([] (DGLArgs args, DGLRetValue* rv) {
+    IdArray ids = args[0];
+    IdArray range_end = args[1];
+    int64_t local_part = args[2];
+    CHECK_IS_ID_ARRAY(ids);
+    CHECK_INT64(range_end, "range_end");
+    CHECK_EQ(ids->ctx.device_type, kDLCPU) << "Only CPU IDs are supported.";
+
+    std::pair<IdArray, IdArray> result;
+    ATEN_ID_TYPE_SWITCH(ids->dtype, IdType, {
+      result = RangeMapIds<IdType>(ids, range_end, local_part);
+    });
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(result.first)));
+    ret.push_back(Value(MakeValue(result.second)));
+    *rv = ret;
+  });
+
+DGL_REGISTER_GLOBAL("distributed.graph_partition_book._CAPI_DGLBasicPartitionBookMapIds")
+.set_body([] (DGLArgs args, DGLRetValue* rv) {
+    IdArray ids = args[0];
+    IdArray id2part = args[1];
+    IdArray g2l = args[2];
+    int64_t local_part = args[3];
+    CHECK_IS_ID_ARRAY(ids);
+    CHECK_INT64(id2part, "id2part");
+    CHECK_INT64(g2l, "g2l");
+    CHECK_EQ(ids->ctx.device_type, kDLCPU) << "Only CPU IDs are supported.";
+
+    std::pair<IdArray, IdArray> result;
+    ATEN_ID_TYPE_SWITCH(ids->dtype, IdType, {
+      result = TableMapIds<IdType>(ids, id2part, g2l, local_part);
+    });
+    List<Value> ret;
+    ret.push_back(Value(MakeValue(result.first)));
+    ret.push_back(Value(MakeValue(result.second)));
+    *rv = ret;
+  });
+
+}  // namespace rpc
+}  // namespace dgl
@@ -658,6 +658,57 @@ def test_degree_bucket_edge_ordering(idtype):
         return {'n': F.sum(nodes.mailbox['eid'], 1)}
     g.update_all(fn.copy_e('eid', 'eid'), reducer)
 
+@parametrize_dtype
+def test_mailbox_layout(idtype):
+    import dgl.function as fn
+    # node 4 has no incoming edge
+    g = dgl.graph(
+        ([1, 3, 5, 0, 4, 2, 3, 3, 4, 5], [1, 1, 0, 0, 1, 2, 2, 0, 3, 3]),
+        num_nodes=6, idtype=idtype, device=F.ctx())
+    g.edata['eid'] = F.copy_to(F.arange(1, 11), F.ctx())
+    g.ndata['x'] = F.copy_to(F.arange(0, 6), F.ctx())
+
+    def bucket_reducer(nodes):
+        # position-dependent reduction to check the message order
+        eid = nodes.mailbox['eid']
+        deg = F.shape(eid)[1]
+        assert F.array_equal(F.copy_to(nodes.mailbox_lengths, F.cpu()),
+                             F.full_1d(len(nodes), deg, F.int64, F.cpu()))
+        w = F.copy_to(F.reshape(F.arange(1, deg + 1), (1, deg)), F.ctx())
+        return {'n': F.sum(eid * w, 1) + nodes.data['x']}
+
+    @dgl.udf.mailbox_layout('padded')
+    def padded_reducer(nodes):
+        eid = F.asnumpy(nodes.mailbox['eid'])
+        mask = F.asnumpy(nodes.mailbox_mask)
+        assert np.array_equal(mask.sum(1), F.asnumpy(nodes.mailbox_lengths))
+        assert np.all(eid[~mask] == 0)
+        w = np.arange(1, eid.shape[1] + 1).reshape((1, -1))
+        n = F.copy_to(F.tensor((eid * w).sum(1), F.int64), F.ctx())
+        return {'n': n + nodes.data['x']}
+
+    @dgl.udf.mailbox_layout('packed')
+    def packed_reducer(nodes):
+        eid = F.asnumpy(nodes.mailbox['eid'])
+        lengths = F.asnumpy(nodes.mailbox_lengths)
+        batch_sizes = F.asnumpy(nodes.mailbox_batch_sizes)
+        assert np.all(np.diff(lengths) <= 0)
+        assert np.array_equal(batch_sizes, [4, 4, 2])
+        n = np.zeros((len(lengths),), dtype=np.int64)
+        pos = 0
+        for step, bs in enumerate(batch_sizes):
+            n[:bs] += eid[pos:pos + bs] * (step + 1)
+            pos += bs
+        n = F.copy_to(F.tensor(n, F.int64), F.ctx())
+        return {'n': n + nodes.data['x']}
+
+    g.update_all(fn.copy_e('eid', 'eid'), bucket_reducer)
+    expected = F.asnumpy(g.ndata.pop('n'))
+    assert expected[4] == 0
+    for reducer in [padded_reducer, packed_reducer]:
+        g.update_all(fn.copy_e('eid', 'eid'), reducer)
+        assert np.array_equal(F.asnumpy(g.ndata.pop('n')), expected)
+
 @parametrize_dtype
 def test_issue_2484(idtype):
     import dgl.function as fn
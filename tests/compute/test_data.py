@@ -1,4 +1,7 @@
+import dgl
 import dgl.data as data
+import numpy as np
+import os
 import unittest
 import backend as F
 
@@ -38,7 +41,110 @@ def test_data_hash():
     assert a.hash == b.hash
     assert a.hash != c.hash
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="Datasets don't need to be tested on GPU.")
+def test_tu_batched_graph():
+    from dgl.data.tu import _batched_graph_from_indicator
+    # nodes of the graphs are interleaved and graph 2 is empty
+    indicator = np.array([0, 1, 0, 1, 0, 3, 3, 1])
+    edges = np.array([[0, 2], [1, 3], [2, 4], [3, 7], [4, 0], [5, 6], [7, 1], [6, 5]])
+    bg, node_perm, edge_perm = _batched_graph_from_indicator(edges, indicator)
+    assert F.array_equal(bg.batch_num_nodes(), F.tensor([3, 3, 0, 2], F.int64))
+    assert F.array_equal(bg.batch_num_edges(), F.tensor([3, 3, 0, 2], F.int64))
+
+    full = dgl.graph((F.tensor(edges[:, 0]), F.tensor(edges[:, 1])), num_nodes=len(indicator))
+    graphs = dgl.unbatch(bg)
+    for i, g in enumerate(graphs):
+        sg = full.subgraph(F.tensor(np.nonzero(indicator == i)[0]))
+        assert g.number_of_nodes() == sg.number_of_nodes()
+        assert F.array_equal(g.ndata[dgl.NID], sg.ndata[dgl.NID])
+        eid = F.asnumpy(g.edata[dgl.EID])
+        assert np.array_equal(np.sort(eid), np.sort(F.asnumpy(sg.edata[dgl.EID])))
+        nid = F.asnumpy(g.ndata[dgl.NID])
+        u, v = g.edges()
+        assert np.array_equal(nid[F.asnumpy(u)], edges[eid, 0])
+        assert np.array_equal(nid[F.asnumpy(v)], edges[eid, 1])
+    assert np.array_equal(node_perm, np.array([0, 2, 4, 1, 3, 7, 5, 6]))
+    assert np.array_equal(edge_perm, np.array([0, 2, 4, 1, 3, 6, 5, 7]))
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="Datasets don't need to be tested on GPU.")
+def test_load_kg_triplets(tmpdir):
+    rng = np.random.RandomState(0)
+    files, expected = [], []
+    for i in range(3):
+        rows = [('e{}'.format(rng.randint(50)), 'r{}'.format(rng.randint(6)),
+                 'e{}'.format(rng.randint(50))) for _ in range(300)]
+        filename = os.path.join(str(tmpdir), 'triplets_{}.txt'.format(i))
+        with open(filename, 'w') as f:
+            f.write(''.join('\t'.join(row) + '\n' for row in rows))
+        files.append(filename)
+        expected.append(rows)
+
+    # small chunks split lines across chunk boundaries
+    for chunk_size, num_workers in [(7, 1), (100, 2), (1 << 20, 1)]:
+        triplets, entities, relations = data.load_kg_triplets(
+            files, num_workers=num_workers, chunk_size=chunk_size)
+        for t, rows in zip(triplets, expected):
+            assert t.shape == (len(rows), 3)
+            assert [(entities[h], relations[r], entities[d]) for h, r, d in t] == rows
+
+    entity_dict = {'e{}'.format(i): i for i in range(50)}
+    relation_dict = {'r{}'.format(i): 5 - i for i in range(6)}
+    cache_path = os.path.join(str(tmpdir), 'cache.npz')
+    triplets, _, relations = data.load_kg_triplets(
+        files, entity_dict, relation_dict, chunk_size=100, cache_path=cache_path)
+    assert os.path.exists(cache_path)
+    assert relations.tolist() == ['r5', 'r4', 'r3', 'r2', 'r1', 'r0']
+    for t, rows in zip(triplets, expected):
+        assert t.tolist() == [[entity_dict[h], relation_dict[r], entity_dict[d]]
+                              for h, r, d in rows]
+    cached, _, _ = data.load_kg_triplets(files, entity_dict, relation_dict,
+                                         cache_path=cache_path)
+    for t, c in zip(triplets, cached):
+        assert np.array_equal(t, c)
+    # the cache is not used with other IDs
+    relation_dict = {'r{}'.format(i): i for i in range(6)}
+    triplets, _, relations = data.load_kg_triplets(files, entity_dict, relation_dict,
+                                                   cache_path=cache_path)
+    assert relations.tolist() == ['r0', 'r1', 'r2', 'r3', 'r4', 'r5']
+    for t, rows in zip(triplets, expected):
+        assert t.tolist() == [[entity_dict[h], relation_dict[r], entity_dict[d]]
+                              for h, r, d in rows]
+
+def test_parse_ntriples(tmpdir):
+    from dgl.data.rdf import parse_ntriples, URIRef, BNode, Literal
+    filename = os.path.join(str(tmpdir), 'test.nt')
+    with open(filename, 'w') as f:
+        f.write('# comment\n'
+                '<http://a/x> <http://p/q> <http://a/y> .\n'
+                '_:b1 <http://p/r> "say \\"hi\\"\\u00e9"@en .\n'
+                '\n'
+                '<http://a/x> <http://p/s> "5"^^<http://www.w3.org/2001/XMLSchema#int>.\n'
+                '<http://a/y> <http://p/t> _:b2 .\n')
+    tuples = list(parse_ntriples(filename))
+    assert tuples == [('http://a/x', 'http://p/q', 'http://a/y'),
+                      ('b1', 'http://p/r', 'say "hi"\u00e9'),
+                      ('http://a/x', 'http://p/s', '5'),
+                      ('http://a/y', 'http://p/t', 'b2')]
+    assert [type(t[0]) for t in tuples] == [URIRef, BNode, URIRef, URIRef]
+    assert [type(t[2]) for t in tuples] == [URIRef, Literal, Literal, BNode]
+    assert tuples[1][2].language == 'en' and tuples[1][2].datatype is None
+    assert tuples[2][2].datatype == 'http://www.w3.org/2001/XMLSchema#int'
+    assert tuples[2][2].language is None
+
+def test_rdf_tuple_key():
+    from dgl.data.rdf import _tuple_key, URIRef, BNode, Literal
+    sbj, pred = URIRef('http://a/x'), URIRef('http://p/q')
+    key = _tuple_key((sbj, pred, Literal('5', 'http://t/int')))
+    assert key == _tuple_key((URIRef('http://a/x'), pred, Literal('5', 'http://t/int')))
+    assert key != _tuple_key((sbj, pred, Literal('5', 'http://t/long')))
+    assert key != _tuple_key((sbj, pred, Literal('5')))
+    assert key != _tuple_key((sbj, pred, URIRef('5')))
+    assert _tuple_key((sbj, pred, Literal('a', language='en'))) != \
+        _tuple_key((sbj, pred, Literal('a', language='de')))
+    assert _tuple_key((BNode('b'), pred, sbj)) != _tuple_key((URIRef('b'), pred, sbj))
+
 if __name__ == '__main__':
     test_minigc()
     test_gin()
     test_data_hash()
+    test_tu_batched_graph()
@@ -4,6 +4,7 @@ from collections import Counter
 import numpy as np
 import scipy.sparse as ssp
 import itertools
+import pickle
 import backend as F
 import networkx as nx
 import unittest, pytest
@@ -2313,6 +2314,41 @@ def test_remove_edges(idtype):
     assert F.array_equal(g.nodes['game'].data['h'], F.tensor([2, 2], dtype=idtype))
     assert F.array_equal(g.nodes['developer'].data['h'], F.tensor([3, 3], dtype=idtype))
 
+@parametrize_dtype
+def test_degree_cache(idtype):
+    g = dgl.graph(([0, 1], [1, 2]), idtype=idtype, device=F.ctx())
+    deg = g.in_degrees()
+    assert F.array_equal(deg, F.tensor([0, 1, 1], dtype=idtype))
+    # the cached degrees are copied so that callers cannot corrupt the cache
+    assert g.in_degrees() is not deg
+    assert F.array_equal(g.in_degrees(), deg)
+    assert F.array_equal(g.out_degrees(), F.tensor([1, 1, 0], dtype=idtype))
+    calls = []
+    def _create():
+        calls.append(1)
+        return len(calls)
+    assert g._get_cached_info('foo', _create) == 1
+    assert g._get_cached_info('foo', _create) == 1
+    # the cache is shared by local scopes
+    with g.local_scope():
+        assert g._get_cached_info('foo', _create) == 1
+    # but is not pickled
+    assert '_struct_cache' not in g.__getstate__()
+    g_pickled = pickle.loads(pickle.dumps(g))
+    assert g_pickled._get_cached_info('foo', _create) == 2
+    assert F.array_equal(g_pickled.in_degrees(), deg)
+    # mutations invalidate the cache
+    g.add_edges(2, 0)
+    assert F.array_equal(g.in_degrees(), F.tensor([1, 1, 1], dtype=idtype))
+    assert F.array_equal(g.out_degrees(), F.tensor([1, 1, 1], dtype=idtype))
+    assert g._get_cached_info('foo', _create) == 3
+    g.remove_edges(0)
+    assert F.array_equal(g.in_degrees(), F.tensor([1, 0, 1], dtype=idtype))
+    assert g._get_cached_info('foo', _create) == 4
+    g2 = g.formats('csc')
+    assert g2._get_cached_info('foo', _create) == 5
+    assert F.array_equal(g2.in_degrees(), F.tensor([1, 0, 1], dtype=idtype))
+
 @parametrize_dtype
 def test_remove_nodes(idtype):
     # homogeneous Graphs
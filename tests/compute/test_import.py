@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+LAZY_MODULES = ['dgl.contrib', 'dgl.data', 'dgl.dataloading', 'dgl.distributed',
+                'dgl._deprecate.graph', 'dgl._deprecate.nodeflow']
+
+def _run(stmt):
+    return subprocess.check_output([sys.executable, '-c', stmt]).decode().split()
+
+def test_lazy_import():
+    loaded = _run('import sys, dgl; print(*[m for m in {} if m in sys.modules])'.format(
+        LAZY_MODULES))
+    assert loaded == []
+
+    # the subpackages are imported on first access
+    loaded = _run('import sys, dgl; dgl.data; dgl.distributed; print(*[m for m in {} '
+                  'if m in sys.modules])'.format(LAZY_MODULES))
+    assert 'dgl.data' in loaded
+    assert 'dgl.distributed' in loaded
+    assert 'dgl.contrib' not in loaded
+
+    out = _run('import dgl; print(dgl.load_graphs is dgl.data.utils.load_graphs, '
+               'dgl.NodeFlow.__name__, "dataloading" in dir(dgl))')
+    assert out == ['True', 'NodeFlow', 'True']
+
+if __name__ == '__main__':
+    test_lazy_import()
@@ -99,6 +99,28 @@ def test_random_walk():
     check_random_walk(g4, metapath, traces[:, :7], ntypes[:7], 'p')
     assert (F.asnumpy(traces[:, 7]) == -1).all()
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU random walk not implemented")
+def test_node2vec_random_walk():
+    g = dgl.graph(([0, 1, 1, 2, 2, 3, 3, 4], [1, 0, 2, 1, 3, 2, 4, 3]))
+    traces = dgl.sampling.node2vec_random_walk(g, [0, 1, 2, 3, 4] * 4, 1, 1, walk_length=6)
+    check_random_walk(g, ['_E'] * 6, traces, F.zeros((7,), F.int64, F.cpu()))
+
+    # a tiny p always returns to the previous node
+    traces = F.asnumpy(dgl.sampling.node2vec_random_walk(g, [2] * 10, 1e-6, 1, walk_length=6))
+    assert np.all(traces[:, 2:] == traces[:, :-2])
+    # a tiny q never returns unless there is no other choice
+    traces = F.asnumpy(dgl.sampling.node2vec_random_walk(g, [2] * 10, 1, 1e-6, walk_length=2))
+    assert np.all(traces[:, 2] != traces[:, 0])
+
+    g.edata['p'] = F.tensor([1., 1., 0., 1., 1., 1., 1., 1.], dtype=F.float32)
+    traces = F.asnumpy(dgl.sampling.node2vec_random_walk(g, [1] * 10, 1, 1, 1, prob='p'))
+    assert np.all(traces[:, 1] == 0)
+
+    # dead ends are padded with -1
+    g = dgl.graph(([0, 1], [1, 2]), num_nodes=3)
+    traces = F.asnumpy(dgl.sampling.node2vec_random_walk(g, [0], 1, 1, walk_length=4))
+    assert traces.tolist() == [[0, 1, 2, -1, -1]]
+
 @unittest.skipIf(F._default_context_str == 'gpu', reason="GPU pack traces not implemented")
 def test_pack_traces():
     traces, types = (np.array(
@@ -144,6 +166,19 @@ def test_pinsage_sampling():
     sampler = dgl.sampling.RandomWalkNeighborSampler(g, 4, 0.5, 3, 2, ['AB', 'BC', 'CA'])
     _test_sampler(g, sampler, 'A')
 
+    # visit counts are accumulated over all walks and ties are broken by node ID
+    g = dgl.graph(([0, 1, 2], [1, 0, 0]))
+    def _edges_with_counts(neighbor_g):
+        u, v = neighbor_g.all_edges(form='uv', order='eid')
+        return sorted(zip(F.asnumpy(u).tolist(), F.asnumpy(v).tolist(),
+                          F.asnumpy(neighbor_g.edata['weights']).tolist()))
+    sampler = dgl.sampling.RandomWalkNeighborSampler(g, 3, 0., 5, 2)
+    neighbor_g = sampler(F.tensor([0, 2, 2], dtype=F.int64))
+    assert _edges_with_counts(neighbor_g) == [(0, 0, 5), (0, 2, 10), (1, 0, 10), (1, 2, 5)]
+    sampler = dgl.sampling.RandomWalkNeighborSampler(g, 2, 0., 5, 1)
+    neighbor_g = sampler(F.tensor([0, 2], dtype=F.int64))
+    assert _edges_with_counts(neighbor_g) == [(0, 0, 5), (0, 2, 5)]
+
 def _gen_neighbor_sampling_test_graph(hypersparse, reverse):
     if hypersparse:
         # should crash if allocated a CSR
@@ -560,8 +595,189 @@ def test_sample_neighbors_with_0deg():
     sg = dgl.sampling.sample_neighbors(g, F.tensor([1, 2], dtype=F.int64), 2, edge_dir='out', replace=True)
     assert sg.number_of_edges() == 0
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_sample_neighbors_alias_table():
+    g = dgl.graph(([1, 2, 3, 4, 1, 2, 3, 4, 0], [0, 0, 0, 0, 5, 5, 5, 5, 1]))
+    g.edata['p'] = F.tensor([1., 0., 3., 0., 0., 0., 0., 0., 1.], dtype=F.float32)
+
+    sg = dgl.sampling.sample_neighbors(g, [0], 1000, prob='p', replace=True)
+    src = F.asnumpy(sg.edges()[0])
+    assert set(np.unique(src)) == {1, 3}
+    assert 2 < (src == 3).sum() / (src == 1).sum() < 4.5
+    sg = dgl.sampling.sample_neighbors(g, [0], 2, prob='p', replace=False)
+    assert sorted(F.asnumpy(sg.edges()[0])) == [1, 3]
+    # rows with zero total probability are sampled uniformly
+    sg = dgl.sampling.sample_neighbors(g, [5], 1000, prob='p', replace=True)
+    assert len(np.unique(F.asnumpy(sg.edges()[0]))) == 4
+
+    # the alias tables are cached until the probability tensor is replaced
+    from dgl.sampling.utils import get_alias_tables
+    tables = get_alias_tables(g, 'p', 'in')
+    assert get_alias_tables(g, 'p', 'in')[0][0] is tables[0][0]
+    g.edata['p'] = F.tensor([0., 0., 1., 0., 0., 0., 0., 0., 1.], dtype=F.float32)
+    assert get_alias_tables(g, 'p', 'in')[0][0] is not tables[0][0]
+    sg = dgl.sampling.sample_neighbors(g, [0], 100, prob='p', replace=True)
+    assert set(np.unique(F.asnumpy(sg.edges()[0]))) == {3}
+    traces, _ = dgl.sampling.random_walk(g, [3] * 100, length=1, prob='p')
+    assert np.all(F.asnumpy(traces)[:, 1] == 0)
+    if F.backend_name == 'pytorch':
+        # in-place updates are detected by the version counter of the tensor
+        g.edata['p'][2] = 0.
+        g.edata['p'][0] = 1.
+        sg = dgl.sampling.sample_neighbors(g, [0], 100, prob='p', replace=True)
+        assert set(np.unique(F.asnumpy(sg.edges()[0]))) == {1}
+
+def _check_blocks(g, blocks, seeds):
+    for block in reversed(blocks):
+        for ntype in g.ntypes:
+            dst = F.asnumpy(block.dstnodes[ntype].data[dgl.NID])
+            src = F.asnumpy(block.srcnodes[ntype].data[dgl.NID])
+            assert np.array_equal(dst, F.asnumpy(seeds[ntype]))
+            # output nodes come first among the input nodes, without duplicates
+            assert np.array_equal(src[:len(dst)], dst)
+            assert len(np.unique(src)) == len(src)
+        for etype in g.canonical_etypes:
+            u, v = block.edges(etype=etype)
+            eid = F.asnumpy(block.edges[etype].data[dgl.EID])
+            gu, gv = g.find_edges(eid, etype=etype)
+            srcnid = F.asnumpy(block.srcnodes[etype[0]].data[dgl.NID])
+            dstnid = F.asnumpy(block.dstnodes[etype[2]].data[dgl.NID])
+            assert np.array_equal(srcnid[F.asnumpy(u)], F.asnumpy(gu))
+            assert np.array_equal(dstnid[F.asnumpy(v)], F.asnumpy(gv))
+        seeds = {ntype: block.srcnodes[ntype].data[dgl.NID] for ntype in g.ntypes}
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_sample_neighbor_blocks():
+    g = dgl.heterograph({
+        ('user', 'follow', 'user'): ([0, 1, 2, 3, 3], [1, 2, 3, 0, 1]),
+        ('user', 'plays', 'game'): ([0, 1, 2, 3], [0, 0, 1, 1]),
+        ('game', 'played-by', 'user'): ([0, 0, 1, 1], [0, 1, 2, 3])})
+    g.nodes['user'].data['h'] = F.arange(0, 4)
+    seeds = {'user': F.tensor([1, 3], dtype=g.idtype), 'game': F.tensor([], dtype=g.idtype)}
+    blocks = dgl.sampling.sample_neighbor_blocks(
+        g, seeds, [-1, {'follow': 1, 'plays': 1, 'played-by': 1}])
+    assert len(blocks) == 2
+    _check_blocks(g, blocks, seeds)
+    assert blocks[1].number_of_edges('follow') == 2
+    assert blocks[1].number_of_edges('played-by') == 2
+    assert F.array_equal(blocks[0].srcnodes['user'].data['h'],
+                         F.astype(blocks[0].srcnodes['user'].data[dgl.NID], F.int64))
+
+    # full neighbors match in_subgraph and to_block
+    frontier = dgl.in_subgraph(g, seeds)
+    block = dgl.to_block(frontier, seeds)
+    fused = dgl.sampling.sample_neighbor_blocks(g, seeds, [-1])[0]
+    for ntype in g.ntypes:
+        assert F.array_equal(fused.srcnodes[ntype].data[dgl.NID],
+                             block.srcnodes[ntype].data[dgl.NID])
+    for etype in g.canonical_etypes:
+        assert F.array_equal(fused.edges[etype].data[dgl.EID],
+                             frontier.edges[etype].data[dgl.EID][block.edges[etype].data[dgl.EID]])
+
+    # large enough to relabel the nodes in parallel (more than 1 << 16 IDs)
+    g = dgl.rand_graph(20000, 300000)
+    seeds = {'_N': F.arange(0, 20000)}
+    num_threads = dgl.utils.get_num_threads()
+    dgl.utils.set_num_threads(4)
+    try:
+        blocks = dgl.sampling.sample_neighbor_blocks(g, seeds['_N'], [-1, 10], replace=True)
+        _check_blocks(g, blocks, seeds)
+        fused = dgl.sampling.sample_neighbor_blocks(g, seeds['_N'], [-1])[0]
+        # the serial relabeling is used with a single thread
+        dgl.utils.set_num_threads(1)
+        frontier = dgl.in_subgraph(g, seeds)
+        block = dgl.to_block(frontier, seeds)
+    finally:
+        dgl.utils.set_num_threads(num_threads)
+    assert F.array_equal(fused.srcdata[dgl.NID], block.srcdata[dgl.NID])
+    assert F.array_equal(fused.dstdata[dgl.NID], block.dstdata[dgl.NID])
+    assert F.array_equal(fused.edata[dgl.EID], frontier.edata[dgl.EID][block.edata[dgl.EID]])
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_deterministic_sampling():
+    g = dgl.rand_graph(1000, 20000)
+    seeds = F.arange(0, 100)
+
+    def _sample(seeds):
+        dgl.seed(42)
+        sg = dgl.sampling.sample_neighbors(g, seeds, 5)
+        traces, _ = dgl.sampling.random_walk(g, seeds, length=4)
+        neg = dgl.dataloading.negative_sampler.Uniform(3)(g, seeds)
+        # drawn from the stream of the calling thread after the keyed kernels
+        after = dgl.random.choice(1000, 10)
+        src, dst = sg.edges()
+        order = np.lexsort((F.asnumpy(src), F.asnumpy(dst)))
+        return (F.asnumpy(src)[order], F.asnumpy(dst)[order],
+                F.asnumpy(traces), F.asnumpy(neg[1]), F.asnumpy(after))
+
+    orig_num_threads = dgl.utils.get_num_threads()
+    dgl.random.set_deterministic(True)
+    try:
+        assert dgl.random.is_deterministic()
+        first = _sample(seeds)
+        second = _sample(seeds)
+        for a, b in zip(first, second):
+            assert np.array_equal(a, b)
+        # the neighbors of a node do not depend on the other seed nodes
+        src, dst, _, neg, _ = _sample(F.arange(0, 50))
+        assert np.array_equal(src, first[0][first[1] < 50])
+        assert np.array_equal(neg, first[3][:150])
+        # nor on the number of threads
+        for num_threads in [1, 4]:
+            dgl.utils.set_num_threads(num_threads)
+            for a, b in zip(first, _sample(seeds)):
+                assert np.array_equal(a, b)
+    finally:
+        dgl.utils.set_num_threads(orig_num_threads)
+        dgl.random.set_deterministic(False)
+    assert not dgl.random.is_deterministic()
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU negative sampling not implemented")
+def test_sample_negative_edges():
+    g = dgl.graph(([0, 0, 1, 2, 3, 3], [1, 2, 2, 3, 1, 2]))
+    eids = F.tensor([0, 2, 3, 5], dtype=g.idtype)
+    src, dst = dgl.sampling.sample_negative_edges(g, eids, 100)
+    assert np.array_equal(F.asnumpy(src), np.repeat([0, 1, 2, 3], 100))
+    assert set(np.unique(F.asnumpy(dst))) == {0, 1, 2, 3}
+
+    # in-degrees are [0, 2, 3, 1], so node 0 is never drawn
+    src, dst = dgl.sampling.sample_negative_edges(g, eids, 2000, power=0.75)
+    counts = np.bincount(F.asnumpy(dst), minlength=4)
+    assert counts[0] == 0
+    assert counts[2] > counts[1] > counts[3]
+
+    src, dst = dgl.sampling.sample_negative_edges(
+        g, eids, 50, power=0.75, exclude_positive=True)
+    for u, v in zip(F.asnumpy(src), F.asnumpy(dst)):
+        assert not g.has_edges_between(u, v)
+
+    # corrupting the sources draws from the nodes with out-edges
+    src, dst = dgl.sampling.sample_negative_edges(
+        g, eids, 50, power=1., corrupt='src', exclude_positive=True)
+    # out-degrees are [2, 1, 1, 2]
+    assert np.array_equal(F.asnumpy(dst), np.repeat([1, 2, 3, 2], 50))
+    assert set(np.unique(F.asnumpy(src))) <= {0, 1, 2, 3}
+    for u, v in zip(F.asnumpy(src), F.asnumpy(dst)):
+        assert not g.has_edges_between(u, v)
+
+    # chunks share the negative nodes
+    src, dst = dgl.sampling.sample_negative_edges(g, eids, 3, chunk_size=2)
+    dst = F.asnumpy(dst).reshape(4, 3)
+    assert np.array_equal(dst[0], dst[1]) and np.array_equal(dst[2], dst[3])
+    src, dst = dgl.sampling.sample_negative_edges(
+        g, eids, 3, chunk_size=2, exclude_positive=True)
+    assert F.shape(src)[0] == F.shape(dst)[0] <= 12
+    for u, v in zip(F.asnumpy(src), F.asnumpy(dst)):
+        assert not g.has_edges_between(u, v)
+
+    neg_sampler = dgl.dataloading.negative_sampler.Unigram(5, exclude_positive=True)
+    src, dst = neg_sampler(g, eids)
+    assert F.shape(src)[0] == 20
+    assert np.all(F.asnumpy(dst) != 0)
+
 if __name__ == '__main__':
     test_random_walk()
+    test_node2vec_random_walk()
     test_pack_traces()
     test_pinsage_sampling()
     test_sample_neighbors()
@@ -569,3 +785,7 @@ if __name__ == '__main__':
     test_sample_neighbors_topk()
     test_sample_neighbors_topk_outedge()
     test_sample_neighbors_with_0deg()
+    test_sample_neighbors_alias_table()
+    test_sample_neighbor_blocks()
+    test_deterministic_sampling()
+    test_sample_negative_edges()
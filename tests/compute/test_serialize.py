@@ -335,6 +335,173 @@ def test_serialize_heterograph_s3():
     assert np.allclose(F.asnumpy(edges[1]), np.array([1, 2, 3]))
 
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
+def test_graph_serialize_append():
+    g_list = construct_graph(6, True)
+    labels = {"label": F.arange(0, 6)}
+
+    # create a temporary file and immediately release it so DGL can open it.
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+
+    dgl.save_graphs(path, g_list[:3], {"label": labels["label"][:3]})
+    size = os.path.getsize(path)
+    dgl.save_graphs(path, g_list[3:5], {"label": labels["label"][3:5]}, append=True)
+    dgl.save_graphs(path, g_list[5], {"label": labels["label"][5:]}, append=True)
+    assert os.path.getsize(path) > size
+
+    load_g_list, load_label_dict = dgl.load_graphs(path)
+    assert len(load_g_list) == 6
+    assert F.array_equal(load_label_dict["label"], labels["label"])
+    for g, load_g in zip(g_list, load_g_list):
+        assert F.array_equal(g.edges()[0], load_g.edges()[0])
+        assert F.array_equal(g.edges()[1], load_g.edges()[1])
+        assert F.allclose(g.ndata['n1'], load_g.ndata['n1'])
+        assert F.allclose(g.edata['e1'], load_g.edata['e1'])
+    load_g_list, _ = dgl.load_graphs(path, [4, 0])
+    assert F.allclose(load_g_list[0].ndata['n1'], g_list[4].ndata['n1'])
+    assert F.allclose(load_g_list[1].ndata['n1'], g_list[0].ndata['n1'])
+    assert F.array_equal(load_labels(path)["label"], labels["label"])
+
+    with pytest.raises(dgl.DGLError):
+        dgl.save_graphs(path, g_list[0], {"other": F.arange(0, 1)}, append=True)
+
+    os.unlink(path)
+
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
+def test_graph_serialize_interrupted_append():
+    import struct
+    g_list = construct_graph(6, True)
+    labels = {"label": F.arange(0, 6)}
+
+    # create a temporary file and immediately release it so DGL can open it.
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+
+    def check(num_graphs):
+        load_g_list, load_label_dict = dgl.load_graphs(path)
+        assert len(load_g_list) == num_graphs
+        assert F.array_equal(load_label_dict["label"], labels["label"][:num_graphs])
+        for g, load_g in zip(g_list, load_g_list):
+            assert F.array_equal(g.edges()[0], load_g.edges()[0])
+            assert F.allclose(g.ndata['n1'], load_g.ndata['n1'])
+
+    # The first append converts the metadata section before writing the data.
+    dgl.save_graphs(path, g_list[:3], {"label": labels["label"][:3]})
+    with open(path, 'rb') as fp:
+        data = fp.read()
+    magic, _, graph_type, num_graphs = struct.unpack('<4Q', data[:32])
+    index_size, = struct.unpack('<Q', data[-8:])
+    base_index_pos = len(data) - 8 - index_size
+    with open(path, 'r+b') as fp:
+        fp.write(struct.pack('<6Q', magic, 3, graph_type, num_graphs, 0, base_index_pos))
+        fp.seek(0, os.SEEK_END)
+        fp.write(b'\x01' * 100)
+    check(3)
+
+    dgl.save_graphs(path, g_list[3:5], {"label": labels["label"][3:5]}, append=True)
+    check(5)
+    with open(path, 'rb') as fp:
+        saved = fp.read()
+    # Cut an append short before the metadata section is updated.
+    dgl.save_graphs(path, g_list[5], {"label": labels["label"][5:]}, append=True)
+    with open(path, 'rb') as fp:
+        data = fp.read()
+    assert len(data) > len(saved) + 10
+    with open(path, 'wb') as fp:
+        fp.write(saved[:4096] + data[4096:len(saved) + 10])
+    check(5)
+
+    dgl.save_graphs(path, g_list[5], {"label": labels["label"][5:]}, append=True)
+    check(6)
+
+    os.unlink(path)
+
+
+def test_serialize_tensors_append():
+    # create a temporary file and immediately release it so DGL can open it.
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+
+    for indexed in [False, True]:
+        save_tensors(path, {"a": F.tensor([1, 3, -1, 0], dtype=F.int64)}, indexed=indexed)
+        save_tensors(path, {"b": F.tensor([1.5, 2], dtype=F.float32)}, append=True)
+        save_tensors(path, {"a": F.tensor([5, 6], dtype=F.int64),
+                            "c": F.zeros((2, 3), F.float32)}, append=True)
+
+        load_tensor_dict = load_tensors(path)
+        assert set(load_tensor_dict.keys()) == {"a", "b", "c"}
+        assert np.array_equal(F.asnumpy(load_tensor_dict["a"]), np.array([5, 6]))
+        assert np.array_equal(F.asnumpy(load_tensor_dict["b"]), np.array([1.5, 2]))
+        assert np.array_equal(F.asnumpy(load_tensor_dict["c"]), np.zeros((2, 3)))
+
+    os.unlink(path)
+
+
+def test_load_tensors_subset():
+    # create a temporary file and immediately release it so DGL can open it.
+    f = tempfile.NamedTemporaryFile(delete=False)
+    path = f.name
+    f.close()
+
+    tensor_dict = {"feat{}".format(i): F.randn((100, i + 1)) for i in range(10)}
+    for indexed in [False, True]:
+        save_tensors(path, tensor_dict, indexed=indexed)
+
+        for num_threads in [0, 1, 4]:
+            load_tensor_dict = load_tensors(path, num_threads=num_threads)
+            assert set(load_tensor_dict.keys()) == set(tensor_dict.keys())
+            for key, value in tensor_dict.items():
+                assert F.allclose(load_tensor_dict[key], value)
+
+        load_tensor_dict = load_tensors(path, keys=["feat7", "feat2"])
+        assert set(load_tensor_dict.keys()) == {"feat7", "feat2"}
+        assert F.allclose(load_tensor_dict["feat7"], tensor_dict["feat7"])
+        assert F.allclose(load_tensor_dict["feat2"], tensor_dict["feat2"])
+
+        with pytest.raises(Exception):
+            load_tensors(path, keys=["unknown"])
+
+    os.unlink(path)
+
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU not implemented")
+def test_mmap_graphs():
+    g_list = construct_graph(10, True)
+    labels = {"label": F.arange(0, 10), "y": F.randn((10, 3))}
+    with tempfile.TemporaryDirectory() as path:
+        # small chunks to exercise incremental writes
+        dgl.data.save_mmap_graphs(path, iter(g_list), labels, chunk_size=3)
+        dataset = dgl.data.MmapGraphDataset(path)
+        assert len(dataset) == 10
+        for i in [0, 4, -1]:
+            g, lbl = dataset[i]
+            g0 = g_list[i]
+            assert g.number_of_nodes() == g0.number_of_nodes()
+            assert F.array_equal(g.edges()[0], g0.edges()[0])
+            assert F.array_equal(g.edges()[1], g0.edges()[1])
+            assert F.allclose(g.ndata['n1'], g0.ndata['n1'])
+            assert F.allclose(g.edata['e1'], g0.edata['e1'])
+            assert F.asnumpy(lbl['label']) == F.asnumpy(labels['label'])[i]
+        for idx in [slice(2, 6), [7, 1, 3], F.tensor([5, 5])]:
+            bg, lbl = dataset[idx]
+            ids = np.arange(10)[idx] if isinstance(idx, slice) else \
+                F.asnumpy(F.tensor(idx))
+            expected = dgl.batch([g_list[i] for i in ids])
+            assert bg.batch_size == len(ids)
+            assert F.array_equal(bg.batch_num_nodes(), expected.batch_num_nodes())
+            assert F.array_equal(bg.batch_num_edges(), expected.batch_num_edges())
+            assert F.array_equal(bg.edges()[0], expected.edges()[0])
+            assert F.array_equal(bg.edges()[1], expected.edges()[1])
+            assert F.allclose(bg.ndata['n1'], expected.ndata['n1'])
+            assert F.allclose(bg.edata['e2'], expected.edata['e2'])
+            assert F.allclose(lbl['y'], F.gather_row(labels['y'], F.tensor(ids)))
+            assert len(dgl.unbatch(bg)) == len(ids)
+
 
 if __name__ == "__main__":
     pass
@@ -109,6 +109,52 @@ void start_server(int id) {
   receiver.Finalize();
 }
 
+const char* coalesce_addr = "socket://127.0.0.1:50094";
+const int kNumCoalesceMessage = 200;
+
+static string coalesce_message(int i) {
+  // messages of different sizes, some larger than a socket buffer
+  // every message is non-empty since an empty one signals the end of the stream
+  int64_t size = (i % 10 == 9) ? 100 * 1024 + i : i % 7 + 1;
+  return string(size, static_cast<char>('a' + i % 26));
+}
+
+static void start_coalesce_client() {
+  SocketSender sender(kQueueSize);
+  sender.AddReceiver(coalesce_addr, 0);
+  sender.Connect();
+  for (int i = 0; i < kNumCoalesceMessage; ++i) {
+    string str = coalesce_message(i);
+    char* str_data = new char[str.size() + 1];
+    memcpy(str_data, str.data(), str.size());
+    Message msg = {str_data, static_cast<int64_t>(str.size())};
+    msg.deallocator = DefaultMessageDeleter;
+    EXPECT_EQ(sender.Send(msg, 0), ADD_SUCCESS);
+  }
+  sender.Finalize();
+}
+
+static void start_coalesce_server() {
+  sleep(2);
+  SocketReceiver receiver(kQueueSize);
+  receiver.Wait(coalesce_addr, 1);
+  for (int i = 0; i < kNumCoalesceMessage; ++i) {
+    Message msg;
+    EXPECT_EQ(receiver.RecvFrom(&msg, 0), REMOVE_SUCCESS);
+    EXPECT_EQ(string(msg.data, msg.size), coalesce_message(i));
+    msg.deallocator(&msg);
+  }
+  receiver.Finalize();
+}
+
+TEST(SocketCommunicatorTest, SendCoalescedMessages) {
+  // queued messages are sent together, the receiver must see them in order
+  std::thread client_thread(start_coalesce_client);
+  std::thread server_thread(start_coalesce_server);
+  client_thread.join();
+  server_thread.join();
+}
+
 #else
 
 #include <windows.h>
@@ -1,7 +1,10 @@
 #include <gtest/gtest.h>
 #include <vector>
 #include <algorithm>
+#include <atomic>
 #include <iostream>
+#include <random>
+#include <thread>
 #include "./common.h"
 #include "../../src/random/cpu/sample_utils.h"
 
@@ -227,3 +230,38 @@ TEST(RandomTest, TestUniformChoice) {
   _TestUniformChoice<int32_t>(re);
   _TestUniformChoice<int64_t>(re);
 }
+
+TEST(RandomTest, TestConcurrentStreams) {
+  RandomEngine::SetGlobalSeed(42);
+  RandomEngine::SetDeterministic(true);
+  std::atomic<bool> done(false);
+  // Keyed kernel calls from another host thread must not switch the generators
+  // of this one back to their own streams.
+  std::thread other([&done]() {
+    while (!done) {
+      RandomEngine::StreamGuard stream_guard(RandomEngine::NewStream());
+      RandomEngine::ThreadLocal()->SetStream(stream_guard, 0);
+      RandomEngine::ThreadLocal()->RandInt<int64_t>(100);
+    }
+  });
+  const int64_t stream = RandomEngine::NewStream();
+  int64_t num_mismatches = 0;
+  {
+    RandomEngine::StreamGuard stream_guard(stream);
+    RandomEngine* re = RandomEngine::ThreadLocal();
+    for (uint64_t item = 0; item < 100; ++item) {
+      re->SetStream(stream_guard, item);
+      PhiloxEngine expected;
+      expected.Reset(42, static_cast<uint32_t>(stream), item);
+      for (int i = 0; i < 1000; ++i) {
+        if (re->RandInt<int64_t>(1000000) !=
+            std::uniform_int_distribution<int64_t>(0, 999999)(expected))
+          ++num_mismatches;
+      }
+    }
+  }
+  done = true;
+  other.join();
+  RandomEngine::SetDeterministic(false);
+  ASSERT_EQ(num_mismatches, 0);
+}
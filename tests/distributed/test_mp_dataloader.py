@@ -240,6 +240,43 @@ def test_dataloader(tmpdir, num_server, num_workers, dataloader_type):
     for p in ptrainer_list:
         p.join()
 
+class _LocalPartitionGraph(object):
+    def __init__(self, local_partition, gpb):
+        self.local_partition = local_partition
+        self.gpb = gpb
+
+    def get_partition_book(self):
+        return self.gpb
+
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+@pytest.mark.parametrize("reshuffle", [True, False])
+def test_group_by_locality(tmpdir, reshuffle):
+    from dgl.distributed.dist_dataloader import _group_by_locality, _shuffle_batches
+    g = CitationGraphDataset("cora")[0]
+    partition_graph(g, 'test_locality', 2, tmpdir,
+                    num_hops=1, part_method='metis', reshuffle=reshuffle)
+    part_g, _, _, gpb, _ = load_partition(tmpdir / 'test_locality.json', 0)
+
+    nodes = np.random.permutation(g.number_of_nodes())
+    grouped = _group_by_locality(_LocalPartitionGraph(part_g, gpb), F.tensor(nodes))
+    assert np.array_equal(np.sort(grouped), np.arange(g.number_of_nodes()))
+    # Seeds in the local partition come first.
+    partids = F.asnumpy(gpb.nid2partid(F.tensor(grouped)))
+    num_local = np.sum(partids == 0)
+    assert np.all(partids[:num_local] == 0)
+    assert np.all(partids[num_local:] == 1)
+
+    # Without a local partition the seeds are not reordered.
+    grouped = _group_by_locality(_LocalPartitionGraph(None, gpb), F.tensor(nodes))
+    assert np.array_equal(grouped, nodes)
+
+    shuffled = _shuffle_batches(np.arange(10), 3)
+    assert np.array_equal(np.sort(shuffled), np.arange(10))
+    assert shuffled[-1] == 9
+    for i in range(3):
+        assert shuffled[i * 3] % 3 == 0
+        assert np.array_equal(shuffled[i * 3:i * 3 + 3], np.arange(3) + shuffled[i * 3])
+
 if __name__ == "__main__":
     import tempfile
     with tempfile.TemporaryDirectory() as tmpdirname:
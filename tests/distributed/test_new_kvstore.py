@@ -76,6 +76,7 @@ data_0_2 = F.tensor([1,2,3,4,5,6], F.int32)
 data_0_3 = F.tensor([1,2,3,4,5,6], F.int64)
 data_1 = F.tensor([[2.,2.],[2.,2.],[2.,2.],[2.,2.],[2.,2.],[2.,2.],[2.,2.]], F.float32)
 data_2 = F.tensor([[0.,0.],[0.,0.],[0.,0.],[0.,0.],[0.,0.],[0.,0.]], F.float32)
+halo_nid = F.tensor([1,4], F.int64)
 
 def init_zero_func(shape, dtype):
     return F.zeros(shape, dtype, F.cpu())
@@ -100,9 +101,25 @@ def test_partition_policy():
     eid_partid = edge_policy.to_partid(F.tensor([0,1,2,3,4,5,6], F.int64))
     assert_array_equal(F.asnumpy(nid_partid), F.asnumpy(F.tensor([0,0,0,0,0,0], F.int64)))
     assert_array_equal(F.asnumpy(eid_partid), F.asnumpy(F.tensor([0,0,0,0,0,0,0], F.int64)))
+    nid_partid, local_nid = node_policy.to_partid_and_local(F.tensor([0,1,2,3,4,5], F.int64))
+    eid_partid, local_eid = edge_policy.to_partid_and_local(F.tensor([0,1,2,3,4,5,6], F.int64))
+    assert_array_equal(F.asnumpy(nid_partid), F.asnumpy(F.tensor([0,0,0,0,0,0], F.int64)))
+    assert_array_equal(F.asnumpy(eid_partid), F.asnumpy(F.tensor([0,0,0,0,0,0,0], F.int64)))
+    assert_array_equal(F.asnumpy(local_nid), F.asnumpy(F.tensor([0,1,2,3,4,5], F.int64)))
+    assert_array_equal(F.asnumpy(local_eid), F.asnumpy(F.tensor([0,1,2,3,4,5,6], F.int64)))
     assert node_policy.get_part_size() == len(node_map)
     assert edge_policy.get_part_size() == len(edge_map)
 
+def test_halo_cache():
+    ids = F.tensor([7, 3, 9], F.int64)
+    data = F.tensor([[7., 7.], [3., 3.], [9., 9.]], F.float32)
+    cache = dgl.distributed.kvstore.HaloCache(ids, data)
+    hit, rows = cache.lookup(F.tensor([3, 4, 9, 10, 7], F.int64))
+    assert_array_equal(hit, np.array([0, 2, 4]))
+    assert_array_equal(F.asnumpy(rows), np.array([[3., 3.], [9., 9.], [7., 7.]], np.float32))
+    hit, _ = cache.lookup(F.tensor([0, 1], F.int64))
+    assert len(hit) == 0
+
 def start_server(server_id, num_clients, num_servers):
     # Init kvserver
     print("Sleep 5 seconds to test client re-connect.")
@@ -123,6 +140,8 @@ def start_server(server_id, num_clients, num_servers):
         kvserver.init_data('data_0_1', 'node', data_0_1)
         kvserver.init_data('data_0_2', 'node', data_0_2)
         kvserver.init_data('data_0_3', 'node', data_0_3)
+        # Replicate some rows to exercise the HALO cache with backup servers.
+        kvserver.init_halo_data('data_0_1', halo_nid, F.gather_row(data_0_1, halo_nid))
     # start server
     server_state = dgl.distributed.ServerState(kv_store=kvserver, local_g=None, partition_book=None)
     dgl.distributed.start_server(server_id=server_id,
@@ -158,6 +177,10 @@ def start_client(num_clients, num_servers):
     kvclient = dgl.distributed.KVClient(ip_config='kv_ip_config.txt', num_servers=num_servers)
     kvclient.map_shared_data(partition_book=gpb)
     assert dgl.distributed.get_num_client() == num_clients
+    # The replicated HALO rows are mapped even with backup servers.
+    assert 'data_0_1' in kvclient._halo_cache
+    res = kvclient.pull(name='data_0_1', id_tensor=F.tensor([0,1,2,4], F.int64))
+    assert_array_equal(F.asnumpy(res), np.array([1.,2.,3.,5.], np.float32))
     kvclient.init_data(name='data_1', 
                        shape=F.shape(data_1), 
                        dtype=F.dtype(data_1), 
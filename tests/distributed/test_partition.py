@@ -6,9 +6,11 @@ from scipy import sparse as spsp
 from numpy.testing import assert_array_equal
 from dgl.heterograph_index import create_unitgraph_from_coo
 from dgl.distributed import partition_graph, load_partition
+from dgl.distributed.partition import load_partition_halo_feats
 from dgl import function as fn
 import backend as F
 import unittest
+import pytest
 import pickle
 import random
 
@@ -49,6 +51,21 @@ def check_partition(g, part_method, reshuffle):
         assert F.dtype(local_eid) in (F.int64, F.int32)
         assert np.all(F.asnumpy(local_eid) == np.arange(0, len(local_eid)))
 
+        # Check the one-pass translation to partition IDs and local IDs.
+        nids = part_g.ndata[dgl.NID]
+        partid, local_nid = gpb.map_nids(nids)
+        assert np.all(F.asnumpy(partid) == F.asnumpy(gpb.nid2partid(nids)))
+        inner = F.asnumpy(partid) == i
+        assert np.all(inner == F.asnumpy(part_g.ndata['inner_node']).astype(bool))
+        assert np.all(F.asnumpy(local_nid)[inner] == np.arange(0, np.sum(inner)))
+        assert np.all(F.asnumpy(local_nid)[~inner] == -1)
+        eids = F.boolean_mask(part_g.edata[dgl.EID], part_g.edata['inner_edge'])
+        partid, local_eid = gpb.map_eids(eids)
+        assert np.all(F.asnumpy(partid) == i)
+        assert np.all(F.asnumpy(local_eid) == np.arange(0, len(local_eid)))
+        with pytest.raises(dgl.DGLError):
+            gpb.map_nids(F.tensor([g.number_of_nodes()], F.int64))
+
         # Check the node map.
         local_nodes = F.boolean_mask(part_g.ndata[dgl.NID], part_g.ndata['inner_node'])
         llocal_nodes = F.nonzero_1d(part_g.ndata['inner_node'])
@@ -87,6 +104,17 @@ def check_partition(g, part_method, reshuffle):
             assert edge_feats[name].shape[0] == len(local_edges)
             assert np.all(F.asnumpy(g.edata[name])[F.asnumpy(local_edges)] == F.asnumpy(edge_feats[name]))
 
+        # Load only some of the features.
+        _, node_feats1, edge_feats1, _, _ = load_partition('/tmp/partition/test.json', i,
+                                                           node_feat_keys=['feats'],
+                                                           edge_feat_keys=['feats'],
+                                                           num_threads=2)
+        assert list(node_feats1.keys()) == ['feats']
+        assert np.all(F.asnumpy(g.ndata['feats'])[F.asnumpy(local_nodes)] ==
+                      F.asnumpy(node_feats1['feats']))
+        assert list(edge_feats1.keys()) == ['feats']
+        assert np.all(F.asnumpy(edge_feats['feats']) == F.asnumpy(edge_feats1['feats']))
+
     if reshuffle:
         node_map = []
         edge_map = []
@@ -118,8 +146,36 @@ def test_hetero_partition():
     check_partition(g, 'random', True)
     check_partition(g, 'random', False)
 
+def check_partition_halo_feats(g, reshuffle):
+    g.ndata['feats'] = F.tensor(np.random.randn(g.number_of_nodes(), 10), F.float32)
+    num_parts = 4
+    partition_graph(g, 'test', num_parts, '/tmp/partition', num_hops=1,
+                    part_method='metis', reshuffle=reshuffle, cache_halo_feats=True)
+    for i in range(num_parts):
+        part_g, node_feats, _, gpb, _ = load_partition('/tmp/partition/test.json', i)
+        halo_feats = load_partition_halo_feats('/tmp/partition/test.json', i)
+        assert 'feats' in halo_feats
+        ndata_name = 'orig_id' if reshuffle else dgl.NID
+        halo_nodes = F.boolean_mask(part_g.ndata[ndata_name], part_g.ndata['inner_node'] == 0)
+        assert halo_feats['feats'].shape[0] == len(halo_nodes)
+        assert np.all(F.asnumpy(g.ndata['feats'])[F.asnumpy(halo_nodes)] ==
+                      F.asnumpy(halo_feats['feats']))
+        # HALO nodes belong to other partitions.
+        halo_nids = F.boolean_mask(part_g.ndata[dgl.NID], part_g.ndata['inner_node'] == 0)
+        assert np.all(F.asnumpy(gpb.nid2partid(halo_nids)) != i)
+
+    partition_graph(g, 'test', num_parts, '/tmp/partition', num_hops=1,
+                    part_method='metis', reshuffle=reshuffle)
+    assert load_partition_halo_feats('/tmp/partition/test.json', 0) is None
+
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+def test_partition_halo_feats():
+    g = create_random_graph(10000)
+    check_partition_halo_feats(g, True)
+    check_partition_halo_feats(g, False)
 
 if __name__ == '__main__':
     os.makedirs('/tmp/partition', exist_ok=True)
     test_partition()
     test_hetero_partition()
+    test_partition_halo_feats()
@@ -1,4 +1,5 @@
 import os
+import json
 import time
 import socket
 
@@ -187,6 +188,37 @@ def test_rpc_msg():
     assert len(rpcmsg.tensors) == 1
     assert F.array_equal(rpcmsg.tensors[0], req.z)
 
+def test_rpc_tracer(tmpdir):
+    from dgl.distributed.rpc_trace import payload_nbytes
+    tracer = dgl.distributed.enable_tracing()
+    assert dgl.distributed.get_tracer() is tracer
+    tracer.record('MyRequest', 'serialize', 0., 3.)
+    tracer.record('MyRequest', 'serialize', 10., 1034.)
+    tracer.begin_call(7, 'MyRequest')
+    tracer.end_call(7)
+    tracer.end_call(8)  # unknown calls are ignored
+    req = MyRequest()
+    data, tensors = dgl.distributed.rpc.serialize_to_payload(req)
+    assert payload_nbytes(data, tensors) == len(data) + 3 * 4 * 4
+    tracer.count_bytes('MyRequest', 'sent', 100)
+    tracer.count_bytes('MyRequest', 'recv', 20)
+    stats = tracer.stats()['MyRequest']
+    assert stats['serialize']['count'] == 2
+    assert stats['serialize']['total_us'] == 1027.
+    assert stats['serialize']['max_us'] == 1024.
+    assert stats['serialize']['histogram'][2] == 1
+    assert stats['serialize']['histogram'][11] == 1
+    assert stats['roundtrip']['count'] == 1
+    assert stats['bytes'] == {'sent': 100, 'recv': 20}
+    path = os.path.join(str(tmpdir), 'trace.json')
+    tracer.dump_chrome_trace(path)
+    with open(path) as f:
+        trace = json.load(f)
+    assert len(trace['traceEvents']) == 4
+    assert trace['otherData']['stats']['MyRequest']['bytes']['sent'] == 100
+    assert dgl.distributed.disable_tracing() is tracer
+    assert dgl.distributed.get_tracer() is None
+
 @unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
 def test_rpc():
     os.environ['DGL_DIST_MODE'] = 'distributed'
@@ -227,5 +259,6 @@ def test_multi_client():
 if __name__ == '__main__':
     test_serialize()
     test_rpc_msg()
+    test_rpc_tracer('/tmp')
     test_rpc()
     test_multi_client()
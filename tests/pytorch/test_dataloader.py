@@ -1,7 +1,9 @@
 import dgl
 import backend as F
 import numpy as np
+import os
 import unittest
+import pytest
 from torch.utils.data import DataLoader
 from collections import defaultdict
 from itertools import product
@@ -208,6 +210,217 @@ def test_neighbor_sampler_dataloader():
             collator.dataset, collate_fn=collator.collate, batch_size=2, shuffle=True, drop_last=False)
         _check_neighbor_sampling_dataloader(_g, nid, dl, mode, collator)
 
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_layerwise_sampler_dataloader():
+    g = dgl.rand_graph(100, 1000)
+    g.edata['a'] = F.uniform((1000,), F.float32, F.cpu(), 0.1, 1)
+    seeds = F.arange(0, 20)
+    for sampler in [dgl.dataloading.FastGCNSampler([30, 30], return_eids=True),
+                    dgl.dataloading.LADIESSampler([30, 30], return_eids=True),
+                    dgl.dataloading.LADIESSampler([30, 30], edge_weight='a', return_eids=True)]:
+        blocks = sampler.sample_blocks(g, seeds)
+        assert len(blocks) == 2
+        assert F.array_equal(blocks[-1].dstdata[dgl.NID], seeds)
+        for block in blocks:
+            # at most ``budget`` distinct input nodes besides the output nodes
+            assert block.number_of_src_nodes() <= block.number_of_dst_nodes() + 30
+            src, dst = block.edges()
+            eid = block.edata[dgl.EID]
+            u, v = g.find_edges(eid)
+            assert F.array_equal(F.gather_row(block.srcdata[dgl.NID], src), u)
+            assert F.array_equal(F.gather_row(block.dstdata[dgl.NID], dst), v)
+            w = F.asnumpy(block.edata['w'])
+            assert np.all(w > 0)
+            if isinstance(sampler, dgl.dataloading.LADIESSampler):
+                w_sum = np.bincount(F.asnumpy(dst), weights=w, minlength=block.number_of_dst_nodes())
+                has_edge = F.asnumpy(block.in_degrees()) > 0
+                assert np.allclose(w_sum[has_edge], 1, rtol=1e-4)
+
+    # the importance weights of FastGCN are unbiased estimates of mean aggregation
+    g = dgl.graph(([1, 2, 3, 3], [0, 0, 0, 1]), num_nodes=4)
+    sampler = dgl.dataloading.FastGCNSampler([2])
+    w_sum = np.zeros(4)
+    num_trials = 2000
+    for _ in range(num_trials):
+        frontier = sampler.sample_frontier(0, g, F.tensor([0], dtype=F.int64))
+        w_sum[F.asnumpy(frontier.edata[dgl.EID])] += F.asnumpy(frontier.edata['w'])
+    assert np.allclose(w_sum[:3] / num_trials, 1. / 3, atol=0.1)
+
+    hg = dgl.heterograph({
+        ('user', 'follow', 'user'): ([0, 1], [1, 2]),
+        ('user', 'play', 'game'): ([0, 1], [0, 1])})
+    with pytest.raises(dgl.DGLError):
+        dgl.dataloading.LADIESSampler([2]).sample_frontier(0, hg, {'user': F.tensor([0])})
+
+@unittest.skipIf(os.name == 'nt', reason='Do not support windows yet')
+@unittest.skipIf(F._default_context_str == 'gpu', reason="METIS doesn't support GPU")
+def test_cluster_gcn_dataloader(tmpdir):
+    g = dgl.to_bidirected(dgl.rand_graph(1000, 5000))
+    g.ndata['feat'] = F.randn((1000, 4))
+    cache_path = os.path.join(str(tmpdir), 'partition.npz')
+    sampler = dgl.dataloading.ClusterGCNSampler(10, cache_path)
+    dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler, batch_size=3, shuffle=True)
+    assert len(dataloader) == 4
+    nids = []
+    for subg in dataloader:
+        nid = subg.ndata[dgl.NID]
+        nids.append(F.asnumpy(nid))
+        assert F.array_equal(subg.ndata['feat'], F.gather_row(g.ndata['feat'], nid))
+    # every node is in exactly one cluster
+    assert np.array_equal(np.sort(np.concatenate(nids)), np.arange(1000))
+
+    # the partition assignment is loaded from disk by another sampler
+    assert os.path.exists(cache_path)
+    with np.load(cache_path) as data:
+        assignment = data['assignment']
+    sampler2 = dgl.dataloading.ClusterGCNSampler(10, cache_path)
+    sampler2.prepare(dgl.graph(g.edges()))
+    assert np.array_equal(sampler2.partition_nodes, np.argsort(assignment, kind='stable'))
+
+    # the assignment is recomputed for other settings or another graph
+    mtime = os.path.getmtime(cache_path)
+    for sampler3, g3 in [
+            (dgl.dataloading.ClusterGCNSampler(5, cache_path), dgl.graph(g.edges())),
+            (dgl.dataloading.ClusterGCNSampler(10, cache_path, balance_edges=True),
+             dgl.graph(g.edges())),
+            (dgl.dataloading.ClusterGCNSampler(10, cache_path),
+             dgl.to_bidirected(dgl.rand_graph(1000, 4000)))]:
+        os.utime(cache_path, (mtime - 10, mtime - 10))
+        sampler3.prepare(g3)
+        assert os.path.getmtime(cache_path) > mtime - 10
+        with np.load(cache_path) as data:
+            assert int(data['num_partitions']) == sampler3.num_partitions
+            assert bool(data['balance_edges']) == sampler3.balance_edges
+        mtime = os.path.getmtime(cache_path)
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_graphsaint_dataloader():
+    g = dgl.rand_graph(200, 2000)
+    g.ndata['feat'] = F.randn((200, 4))
+    for sampler in [dgl.dataloading.GraphSAINTNodeSampler(50, 5),
+                    dgl.dataloading.GraphSAINTEdgeSampler(30, 5),
+                    dgl.dataloading.GraphSAINTRandomWalkSampler(20, 2, 5)]:
+        dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler)
+        assert len(dataloader) == 5
+        for subg in dataloader:
+            nid = subg.ndata[dgl.NID]
+            eid = subg.edata[dgl.EID]
+            assert F.array_equal(subg.ndata['feat'], F.gather_row(g.ndata['feat'], nid))
+            assert F.array_equal(subg.ndata['node_norm'],
+                                 F.gather_row(sampler.node_norm_values, nid))
+            assert F.array_equal(subg.edata['edge_norm'],
+                                 F.gather_row(sampler.edge_norm_values, eid))
+            assert F.asnumpy(subg.edata['edge_norm']).min() >= 1
+
+def test_graphsaint_dataloader_workers():
+    g = dgl.rand_graph(200, 2000)
+    sampler = dgl.dataloading.GraphSAINTNodeSampler(50, 8)
+    dataloader = dgl.dataloading.SubgraphDataLoader(g, sampler, num_workers=2)
+    nids = [tuple(sorted(F.asnumpy(subg.ndata[dgl.NID]).tolist())) for subg in dataloader]
+    assert len(nids) == 8
+    # the batches alternate between the two workers, which must not repeat each other
+    assert nids[0::2] != nids[1::2]
+    assert len(set(nids)) == 8
+
+def test_prefetch_dataloader():
+    g = dgl.rand_graph(100, 1000)
+    g.ndata['feat'] = F.randn((100, 4))
+    g.ndata['label'] = F.arange(0, 100)
+    sampler = dgl.dataloading.MultiLayerNeighborSampler([3, 3])
+    nids = F.arange(0, 50)
+    for device in [None, F.ctx()]:
+        dataloader = dgl.dataloading.NodeDataLoader(
+            g, nids, sampler, prefetch_node_feats=['feat'], device=device,
+            batch_size=8, shuffle=True, num_workers=0)
+        num_batches = 0
+        for input_nodes, output_nodes, blocks in dataloader:
+            num_batches += 1
+            input_nodes = F.copy_to(input_nodes, F.cpu())
+            assert F.array_equal(F.copy_to(blocks[0].srcdata['feat'], F.cpu()),
+                                 F.gather_row(g.ndata['feat'], input_nodes))
+            # features not prefetched are still available
+            output_nodes = F.copy_to(output_nodes, F.cpu())
+            assert F.array_equal(F.copy_to(blocks[-1].dstdata['label'], F.cpu()),
+                                 F.gather_row(g.ndata['label'], output_nodes))
+            if device is not None:
+                assert blocks[0].device == device
+        assert num_batches == len(dataloader)
+
+        dataloader = dgl.dataloading.EdgeDataLoader(
+            g, F.arange(0, 100), sampler, prefetch_node_feats=['feat'], device=device,
+            negative_sampler=dgl.dataloading.negative_sampler.Uniform(2), batch_size=16)
+        for input_nodes, pair_graph, neg_pair_graph, blocks in dataloader:
+            input_nodes = F.copy_to(input_nodes, F.cpu())
+            assert F.array_equal(F.copy_to(blocks[0].srcdata['feat'], F.cpu()),
+                                 F.gather_row(g.ndata['feat'], input_nodes))
+            if device is not None:
+                assert pair_graph.device == device
+                assert neg_pair_graph.device == device
+
+@unittest.skipIf(F._default_context_str == 'gpu', reason="GPU sample neighbors not implemented")
+def test_block_cache(tmpdir):
+    g = dgl.rand_graph(100, 1000)
+    g.ndata['feat'] = F.randn((100, 4))
+    g.edata['w'] = F.randn((1000,))
+    seeds = F.arange(0, 20)
+    for cache in [dgl.dataloading.BlockCache(),
+                  dgl.dataloading.BlockCache(str(tmpdir), in_memory=False)]:
+        sampler = dgl.dataloading.CachedBlockSampler(
+            dgl.dataloading.MultiLayerFullNeighborSampler(2), cache)
+        blocks = sampler.sample_blocks(g, seeds)
+        cached_blocks = sampler.sample_blocks(g, seeds)
+        for block, cached_block in zip(blocks, cached_blocks):
+            assert F.array_equal(block.srcdata[dgl.NID], cached_block.srcdata[dgl.NID])
+            assert F.array_equal(block.dstdata[dgl.NID], cached_block.dstdata[dgl.NID])
+            assert F.array_equal(block.edata[dgl.EID], cached_block.edata[dgl.EID])
+            assert F.array_equal(block.srcdata['feat'], cached_block.srcdata['feat'])
+            assert F.array_equal(block.edata['w'], cached_block.edata['w'])
+            src, dst = block.edges(order='eid')
+            cached_src, cached_dst = cached_block.edges(order='eid')
+            assert F.array_equal(src, cached_src)
+            assert F.array_equal(dst, cached_dst)
+
+    # a cache on disk is shared by another sampler
+    num_files = len(os.listdir(str(tmpdir)))
+    assert num_files == 1
+    sampler = dgl.dataloading.CachedBlockSampler(
+        dgl.dataloading.MultiLayerFullNeighborSampler(2), dgl.dataloading.BlockCache(str(tmpdir)))
+    assert len(sampler.sample_blocks(g, seeds)) == 2
+    assert len(os.listdir(str(tmpdir))) == 1
+
+    # changing the graph invalidates the cache
+    g2 = dgl.add_edges(g, F.tensor([0]), F.tensor([1]))
+    sampler.sample_blocks(g2, seeds)
+    assert len(os.listdir(str(tmpdir))) == 2
+
+    # the key only depends on the configuration of the sampler
+    def _key(sampler):
+        return dgl.dataloading.CachedBlockSampler(sampler)._sampler_key
+    key = _key(dgl.dataloading.MultiLayerNeighborSampler([5, {'_E': 10}], replace=True))
+    assert _key(dgl.dataloading.MultiLayerNeighborSampler([5, {'_E': 10}], replace=True)) == key
+    assert _key(dgl.dataloading.MultiLayerNeighborSampler([5, {'_E': 10}])) != key
+    assert _key(dgl.dataloading.MultiLayerNeighborSampler([5, 5], replace=True)) != key
+    assert '0x' not in key
+
+def test_layerwise_inference():
+    g = dgl.rand_graph(100, 1000)
+    feat = F.randn((100, 4))
+    def layer(block, h):
+        with block.local_scope():
+            block.srcdata['h'] = h
+            block.update_all(dgl.function.copy_u('h', 'm'), dgl.function.sum('m', 'h'))
+            return block.dstdata['h'] + 1
+    cache = dgl.dataloading.BlockCache()
+    y = dgl.dataloading.layerwise_inference(g, [layer, layer], feat, 32, cache=cache)
+    with g.local_scope():
+        g.ndata['h'] = feat
+        for _ in range(2):
+            g.update_all(dgl.function.copy_u('h', 'm'), dgl.function.sum('m', 'h'))
+            g.ndata['h'] = g.ndata['h'] + 1
+        assert F.allclose(y, g.ndata['h'])
+    # the blocks of the 4 batches are shared by both layers
+    assert len(cache) == 4
+
 def test_graph_dataloader():
     batch_size = 16
     num_batches = 2
@@ -219,4 +432,8 @@ def test_graph_dataloader():
 
 if __name__ == '__main__':
     test_neighbor_sampler_dataloader()
+    test_layerwise_sampler_dataloader()
+    test_graphsaint_dataloader()
+    test_prefetch_dataloader()
+    test_layerwise_inference()
     test_graph_dataloader()